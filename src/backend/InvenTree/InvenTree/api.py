@@ -1,23 +1,30 @@
 """Main JSON interface views."""
 
+import copy
 import json
 import logging
 import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from django.conf import settings
-from django.db import transaction
+from django.db import connection, connections, transaction
 from django.http import JsonResponse
 from django.utils.translation import gettext_lazy as _
 
 from django_q.models import OrmQ
 from drf_spectacular.utils import OpenApiResponse, extend_schema
 from rest_framework import permissions, serializers
+from rest_framework.exceptions import NotFound
 from rest_framework.generics import GenericAPIView
+from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
 from rest_framework.views import APIView
 
+import InvenTree.helpers
 import InvenTree.version
 import users.models
 from InvenTree.filters import SEARCH_ORDER_FILTER
@@ -289,11 +296,20 @@ class BulkDeleteMixin:
     Bulk delete allows for multiple items to be deleted in a single API query,
     rather than using multiple API calls to the various detail endpoints.
 
-    This is implemented for two major reasons:
-    - Atomicity (guaranteed that either *all* items are deleted, or *none*)
-    - Speed (single API call and DB query)
+    Items are deleted in chunks of BULK_DELETE_CHUNK_SIZE items,
+    each in a separate (short) database transaction.
+
+    If more than BULK_DELETE_BACKGROUND_THRESHOLD items are selected,
+    they are deleted by the background worker (refer to InvenTree.tasks.bulk_delete),
+    and the progress can be retrieved from the 'api-bulk-delete-progress' endpoint.
     """
 
+    # Maximum number of items deleted in each database transaction
+    BULK_DELETE_CHUNK_SIZE = 500
+
+    # Maximum number of items which are deleted as part of the request
+    BULK_DELETE_BACKGROUND_THRESHOLD = 5000
+
     def filter_delete_queryset(self, queryset, request):
         """Provide custom filtering for the queryset *before* it is deleted."""
         return queryset
@@ -306,7 +322,12 @@ class BulkDeleteMixin:
             items: [4, 8, 15, 16, 23, 42]
         }
 
+        The response contains the number of 'deleted' items (or a background 'job' ID, with a 202 response).
         """
+        import InvenTree.tasks
+        from common.models import TaskProgress
+        from InvenTree.helpers_model import delete_in_chunks, pk_chunks
+
         model = self.serializer_class.Meta.model
 
         # Extract the items from the request body
@@ -338,26 +359,96 @@ class BulkDeleteMixin:
                 'filters': ["'filters' must be supplied as a dict object"]
             })
 
-        # Keep track of how many items we deleted
-        n_deleted = 0
+        # Start with *all* models and perform basic filtering
+        queryset = model.objects.all()
+        queryset = self.filter_delete_queryset(queryset, request)
+
+        # Filter by provided item ID values
+        if items:
+            queryset = queryset.filter(id__in=items)
 
-        with transaction.atomic():
-            # Start with *all* models and perform basic filtering
-            queryset = model.objects.all()
-            queryset = self.filter_delete_queryset(queryset, request)
+        # Filter by provided filters
+        if filters:
+            queryset = queryset.filter(**filters)
 
-            # Filter by provided item ID values
-            if items:
-                queryset = queryset.filter(id__in=items)
+        n_items = queryset.count()
 
-            # Filter by provided filters
-            if filters:
-                queryset = queryset.filter(**filters)
+        if n_items > self.BULK_DELETE_BACKGROUND_THRESHOLD:
+            # Offload the deletion of a large number of items to the background worker
+            job = uuid.uuid4().hex
+            user_id = request.user.pk
+            pks = list(queryset.order_by('pk').values_list('pk', flat=True))
 
-            n_deleted = queryset.count()
-            queryset.delete()
+            TaskProgress.set_progress(
+                InvenTree.tasks.bulk_delete_progress_key(job),
+                n_items,
+                0,
+                user_id=user_id,
+            )
 
-        return Response({'success': f'Deleted {n_deleted} items'}, status=204)
+            InvenTree.tasks.offload_task(
+                InvenTree.tasks.bulk_delete,
+                model._meta.label_lower,
+                pks,
+                job,
+                user_id=user_id,
+                chunk_size=self.BULK_DELETE_CHUNK_SIZE,
+            )
+
+            return Response(
+                {
+                    'success': f'Deleting {n_items} items in the background',
+                    'job': job,
+                    'total': n_items,
+                    'deleted': 0,
+                },
+                status=202,
+            )
+
+        n_deleted = delete_in_chunks(
+            model, pk_chunks(queryset, self.BULK_DELETE_CHUNK_SIZE)
+        )
+
+        return Response(
+            {'success': f'Deleted {n_deleted} items', 'deleted': n_deleted}, status=200
+        )
+
+
+class BulkDeleteProgressSerializer(serializers.Serializer):
+    """Serializer for reporting the progress of a background bulk deletion task."""
+
+    total = serializers.IntegerField(read_only=True, label=_('Total'))
+    deleted = serializers.IntegerField(
+        source='completed', read_only=True, label=_('Deleted')
+    )
+    finished = serializers.BooleanField(read_only=True, label=_('Finished'))
+    error = serializers.CharField(read_only=True, label=_('Error'))
+
+
+class BulkDeleteProgress(APIView):
+    """API endpoint for reporting the progress of a background bulk deletion task."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    @extend_schema(
+        responses={200: OpenApiResponse(response=BulkDeleteProgressSerializer)}
+    )
+    def get(self, request, job, *args, **kwargs):
+        """Return the progress of the specified bulk deletion task."""
+        import InvenTree.tasks
+        from common.models import TaskProgress
+
+        progress = TaskProgress.get_progress(
+            InvenTree.tasks.bulk_delete_progress_key(job)
+        )
+
+        # Only the user who requested the deletion can view the progress
+        if progress is None or (
+            progress.user_id != request.user.pk and not request.user.is_superuser
+        ):
+            raise NotFound()
+
+        return Response(BulkDeleteProgressSerializer(progress.to_dict()).data)
 
 
 class ListCreateDestroyAPIView(BulkDeleteMixin, ListCreateAPI):
@@ -424,6 +515,7 @@ class APISearchViewSerializer(serializers.Serializer):
     search = serializers.CharField()
     search_regex = serializers.BooleanField(default=False, required=False)
     search_whole = serializers.BooleanField(default=False, required=False)
+    brief = serializers.BooleanField(default=False, required=False)
     limit = serializers.IntegerField(default=1, required=False)
     offset = serializers.IntegerField(default=0, required=False)
 
@@ -435,11 +527,54 @@ class APISearchView(GenericAPIView):
     to consolidate multiple API requests into a single query.
 
     Is much more efficient and simplifies code!
+
+    - Individual model searches are run concurrently (see settings.SEARCH_WORKERS)
+    - If the 'brief' parameter is specified, a lightweight result set is returned
     """
 
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = APISearchViewSerializer
 
+    # Fields returned for each model type when a 'brief' search is requested
+    # Each entry maps the returned key to the (related) model field
+    BRIEF_FIELDS = {
+        'build': {'name': 'reference', 'description': 'title', 'image': 'part__image'},
+        'company': {'name': 'name', 'description': 'description', 'image': 'image'},
+        'manufacturerpart': {
+            'name': 'MPN',
+            'description': 'description',
+            'image': 'part__image',
+        },
+        'supplierpart': {
+            'name': 'SKU',
+            'description': 'description',
+            'image': 'part__image',
+        },
+        'part': {'name': 'name', 'description': 'description', 'image': 'image'},
+        'partcategory': {'name': 'pathstring', 'description': 'description'},
+        'purchaseorder': {
+            'name': 'reference',
+            'description': 'description',
+            'image': 'supplier__image',
+        },
+        'returnorder': {
+            'name': 'reference',
+            'description': 'description',
+            'image': 'customer__image',
+        },
+        'salesorder': {
+            'name': 'reference',
+            'description': 'description',
+            'image': 'customer__image',
+        },
+        'stockitem': {
+            'name': 'part__name',
+            'description': 'part__description',
+            'image': 'part__image',
+        },
+        'stocklocation': {'name': 'pathstring', 'description': 'description'},
+    }
+
     def get_result_types(self):
         """Construct a list of search types we can return."""
         import build.api
@@ -462,6 +597,120 @@ class APISearchView(GenericAPIView):
             'stocklocation': stock.api.StockLocationList,
         }
 
+    def get_search_request(self, request, params):
+        """Construct a separate request object for an individual search query.
+
+        Each search query requires its own set of query parameters,
+        so the original request object cannot be shared between (concurrent) queries.
+        """
+        http_request = copy.copy(request._request)
+        http_request.GET = params
+
+        search_request = Request(
+            http_request,
+            parsers=request.parsers,
+            authenticators=request.authenticators,
+            negotiator=request.negotiator,
+            parser_context=request.parser_context,
+        )
+
+        search_request.user = request.user
+        search_request.auth = request.auth
+
+        return search_request
+
+    def get_brief_results(self, key, view):
+        """Return a lightweight set of search results for the provided view.
+
+        Only a small number of fields are returned for each result,
+        and the serializer (and any annotations) are bypassed entirely.
+        """
+        fields = self.BRIEF_FIELDS.get(key, {})
+
+        queryset = view.filter_queryset(view.get_queryset())
+        queryset = queryset.prefetch_related(None).values('pk', *fields.values())
+
+        page = view.paginate_queryset(queryset)
+
+        results = []
+
+        for row in queryset if page is None else page:
+            result = {'pk': row['pk']}
+
+            for name, field in fields.items():
+                if name == 'image':
+                    result['thumbnail'] = InvenTree.helpers.getMediaThumbnailUrl(
+                        row[field]
+                    )
+                else:
+                    result[name] = row[field]
+
+            results.append(result)
+
+        if page is None:
+            return results
+
+        return view.get_paginated_response(results).data
+
+    def perform_search(self, key, view_class, request, brief=False):
+        """Perform a search query against a single model type.
+
+        Returns:
+            A tuple of (results, duration) where duration is the query time in seconds
+        """
+        t_start = time.time()
+
+        view = view_class()
+        view.request = request
+        view.args = ()
+        view.kwargs = {}
+        view.format_kwarg = 'format'
+
+        # Check permissions and update results dict with particular query
+        model = view.serializer_class.Meta.model
+        app_label = model._meta.app_label
+        model_name = model._meta.model_name
+        table = f'{app_label}_{model_name}'
+
+        try:
+            if users.models.RuleSet.check_table_permission(request.user, table, 'view'):
+                if brief:
+                    result = self.get_brief_results(key, view)
+                else:
+                    result = view.list(request).data
+            else:
+                result = {
+                    'error': _('User does not have permission to view this model')
+                }
+        except Exception as exc:
+            result = {'error': str(exc)}
+
+        return result, time.time() - t_start
+
+    def perform_threaded_search(self, *args, **kwargs):
+        """Perform a search query from within a worker thread.
+
+        Each worker thread opens its own database connection,
+        which must be closed once the query has been completed.
+        """
+        try:
+            return self.perform_search(*args, **kwargs)
+        finally:
+            connections.close_all()
+
+    def get_search_workers(self, n_queries):
+        """Return the number of worker threads to use for the provided number of queries.
+
+        Concurrent searches are not performed if:
+        - The database backend is sqlite (which cannot run concurrent queries anyway)
+        - The request is being served inside a database transaction,
+          as uncommitted data would not be visible to the other database connections
+        """
+        if connection.vendor == 'sqlite' or connection.in_atomic_block:
+            return 1
+
+        return max(1, min(int(settings.SEARCH_WORKERS), n_queries))
+
     def post(self, request, *args, **kwargs):
         """Perform search query against available models."""
         data = request.data
@@ -480,47 +729,55 @@ class APISearchView(GenericAPIView):
         if 'search' not in data:
             raise ValidationError({'search': 'Search term must be provided'})
 
+        brief = InvenTree.helpers.str2bool(data.get('brief', False))
+
+        queries = []
+
         for key, cls in self.get_result_types().items():
             # Only return results which are specifically requested
             if key in data:
                 params = data[key]
 
+                # Ignore if the params are wrong
+                if type(params) is not dict:
+                    continue
+
                 for k, v in pass_through_params.items():
                     params[k] = request.data.get(k, v)
 
                 # Enforce json encoding
                 params['format'] = 'json'
 
-                # Ignore if the params are wrong
-                if type(params) is not dict:
-                    continue
+                queries.append((
+                    key,
+                    cls,
+                    self.get_search_request(request, params),
+                    brief,
+                ))
+
+        workers = self.get_search_workers(len(queries))
+
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self.perform_threaded_search, *query)
+                    for query in queries
+                ]
+
+                outputs = [future.result() for future in futures]
+        else:
+            outputs = [self.perform_search(*query) for query in queries]
+
+        timings = {}
+
+        for query, (result, duration) in zip(queries, outputs):
+            key = query[0]
+            results[key] = result
+            timings[key] = round(duration * 1000, 2)
 
-                view = cls()
-
-                # Override regular query params with specific ones for this search request
-                request._request.GET = params
-                view.request = request
-                view.format_kwarg = 'format'
-
-                # Check permissions and update results dict with particular query
-                model = view.serializer_class.Meta.model
-                app_label = model._meta.app_label
-                model_name = model._meta.model_name
-                table = f'{app_label}_{model_name}'
-
-                try:
-                    if users.models.RuleSet.check_table_permission(
-                        request.user, table, 'view'
-                    ):
-                        results[key] = view.list(request, *args, **kwargs).data
-                    else:
-                        results[key] = {
-                            'error': _(
-                                'User does not have permission to view this model'
-                            )
-                        }
-                except Exception as exc:
-                    results[key] = {'error': str(exc)}
+        if settings.DEBUG:
+            # Include per-model query timing (in milliseconds)
+            results['timings'] = timings
 
         return Response(results)
 
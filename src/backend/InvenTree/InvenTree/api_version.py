@@ -1,11 +1,52 @@
 """InvenTree API version information."""
 
 # InvenTree API version
-INVENTREE_API_VERSION = 193
+INVENTREE_API_VERSION = 204
 """Increment this API version number whenever there is a significant change to the API that any clients need to know about."""
 
 INVENTREE_API_TEXT = """
 
+v204 - 2026-10-19
+    - Bulk delete API endpoints delete items in chunks, and return the number of deleted items (with a 200 response, rather than 204)
+    - Large bulk deletions are performed by the background worker (returning a job ID)
+    - Adds API endpoint for reporting the progress (and any error) of a background bulk deletion
+
+v203 - 2026-10-19
+    - Machine status, status text and errors are shared between all server processes
+    - Label printing via a machine creates a print job, which is run by the background worker
+    - Adds API endpoints for listing the jobs of a machine, and for the status and progress of a job
+
+v202 - 2026-10-19
+    - Sales order shipment complete API endpoint returns "background" if the shipment is completed by the background worker
+    - Adds API endpoint for reporting the progress (and any error) of background shipment completion
+
+v201 - 2026-10-19
+    - Adds "fields" and "omit" query parameters to the Part, StockItem and BuildLine list API endpoints
+
+v200 - 2026-10-19
+    - Adds keyset (cursor) pagination to the Part, StockItem and StockTracking list API endpoints
+    - Adds "count" query parameter to skip or approximate the total count for these endpoints
+
+v199 - 2026-10-19
+    - Adds "parameter_<id>" and "parameter_<id>_<func>" filters to the Part list API endpoint
+
+v198 - 2026-10-19
+    - Build output complete API endpoint returns "background" if outputs are completed by the background worker
+    - Adds API endpoint for reporting the progress (and any error) of background build output completion
+
+v197 - 2026-10-19
+    - Adds "dry_run" option to the build order auto-allocate API endpoint
+    - Build order auto-allocate API endpoint returns the list of (proposed) allocations
+
+v196 - 2026-10-19
+    - Adds API endpoint for listing the available stock items against a particular BuildLine
+
+v195 - 2026-10-19
+    - Adds API endpoint for reserving a block of serial numbers for a part
+
+v194 - 2026-10-19
+    - Adds "brief" option to the global search API endpoint
+
 v193 - 2024-04-30 : https://github.com/inventree/InvenTree/pull/7144
     - Adds "assigned_to" filter to PurchaseOrder / SalesOrder / ReturnOrder API endpoints
 
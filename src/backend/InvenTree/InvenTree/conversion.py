@@ -1,5 +1,6 @@
 """Helper functions for converting between units."""
 
+import functools
 import logging
 import re
 
@@ -10,6 +11,12 @@ import pint
 
 _unit_registry = None
 
+# Incremented whenever the unit registry is reloaded
+_unit_registry_version = 0
+
+# Maximum number of cached conversion results
+CONVERSION_CACHE_SIZE = 8192
+
 logger = logging.getLogger('inventree')
 
 
@@ -33,8 +40,13 @@ def reload_unit_registry():
     t_start = time.time()
 
     global _unit_registry
+    global _unit_registry_version
 
     _unit_registry = None
+    _unit_registry_version += 1
+
+    # Cached conversions may no longer be valid
+    clear_conversion_cache()
 
     reg = pint.UnitRegistry(autoconvert_offset_to_baseunit=True)
 
@@ -136,6 +148,9 @@ def convert_value(value, unit):
 def convert_physical_value(value: str, unit: str = None, strip_units=True):
     """Validate that the provided value is a valid physical quantity.
 
+    Conversion results are cached, as constructing pint.Quantity objects is expensive.
+    The cache is invalidated whenever the unit registry is reloaded.
+
     Arguments:
         value: Value to validate (str)
         unit: Optional unit to convert to, and validate against
@@ -147,6 +162,72 @@ def convert_physical_value(value: str, unit: str = None, strip_units=True):
     Returns:
         The converted quantity, in the specified units
     """
+    # Ensure that the unit registry is loaded *before* the registry version is read
+    get_unit_registry()
+
+    # Blank values (e.g. None, 0) are all treated as an empty string
+    value = str(value).strip() if value else ''
+
+    result, error = _cached_conversion(
+        value, unit, bool(strip_units), _unit_registry_version
+    )
+
+    if error is not None:
+        raise ValidationError(error)
+
+    return result
+
+
+def convert_physical_values(values, unit: str = None, strip_units=True) -> dict:
+    """Convert multiple values to the specified unit.
+
+    Each distinct value is only converted once.
+
+    Arguments:
+        values: Iterable of values to convert
+        unit: Optional unit to convert to
+        strip_units: If True, strip units from the returned values
+
+    Returns:
+        A dict mapping each provided value to the converted value (or None, if the value could not be converted)
+    """
+    results = {}
+
+    for value in values:
+        if value in results:
+            continue
+
+        try:
+            results[value] = convert_physical_value(value, unit, strip_units)
+        except (ValidationError, ValueError):
+            results[value] = None
+
+    return results
+
+
+def clear_conversion_cache():
+    """Clear any cached conversion results."""
+    _cached_conversion.cache_clear()
+
+
+@functools.lru_cache(maxsize=CONVERSION_CACHE_SIZE)
+def _cached_conversion(value: str, unit: str, strip_units: bool, registry_version: int):
+    """Perform (and cache) a physical value conversion.
+
+    The registry version forms part of the cache key,
+    so that results are not shared between different unit registries.
+
+    Returns:
+        A tuple of (result, error message)
+    """
+    try:
+        return _convert_physical_value(value, unit, strip_units), None
+    except ValidationError as exc:
+        return None, exc.message
+
+
+def _convert_physical_value(value: str, unit: str = None, strip_units=True):
+    """Convert the provided value to the specified unit (see convert_physical_value)."""
     ureg = get_unit_registry()
 
     # Check that the provided unit is available in the unit registry
@@ -26,7 +26,33 @@ class InvenTreeDateFilter(rest_filters.DateFilter):
 
 
 class InvenTreeSearchFilter(filters.SearchFilter):
-    """Custom search filter which allows adjusting of search terms dynamically."""
+    """Custom search filter which allows adjusting of search terms dynamically.
+
+    If the search index is enabled (and covers the view), search queries are performed against the index.
+    Regex and whole-word searches are always performed using the standard field lookups.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        """Filter the queryset, using the search index where possible."""
+        import common.search
+
+        regex = InvenTree.helpers.str2bool(
+            request.query_params.get('search_regex', False)
+        )
+
+        whole = InvenTree.helpers.str2bool(
+            request.query_params.get('search_whole', False)
+        )
+
+        if regex or whole or not common.search.can_search_view(view, queryset):
+            return super().filter_queryset(request, queryset, view)
+
+        terms = self.get_search_terms(request)
+
+        if not terms:
+            return queryset
+
+        return common.search.search_queryset(queryset, terms)
 
     def get_search_fields(self, view, request):
         """Return a set of search fields for the request, adjusted based on request params.
@@ -81,7 +107,29 @@ class InvenTreeSearchFilter(filters.SearchFilter):
         return terms
 
 
-class InvenTreeOrderingFilter(filters.OrderingFilter):
+class SearchRankOrderingMixin:
+    """Mixin for OrderingFilter classes, which retains the ordering of ranked search results.
+
+    If the queryset has been ranked against the search index,
+    the ranked ordering is retained unless an ordering is explicitly requested.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        """Return None (no ordering) for ranked search results."""
+        from common.search import SEARCH_RANK_FIELD
+
+        if SEARCH_RANK_FIELD in queryset.query.annotations:
+            if not request.query_params.get(self.ordering_param):
+                return None
+
+        return super().get_ordering(request, queryset, view)
+
+
+class InvenTreeRankedOrderingFilter(SearchRankOrderingMixin, filters.OrderingFilter):
+    """OrderingFilter class which retains the ordering of ranked search results."""
+
+
+class InvenTreeOrderingFilter(SearchRankOrderingMixin, filters.OrderingFilter):
     """Custom OrderingFilter class which allows aliased filtering of related fields.
 
     To use, simply specify this filter in the "filter_backends" section.
@@ -156,7 +204,7 @@ class InvenTreeOrderingFilter(filters.OrderingFilter):
 SEARCH_ORDER_FILTER = [
     rest_filters.DjangoFilterBackend,
     InvenTreeSearchFilter,
-    filters.OrderingFilter,
+    InvenTreeRankedOrderingFilter,
 ]
 
 SEARCH_ORDER_FILTER_ALIAS = [
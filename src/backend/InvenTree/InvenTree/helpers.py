@@ -160,6 +160,20 @@ def getBlankThumbnail():
     return getStaticUrl('img/blank_image.thumbnail.png')
 
 
+def getMediaThumbnailUrl(filename):
+    """Return the qualified access path for the thumbnail of the given image file.
+
+    The thumbnail name is derived from the image name (e.g. 'image.png' -> 'image.thumbnail.png'),
+    without requiring the image model instance to be loaded.
+    """
+    if not filename:
+        return getBlankThumbnail()
+
+    root, ext = os.path.splitext(str(filename))
+
+    return getMediaUrl(f'{root}.thumbnail{ext}')
+
+
 def getLogoImage(as_file=False, custom=True):
     """Return the InvenTree logo image, or a custom logo if available."""
     """Return the path to the logo-file."""
@@ -469,13 +483,14 @@ def DownloadFile(
     return response
 
 
-def increment_serial_number(serial):
+def increment_serial_number(serial, plugins=None):
     """Given a serial number, (attempt to) generate the *next* serial number.
 
     Note: This method is exposed to custom plugins.
 
     Arguments:
         serial: The serial number which should be incremented
+        plugins: List of active validation plugins (looked up from the registry if not provided)
 
     Returns:
         incremented value, or None if incrementing could not be performed.
@@ -486,8 +501,11 @@ def increment_serial_number(serial):
     if serial is not None:
         serial = str(serial).strip()
 
+    if plugins is None:
+        plugins = registry.with_mixin('validation')
+
     # First, let any plugins attempt to increment the serial number
-    for plugin in registry.with_mixin('validation'):
+    for plugin in plugins:
         result = plugin.increment_serial_number(serial)
         if result is not None:
             return str(result)
@@ -497,7 +515,9 @@ def increment_serial_number(serial):
     return increment(serial)
 
 
-def extract_serial_numbers(input_string, expected_quantity: int, starting_value=None):
+def extract_serial_numbers(
+    input_string, expected_quantity: int, starting_value=None, plugins=None
+):
     """Extract a list of serial numbers from a provided input string.
 
     The input string can be specified using the following concepts:
@@ -515,9 +535,16 @@ def extract_serial_numbers(input_string, expected_quantity: int, starting_value=
         input_string: Input string with specified serial numbers (string, or integer)
         expected_quantity: The number of (unique) serial numbers we expect
         starting_value: Provide a starting value for the sequence (or None)
+        plugins: List of active validation plugins (looked up from the registry if not provided)
     """
+    from plugin.registry import registry
+
+    # Look up the validation plugins once, rather than for each serial number
+    if plugins is None:
+        plugins = registry.with_mixin('validation')
+
     if starting_value is None:
-        starting_value = increment_serial_number(None)
+        starting_value = increment_serial_number(None, plugins=plugins)
 
     try:
         expected_quantity = int(expected_quantity)
@@ -532,12 +559,12 @@ def extract_serial_numbers(input_string, expected_quantity: int, starting_value=
     if len(input_string) == 0:
         raise ValidationError([_('Empty serial number string')])
 
-    next_value = increment_serial_number(starting_value)
+    next_value = increment_serial_number(starting_value, plugins=plugins)
 
     # Substitute ~ character with latest value
     while '~' in input_string and next_value:
         input_string = input_string.replace('~', str(next_value), 1)
-        next_value = increment_serial_number(next_value)
+        next_value = increment_serial_number(next_value, plugins=plugins)
 
     # Split input string by whitespace or comma (,) characters
     groups = re.split(r'[\s,]+', input_string)
@@ -605,7 +632,7 @@ def extract_serial_numbers(input_string, expected_quantity: int, starting_value=
                     count += 1
 
                     # Progress to the 'next' sequential value
-                    a_next = str(increment_serial_number(a_next))
+                    a_next = str(increment_serial_number(a_next, plugins=plugins))
 
                     if a_next == b:
                         # Successfully got to the end of the range
@@ -671,7 +698,7 @@ def extract_serial_numbers(input_string, expected_quantity: int, starting_value=
                 and counter < sequence_count
             ):
                 sequence_items.append(value)
-                value = increment_serial_number(value)
+                value = increment_serial_number(value, plugins=plugins)
                 counter += 1
 
             if len(sequence_items) == sequence_count:
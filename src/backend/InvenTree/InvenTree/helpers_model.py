@@ -3,16 +3,19 @@
 import io
 import logging
 from decimal import Decimal
+from typing import Callable, Optional
 from urllib.parse import urljoin
 
 from django.conf import settings
 from django.core.validators import URLValidator
+from django.db import transaction
 from django.db.utils import OperationalError, ProgrammingError
 from django.utils.translation import gettext_lazy as _
 
 import requests
 from djmoney.contrib.exchange.models import convert_money
 from djmoney.money import Money
+from mptt.models import MPTTModel
 from PIL import Image
 
 import common.models
@@ -362,3 +365,94 @@ def notify_users(
         target_exclude=[exclude],
         context=context,
     )
+
+
+def pk_chunks(items, chunk_size: int = 500):
+    """Yield the primary key values of the provided items, in chunks.
+
+    Arguments:
+        items: A list of primary key values, or a queryset
+        chunk_size: Maximum number of primary key values in each chunk
+
+    Querysets are read in primary key order (one chunk at a time),
+    so that the entire set of primary key values is never held in memory.
+    """
+    chunk_size = max(1, chunk_size)
+
+    if isinstance(items, (list, tuple)):
+        for idx in range(0, len(items), chunk_size):
+            yield list(items[idx : idx + chunk_size])
+        return
+
+    queryset = items.order_by('pk').values_list('pk', flat=True)
+    last_pk = None
+
+    while True:
+        chunk = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        chunk = list(chunk[:chunk_size])
+
+        if not chunk:
+            break
+
+        yield chunk
+
+        last_pk = chunk[-1]
+
+
+def delete_in_chunks(
+    model, chunks, progress: Optional[Callable[[int], None]] = None
+) -> int:
+    """Delete instances of the provided model, one chunk at a time.
+
+    Each chunk is deleted in a separate (short) transaction, so that a large deletion
+    does not hold database locks for an extended period.
+
+    For tree (MPTT) models, tree updates are disabled while the chunks are deleted,
+    and each affected tree is rebuilt once at the end.
+
+    Arguments:
+        model: The model class
+        chunks: Iterable of lists of primary key values (refer to pk_chunks)
+        progress: Optional callback, called with the number of deleted instances after each chunk
+
+    Returns:
+        The number of deleted instances (excluding any cascaded deletions)
+    """
+    is_tree = issubclass(model, MPTTModel)
+    tree_ids = set()
+    deleted = 0
+
+    try:
+        for chunk in chunks:
+            with transaction.atomic():
+                queryset = model.objects.filter(pk__in=chunk)
+
+                if is_tree:
+                    tree_ids.update(
+                        queryset.order_by()
+                        .values_list(model._mptt_meta.tree_id_attr, flat=True)
+                        .distinct()
+                    )
+
+                    with model.objects.disable_mptt_updates():
+                        _total, counts = queryset.delete()
+                else:
+                    _total, counts = queryset.delete()
+
+            deleted += counts.get(
+                model._meta.label, counts.get(model._meta.concrete_model._meta.label, 0)
+            )
+
+            if progress:
+                progress(deleted)
+    finally:
+        # Rebuild each affected tree, even if a chunk failed to delete
+        for tree_id in sorted(tree_ids):
+            try:
+                model.objects.partial_rebuild(tree_id)
+            except Exception:
+                logger.warning('Rebuilding entire %s tree', model.__name__)
+                model.objects.rebuild()
+                break
+
+    return deleted
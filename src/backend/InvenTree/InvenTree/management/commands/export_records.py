@@ -0,0 +1,250 @@
+"""Custom management command to export database records.
+
+Records are exported to a directory, which contains:
+
+- manifest.json: The exported models (in dependency order), with the row count and data files for each model
+- <app_label>.<model_name>.<chunk>.jsonl: The serialized records for each model, one record per line
+
+Records are read (and written) in chunks, so memory usage does not depend on the size of the database.
+The exported directory can be imported using the 'import_records' command.
+"""
+
+import json
+import logging
+from pathlib import Path
+
+from django.apps import apps
+from django.core import serializers
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, router
+
+logger = logging.getLogger('inventree')
+
+# Version of the export format
+EXPORT_VERSION = 1
+
+# Name of the manifest file (within the export directory)
+MANIFEST_FILE = 'manifest.json'
+
+
+def get_excluded_models(excludes: list) -> set:
+    """Return the set of models which match the provided exclusions.
+
+    Arguments:
+        excludes: List of exclusions, in the form 'app_label' or 'app_label.ModelName'
+    """
+    excluded = set()
+
+    for label in excludes or []:
+        try:
+            if '.' in label:
+                excluded.add(apps.get_model(label))
+            else:
+                excluded.update(apps.get_app_config(label).get_models())
+        except LookupError:
+            raise CommandError(f"Unknown model or app in excludes: '{label}'")
+
+    return excluded
+
+
+def get_export_models(excludes: list) -> list:
+    """Return the models to export, sorted so that each model follows the models it depends on.
+
+    A model depends on each model referenced by its foreign key (or many-to-many) fields.
+    Any dependency cycles are broken in alphabetical order.
+    """
+    excluded = get_excluded_models(excludes)
+
+    models = {
+        model
+        for model in apps.get_models()
+        if not model._meta.proxy
+        and model not in excluded
+        and router.allow_migrate_model(DEFAULT_DB_ALIAS, model)
+    }
+
+    dependencies = {}
+
+    for model in models:
+        dependencies[model] = {
+            field.related_model
+            for field in model._meta.get_fields()
+            if field.is_relation
+            and field.concrete
+            and (field.many_to_one or field.one_to_one or field.many_to_many)
+            and field.related_model in models
+            and field.related_model is not model
+        }
+
+    ordered = []
+
+    while dependencies:
+        ready = sorted(
+            (model for model, deps in dependencies.items() if not deps),
+            key=lambda model: model._meta.label_lower,
+        )
+
+        if not ready:
+            # Break a dependency cycle
+            ready = [min(dependencies, key=lambda model: model._meta.label_lower)]
+
+        for model in ready:
+            ordered.append(model)
+            del dependencies[model]
+
+            for deps in dependencies.values():
+                deps.discard(model)
+
+    return ordered
+
+
+def clean_record(record: dict, include_permissions: bool = False):
+    """Clean a serialized record before it is exported.
+
+    Returns:
+        The cleaned record, or None if the record should not be exported
+    """
+    model = record['model']
+    fields = record['fields']
+
+    # Ignore any temporary settings (start with underscore)
+    if model in ['common.inventreesetting', 'common.inventreeusersetting']:
+        if fields.get('key', '').startswith('_'):
+            return None
+
+    if not include_permissions:
+        if model == 'auth.group':
+            fields['permissions'] = []
+
+        if model == 'auth.user':
+            fields['user_permissions'] = []
+
+    return record
+
+
+class Command(BaseCommand):
+    """Export all database records to a directory of chunked JSONL files."""
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument('directory', type=str, help='Output directory')
+        parser.add_argument(
+            '-e',
+            '--exclude',
+            action='append',
+            default=[],
+            help='An app_label or app_label.ModelName to exclude (use multiple --exclude to exclude multiple apps/models)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=10000,
+            help='Maximum number of records per data file',
+        )
+        parser.add_argument(
+            '--include-permissions',
+            action='store_true',
+            help='Include user and group permissions',
+        )
+        parser.add_argument(
+            '--overwrite',
+            action='store_true',
+            help='Overwrite an existing export in the output directory',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Export database records."""
+        directory = Path(kwargs['directory'])
+        chunk_size = max(1, kwargs['chunk_size'])
+        include_permissions = kwargs['include_permissions']
+
+        if directory.exists():
+            if not directory.is_dir():
+                raise CommandError(f"'{directory}' is not a directory")
+
+            if any(directory.iterdir()) and not kwargs['overwrite']:
+                raise CommandError(f"Directory '{directory}' is not empty")
+
+            for path in directory.glob('*.jsonl'):
+                path.unlink()
+        else:
+            directory.mkdir(parents=True)
+
+        manifest = {'version': EXPORT_VERSION, 'models': []}
+
+        for model in get_export_models(kwargs['exclude']):
+            label = model._meta.label_lower
+            count, files = self.export_model(
+                model, directory, chunk_size, include_permissions
+            )
+
+            logger.info('Exported %s records for %s', count, label)
+
+            manifest['models'].append({'model': label, 'count': count, 'files': files})
+
+        with open(directory.joinpath(MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+        total = sum(entry['count'] for entry in manifest['models'])
+        logger.info("Exported %s records to '%s'", total, directory)
+
+    def export_model(self, model, directory, chunk_size, include_permissions):
+        """Export all records for the provided model.
+
+        Records are read in primary key order, one chunk at a time,
+        and each chunk is written to a separate data file.
+
+        Returns:
+            A tuple of (record count, list of data file names)
+        """
+        label = model._meta.label_lower
+
+        # Prefetch many-to-many fields, to avoid a query per record
+        m2m_fields = [
+            field.name
+            for field in model._meta.many_to_many
+            if field.remote_field.through._meta.auto_created
+        ]
+
+        queryset = model._default_manager.order_by('pk').prefetch_related(*m2m_fields)
+
+        count = 0
+        files = []
+        last_pk = None
+
+        while True:
+            chunk = queryset
+
+            if last_pk is not None:
+                chunk = chunk.filter(pk__gt=last_pk)
+
+            chunk = list(chunk[:chunk_size])
+
+            if not chunk:
+                break
+
+            last_pk = chunk[-1].pk
+
+            records = serializers.serialize(
+                'python', chunk, use_natural_foreign_keys=True
+            )
+
+            filename = f'{label}.{len(files):05d}.jsonl'
+
+            with open(directory.joinpath(filename), 'w', encoding='utf-8') as f:
+                for record in records:
+                    record = clean_record(record, include_permissions)
+
+                    if record is None:
+                        continue
+
+                    f.write(json.dumps(record, cls=DjangoJSONEncoder) + '\n')
+                    count += 1
+
+            files.append(filename)
+
+            if len(chunk) < chunk_size:
+                break
+
+        return count, files
@@ -0,0 +1,268 @@
+"""Custom management command to import database records.
+
+Imports a directory of records which was created by the 'export_records' command:
+
+- Models are imported in the (dependency) order specified in the manifest file
+- Data files are read one line at a time, and records are inserted in batches
+- Records which already exist in the database are updated
+- After import, the row count for each model is compared against the manifest
+"""
+
+import json
+import logging
+from pathlib import Path
+
+from django.apps import apps
+from django.core import serializers
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from InvenTree.management.commands.export_records import (
+    EXPORT_VERSION,
+    MANIFEST_FILE,
+    get_excluded_models,
+)
+
+logger = logging.getLogger('inventree')
+
+
+def read_records(path: Path, excluded_fields: dict):
+    """Yield the records from the provided data file, one at a time."""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+
+            if not line:
+                continue
+
+            record = json.loads(line)
+
+            # Permissions are not imported for users or groups
+            for field in excluded_fields.get(record.get('model'), []):
+                if field in record.get('fields', {}):
+                    record['fields'][field] = []
+
+            yield record
+
+
+class Command(BaseCommand):
+    """Import database records from a directory of chunked JSONL files."""
+
+    # Permissions are not imported, as they are regenerated for each database
+    excluded_fields = {'auth.group': ['permissions'], 'auth.user': ['user_permissions']}
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            'directory', type=str, help='Directory created by export_records'
+        )
+        parser.add_argument(
+            '-e',
+            '--exclude',
+            action='append',
+            default=[],
+            help='An app_label or app_label.ModelName to exclude (use multiple --exclude to exclude multiple apps/models)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of records to insert at once',
+        )
+
+    def load_manifest(self, directory: Path) -> dict:
+        """Load and validate the manifest file for the provided directory."""
+        try:
+            with open(directory.joinpath(MANIFEST_FILE), encoding='utf-8') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            raise CommandError(f"'{directory}' does not contain a {MANIFEST_FILE} file")
+        except ValueError as exc:
+            raise CommandError(f'Failed to decode {MANIFEST_FILE}: {exc}')
+
+        if manifest.get('version') != EXPORT_VERSION:
+            raise CommandError(f'Unsupported export version: {manifest.get("version")}')
+
+        return manifest
+
+    def handle(self, *args, **kwargs):
+        """Import database records."""
+        directory = Path(kwargs['directory'])
+        batch_size = max(1, kwargs['batch_size'])
+
+        manifest = self.load_manifest(directory)
+        excluded = get_excluded_models(kwargs['exclude'])
+
+        entries = []
+
+        for entry in manifest['models']:
+            try:
+                model = apps.get_model(entry['model'])
+            except LookupError:
+                logger.warning("Skipping unknown model '%s'", entry['model'])
+                continue
+
+            if model not in excluded:
+                entries.append((model, entry))
+
+        connection = connections[DEFAULT_DB_ALIAS]
+
+        self.deferred = []
+
+        with transaction.atomic():
+            with connection.constraint_checks_disabled():
+                for model, entry in entries:
+                    count = self.import_model(model, entry, directory, batch_size)
+                    logger.info('Imported %s records for %s', count, entry['model'])
+
+                for obj in self.deferred:
+                    obj.save_deferred_fields()
+
+            # Constraint checks were disabled, so check for any invalid keys
+            models = [model for model, _entry in entries]
+
+            connection.check_constraints(
+                table_names=[model._meta.db_table for model in models]
+            )
+
+            # Reset the database sequences, as records were inserted with explicit keys
+            if sequence_sql := connection.ops.sequence_reset_sql(no_style(), models):
+                with connection.cursor() as cursor:
+                    for sql in sequence_sql:
+                        cursor.execute(sql)
+
+        self.check_integrity(entries)
+
+        total = sum(entry['count'] for _model, entry in entries)
+        logger.info("Imported %s records from '%s'", total, directory)
+
+    def import_model(self, model, entry, directory, batch_size) -> int:
+        """Import all records for the provided model.
+
+        Returns:
+            The number of imported records
+        """
+        count = 0
+
+        for filename in entry['files']:
+            records = read_records(directory.joinpath(filename), self.excluded_fields)
+            objects = serializers.deserialize(
+                'python',
+                records,
+                ignorenonexistent=True,
+                handle_forward_references=True,
+            )
+
+            batch = []
+
+            for obj in objects:
+                if type(obj.object) is not model:
+                    raise CommandError(
+                        f"Unexpected record for '{obj.object._meta.label_lower}' in '{filename}'"
+                    )
+
+                batch.append(obj)
+
+                if len(batch) >= batch_size:
+                    count += self.save_batch(model, batch)
+                    batch = []
+
+            if batch:
+                count += self.save_batch(model, batch)
+
+        return count
+
+    def save_batch(self, model, batch) -> int:
+        """Save a batch of deserialized records.
+
+        New records are inserted with a single query (per table),
+        while records which already exist in the database are updated individually.
+
+        Records are saved in 'raw' mode (as per the 'loaddata' command),
+        so that the exported values of auto_now and auto_now_add fields are retained.
+
+        Returns:
+            The number of saved records
+        """
+        pks = [obj.object.pk for obj in batch]
+        existing = set(
+            model._base_manager.filter(pk__in=pks).values_list('pk', flat=True)
+        )
+
+        # Models with multi-table inheritance cannot be inserted in bulk
+        bulk = not model._meta.parents
+
+        created = []
+
+        for obj in batch:
+            if obj.deferred_fields:
+                self.deferred.append(obj)
+
+            if bulk and obj.object.pk not in existing:
+                created.append(obj)
+            else:
+                obj.save()
+
+        if created:
+            self.insert_raw(model, [obj.object for obj in created])
+
+            # Insert the many-to-many relationships for the new records
+            for field in model._meta.many_to_many:
+                through = field.remote_field.through
+
+                if not through._meta.auto_created:
+                    continue
+
+                source = field.m2m_field_name()
+                target = field.m2m_reverse_field_name()
+
+                rows = [
+                    through(**{f'{source}_id': obj.object.pk, f'{target}_id': value})
+                    for obj in created
+                    for value in obj.m2m_data.get(field.name, [])
+                ]
+
+                through._base_manager.bulk_create(rows)
+
+        return len(batch)
+
+    def insert_raw(self, model, objects):
+        """Insert the provided model instances, without any pre-save processing of field values.
+
+        Unlike bulk_create, field values are not updated before they are inserted
+        (e.g. the exported values of auto_now_add fields are not replaced with the current time).
+        """
+        connection = connections[model._base_manager.db]
+        fields = model._meta.local_concrete_fields
+        batch_size = max(1, connection.ops.bulk_batch_size(fields, objects))
+
+        for idx in range(0, len(objects), batch_size):
+            model._base_manager._insert(
+                objects[idx : idx + batch_size], fields=fields, raw=True
+            )
+
+    def check_integrity(self, entries):
+        """Compare the number of rows in the database against the manifest.
+
+        Raises:
+            CommandError: If any model has fewer rows than were exported
+        """
+        errors = []
+
+        for model, entry in entries:
+            count = model._base_manager.count()
+
+            if count < entry['count']:
+                errors.append(
+                    f'{entry["model"]}: expected {entry["count"]} rows, found {count}'
+                )
+            elif count > entry['count']:
+                logger.info(
+                    '%s: %s rows were already present in the database',
+                    entry['model'],
+                    count - entry['count'],
+                )
+
+        if errors:
+            raise CommandError('Integrity check failed:\n' + '\n'.join(errors))
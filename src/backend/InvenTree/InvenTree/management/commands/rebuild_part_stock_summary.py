@@ -0,0 +1,37 @@
+"""Custom management command to rebuild the part stock summary table.
+
+- Required after enabling the stock summary table for the first time
+- May be required after importing a new dataset
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+logger = logging.getLogger('inventree')
+
+
+class Command(BaseCommand):
+    """Rebuild the stock summary table for all parts."""
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of parts to rebuild at once',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Rebuild the part stock summary table."""
+        import part.summary
+
+        if not part.summary.stock_summary_enabled():
+            logger.warning(
+                'Part stock summary is not enabled (INVENTREE_PART_STOCK_SUMMARY)'
+            )
+
+        part.summary.rebuild_stock_summary(chunk_size=kwargs['chunk_size'])
+
+        logger.info('Part stock summary rebuilt')
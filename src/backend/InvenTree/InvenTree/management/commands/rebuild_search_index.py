@@ -0,0 +1,35 @@
+"""Custom management command to rebuild the search index.
+
+- Required after enabling the search index for the first time
+- May be required after importing a new dataset
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+logger = logging.getLogger('inventree')
+
+
+class Command(BaseCommand):
+    """Rebuild the search index for all indexed models."""
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of documents to rebuild at once',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Rebuild the search index."""
+        import common.search
+
+        if not common.search.search_index_enabled():
+            logger.warning('Search index is not enabled (INVENTREE_SEARCH_INDEX)')
+
+        common.search.rebuild_search_index(chunk_size=kwargs['chunk_size'])
+
+        logger.info('Search index rebuilt')
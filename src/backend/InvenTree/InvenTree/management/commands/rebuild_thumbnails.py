@@ -1,69 +1,242 @@
 """Custom management command to rebuild thumbnail images.
 
 - May be required after importing a new dataset, for example
+- May be required after restoring a backup of the media directory
+
+A manifest of the processed images (and the size / modification time of each source image)
+is stored in the media directory, so that subsequent runs only render the variations
+for images which have changed, or for which variations are missing.
 """
 
+import json
 import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
 
+from django.conf import settings
+from django.core.files.storage import default_storage
 from django.core.management.base import BaseCommand
+from django.db import connections
 from django.db.utils import OperationalError, ProgrammingError
 
 from PIL import UnidentifiedImageError
-
-from company.models import Company
-from part.models import Part
+from stdimage.models import StdImageFieldFile
 
 logger = logging.getLogger('inventree')
 
+# Name of the manifest file (in the media directory)
+MANIFEST_FILE = '.thumbnails.json'
 
-class Command(BaseCommand):
-    """Rebuild all thumbnail images."""
 
-    def rebuild_thumbnail(self, model):
-        """Rebuild the thumbnail specified by the "image" field of the provided model."""
-        if not model.image:
-            return
+def process_image(
+    name: str, variations: dict, previous: Optional[dict] = None, force: bool = False
+) -> tuple[str, str, Optional[dict]]:
+    """Render the variations for a single image file.
+
+    This function only accesses the file storage (not the database),
+    so that it can be run in a separate worker process.
+
+    Arguments:
+        name: Name of the image file (within the file storage)
+        variations: The variations to render for this image
+        previous: The manifest entry for this image from a previous run (if available)
+        force: If True, all variations are rendered (and replaced)
+
+    Returns:
+        A tuple of (name, result, manifest entry), where result is one of:
+        - 'rendered': One or more variations were rendered
+        - 'skipped': The image is unchanged, and all variations exist
+        - 'missing': The image file does not exist
+        - 'invalid': The image file is not a valid image
+    """
+    try:
+        stat = os.stat(default_storage.path(name))
+    except FileNotFoundError:
+        logger.warning("Warning: Image file '%s' is missing", name)
+        return name, 'missing', None
+
+    entry = {'size': stat.st_size, 'mtime': stat.st_mtime}
+
+    # Replace existing variations if the source image has changed since the last run
+    replace = force or (previous is not None and previous != entry)
+
+    pending = [
+        variation
+        for variation in variations.values()
+        if replace
+        or not default_storage.exists(
+            StdImageFieldFile.get_variation_name(name, variation['name'])
+        )
+    ]
 
-        img = model.image
+    if not pending:
+        return name, 'skipped', entry
 
-        # Check for image paths
-        img_paths = []
+    logger.info("Generating thumbnail image for '%s'", name)
 
-        for x in [model.image, model.image.thumbnail, model.image.preview]:
-            if x and x.path:
-                img_paths.append(x.path)
+    try:
+        for variation in pending:
+            StdImageFieldFile.render_variation(
+                name, variation, replace=replace, storage=default_storage
+            )
+    except FileNotFoundError:
+        logger.warning("Warning: Image file '%s' is missing", name)
+        return name, 'missing', None
+    except UnidentifiedImageError:
+        logger.warning("Warning: Image file '%s' is not a valid image", name)
+        return name, 'invalid', None
 
-        if len(img_paths) > 0:
-            if all((os.path.exists(path) for path in img_paths)):
-                # All images exist - skip further work
-                return
+    return name, 'rendered', entry
 
-        logger.info("Generating thumbnail image for '%s'", img)
 
+def process_image_args(args):
+    """Wrapper for process_image, for use with executor.map."""
+    return process_image(*args)
+
+
+class Command(BaseCommand):
+    """Rebuild all thumbnail images."""
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of worker processes used to render images',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of images to process at once',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Render (and replace) all variations, ignoring the manifest',
+        )
+
+    def get_manifest_path(self) -> Path:
+        """Return the path to the thumbnail manifest file."""
+        return Path(settings.MEDIA_ROOT).joinpath(MANIFEST_FILE)
+
+    def load_manifest(self) -> dict:
+        """Load the manifest of previously processed images."""
         try:
-            model.image.render_variations(replace=False)
+            with open(self.get_manifest_path(), encoding='utf-8') as f:
+                manifest = json.load(f)
         except FileNotFoundError:
-            logger.warning("Warning: Image file '%s' is missing", img)
-        except UnidentifiedImageError:
-            logger.warning("Warning: Image file '%s' is not a valid image", img)
+            return {}
+        except (OSError, ValueError):
+            logger.warning('Thumbnail manifest is invalid - ignoring')
+            return {}
+
+        return manifest if isinstance(manifest, dict) else {}
+
+    def save_manifest(self, manifest: dict):
+        """Save the manifest of processed images."""
+        path = self.get_manifest_path()
+        tmp = path.with_suffix('.tmp')
+
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+
+            os.replace(tmp, path)
+        except OSError:
+            logger.warning("Could not write thumbnail manifest '%s'", path)
+
+    def get_images(self, chunk_size: int):
+        """Yield (name, variations) for each distinct image file referenced in the database."""
+        from company.models import Company
+        from part.models import Part
+
+        for model in [Part, Company]:
+            logger.info('Rebuilding %s thumbnails', model.__name__)
+
+            variations = model._meta.get_field('image').variations
+
+            images = (
+                model.objects.exclude(image=None)
+                .exclude(image='')
+                .order_by('image')
+                .values_list('image', flat=True)
+                .distinct()
+            )
+
+            for name in images.iterator(chunk_size=chunk_size):
+                yield name, variations
 
     def handle(self, *args, **kwargs):
         """Rebuild all thumbnail images."""
-        logger.info('Rebuilding Part thumbnails')
-
-        for part in Part.objects.exclude(image=None):
-            try:
-                self.rebuild_thumbnail(part)
-            except (OperationalError, ProgrammingError):
-                logger.exception('ERROR: Database read error.')
-                break
-
-        logger.info('Rebuilding Company thumbnails')
-
-        for company in Company.objects.exclude(image=None):
-            try:
-                self.rebuild_thumbnail(company)
-            except (OperationalError, ProgrammingError):
-                logger.exception('ERROR: abase read error.')
-                break
+        workers = max(1, kwargs['workers'])
+        chunk_size = max(1, kwargs['chunk_size'])
+        force = kwargs['force']
+
+        previous = {} if force else self.load_manifest()
+        manifest = {}
+        results = {'rendered': 0, 'skipped': 0, 'missing': 0, 'invalid': 0}
+
+        executor = None
+
+        if workers > 1:
+            # Worker processes do not access the database, but must not share the open connections
+            connections.close_all()
+            executor = ProcessPoolExecutor(max_workers=workers)
+
+        chunk = []
+        processed = 0
+
+        def process_chunk():
+            nonlocal processed
+
+            tasks = [
+                (name, variations, previous.get(name), force)
+                for name, variations in chunk
+            ]
+
+            if executor:
+                output = executor.map(process_image_args, tasks)
+            else:
+                output = map(process_image_args, tasks)
+
+            for name, result, entry in output:
+                results[result] += 1
+
+                if entry is not None:
+                    manifest[name] = entry
+
+            processed += len(chunk)
+            chunk.clear()
+
+            logger.info('Processed %s images', processed)
+
+        try:
+            for image in self.get_images(chunk_size):
+                chunk.append(image)
+
+                if len(chunk) >= chunk_size:
+                    process_chunk()
+
+            if chunk:
+                process_chunk()
+        except (OperationalError, ProgrammingError):
+            logger.exception('ERROR: Database read error.')
+            return
+        finally:
+            if executor:
+                executor.shutdown()
+
+        self.save_manifest(manifest)
+
+        logger.info(
+            'Thumbnails rebuilt: %s images (%s rendered, %s unchanged, %s missing, %s invalid)',
+            processed,
+            results['rendered'],
+            results['skipped'],
+            results['missing'],
+            results['invalid'],
+        )
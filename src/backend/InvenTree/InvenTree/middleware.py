@@ -11,9 +11,10 @@ from django.urls import Resolver404, include, path, resolve, reverse_lazy
 
 from allauth_2fa.middleware import AllauthTwoFactorMiddleware, BaseRequire2FAMiddleware
 from error_report.middleware import ExceptionProcessor
+from rest_framework.exceptions import AuthenticationFailed
 
 from InvenTree.urls import frontendpatterns
-from users.models import ApiToken
+from users.authentication import authenticate_api_token
 
 logger = logging.getLogger('inventree')
 
@@ -47,14 +48,13 @@ class AuthRequiredMiddleware(object):
         if token := get_token_from_request(request):
             # Does the provided token match a valid user?
             try:
-                token = ApiToken.objects.get(key=token)
-
-                if token.active and token.user:
-                    # Provide the user information to the request
-                    request.user = token.user
-                    return True
-            except ApiToken.DoesNotExist:
-                logger.warning('Access denied for unknown token %s', token)
+                user, _token = authenticate_api_token(token, request)
+
+                # Provide the user information to the request
+                request.user = user
+                return True
+            except AuthenticationFailed:
+                logger.warning('Access denied for invalid token %s', token)
 
         return False
 
@@ -113,6 +113,29 @@ class CleanMixin:
         return clean_data
 
 
+class SparseFieldsMixin:
+    """Mixin for list API endpoints which support sparse fieldsets.
+
+    If the 'fields' (or 'omit') query parameter is provided, only the selected fields are serialized,
+    and any queryset annotations or prefetches which are not required by those fields are discarded.
+    """
+
+    # Serializers only apply the 'fields' and 'omit' query parameters for views which set this flag
+    sparse_fields = True
+
+    def filter_queryset(self, queryset):
+        """Remove unused annotations and prefetches from the filtered queryset."""
+        queryset = super().filter_queryset(queryset)
+
+        if self.request.method == 'GET' and 'export' not in self.request.query_params:
+            serializer = self.get_serializer()
+
+            if hasattr(serializer, 'prune_queryset'):
+                queryset = serializer.prune_queryset(queryset)
+
+        return queryset
+
+
 class ListAPI(generics.ListAPIView):
     """View for list API."""
 
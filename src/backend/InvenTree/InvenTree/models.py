@@ -11,6 +11,7 @@ from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Max
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.urls import reverse
@@ -85,13 +86,20 @@ class PluginValidationMixin(DiffMixin):
     Any model class which inherits from this mixin will be exposed to the plugin validation system.
     """
 
-    def run_plugin_validation(self):
-        """Throw this model against the plugin validation interface."""
+    def run_plugin_validation(self, plugins=None):
+        """Throw this model against the plugin validation interface.
+
+        Arguments:
+            plugins: List of active validation plugins (looked up from the registry if not provided)
+        """
         from plugin.registry import registry
 
         deltas = self.get_field_deltas()
 
-        for plugin in registry.with_mixin('validation'):
+        if plugins is None:
+            plugins = registry.with_mixin('validation')
+
+        for plugin in plugins:
             try:
                 if plugin.validate_model_instance(self, deltas=deltas) is True:
                     return
@@ -318,39 +326,54 @@ class ReferenceIndexingMixin(models.Model):
             return query.first()
         return None
 
+    @classmethod
+    def get_reference_sequence_key(cls) -> str:
+        """Return the name of the Sequence which is used to allocate reference values for this class."""
+        return f'reference:{cls._meta.label_lower}'
+
+    @classmethod
+    def get_latest_reference_int(cls) -> int:
+        """Return the highest 'reference_int' value in use for this class."""
+        return cls.objects.aggregate(latest=Max('reference_int'))['latest'] or 0
+
     @classmethod
     def get_next_reference(cls):
-        """Return the next available reference value for this particular class."""
-        # Find the "most recent" item
-        latest = cls.get_most_recent_item()
+        """Return the next available reference value for this particular class.
 
-        if not latest:
-            # No existing items
-            return 1
+        Note: The returned value is not reserved (refer to allocate_next_reference)
+        """
+        from common.models import Sequence
 
-        reference = latest.reference.strip
+        allocated = (
+            Sequence.objects.filter(key=cls.get_reference_sequence_key())
+            .values_list('value', flat=True)
+            .first()
+        )
 
-        try:
-            reference = InvenTree.format.extract_named_group(
-                'ref', reference, cls.get_reference_pattern()
-            )
-        except Exception:
-            # If reference cannot be extracted using the pattern, try just the integer value
-            reference = str(latest.reference_int)
+        return max(cls.get_latest_reference_int(), allocated or 0) + 1
 
-        # Attempt to perform 'intelligent' incrementing of the reference field
-        incremented = InvenTree.helpers.increment(reference)
+    @classmethod
+    def allocate_next_reference(cls) -> int:
+        """Allocate the next reference value for this particular class.
 
-        try:
-            incremented = int(incremented)
-        except ValueError:
-            pass
+        The value is allocated from a database sequence (above any reference value already in use),
+        so concurrent callers are never allocated the same value.
+        """
+        from common.models import Sequence
 
-        return incremented
+        return Sequence.allocate(
+            cls.get_reference_sequence_key(), minimum=cls.get_latest_reference_int()
+        )
 
     @classmethod
-    def generate_reference(cls):
-        """Generate the next 'reference' field based on specified pattern."""
+    def generate_reference(cls, allocate: bool = True):
+        """Generate the next 'reference' field based on specified pattern.
+
+        Arguments:
+            allocate: If True, the 'ref' value is allocated from the reference sequence.
+                      If False, the next available value is returned (but not reserved),
+                      e.g. for displaying a default value to the user
+        """
         fmt = cls.get_reference_pattern()
         ctx = cls.get_reference_context()
 
@@ -359,6 +382,11 @@ class ReferenceIndexingMixin(models.Model):
         attempts = set()
 
         while reference is None:
+            if allocate:
+                # Note: Database errors are not suppressed here,
+                # otherwise the fallback value below would be a duplicate reference
+                ctx['ref'] = cls.allocate_next_reference()
+
             try:
                 ref = fmt.format(**ctx)
 
@@ -463,7 +491,7 @@ class ReferenceIndexingMixin(models.Model):
 
         return reference_int
 
-    reference_int = models.BigIntegerField(default=0)
+    reference_int = models.BigIntegerField(default=0, db_index=True)
 
 
 class InvenTreeModel(PluginValidationMixin, models.Model):
@@ -0,0 +1,381 @@
+"""Custom pagination classes for the InvenTree API.
+
+The default LimitOffsetPagination class requires a COUNT query for every page,
+and large 'offset' values require the database to scan (and discard) all preceding rows.
+
+For large list endpoints, the InvenTreePagination class provides some additional options:
+
+- Keyset ("cursor") pagination, enabled by providing the 'cursor' query parameter
+- Skipping (or approximating) the total count, via the 'count' query parameter
+"""
+
+import base64
+import json
+
+from django.db import connections
+from django.db.models import F, Q
+from django.db.models.expressions import OrderBy
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class InvenTreePagination(LimitOffsetPagination):
+    """Pagination class which supports limit/offset and keyset (cursor) pagination.
+
+    Limit / Offset pagination (default):
+    - e.g. '?limit=100&offset=500'
+
+    Keyset pagination:
+    - Enabled by providing the 'cursor' query parameter (an empty value returns the first page)
+    - e.g. '?limit=100&cursor=' followed by '?limit=100&cursor=<next>'
+    - Each page is selected based on the (ordering fields, pk) values of the last row of the previous page
+    - The 'next' link contains the cursor for the following page
+    - Compatible with the InvenTreeOrderingFilter (the cursor is only valid for the same ordering)
+
+    Count:
+    - '?count=false' skips the COUNT query (the returned count is null)
+    - '?count=approximate' returns an estimate of the total count (where supported by the database)
+    """
+
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+
+    # Default page size for keyset pagination (if no limit is provided)
+    cursor_default_limit = 100
+
+    # Prefix for the annotations which are used to order the queryset in keyset mode
+    cursor_prefix = '_cursor_'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Paginate the queryset, based on the provided query parameters."""
+        self.request = request
+        self.count_mode = self.get_count_mode(request)
+
+        if self.cursor_query_param in request.query_params:
+            return self.paginate_cursor(queryset, request)
+
+        if self.count_mode == 'exact':
+            return super().paginate_queryset(queryset, request, view=view)
+
+        self.limit = self.get_limit(request)
+
+        if self.limit is None:
+            return None
+
+        self.offset = self.get_offset(request)
+
+        # Fetch an extra row, to determine whether there is another page of results
+        results = list(queryset[self.offset : self.offset + self.limit + 1])
+
+        self.has_next = len(results) > self.limit
+        self.count = self.get_approximate_count(queryset)
+
+        return results[: self.limit]
+
+    def get_count_mode(self, request) -> str:
+        """Return the requested count mode: 'exact', 'approximate' or 'none'."""
+        value = str(request.query_params.get(self.count_query_param, 'exact'))
+        value = value.strip().lower()
+
+        if value in ['false', 'none', '0', 'no']:
+            return 'none'
+
+        if value in ['approximate', 'estimate', 'approx']:
+            return 'approximate'
+
+        return 'exact'
+
+    def get_approximate_count(self, queryset):
+        """Return the total count, according to the requested count mode.
+
+        - 'none': No count is performed
+        - 'approximate': The query planner estimate is used (PostgreSQL only)
+        - 'exact': A COUNT query is performed
+        """
+        if self.count_mode == 'none':
+            return None
+
+        if self.count_mode == 'approximate':
+            estimate = estimate_count(queryset)
+
+            if estimate is not None:
+                return estimate
+
+        return self.get_count(queryset)
+
+    def get_next_link(self):
+        """Return the link to the next page of results."""
+        if self.cursor_query_param in self.request.query_params:
+            if self.next_cursor is None:
+                return None
+
+            url = self.request.build_absolute_uri()
+            url = replace_query_param(url, self.limit_query_param, self.limit)
+            return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+        if self.count_mode == 'exact':
+            return super().get_next_link()
+
+        if not self.has_next:
+            return None
+
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(
+            url, self.offset_query_param, self.offset + self.limit
+        )
+
+    def get_previous_link(self):
+        """Return the link to the previous page of results.
+
+        Keyset pagination only supports forward iteration.
+        """
+        if self.cursor_query_param in self.request.query_params:
+            return None
+
+        return super().get_previous_link()
+
+    def get_paginated_response(self, data):
+        """Return the paginated response data."""
+        return Response({
+            'count': self.count,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_html_context(self):
+        """Page controls are only available for limit/offset pagination with an exact count."""
+        if self.cursor_query_param in self.request.query_params:
+            return {'previous_url': None, 'next_url': self.get_next_link()}
+
+        if self.count_mode != 'exact':
+            return {
+                'previous_url': self.get_previous_link(),
+                'next_url': self.get_next_link(),
+            }
+
+        return super().get_html_context()
+
+    def get_schema_operation_parameters(self, view):
+        """Return the schema parameters for this pagination class."""
+        parameters = super().get_schema_operation_parameters(view)
+
+        parameters.extend([
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': str(
+                    _('Cursor for keyset pagination (empty for the first page)')
+                ),
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.count_query_param,
+                'required': False,
+                'in': 'query',
+                'description': str(_('Total count mode (exact, approximate or false)')),
+                'schema': {'type': 'string'},
+            },
+        ])
+
+        return parameters
+
+    def get_ordering(self, queryset) -> list:
+        """Return the ordering of the provided queryset, as a list of (field, descending) tuples.
+
+        The primary key is appended to ensure a stable (unique) ordering.
+
+        Raises:
+            ValidationError: If the queryset ordering cannot be used for keyset pagination
+        """
+        query = queryset.query
+
+        if query.order_by:
+            ordering = query.order_by
+        elif query.default_ordering:
+            ordering = query.get_meta().ordering or []
+        else:
+            ordering = []
+
+        result = []
+
+        for item in ordering:
+            if isinstance(item, str):
+                if item == '?':
+                    ordering_error()
+
+                descending = item.startswith('-')
+                field = item.lstrip('-+')
+            elif isinstance(item, OrderBy) and isinstance(item.expression, F):
+                descending = item.descending
+                field = item.expression.name
+            elif isinstance(item, F):
+                descending = False
+                field = item.name
+            else:
+                ordering_error()
+
+            if field in ['pk', 'id']:
+                result.append(('pk', descending))
+                break
+
+            result.append((field, descending))
+        else:
+            result.append(('pk', False))
+
+        return result
+
+    def paginate_cursor(self, queryset, request):
+        """Paginate the queryset using keyset (cursor) pagination.
+
+        The queryset is annotated with the values of each ordering field,
+        and then filtered to the rows which appear *after* the provided cursor.
+        Null values are always ordered last.
+        """
+        self.limit = self.get_limit(request) or self.cursor_default_limit
+        self.next_cursor = None
+
+        ordering = self.get_ordering(queryset)
+        signature = [
+            f'{"-" if descending else ""}{field}' for field, descending in ordering
+        ]
+
+        annotations = {}
+        order_by = []
+
+        for idx, (field, descending) in enumerate(ordering):
+            name = f'{self.cursor_prefix}{idx}'
+            annotations[name] = F(field)
+
+            if descending:
+                order_by.append(F(name).desc(nulls_last=True))
+            else:
+                order_by.append(F(name).asc(nulls_last=True))
+
+        queryset = queryset.annotate(**annotations).order_by(*order_by)
+
+        self.count = self.get_approximate_count(queryset)
+
+        if cursor := request.query_params.get(self.cursor_query_param):
+            position = self.decode_cursor(cursor, signature)
+            queryset = queryset.filter(self.get_cursor_filter(ordering, position))
+
+        results = list(queryset[: self.limit + 1])
+
+        if len(results) > self.limit:
+            results = results[: self.limit]
+            last = results[-1]
+
+            if isinstance(last, dict):
+                values = [last[name] for name in annotations]
+            else:
+                values = [getattr(last, name) for name in annotations]
+
+            self.next_cursor = self.encode_cursor(signature, values)
+
+        return results
+
+    def get_cursor_filter(self, ordering, position) -> Q:
+        """Construct a filter which selects the rows after the provided position.
+
+        For ordering fields (f1, f2, ... fn) and position values (v1, v2, ... vn),
+        a row appears after the position if, for some i:
+        - f1 = v1, ..., f(i-1) = v(i-1)
+        - fi appears after vi (in the specified ordering, with null values last)
+        """
+        query = None
+        equal = Q()
+
+        for idx, ((_field, descending), value) in enumerate(zip(ordering, position)):
+            name = f'{self.cursor_prefix}{idx}'
+
+            if value is None:
+                # Null values are ordered last, so only subsequent fields can differ
+                equal &= Q(**{f'{name}__isnull': True})
+                continue
+
+            lookup = 'lt' if descending else 'gt'
+
+            after = equal & (
+                Q(**{f'{name}__{lookup}': value}) | Q(**{f'{name}__isnull': True})
+            )
+
+            query = after if query is None else query | after
+            equal &= Q(**{name: value})
+
+        return query
+
+    def encode_cursor(self, signature, values) -> str:
+        """Encode the position of a row (and the ordering used) as a cursor string."""
+        data = json.dumps({'o': signature, 'p': values}, default=encode_cursor_value)
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    def decode_cursor(self, cursor: str, signature) -> list:
+        """Decode the provided cursor string, and return the position values.
+
+        Raises:
+            ValidationError: If the cursor is invalid, or does not match the requested ordering
+        """
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+            position = data['p']
+            valid = data['o'] == signature and len(position) == len(signature)
+        except Exception:
+            valid = False
+
+        if not valid:
+            raise ValidationError({self.cursor_query_param: _('Invalid cursor')})
+
+        return position
+
+
+def encode_cursor_value(value):
+    """Encode a (non-JSON) ordering value for inclusion in a cursor.
+
+    Dates and times are encoded at full precision, so that the row is matched exactly.
+    """
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+
+    return str(value)
+
+
+def ordering_error():
+    """Raise an error for an ordering which is not supported by keyset pagination."""
+    raise ValidationError({
+        'cursor': _('Cursor pagination is not supported for the requested ordering')
+    })
+
+
+def estimate_count(queryset):
+    """Return the estimated number of rows for the provided queryset.
+
+    The estimate is provided by the query planner, which avoids a (potentially expensive) COUNT query.
+
+    Returns:
+        The estimated count, or None if an estimate is not available
+    """
+    connection = connections[queryset.db]
+
+    if connection.vendor != 'postgresql':
+        return None
+
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return int(plan[0]['Plan']['Plan Rows'])
+    except Exception:
+        return None
@@ -11,7 +11,18 @@ def isInTestMode():
 
 def isImportingData():
     """Returns True if the database is currently importing (or exporting) data, e.g. 'loaddata' command is performed."""
-    return any((x in sys.argv for x in ['flush', 'loaddata', 'dumpdata']))
+    return any(
+        (
+            x in sys.argv
+            for x in [
+                'flush',
+                'loaddata',
+                'dumpdata',
+                'import_records',
+                'export_records',
+            ]
+        )
+    )
 
 
 def isRunningMigrations():
@@ -288,6 +288,162 @@ class InvenTreeModelSerializer(serializers.ModelSerializer):
         """
         return []
 
+    # Query parameters which select (or exclude) fields from the serialized output
+    SPARSE_FIELDS_PARAM = 'fields'
+    SPARSE_OMIT_PARAM = 'omit'
+
+    def get_sparse_fieldset(self):
+        """Return the set of field names selected via the 'fields' and 'omit' query parameters.
+
+        - Only applies to GET requests, for the top-level serializer
+        - Only applies to API views which support sparse fieldsets (see SparseFieldsMixin)
+        - The 'pk' field is always included
+
+        Returns:
+            A set of selected field names, or None if all fields are selected
+        """
+        if hasattr(self, '_sparse_fieldset'):
+            return self._sparse_fieldset
+
+        self._sparse_fieldset = None
+
+        parent = self.parent
+
+        # Sparse fields do not apply to nested serializers
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+
+        request = self.context.get('request', None)
+
+        if parent is not None or request is None or request.method != 'GET':
+            return None
+
+        view = self.context.get('view', None)
+
+        if not getattr(view, 'sparse_fields', False):
+            return None
+
+        def get_names(param):
+            names = set()
+
+            for value in request.query_params.getlist(param, []):
+                names.update(name.strip() for name in value.split(',') if name.strip())
+
+            return names
+
+        include = get_names(self.SPARSE_FIELDS_PARAM)
+        omit = get_names(self.SPARSE_OMIT_PARAM)
+
+        if include or omit:
+            selected = set(include or self.fields.keys()) - omit
+            selected.add('pk')
+
+            self._sparse_fieldset = selected
+
+        return self._sparse_fieldset
+
+    @property
+    def _readable_fields(self):
+        """Return the readable fields, excluding any which are not selected (see get_sparse_fieldset)."""
+        selected = self.get_sparse_fieldset()
+
+        for field in super()._readable_fields:
+            if selected is None or field.field_name in selected:
+                yield field
+
+    def get_source_paths(self, fields=None):
+        """Return the model attribute paths which are required to serialize the provided fields.
+
+        Arguments:
+            fields: The names of the fields to be serialized (defaults to all readable fields)
+
+        Returns:
+            A list of paths (each path is a list of attribute names),
+            or None if the attributes required by a field cannot be determined
+        """
+        paths = []
+
+        for field in self.fields.values():
+            if field.write_only or (
+                fields is not None and field.field_name not in fields
+            ):
+                continue
+
+            if field.source == '*':
+                # Field depends on the entire instance (e.g. SerializerMethodField)
+                return None
+
+            source = list(field.source_attrs)
+            nested = (
+                field.child if isinstance(field, serializers.ListSerializer) else field
+            )
+
+            if isinstance(nested, InvenTreeModelSerializer):
+                nested_paths = nested.get_source_paths()
+
+                if nested_paths is None:
+                    return None
+
+                paths.append(source)
+                paths.extend(source + path for path in nested_paths)
+            elif isinstance(nested, serializers.RelatedField) and (
+                nested.use_pk_only_optimization()
+            ):
+                # Only the primary key value of the related object is required
+                paths.append(source[:-1])
+            else:
+                paths.append(source)
+
+        return [path for path in paths if path]
+
+    def prune_queryset(self, queryset):
+        """Remove annotations and prefetches which are not required by the selected fields.
+
+        Annotations are removed from the SELECT clause (but may still be used for filtering and ordering),
+        and any prefetch lookups which are not required are discarded.
+
+        Returns:
+            The pruned queryset (unchanged if no sparse fieldset is requested)
+        """
+        selected = self.get_sparse_fieldset()
+
+        if selected is None:
+            return queryset
+
+        paths = self.get_source_paths(selected)
+
+        if paths is None:
+            return queryset
+
+        required = {
+            '__'.join(path[:idx]) for path in paths for idx in range(1, len(path) + 1)
+        }
+
+        # Annotations which are referenced by the ordering must be retained
+        ordering = {
+            str(item).lstrip('-')
+            for item in queryset.query.order_by
+            if isinstance(item, str)
+        }
+
+        queryset = queryset.all()
+
+        annotations = [
+            name
+            for name in queryset.query.annotations
+            if name in required or name in ordering
+        ]
+
+        queryset.query.set_annotation_mask(annotations)
+
+        lookups = [
+            lookup
+            for lookup in queryset._prefetch_related_lookups
+            if getattr(lookup, 'prefetch_to', lookup) in required
+        ]
+
+        return queryset.prefetch_related(None).prefetch_related(*lookups)
+
     def save(self, **kwargs):
         """Catch any django ValidationError thrown at the moment `save` is called, and re-throw as a DRF ValidationError."""
         try:
@@ -774,16 +930,29 @@ class DataFileExtractSerializer(serializers.Serializer):
 
         rows = []
 
-        for row in self.rows:
+        row_dicts = [self.row_to_dict(row) for row in self.rows]
+
+        # Allow the implementing class to perform any set-based lookups up front
+        self.prepare_rows(row_dicts)
+
+        for row, row_dict in zip(self.rows, row_dicts):
             """Optionally pre-process each row, before sending back to the client."""
 
-            processed_row = self.process_row(self.row_to_dict(row))
+            processed_row = self.process_row(row_dict)
 
             if processed_row:
                 rows.append({'original': row, 'data': processed_row})
 
         return {'fields': model_fields, 'columns': self.columns, 'rows': rows}
 
+    def prepare_rows(self, rows):
+        """Prepare the complete set of rows before each row is processed.
+
+        Implementing classes can override this to resolve related data for all
+        rows at once, rather than performing separate lookups for each row.
+        """
+        pass
+
     def process_row(self, row):
         """Process a 'row' of data, which is a mapped column:value dict.
 
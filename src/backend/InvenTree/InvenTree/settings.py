@@ -492,6 +492,30 @@ if DEBUG:
         'rest_framework.renderers.BrowsableAPIRenderer'
     )
 
+# Maximum number of concurrent queries performed by the global search API endpoint
+SEARCH_WORKERS = int(get_setting('INVENTREE_SEARCH_WORKERS', 'search.workers', 4))
+
+# Use the search index for API search queries (see common.search)
+SEARCH_INDEX_ENABLED = get_boolean_setting(
+    'INVENTREE_SEARCH_INDEX', 'search.index', False
+)
+
+# Read part stock quantities from the stock summary table (see part.summary)
+PART_STOCK_SUMMARY_ENABLED = get_boolean_setting(
+    'INVENTREE_PART_STOCK_SUMMARY', 'part_stock_summary', False
+)
+
+# Retention cleanup of old records by the background worker (see InvenTree.tasks.delete_old_records)
+CLEANUP_BATCH_SIZE = int(
+    get_setting('INVENTREE_CLEANUP_BATCH_SIZE', 'cleanup.batch_size', 1000)
+)
+CLEANUP_BATCH_DELAY = float(
+    get_setting('INVENTREE_CLEANUP_BATCH_DELAY', 'cleanup.batch_delay', 0.1)
+)
+CLEANUP_TIME_LIMIT = int(
+    get_setting('INVENTREE_CLEANUP_TIME_LIMIT', 'cleanup.time_limit', 60)
+)
+
 # JWT switch
 USE_JWT = get_boolean_setting('INVENTREE_USE_JWT', 'use_jwt', False)
 REST_USE_JWT = USE_JWT
@@ -374,6 +374,112 @@ def heartbeat():
             task.delete()
 
 
+def bulk_delete_progress_key(job: str) -> str:
+    """Return the key used to report bulk deletion progress."""
+    return f'bulk_delete_{job}'
+
+
+def bulk_delete(
+    model_label: str, pks: list, job: str, user_id: int = None, chunk_size: int = 500
+):
+    """Delete the specified items in the background (refer to InvenTree.api.BulkDeleteMixin).
+
+    Arguments:
+        model_label: The label of the model (e.g. 'stock.stockitemtestresult')
+        pks: List of primary key values to delete
+        job: Unique identifier for this deletion, used to report progress
+        user_id: The ID of the user who requested the deletion
+        chunk_size: Number of items deleted in each transaction
+
+    Progress is reported via the TaskProgress record for bulk_delete_progress_key.
+    If the deletion fails, the task is reported as finished with the error message
+    (and the number of items deleted so far), and the error is re-raised.
+    """
+    from django.apps import apps
+
+    from common.models import TaskProgress
+    from InvenTree.helpers_model import delete_in_chunks, pk_chunks
+
+    key = bulk_delete_progress_key(job)
+    model = apps.get_model(model_label)
+    total = len(pks)
+
+    def progress(deleted):
+        TaskProgress.set_progress(key, total, deleted, user_id=user_id)
+
+    progress(0)
+
+    try:
+        deleted = delete_in_chunks(model, pk_chunks(pks, chunk_size), progress=progress)
+    except Exception as exc:
+        # Report the failure, so that clients stop waiting for the deletion
+        TaskProgress.set_failed(key, exc)
+        raise
+
+    logger.info('Deleted %s %s items', deleted, model_label)
+
+    TaskProgress.set_progress(key, total, deleted, finished=True, user_id=user_id)
+
+
+def cleanup_deadline() -> float:
+    """Return the deadline for a retention cleanup task which starts *now*.
+
+    The deadline is a time.monotonic() value, CLEANUP_TIME_LIMIT seconds from now.
+    """
+    return time.monotonic() + settings.CLEANUP_TIME_LIMIT
+
+
+def delete_old_records(queryset, deadline: float) -> int:
+    """Delete the records in the provided queryset, in batches.
+
+    This is used by the retention cleanup tasks, so that a large number of old records
+    can be removed without holding database locks for an extended period:
+
+    - Records are deleted in batches of CLEANUP_BATCH_SIZE, each in a separate transaction
+    - The task pauses for CLEANUP_BATCH_DELAY seconds between batches
+    - No further batches are deleted once the deadline has passed
+      (the remaining records are deleted by the next run of the task)
+
+    Arguments:
+        queryset: The records to delete
+        deadline: time.monotonic() value after which no further batches are deleted (refer to cleanup_deadline)
+
+    Returns:
+        The number of deleted records
+    """
+    from InvenTree.helpers_model import delete_in_chunks, pk_chunks
+
+    label = queryset.model._meta.label_lower
+    finished = True
+
+    def batches():
+        nonlocal finished
+
+        for idx, chunk in enumerate(pk_chunks(queryset, settings.CLEANUP_BATCH_SIZE)):
+            # At least one batch is deleted per run, to ensure progress
+            if idx > 0:
+                if time.monotonic() >= deadline:
+                    finished = False
+                    return
+
+                time.sleep(settings.CLEANUP_BATCH_DELAY)
+
+            yield chunk
+
+    deleted = delete_in_chunks(queryset.model, batches())
+
+    if deleted > 0:
+        logger.info('Deleted %s old %s records', deleted, label)
+
+    if not finished:
+        logger.info(
+            "Time limit reached - remaining '%s' records will be deleted on the next run",
+            label,
+        )
+
+    return deleted
+
+
 @scheduled_task(ScheduledTask.DAILY)
 def delete_successful_tasks():
     """Delete successful task logs which are older than a specified period."""
@@ -388,9 +494,9 @@ def delete_successful_tasks():
         # Delete successful tasks
         results = Success.objects.filter(started__lte=threshold)
 
-        if results.count() > 0:
-            logger.info('Deleting %s successful task records', results.count())
-            results.delete()
+        deleted = delete_old_records(results, cleanup_deadline())
+
+        return {'django_q.success': deleted}
 
     except AppRegistryNotReady:  # pragma: no cover
         logger.info(
@@ -412,9 +518,9 @@ def delete_failed_tasks():
         # Delete failed tasks
         results = Failure.objects.filter(started__lte=threshold)
 
-        if results.count() > 0:
-            logger.info('Deleting %s failed task records', results.count())
-            results.delete()
+        deleted = delete_old_records(results, cleanup_deadline())
+
+        return {'django_q.failure': deleted}
 
     except AppRegistryNotReady:  # pragma: no cover
         logger.info("Could not perform 'delete_failed_tasks' - App registry not ready")
@@ -433,9 +539,9 @@ def delete_old_error_logs():
 
         errors = Error.objects.filter(when__lte=threshold)
 
-        if errors.count() > 0:
-            logger.info('Deleting %s old error logs', errors.count())
-            errors.delete()
+        deleted = delete_old_records(errors, cleanup_deadline())
+
+        return {'error_report.error': deleted}
 
     except AppRegistryNotReady:  # pragma: no cover
         # Apps not yet loaded
@@ -457,17 +563,16 @@ def delete_old_notifications():
         days = InvenTreeSetting.get_setting('INVENTREE_DELETE_NOTIFICATIONS_DAYS', 30)
         threshold = timezone.now() - timedelta(days=days)
 
-        items = NotificationEntry.objects.filter(updated__lte=threshold)
-
-        if items.count() > 0:
-            logger.info('Deleted %s old notification entries', items.count())
-            items.delete()
-
-        items = NotificationMessage.objects.filter(creation__lte=threshold)
+        deadline = cleanup_deadline()
 
-        if items.count() > 0:
-            logger.info('Deleted %s old notification messages', items.count())
-            items.delete()
+        return {
+            'common.notificationentry': delete_old_records(
+                NotificationEntry.objects.filter(updated__lte=threshold), deadline
+            ),
+            'common.notificationmessage': delete_old_records(
+                NotificationMessage.objects.filter(creation__lte=threshold), deadline
+            ),
+        }
 
     except AppRegistryNotReady:
         logger.info(
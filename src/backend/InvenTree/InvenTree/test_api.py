@@ -6,6 +6,7 @@ from django.urls import reverse
 
 from rest_framework import status
 
+from InvenTree.api import APISearchView
 from InvenTree.unit_test import InvenTreeAPITestCase, InvenTreeTestCase
 from users.models import RuleSet, update_group_roles
 
@@ -402,3 +403,62 @@ class SearchTests(InvenTreeAPITestCase):
                 self.assertEqual(
                     result['error'], 'User does not have permission to view this model'
                 )
+
+    def test_brief(self):
+        """Test the 'brief' search results."""
+        query = {
+            'search': 'chair',
+            'limit': 3,
+            'brief': True,
+            'part': {},
+            'stockitem': {},
+            'partcategory': {},
+        }
+
+        response = self.post(reverse('api-search'), query, expected_code=200)
+
+        # Brief results are paginated in the same manner as full results
+        full = self.post(
+            reverse('api-search'),
+            {'search': 'chair', 'limit': 3, 'part': {}},
+            expected_code=200,
+        )
+
+        self.assertEqual(response.data['part']['count'], full.data['part']['count'])
+        self.assertEqual(len(response.data['part']['results']), 3)
+
+        for result in response.data['part']['results']:
+            self.assertEqual(
+                set(result.keys()), {'pk', 'name', 'description', 'thumbnail'}
+            )
+            self.assertIn('chair', result['name'].lower())
+
+        for result in response.data['stockitem']['results']:
+            self.assertEqual(
+                set(result.keys()), {'pk', 'name', 'description', 'thumbnail'}
+            )
+
+        for result in response.data['partcategory']['results']:
+            self.assertEqual(set(result.keys()), {'pk', 'name', 'description'})
+
+        # Timing information is only provided in debug mode
+        self.assertNotIn('timings', response.data)
+
+        with self.settings(DEBUG=True):
+            response = self.post(reverse('api-search'), query, expected_code=200)
+
+        self.assertEqual(
+            set(response.data['timings'].keys()), {'part', 'stockitem', 'partcategory'}
+        )
+
+        # Brief results are available for all model types
+        query = {'search': 'a', 'limit': 2, 'brief': True}
+
+        for key in APISearchView.BRIEF_FIELDS.keys():
+            query[key] = {}
+
+        response = self.post(reverse('api-search'), query, expected_code=200)
+
+        for key in APISearchView.BRIEF_FIELDS.keys():
+            self.assertNotIn('error', response.data[key])
+            self.assertIn('count', response.data[key])
@@ -2,6 +2,7 @@
 
 import os
 from datetime import timedelta
+from unittest import mock
 
 from django.conf import settings
 from django.core.management import call_command
@@ -13,7 +14,7 @@ from django_q.models import Schedule
 from error_report.models import Error
 
 import InvenTree.tasks
-from common.models import InvenTreeSetting
+from common.models import InvenTreeSetting, TaskProgress
 
 threshold = timezone.now() - timedelta(days=30)
 threshold_low = threshold - timedelta(days=1)
@@ -119,6 +120,58 @@ class InvenTreeTaskTests(TestCase):
         errors = Error.objects.filter(when__lte=threshold)
         self.assertEqual(len(errors), 0)
 
+    def test_task_delete_old_records(self):
+        """Test that old records are deleted in batches, within the cleanup time limit."""
+        for _ in range(6):
+            Error.objects.create()
+
+        old = Error.objects.order_by('pk')[:5].values_list('pk', flat=True)
+        Error.objects.filter(pk__in=list(old)).update(when=threshold_low)
+
+        with self.settings(
+            CLEANUP_BATCH_SIZE=2, CLEANUP_BATCH_DELAY=0, CLEANUP_TIME_LIMIT=0
+        ):
+            # Time limit is exceeded immediately - only a single batch is deleted
+            with self.assertLogs('inventree', level='INFO') as cm:
+                result = InvenTree.tasks.delete_old_error_logs()
+
+            self.assertEqual(result, {'error_report.error': 2})
+            self.assertIn('Time limit reached', str(cm.output))
+            self.assertEqual(Error.objects.filter(when__lte=threshold).count(), 3)
+
+        with self.settings(CLEANUP_BATCH_SIZE=2, CLEANUP_BATCH_DELAY=0):
+            # The next run deletes the remaining records
+            result = InvenTree.tasks.delete_old_error_logs()
+            self.assertEqual(result, {'error_report.error': 3})
+
+        self.assertEqual(Error.objects.filter(when__lte=threshold).count(), 0)
+        self.assertEqual(Error.objects.count(), 1)
+
+    def test_task_bulk_delete_error(self):
+        """Test that a failure of the bulk delete task is reported."""
+        errors = [Error.objects.create() for _ in range(3)]
+
+        def fail(model, chunks, progress=None):
+            """Delete the first chunk, then fail."""
+            progress(1)
+            raise ValueError('Deletion failed')
+
+        with mock.patch('InvenTree.helpers_model.delete_in_chunks', fail):
+            with self.assertRaises(ValueError):
+                InvenTree.tasks.bulk_delete(
+                    'error_report.error', [e.pk for e in errors], 'job', user_id=None
+                )
+
+        # The task is reported as finished, with the error and the items deleted so far
+        progress = TaskProgress.get_progress_data(
+            InvenTree.tasks.bulk_delete_progress_key('job')
+        )
+
+        self.assertEqual(
+            progress,
+            {'total': 3, 'completed': 1, 'finished': True, 'error': 'Deletion failed'},
+        )
+
     def test_task_check_for_updates(self):
         """Test the task check_for_updates."""
         # Check that setting should be empty
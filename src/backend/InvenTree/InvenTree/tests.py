@@ -2,9 +2,11 @@
 
 import json
 import os
+import tempfile
 import time
 from datetime import datetime, timedelta
 from decimal import Decimal
+from pathlib import Path
 from unittest import mock
 
 import django.core.exceptions as django_exceptions
@@ -12,10 +14,13 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core import mail
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.core.management.base import CommandError
 from django.test import TestCase, override_settings, tag
 from django.urls import reverse
 from django.utils import timezone
 
+import PIL.Image
 import pint.errors
 import pytz
 from djmoney.contrib.exchange.exceptions import MissingRate
@@ -33,9 +38,10 @@ from common.models import CustomUnit, InvenTreeSetting
 from common.settings import currency_codes
 from InvenTree.helpers_mixin import ClassProviderMixin, ClassValidationMixin
 from InvenTree.sanitizer import sanitize_svg
+from InvenTree.status_codes import StockHistoryCode
 from InvenTree.unit_test import InvenTreeTestCase
 from part.models import Part, PartCategory
-from stock.models import StockItem, StockLocation
+from stock.models import StockItem, StockItemTracking, StockLocation
 
 from . import config, helpers, ready, status, version
 from .tasks import offload_task
@@ -391,6 +397,44 @@ class ConversionTest(TestCase):
             q = InvenTree.conversion.convert_physical_value(val, 'henry / km')
             self.assertAlmostEqual(q, expected, 2)
 
+    def test_conversion_cache(self):
+        """Test that conversion results are cached, and invalidated when units change."""
+        CustomUnit.objects.filter(symbol='wdg').delete()
+        InvenTree.conversion.reload_unit_registry()
+
+        cache = InvenTree.conversion._cached_conversion
+
+        self.assertEqual(cache.cache_info().currsize, 0)
+
+        for _ in range(3):
+            q = InvenTree.conversion.convert_physical_value('3 inch', 'mm')
+            self.assertAlmostEqual(q, 76.2, 3)
+
+            with self.assertRaises(ValidationError):
+                InvenTree.conversion.convert_physical_value('3 wdg', 'mm')
+
+        # Each value is converted once, and subsequent requests hit the cache
+        info = cache.cache_info()
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.hits, 4)
+
+        # Creating a custom unit reloads the unit registry, and clears the cache
+        CustomUnit.objects.create(name='widget', definition='10 mm', symbol='wdg')
+        self.assertEqual(cache.cache_info().currsize, 0)
+
+        q = InvenTree.conversion.convert_physical_value('3 wdg', 'mm')
+        self.assertAlmostEqual(q, 30, 3)
+
+        # Batch conversion
+        results = InvenTree.conversion.convert_physical_values(
+            ['1 wdg', '1m', 'abc', '1 wdg'], 'mm'
+        )
+
+        self.assertEqual(len(results), 3)
+        self.assertAlmostEqual(results['1 wdg'], 10, 3)
+        self.assertAlmostEqual(results['1m'], 1000, 3)
+        self.assertIsNone(results['abc'])
+
 
 class ValidatorTest(TestCase):
     """Simple tests for custom field validators."""
@@ -1448,7 +1492,7 @@ class BarcodeMixinTest(InvenTreeTestCase):
     def test_barcode_model_type(self):
         """Test that the barcode_model_type property works for each class."""
         from part.models import Part
-        from stock.models import StockItem, StockLocation
+        from stock.models import StockItem, StockItemTracking, StockLocation
 
         self.assertEqual(Part.barcode_model_type(), 'part')
         self.assertEqual(StockItem.barcode_model_type(), 'stockitem')
@@ -1667,3 +1711,216 @@ class ClassProviderMixinTest(TestCase):
     def test_get_is_builtin(self):
         """Test the get_is_builtin function."""
         self.assertTrue(self.TestClass.get_is_builtin())
+
+
+class RebuildThumbnailsTest(TestCase):
+    """Tests for the rebuild_thumbnails management command."""
+
+    fixtures = ['category', 'part', 'location']
+
+    def setUp(self):
+        """Create a temporary media directory, with some part images."""
+        super().setUp()
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+
+        media = override_settings(MEDIA_ROOT=tmp.name)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        self.media = Path(tmp.name)
+        self.media.joinpath('part_images').mkdir()
+
+        self.save_image('part_images/red.png', 'red', (512, 512))
+        self.media.joinpath('part_images', 'bad.png').write_text('not an image')
+
+        parts = Part.objects.all()[:4]
+
+        for part, name in zip(
+            parts,
+            [
+                'part_images/red.png',
+                'part_images/red.png',
+                'part_images/bad.png',
+                'part_images/missing.png',
+            ],
+        ):
+            part.image = name
+            part.save()
+
+    def save_image(self, name, color, size):
+        """Save an image to the media directory."""
+        PIL.Image.new('RGB', size, color=color).save(self.media.joinpath(name))
+
+    def variation(self, name):
+        """Return the path to an image variation."""
+        return self.media.joinpath('part_images', f'red.{name}.png')
+
+    def rebuild(self, **kwargs):
+        """Run the command, and return the number of rendered variations."""
+        from stdimage.models import StdImageFieldFile
+
+        render = StdImageFieldFile.render_variation
+
+        with mock.patch.object(
+            StdImageFieldFile, 'render_variation', side_effect=render
+        ) as renderer:
+            call_command('rebuild_thumbnails', **kwargs)
+
+        return renderer.call_count
+
+    def test_rebuild(self):
+        """Test that only changed or missing variations are rendered."""
+        # Shared images are only rendered once (the invalid image is attempted)
+        self.assertEqual(self.rebuild(), 3)
+
+        for name in ['thumbnail', 'preview']:
+            self.assertTrue(self.variation(name).exists())
+
+        with PIL.Image.open(self.variation('preview')) as img:
+            self.assertEqual(img.size, (256, 256))
+
+        manifest = json.loads(self.media.joinpath('.thumbnails.json').read_text())
+        self.assertEqual(list(manifest.keys()), ['part_images/red.png'])
+
+        # Nothing has changed
+        self.assertEqual(self.rebuild(), 1)
+
+        # A missing variation is rendered
+        self.variation('preview').unlink()
+        self.assertEqual(self.rebuild(), 2)
+        self.assertTrue(self.variation('preview').exists())
+
+        # A changed image is rendered again
+        self.save_image('part_images/red.png', 'red', (200, 100))
+        self.assertEqual(self.rebuild(), 3)
+
+        with PIL.Image.open(self.variation('preview')) as img:
+            self.assertEqual(img.size, (200, 100))
+
+        # All variations are rendered with the --force option
+        self.assertEqual(self.rebuild(force=True), 3)
+
+    def test_workers(self):
+        """Test that images can be rendered using multiple worker processes."""
+        call_command('rebuild_thumbnails', workers=2, chunk_size=1)
+
+        for name in ['thumbnail', 'preview']:
+            self.assertTrue(self.variation(name).exists())
+
+        self.assertTrue(self.media.joinpath('.thumbnails.json').exists())
+
+
+class ExportImportRecordsTest(InvenTreeTestCase):
+    """Tests for the export_records and import_records management commands."""
+
+    fixtures = ['category', 'part', 'location', 'stock']
+
+    def setUp(self):
+        """Create a temporary directory for the exported data."""
+        super().setUp()
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+
+        self.directory = Path(tmp.name).joinpath('data')
+
+    def export(self, **kwargs):
+        """Export all records, and return the manifest."""
+        call_command(
+            'export_records',
+            str(self.directory),
+            exclude=['contenttypes', 'auth.permission', 'django_q'],
+            **kwargs,
+        )
+
+        return json.loads(self.directory.joinpath('manifest.json').read_text())
+
+    def test_export(self):
+        """Test that records are exported in chunks, in dependency order."""
+        manifest = self.export(chunk_size=5)
+
+        models = [entry['model'] for entry in manifest['models']]
+        entries = {entry['model']: entry for entry in manifest['models']}
+
+        self.assertNotIn('contenttypes.contenttype', models)
+        self.assertLess(models.index('part.partcategory'), models.index('part.part'))
+        self.assertLess(models.index('part.part'), models.index('stock.stockitem'))
+        self.assertLess(models.index('auth.user'), models.index('users.apitoken'))
+
+        entry = entries['part.part']
+        self.assertEqual(entry['count'], Part.objects.count())
+        self.assertEqual(len(entry['files']), (entry['count'] + 4) // 5)
+
+        lines = self.directory.joinpath(entry['files'][0]).read_text().splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(json.loads(lines[0])['model'], 'part.part')
+
+        # Permissions are not exported by default
+        for line in self.directory.joinpath(entries['auth.user']['files'][0]).open():
+            self.assertEqual(json.loads(line)['fields']['user_permissions'], [])
+
+        # The output directory must be empty
+        with self.assertRaisesRegex(CommandError, 'is not empty'):
+            self.export()
+
+        self.export(overwrite=True)
+
+    def test_import(self):
+        """Test that exported records can be imported again."""
+        self.export(chunk_size=3)
+
+        part = Part.objects.get(pk=1)
+        name = part.name
+        part.name = 'Modified'
+        part.save()
+
+        items = StockItem.objects.count()
+        StockItem.objects.filter(part__pk=1).delete()
+        self.assertLess(StockItem.objects.count(), items)
+
+        call_command(
+            'import_records',
+            str(self.directory),
+            exclude=['contenttypes', 'auth.permission', 'django_q'],
+            batch_size=2,
+        )
+
+        # Existing records are updated, and missing records are created
+        self.assertEqual(Part.objects.get(pk=1).name, name)
+        self.assertEqual(StockItem.objects.count(), items)
+
+    def test_import_dates(self):
+        """Test that auto_now_add values are retained when records are imported."""
+        entry = StockItemTracking.objects.create(
+            item=StockItem.objects.first(), tracking_type=StockHistoryCode.EDITED.value
+        )
+
+        date = datetime(2020, 1, 1)
+        StockItemTracking.objects.filter(pk=entry.pk).update(date=date)
+
+        self.export()
+
+        StockItemTracking.objects.filter(pk=entry.pk).delete()
+
+        call_command(
+            'import_records',
+            str(self.directory),
+            exclude=['contenttypes', 'auth.permission', 'django_q'],
+        )
+
+        self.assertEqual(StockItemTracking.objects.get(pk=entry.pk).date, date)
+
+    def test_integrity_check(self):
+        """Test that the import fails if the data files do not match the manifest."""
+        manifest = self.export()
+
+        for entry in manifest['models']:
+            if entry['model'] == 'part.partcategory':
+                entry['count'] += 1
+
+        self.directory.joinpath('manifest.json').write_text(json.dumps(manifest))
+
+        with self.assertRaisesRegex(CommandError, 'part.partcategory: expected'):
+            call_command('import_records', str(self.directory))
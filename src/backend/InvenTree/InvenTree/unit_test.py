@@ -89,6 +89,33 @@ def getNewestMigrationFile(app, exclude_extension=True):
     return newest_file
 
 
+def run_queued_tasks(func) -> int:
+    """Run (and remove) any queued background tasks for the provided function.
+
+    Tasks which are offloaded with force_async=True are added to the task queue,
+    but there is no background worker to run them during testing.
+
+    Returns:
+        The number of tasks which were run
+    """
+    from django_q.models import OrmQ
+
+    name = f'{func.__module__}.{func.__name__}'
+    count = 0
+
+    for queued in OrmQ.objects.order_by('pk'):
+        if queued.func() != name:
+            continue
+
+        task = queued.task
+        queued.delete()
+
+        func(*task.get('args', ()), **task.get('kwargs', {}))
+        count += 1
+
+    return count
+
+
 class UserMixin:
     """Mixin to setup a user and login for tests.
 
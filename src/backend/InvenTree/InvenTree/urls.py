@@ -41,6 +41,7 @@ from web.urls import urlpatterns as platform_urls
 
 from .api import (
     APISearchView,
+    BulkDeleteProgress,
     InfoView,
     LicenseView,
     NotFoundView,
@@ -111,6 +112,11 @@ apipatterns = [
         'version-text', VersionTextView.as_view(), name='api-version-text'
     ),  # version text
     path('version/', VersionView.as_view(), name='api-version'),  # version info
+    path(
+        'bulk-delete/<str:job>/',
+        BulkDeleteProgress.as_view(),
+        name='api-bulk-delete-progress',
+    ),
     path('', InfoView.as_view(), name='api-inventree-info'),  # server info
     # Auth API endpoints
     path(
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 from django.db.models import F, Q
+from django.shortcuts import get_object_or_404
 from django.urls import include, path
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth.models import User
 
+from rest_framework import status
 from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
 
 from django_filters.rest_framework import DjangoFilterBackend
 from django_filters import rest_framework as rest_filters
@@ -15,13 +18,15 @@ from InvenTree.api import AttachmentMixin, APIDownloadMixin, ListCreateDestroyAP
 from generic.states.api import StatusView
 from InvenTree.helpers import str2bool, isNull, DownloadFile
 from InvenTree.status_codes import BuildStatus, BuildStatusGroups
-from InvenTree.mixins import CreateAPI, RetrieveUpdateDestroyAPI, ListCreateAPI
+from InvenTree.mixins import CreateAPI, ListAPI, RetrieveAPI, RetrieveUpdateDestroyAPI, ListCreateAPI, SparseFieldsMixin
 
 import common.models
 import build.admin
 import build.serializers
 from build.models import Build, BuildLine, BuildItem, BuildOrderAttachment
 import part.models
+import stock.serializers
+from stock.models import StockItem
 from users.models import Owner
 from InvenTree.filters import SEARCH_ORDER_FILTER_ALIAS
 
@@ -334,7 +339,7 @@ class BuildLineEndpoint:
         return queryset
 
 
-class BuildLineList(BuildLineEndpoint, ListCreateAPI):
+class BuildLineList(SparseFieldsMixin, BuildLineEndpoint, ListCreateAPI):
     """API endpoint for accessing a list of BuildLine objects"""
 
     filterset_class = BuildLineFilter
@@ -388,6 +393,60 @@ class BuildLineDetail(BuildLineEndpoint, RetrieveUpdateDestroyAPI):
         return None
 
 
+class BuildLineStockList(ListAPI):
+    """API endpoint for listing the stock items which can be allocated against a BuildLine.
+
+    Stock items are loaded on demand for a single line,
+    rather than being fetched for every line in the build.
+    """
+
+    serializer_class = stock.serializers.StockItemSerializer
+
+    def get_queryset(self):
+        """Return the in-stock items which are valid for the referenced BuildLine."""
+        line = get_object_or_404(
+            BuildLine.objects.select_related('build', 'bom_item', 'bom_item__sub_part'),
+            pk=self.kwargs.get('pk', None),
+        )
+
+        parts = line.bom_item.get_valid_parts_for_allocation()
+
+        queryset = StockItem.objects.filter(StockItem.IN_STOCK_FILTER, part__in=parts)
+
+        # Filter by the source location for the build (if specified)
+        if location := line.build.take_from:
+            queryset = queryset.filter(
+                location__in=location.get_descendants(include_self=True)
+            )
+
+        return stock.serializers.StockItemSerializer.annotate_queryset(queryset)
+
+    filter_backends = SEARCH_ORDER_FILTER_ALIAS
+
+    ordering_field_aliases = {
+        'location': 'location__pathstring',
+        'stock': ['quantity', 'serial_int', 'serial'],
+    }
+
+    ordering_fields = [
+        'batch',
+        'location',
+        'part__name',
+        'expiry_date',
+        'quantity',
+        'stock',
+    ]
+
+    ordering = ['part__name', 'quantity', 'location']
+
+    search_fields = [
+        'serial',
+        'batch',
+        'part__name',
+        'location__name',
+    ]
+
+
 class BuildOrderContextMixin:
     """Mixin class which adds build order as serializer context variable."""
 
@@ -428,12 +487,47 @@ class BuildOutputScrap(BuildOrderContextMixin, CreateAPI):
 
 
 class BuildOutputComplete(BuildOrderContextMixin, CreateAPI):
-    """API endpoint for completing build outputs."""
+    """API endpoint for completing build outputs.
+
+    A large number of outputs are completed by the background worker,
+    in which case the response contains 'background': True.
+    Progress can be monitored via the BuildOutputCompleteProgress endpoint.
+    """
 
     queryset = Build.objects.none()
 
     serializer_class = build.serializers.BuildOutputCompleteSerializer
 
+    def create(self, request, *args, **kwargs):
+        """Complete the build outputs, and report whether a background task was used."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        background = serializer.save()
+
+        data = serializer.data
+        data['background'] = background
+
+        return Response(data, status=status.HTTP_201_CREATED)
+
+
+class BuildOutputCompleteProgress(RetrieveAPI):
+    """API endpoint for reporting the progress of the background build output completion task."""
+
+    queryset = Build.objects.all()
+
+    serializer_class = build.serializers.BuildOutputCompleteProgressSerializer
+
+    def get_object(self):
+        """Return the progress information for the specified build order."""
+        import build.tasks
+
+        build_order = super().get_object()
+
+        return common.models.TaskProgress.get_progress_data(
+            build.tasks.output_completion_progress_key(build_order.pk)
+        )
+
 
 class BuildOutputDelete(BuildOrderContextMixin, CreateAPI):
     """API endpoint for deleting multiple build outputs."""
@@ -472,6 +566,26 @@ class BuildAutoAllocate(BuildOrderContextMixin, CreateAPI):
 
     serializer_class = build.serializers.BuildAutoAllocationSerializer
 
+    def create(self, request, *args, **kwargs):
+        """Perform the auto-allocation, and return the (proposed) allocations."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        allocations = serializer.save()
+
+        data = serializer.data
+
+        data['allocations'] = [
+            {
+                'build_line': item.build_line.pk,
+                'stock_item': item.stock_item_id,
+                'quantity': float(item.quantity),
+            }
+            for item in allocations
+        ]
+
+        return Response(data, status=status.HTTP_201_CREATED)
+
 
 class BuildAllocate(BuildOrderContextMixin, CreateAPI):
     """API endpoint to allocate stock items to a build order.
@@ -623,7 +737,10 @@ build_api_urls = [
 
     # Build lines
     path('line/', include([
-        path('<int:pk>/', BuildLineDetail.as_view(), name='api-build-line-detail'),
+        path('<int:pk>/', include([
+            path('stock/', BuildLineStockList.as_view(), name='api-build-line-stock'),
+            path('', BuildLineDetail.as_view(), name='api-build-line-detail'),
+        ])),
         path('', BuildLineList.as_view(), name='api-build-line-list'),
     ])),
 
@@ -641,6 +758,7 @@ build_api_urls = [
         path('allocate/', BuildAllocate.as_view(), name='api-build-allocate'),
         path('auto-allocate/', BuildAutoAllocate.as_view(), name='api-build-auto-allocate'),
         path('complete/', BuildOutputComplete.as_view(), name='api-build-output-complete'),
+        path('complete-progress/', BuildOutputCompleteProgress.as_view(), name='api-build-output-complete-progress'),
         path('create-output/', BuildOutputCreate.as_view(), name='api-build-output-create'),
         path('delete-outputs/', BuildOutputDelete.as_view(), name='api-build-output-delete'),
         path('scrap-outputs/', BuildOutputScrap.as_view(), name='api-build-output-scrap'),
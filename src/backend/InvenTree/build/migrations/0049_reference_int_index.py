@@ -0,0 +1,18 @@
+# Generated by Django 4.2.11 on 2026-10-19 10:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('build', '0048_build_project_code'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='build',
+            name='reference_int',
+            field=models.BigIntegerField(db_index=True, default=0),
+        ),
+    ]
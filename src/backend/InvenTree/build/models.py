@@ -20,9 +20,9 @@ from django.utils.translation import gettext_lazy as _
 from mptt.models import MPTTModel, TreeForeignKey
 from mptt.exceptions import InvalidMove
 
-from rest_framework import serializers
+from sql_util.utils import SubquerySum
 
-from InvenTree.status_codes import BuildStatus, StockStatus, StockHistoryCode, BuildStatusGroups
+from InvenTree.status_codes import BuildStatus, StockStatus, StockHistoryCode, BuildStatusGroups, SalesOrderStatusGroups
 
 from build.validators import generate_next_build_reference, validate_build_order_reference
 
@@ -96,7 +96,7 @@ class Build(InvenTree.models.InvenTreeBarcodeMixin, InvenTree.models.InvenTreeNo
     def api_defaults(cls, request):
         """Return default values for this model when issuing an API OPTIONS request."""
         defaults = {
-            'reference': generate_next_build_reference(),
+            'reference': cls.generate_reference(allocate=False),
         }
 
         if request and request.user:
@@ -615,8 +615,7 @@ class Build(InvenTree.models.InvenTreeBarcodeMixin, InvenTree.models.InvenTreeNo
         items = self.allocated_stock
 
         if remove_allocated_stock:
-            for item in items:
-                item.complete_allocation(user)
+            self.consume_allocations(items, user)
 
         items.delete()
 
@@ -861,8 +860,7 @@ class Build(InvenTree.models.InvenTreeBarcodeMixin, InvenTree.models.InvenTreeNo
         )
 
         # Remove stock
-        for item in items:
-            item.complete_allocation(user)
+        self.consume_allocations(items, user)
 
         # Delete allocation
         items.all().delete()
@@ -907,9 +905,8 @@ class Build(InvenTree.models.InvenTreeBarcodeMixin, InvenTree.models.InvenTreeNo
         allocated_items = output.items_to_install.all()
 
         # Complete or discard allocations
-        for build_item in allocated_items:
-            if not discard_allocations:
-                build_item.complete_allocation(user)
+        if not discard_allocations:
+            self.consume_allocations(allocated_items, user)
 
         # Delete allocations
         allocated_items.delete()
@@ -925,40 +922,57 @@ class Build(InvenTree.models.InvenTreeBarcodeMixin, InvenTree.models.InvenTreeNo
             }
         )
 
-    @transaction.atomic
     def complete_build_output(self, output, user, **kwargs):
         """Complete a particular build output.
 
         - Remove allocated StockItems
         - Mark the output as complete
+
+        Refer to complete_build_outputs for the available keyword arguments.
+        """
+        self.complete_build_outputs([output], user, **kwargs)
+
+    @transaction.atomic
+    def complete_build_outputs(self, outputs, user, **kwargs):
+        """Complete multiple build outputs at once.
+
+        - The allocated stock for all outputs is consumed (or installed) in bulk
+        - The outputs are marked as complete with a single update query
+        - Stock tracking entries are written in a single batch
+
+        Arguments:
+            outputs: A list of build outputs (StockItem objects) to complete
+            user: The user completing the build outputs
+
+        kwargs:
+            location: The location for the completed outputs (default = build destination)
+            status: The status for the completed outputs (default = OK)
+            notes: Optional notes for the stock tracking entries
         """
-        # Select the location for the build output
         location = kwargs.get('location', self.destination)
         status = kwargs.get('status', StockStatus.OK.value)
         notes = kwargs.get('notes', '')
 
-        # List the allocated BuildItem objects for the given output
-        allocated_items = output.items_to_install.all()
+        outputs = list(outputs)
 
-        if (common.settings.prevent_build_output_complete_on_incompleted_tests() and output.hasRequiredTests() and not output.passedAllRequiredTests()):
-            serial = output.serial
-            raise ValidationError(
-                _(f"Build output {serial} has not passed all required tests"))
+        if len(outputs) == 0:
+            return
 
-        for build_item in allocated_items:
-            # Complete the allocation of stock for that item
-            build_item.complete_allocation(user)
+        if common.settings.prevent_build_output_complete_on_incompleted_tests():
+            for output in outputs:
+                if output.hasRequiredTests() and not output.passedAllRequiredTests():
+                    serial = output.serial
+                    raise ValidationError(
+                        _(f"Build output {serial} has not passed all required tests"))
 
-        # Delete the BuildItem objects from the database
-        allocated_items.all().delete()
+        # List the allocated BuildItem objects for the given outputs
+        allocated_items = BuildItem.objects.filter(install_into__in=outputs)
 
-        # Ensure that the output is updated correctly
-        output.build = self
-        output.is_building = False
-        output.location = location
-        output.status = status
+        # Complete the allocation of stock for each item
+        self.consume_allocations(allocated_items, user)
 
-        output.save(add_note=False)
+        # Delete the BuildItem objects from the database
+        allocated_items.delete()
 
         deltas = {
             'status': status,
@@ -968,20 +982,154 @@ class Build(InvenTree.models.InvenTreeBarcodeMixin, InvenTree.models.InvenTreeNo
         if location:
             deltas['location'] = location.pk
 
-        output.add_tracking_entry(
-            StockHistoryCode.BUILD_OUTPUT_COMPLETED,
-            user,
-            notes=notes,
-            deltas=deltas
+        tracking = []
+        quantity = 0
+
+        # Ensure that each output is updated correctly
+        for output in outputs:
+            output.build = self
+            output.is_building = False
+            output.location = location
+            output.status = status
+
+            quantity += output.quantity
+
+            tracking.append(stock.models.StockItemTracking(
+                item=output,
+                tracking_type=StockHistoryCode.BUILD_OUTPUT_COMPLETED.value,
+                user=user,
+                date=InvenTree.helpers.current_time(),
+                notes=notes,
+                deltas=deltas,
+            ))
+
+        stock.models.StockItem.objects.bulk_update(
+            outputs,
+            ['build', 'is_building', 'location', 'status'],
         )
 
+        stock.models.StockItemTracking.objects.bulk_create(tracking)
+
         # Increase the completed quantity for this build
-        self.completed += output.quantity
+        self.completed += quantity
 
         self.save()
 
     @transaction.atomic
-    def auto_allocate_stock(self, **kwargs):
+    def consume_allocations(self, build_items, user, notes=''):
+        """Complete the allocation of the provided BuildItem objects against this build.
+
+        This is the bulk equivalent of BuildItem.complete_allocation:
+
+        - Any stock item with more stock than is allocated is split first
+        - Trackable stock is installed into the build output it is allocated to
+        - Untracked stock is marked as consumed by this build
+
+        All the required changes are planned up front, and then written to the database
+        with bulk insert and update queries (rather than saving each item individually).
+
+        Note: The BuildItem objects are not deleted by this function
+        """
+        from part.summary import schedule_summary_update
+
+        StockItem = stock.models.StockItem
+        StockItemTracking = stock.models.StockItemTracking
+
+        build_items = list(
+            build_items.select_related('stock_item', 'stock_item__part', 'install_into').order_by('pk')
+        )
+
+        if len(build_items) == 0:
+            return
+
+        now = InvenTree.helpers.current_time()
+
+        # List of (stock_item, code, deltas) tuples for the tracking entries
+        tracking = []
+
+        # Remaining quantity for each source stock item, after splitting
+        remaining = {}
+
+        # Ensure that each source stock item is represented by a single instance
+        sources = {}
+
+        # List of (build_item, stock_item) pairs to be consumed or installed
+        targets = []
+
+        # List of (source, new_item, quantity) tuples for stock which must be split
+        splits = []
+
+        for build_item in build_items:
+            source = sources.setdefault(build_item.stock_item_id, build_item.stock_item)
+
+            available = remaining.get(source.pk, source.quantity)
+
+            if available > build_item.quantity and not source.serialized:
+                # Split the allocated quantity into a new stock item
+                item = source.get_split_item(build_item.quantity)
+
+                remaining[source.pk] = available - build_item.quantity
+                splits.append((source, item, build_item.quantity))
+            else:
+                item = source
+
+            targets.append((build_item, item))
+
+        # Assign the new location of each stock item
+        updated = {}
+
+        for build_item, item in targets:
+            if item.part.trackable and build_item.install_into:
+                # Install the stock item into the build output
+                item.belongs_to = build_item.install_into
+
+            # Mark the item as "consumed" by the build order
+            item.consumed_by = self
+
+            if item.pk:
+                updated[item.pk] = item
+
+        new_items = [item for _source, item, _quantity in splits]
+
+        tracking.extend(stock.models.create_split_items(splits))
+
+        StockItem.objects.bulk_update(updated.values(), ['belongs_to', 'consumed_by'])
+
+        for _build_item, item in targets:
+            if item.belongs_to_id and item.part.trackable:
+                tracking.append((item, StockHistoryCode.INSTALLED_INTO_ASSEMBLY, {
+                    'stockitem': item.belongs_to_id,
+                    'buildorder': self.pk,
+                }))
+
+                tracking.append((item.belongs_to, StockHistoryCode.INSTALLED_CHILD_ITEM, {
+                    'stockitem': item.pk,
+                }))
+            else:
+                tracking.append((item, StockHistoryCode.BUILD_CONSUMED, {
+                    'buildorder': self.pk,
+                    'quantity': float(item.quantity),
+                }))
+
+        StockItemTracking.objects.bulk_create([
+            StockItemTracking(
+                item=item,
+                tracking_type=code.value,
+                user=user,
+                date=now,
+                notes=notes,
+                deltas=deltas,
+            ) for item, code, deltas in tracking
+        ])
+
+        # Stock items were updated without triggering the post_save signal
+        schedule_summary_update('part.part', {item.part_id for item in sources.values()})
+
+        # New stock items were created, without triggering the post_save signal
+        stock.models.after_bulk_create_stock_items(new_items)
+
+    @transaction.atomic
+    def auto_allocate_stock(self, dry_run=False, **kwargs):
         """Automatically allocate stock items against this build order.
 
         Following a number of 'guidelines':
@@ -993,6 +1141,39 @@ class Build(InvenTree.models.InvenTreeBarcodeMixin, InvenTree.models.InvenTreeNo
         - If a single stock item is found, we can allocate that and move on!
         - If multiple stock items are found, we *may* be able to allocate:
             - If the calling function has specified that items are interchangeable
+
+        Arguments:
+            dry_run: If True, the proposed allocations are returned but not saved
+
+        Refer to plan_auto_allocation for the available keyword arguments.
+
+        Returns:
+            A list of the BuildItem objects which were (or would be) created
+        """
+        new_items = self.plan_auto_allocation(**kwargs)
+
+        if not dry_run:
+            # Bulk-create the new BuildItem objects
+            BuildItem.objects.bulk_create(new_items)
+
+        return new_items
+
+    def plan_auto_allocation(self, **kwargs):
+        """Plan the automatic allocation of stock items against this build order.
+
+        Rather than querying stock for each line in turn, the available stock for *all* lines
+        is loaded with a single query (annotated with existing build and sales order allocations),
+        and the allocations are then calculated in memory.
+
+        Keyword Arguments:
+            location: Only allocate stock items located below this location
+            exclude_location: Do not allocate stock items located below this location
+            interchangeable: If True, stock may be allocated from multiple stock items
+            substitutes: If True, stock for substitute parts may be allocated
+            optional_items: If True, optional BOM items are also allocated
+
+        Returns:
+            A list of (unsaved) BuildItem objects
         """
         location = kwargs.get('location', None)
         exclude_location = kwargs.get('exclude_location', None)
@@ -1000,19 +1181,18 @@ class Build(InvenTree.models.InvenTreeBarcodeMixin, InvenTree.models.InvenTreeNo
         substitutes = kwargs.get('substitutes', True)
         optional_items = kwargs.get('optional_items', False)
 
-        def stock_sort(item, bom_item, variant_parts):
-            if item.part == bom_item.sub_part:
-                return 1
-            elif item.part in variant_parts:
-                return 2
-            return 3
-
-        new_items = []
+        lines = self.untracked_line_items.select_related(
+            'bom_item', 'bom_item__sub_part'
+        ).prefetch_related(
+            'bom_item__substitutes', 'bom_item__substitutes__part'
+        ).annotate(
+            allocated=Coalesce(Sum('allocations__quantity'), 0, output_field=models.DecimalField())
+        ).order_by('pk')
 
-        # Auto-allocation is only possible for "untracked" line items
-        for line_item in self.untracked_line_items.all():
+        # Lines which require allocation
+        pending = []
 
-            # Find the referenced BomItem
+        for line_item in lines:
             bom_item = line_item.bom_item
 
             if bom_item.consumable:
@@ -1023,89 +1203,160 @@ class Build(InvenTree.models.InvenTreeBarcodeMixin, InvenTree.models.InvenTreeNo
                 # User has specified that optional_items are to be ignored
                 continue
 
-            variant_parts = bom_item.sub_part.get_descendants(include_self=False)
-
-            unallocated_quantity = line_item.unallocated_quantity()
-
-            if unallocated_quantity <= 0:
+            if line_item.quantity - line_item.allocated <= 0:
                 # This BomItem is fully allocated, we can continue
                 continue
 
-            # Check which parts we can "use" (may include variants and substitutes)
-            available_parts = bom_item.get_valid_parts_for_allocation(
-                allow_variants=True,
-                allow_substitutes=substitutes,
-            )
+            pending.append(line_item)
+
+        if len(pending) == 0:
+            return []
+
+        # Find all variant parts (for BOM items which allow variants) with a single query
+        variant_filter = Q()
+
+        for line_item in pending:
+            sub_part = line_item.bom_item.sub_part
+
+            if line_item.bom_item.allow_variants:
+                variant_filter |= Q(
+                    tree_id=sub_part.tree_id,
+                    lft__gt=sub_part.lft,
+                    rght__lt=sub_part.rght,
+                )
+
+        variants = []
+
+        if variant_filter:
+            variants = list(part.models.Part.objects.filter(variant_filter).values(
+                'pk', 'tree_id', 'lft', 'rght', 'trackable'
+            ))
+
+        # Determine the valid parts (and their priority) for each line
+        # Priority: 1 = direct match, 2 = variant part, 3 = substitute part
+        line_parts = {}
+
+        for line_item in pending:
+            bom_item = line_item.bom_item
+            sub_part = bom_item.sub_part
+
+            parts = {sub_part.pk: 1}
+
+            if bom_item.allow_variants:
+                for variant in variants:
+                    if variant['tree_id'] == sub_part.tree_id and sub_part.lft < variant['lft'] and variant['rght'] < sub_part.rght:
+                        if variant['trackable'] == sub_part.trackable:
+                            parts.setdefault(variant['pk'], 2)
+
+            if substitutes:
+                for substitute in bom_item.substitutes.all():
+                    if substitute.part.trackable == sub_part.trackable:
+                        parts.setdefault(substitute.part.pk, 3)
 
-            # Look for available stock items
-            available_stock = stock.models.StockItem.objects.filter(stock.models.StockItem.IN_STOCK_FILTER)
+            line_parts[line_item.pk] = parts
 
-            # Filter by list of available parts
+        part_ids = set()
+
+        for parts in line_parts.values():
+            part_ids.update(parts.keys())
+
+        # Look for available stock items (for all lines at once)
+        available_stock = stock.models.StockItem.objects.filter(
+            stock.models.StockItem.IN_STOCK_FILTER,
+            part__in=part_ids,
+        )
+
+        # Filter out "serialized" stock items, these cannot be auto-allocated
+        available_stock = available_stock.filter(Q(serial=None) | Q(serial=''))
+
+        if location:
+            # Filter only stock items located "below" the specified location
             available_stock = available_stock.filter(
-                part__in=list(available_parts),
+                location__tree_id=location.tree_id,
+                location__lft__gte=location.lft,
+                location__rght__lte=location.rght,
             )
 
-            # Filter out "serialized" stock items, these cannot be auto-allocated
-            available_stock = available_stock.filter(Q(serial=None) | Q(serial='')).distinct()
+        if exclude_location:
+            # Exclude any stock items from the provided location
+            available_stock = available_stock.exclude(
+                location__tree_id=exclude_location.tree_id,
+                location__lft__gte=exclude_location.lft,
+                location__rght__lte=exclude_location.rght,
+            )
 
-            if location:
-                # Filter only stock items located "below" the specified location
-                sublocations = location.get_descendants(include_self=True)
-                available_stock = available_stock.filter(location__in=list(sublocations))
+        # Annotate with the quantity already allocated to builds and (open) sales orders
+        available_stock = available_stock.annotate(
+            build_allocated=Coalesce(
+                SubquerySum('allocations__quantity'), 0, output_field=models.DecimalField()
+            ),
+            sales_allocated=Coalesce(
+                SubquerySum(
+                    'sales_order_allocations__quantity',
+                    filter=Q(
+                        line__order__status__in=SalesOrderStatusGroups.OPEN,
+                        shipment__shipment_date=None,
+                    ),
+                ),
+                0,
+                output_field=models.DecimalField(),
+            ),
+        ).values(
+            'pk', 'part', 'part__active', 'quantity', 'build_allocated', 'sales_allocated'
+        ).order_by('pk')
+
+        # Quantity available for allocation against each stock item, grouped by part
+        stock_items = {}
+
+        for item in available_stock:
+            item['available'] = max(item['quantity'] - item['build_allocated'] - item['sales_allocated'], 0)
+            stock_items.setdefault(item['part'], []).append(item)
 
-            if exclude_location:
-                # Exclude any stock items from the provided location
-                sublocations = exclude_location.get_descendants(include_self=True)
-                available_stock = available_stock.exclude(location__in=list(sublocations))
+        new_items = []
 
-            """
-            Next, we sort the available stock items with the following priority:
-            1. Direct part matches (+1)
-            2. Variant part matches (+2)
-            3. Substitute part matches (+3)
+        for line_item in pending:
+            parts = line_parts[line_item.pk]
 
-            This ensures that allocation priority is first given to "direct" parts
-            """
-            available_stock = sorted(available_stock, key=lambda item, b=bom_item, v=variant_parts: stock_sort(item, b, v))
+            unallocated_quantity = line_item.quantity - line_item.allocated
+
+            # Sort the available stock items by priority, so that "direct" parts are allocated first
+            candidates = sorted(
+                [item for part_id in parts for item in stock_items.get(part_id, [])],
+                key=lambda item, p=parts: (p[item['part']], item['pk'])
+            )
 
-            if len(available_stock) == 0:
+            if len(candidates) == 0:
                 # No stock items are available
                 continue
-            elif len(available_stock) == 1 or interchangeable:
+            elif len(candidates) == 1 or interchangeable:
                 # Either there is only a single stock item available,
                 # or all items are "interchangeable" and we don't care where we take stock from
 
-                for stock_item in available_stock:
+                for item in candidates:
 
                     # Skip inactive parts
-                    if not stock_item.part.active:
+                    if not item['part__active']:
                         continue
 
                     # How much of the stock item is "available" for allocation?
-                    quantity = min(unallocated_quantity, stock_item.unallocated_quantity())
+                    quantity = min(unallocated_quantity, item['available'])
 
                     if quantity > 0:
+                        new_items.append(BuildItem(
+                            build_line=line_item,
+                            stock_item_id=item['pk'],
+                            quantity=quantity,
+                        ))
 
-                        try:
-                            new_items.append(BuildItem(
-                                build_line=line_item,
-                                stock_item=stock_item,
-                                quantity=quantity,
-                            ))
-
-                            # Subtract the required quantity
-                            unallocated_quantity -= quantity
-
-                        except (ValidationError, serializers.ValidationError) as exc:
-                            # Catch model errors and re-throw as DRF errors
-                            raise ValidationError(detail=serializers.as_serializer_error(exc))
+                        # Subtract the allocated quantity
+                        unallocated_quantity -= quantity
+                        item['available'] -= quantity
 
                     if unallocated_quantity <= 0:
                         # We have now fully-allocated this BomItem - no need to continue!
                         break
 
-        # Bulk-create the new BuildItem objects
-        BuildItem.objects.bulk_create(new_items)
+        return new_items
 
     def unallocated_lines(self, tracked=None):
         """Returns a list of BuildLine objects which have not been fully allocated."""
@@ -1503,54 +1754,19 @@ class BuildItem(InvenTree.models.InvenTreeMetadataModel):
         """Return the BomItem associated with this BuildItem"""
         return self.build_line.bom_item if self.build_line else None
 
-    @transaction.atomic
     def complete_allocation(self, user, notes=''):
         """Complete the allocation of this BuildItem into the output stock item.
 
         - If the referenced part is trackable, the stock item will be *installed* into the build output
         - If the referenced part is *not* trackable, the stock item will be *consumed* by the build order
-        """
-        item = self.stock_item
-
-        # Split the allocated stock if there are more available than allocated
-        if item.quantity > self.quantity:
-            item = item.splitStock(
-                self.quantity,
-                None,
-                user,
-                notes=notes,
-            )
-
-        # For a trackable part, special consideration needed!
-        if item.part.trackable:
-
-            # Make sure we are pointing to the new item
-            self.stock_item = item
-            self.save()
-
-            # Install the stock item into the output
-            self.install_into.installStockItem(
-                item,
-                self.quantity,
-                user,
-                notes,
-                build=self.build,
-            )
-
-        else:
-            # Mark the item as "consumed" by the build order
-            item.consumed_by = self.build
-            item.save(add_note=False)
 
-            item.add_tracking_entry(
-                StockHistoryCode.BUILD_CONSUMED,
-                user,
-                notes=notes,
-                deltas={
-                    'buildorder': self.build.pk,
-                    'quantity': float(item.quantity),
-                }
-            )
+        Refer to Build.consume_allocations for the bulk equivalent of this function.
+        """
+        self.build.consume_allocations(
+            BuildItem.objects.filter(pk=self.pk),
+            user,
+            notes=notes,
+        )
 
     build_line = models.ForeignKey(
         BuildLine,
@@ -21,6 +21,7 @@ from InvenTree.serializers import InvenTreeModelSerializer, InvenTreeAttachmentS
 from InvenTree.serializers import UserSerializer
 
 import InvenTree.helpers
+import InvenTree.tasks
 from InvenTree.serializers import InvenTreeDecimalField
 from InvenTree.status_codes import BuildStatusGroups, StockStatus
 
@@ -325,12 +326,8 @@ class BuildOutputCreateSerializer(serializers.Serializer):
                     'serial_numbers': e.messages,
                 })
 
-            # Check for conflicting serial numbesr
-            existing = []
-
-            for serial in self.serials:
-                if not part.validate_serial_number(serial):
-                    existing.append(serial)
+            # Check for conflicting serial numbers
+            existing = part.find_conflicting_serial_numbers(self.serials)
 
             if len(existing) > 0:
 
@@ -474,7 +471,14 @@ class BuildOutputScrapSerializer(serializers.Serializer):
 
 
 class BuildOutputCompleteSerializer(serializers.Serializer):
-    """DRF serializer for completing one or more build outputs."""
+    """DRF serializer for completing one or more build outputs.
+
+    If more than BACKGROUND_THRESHOLD outputs are provided,
+    they are completed by the background worker (refer to build.tasks.complete_build_outputs).
+    """
+
+    # Maximum number of outputs which are completed as part of the request
+    BACKGROUND_THRESHOLD = 50
 
     class Meta:
         """Serializer metaclass"""
@@ -541,8 +545,14 @@ class BuildOutputCompleteSerializer(serializers.Serializer):
         return data
 
     def save(self):
-        """Save the serializer to complete the build outputs."""
-        build = self.context['build']
+        """Save the serializer to complete the build outputs.
+
+        Returns:
+            True if the outputs were queued for completion by the background worker
+        """
+        import build.tasks
+
+        build_order = self.context['build']
         request = self.context['request']
 
         data = self.validated_data
@@ -551,21 +561,63 @@ class BuildOutputCompleteSerializer(serializers.Serializer):
         status = data['status']
         notes = data.get('notes', '')
 
-        outputs = data.get('outputs', [])
+        outputs = [item['output'] for item in data.get('outputs', [])]
+
+        if len(outputs) > self.BACKGROUND_THRESHOLD:
+            progress_key = build.tasks.output_completion_progress_key(build_order.pk)
+
+            # Report the outputs as pending until the background worker completes them
+            common.models.TaskProgress.set_progress(progress_key, len(outputs), 0)
+
+            # Offload the completion of a large number of outputs to the background worker
+            if InvenTree.tasks.offload_task(
+                build.tasks.complete_build_outputs,
+                build_order.pk,
+                [output.pk for output in outputs],
+                request.user.pk if request.user else None,
+                force_async=True,
+                location_id=location.pk if location else None,
+                status=status,
+                notes=notes,
+            ):
+                return True
+
+            # The task could not be queued - complete the outputs now,
+            # so that any errors are reported to the client
+            common.models.TaskProgress.clear_progress(progress_key)
 
         # Mark the specified build outputs as "complete"
         with transaction.atomic():
-            for item in outputs:
+            build_order.complete_build_outputs(
+                outputs,
+                request.user,
+                location=location,
+                status=status,
+                notes=notes,
+            )
 
-                output = item['output']
+        return False
 
-                build.complete_build_output(
-                    output,
-                    request.user,
-                    location=location,
-                    status=status,
-                    notes=notes,
-                )
+
+class BuildOutputCompleteProgressSerializer(serializers.Serializer):
+    """Serializer for reporting the progress of the background build output completion task."""
+
+    class Meta:
+        """Serializer metaclass"""
+        fields = [
+            'total',
+            'completed',
+            'finished',
+            'error',
+        ]
+
+    total = serializers.IntegerField(read_only=True, label=_('Total'))
+
+    completed = serializers.IntegerField(read_only=True, label=_('Completed'))
+
+    finished = serializers.BooleanField(read_only=True, label=_('Finished'))
+
+    error = serializers.CharField(read_only=True, label=_('Error'))
 
 
 class BuildCancelSerializer(serializers.Serializer):
@@ -954,6 +1006,7 @@ class BuildAutoAllocationSerializer(serializers.Serializer):
             'interchangeable',
             'substitutes',
             'optional_items',
+            'dry_run',
         ]
 
     location = serializers.PrimaryKeyRelatedField(
@@ -992,18 +1045,25 @@ class BuildAutoAllocationSerializer(serializers.Serializer):
         help_text=_('Allocate optional BOM items to build order'),
     )
 
+    dry_run = serializers.BooleanField(
+        default=False,
+        label=_('Dry Run'),
+        help_text=_('Return the proposed allocations without saving them'),
+    )
+
     def save(self):
-        """Perform the auto-allocation step"""
+        """Perform the auto-allocation step, and return the list of allocations"""
         data = self.validated_data
 
         build = self.context['build']
 
-        build.auto_allocate_stock(
+        return build.auto_allocate_stock(
             location=data.get('location', None),
             exclude_location=data.get('exclude_location', None),
             interchangeable=data['interchangeable'],
             substitutes=data['substitutes'],
             optional_items=data['optional_items'],
+            dry_run=data['dry_run'],
         )
 
 
@@ -1148,17 +1208,14 @@ class BuildLineSerializer(InvenTreeModelSerializer):
         )
 
         # Pre-fetch related fields
+        # Note: Stock quantities are calculated by the (aggregate) annotations below,
+        # individual stock items are *not* fetched here.
+        # Refer to the BuildLineStockList API endpoint for stock item information.
         queryset = queryset.prefetch_related(
             'bom_item__sub_part',
-            'bom_item__sub_part__stock_items',
-            'bom_item__sub_part__stock_items__allocations',
-            'bom_item__sub_part__stock_items__sales_order_allocations',
             'bom_item__sub_part__tags',
 
             'bom_item__substitutes',
-            'bom_item__substitutes__part__stock_items',
-            'bom_item__substitutes__part__stock_items__allocations',
-            'bom_item__substitutes__part__stock_items__sales_order_allocations',
 
             'allocations',
             'allocations__stock_item',
@@ -5,19 +5,21 @@ from decimal import Decimal
 import logging
 
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 from django.template.loader import render_to_string
 
 from allauth.account.models import EmailAddress
 
 from plugin.events import trigger_event
+from common.models import TaskProgress
 import common.notifications
 import build.models
 import InvenTree.email
 import InvenTree.helpers
 import InvenTree.helpers_model
 import InvenTree.tasks
-from InvenTree.status_codes import BuildStatusGroups
+from InvenTree.status_codes import BuildStatusGroups, StockStatus
 from InvenTree.ready import isImportingData
 
 import part.models as part_models
@@ -47,6 +49,83 @@ def complete_build_allocations(build_id: int, user_id: int):
     build_order.complete_allocations(user)
 
 
+def output_completion_progress_key(build_id: int) -> str:
+    """Return the key used to report build output completion progress."""
+    return f'build_output_completion_{build_id}'
+
+
+def complete_build_outputs(build_id: int, output_ids: list, user_id: int, chunk_size: int = 50, **kwargs):
+    """Complete multiple build outputs for a specified BuildOrder.
+
+    Arguments:
+        build_id: The ID of the BuildOrder
+        output_ids: The IDs of the build outputs (StockItem objects) to complete
+        user_id: The ID of the user completing the build outputs
+        chunk_size: The number of outputs to complete in each database transaction
+
+    kwargs:
+        location_id: The ID of the location for the completed outputs
+        status: The status for the completed outputs
+        notes: Optional notes for the stock tracking entries
+
+    Progress is reported (per chunk) via the TaskProgress record for output_completion_progress_key.
+    If a chunk fails, the task is reported as finished with the error message, and the error is re-raised.
+    Outputs which have already been completed are skipped, so the task can be safely retried.
+    """
+    from stock.models import StockItem, StockLocation
+
+    key = output_completion_progress_key(build_id)
+
+    build_order = build.models.Build.objects.filter(pk=build_id).first()
+
+    if not build_order:
+        logger.warning("Could not complete build outputs for BuildOrder <%s> - BuildOrder does not exist", build_id)
+        TaskProgress.clear_progress(key)
+        return
+
+    user = User.objects.filter(pk=user_id).first() if user_id else None
+
+    options = {
+        'status': kwargs.get('status', StockStatus.OK.value),
+        'notes': kwargs.get('notes', ''),
+    }
+
+    if location_id := kwargs.get('location_id', None):
+        options['location'] = StockLocation.objects.filter(pk=location_id).first()
+
+    output_ids = list(output_ids)
+    total = len(output_ids)
+
+    outputs = StockItem.objects.filter(
+        pk__in=output_ids,
+        build=build_order,
+        is_building=True,
+    ).order_by('pk')
+
+    output_ids = list(outputs.values_list('pk', flat=True))
+    completed = total - len(output_ids)
+
+    TaskProgress.set_progress(key, total, completed, finished=completed >= total)
+
+    try:
+        for idx in range(0, len(output_ids), chunk_size):
+            chunk = output_ids[idx:idx + chunk_size]
+
+            with transaction.atomic():
+                build_order.complete_build_outputs(
+                    StockItem.objects.filter(pk__in=chunk).order_by('pk'),
+                    user,
+                    **options
+                )
+
+            completed += len(chunk)
+            TaskProgress.set_progress(key, total, completed, finished=completed >= total)
+    except Exception as exc:
+        # Report the failure, so that clients stop waiting for the task to finish
+        TaskProgress.set_failed(key, exc)
+        raise
+
+
 def update_build_order_lines(bom_item_pk: int):
     """Update all BuildOrderLineItem objects which reference a particular BomItem.
 
@@ -1,17 +1,23 @@
 """Unit tests for the BuildOrder API"""
 
 from datetime import datetime, timedelta
+from unittest import mock
 
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from rest_framework import status
 
-from part.models import Part
+import build.serializers
+import build.tasks
+from part.models import BomItem, Part
 from build.models import Build, BuildItem
-from stock.models import StockItem
+from stock.models import StockItem, StockLocation
 
 from InvenTree.status_codes import BuildStatus, StockStatus
-from InvenTree.unit_test import InvenTreeAPITestCase
+from InvenTree.unit_test import InvenTreeAPITestCase, run_queued_tasks
 
 
 class TestBuildAPI(InvenTreeAPITestCase):
@@ -263,6 +269,54 @@ class BuildTest(BuildAPITest):
         # Build should have been marked as complete
         self.assertTrue(self.build.is_complete)
 
+    def test_complete_background(self):
+        """Test that a large number of build outputs are completed via the background task."""
+        for _ in range(5):
+            self.build.create_build_output(10)
+
+        outputs = self.build.incomplete_outputs.all()
+
+        progress_url = reverse('api-build-output-complete-progress', kwargs={'pk': self.build.pk})
+
+        data = {
+            "outputs": [{"output": output.pk} for output in outputs],
+            "location": 1,
+        }
+
+        with mock.patch.object(build.serializers.BuildOutputCompleteSerializer, 'BACKGROUND_THRESHOLD', 3):
+            # The outputs are completed inline if the task cannot be queued
+            with mock.patch('InvenTree.tasks.offload_task', return_value=False):
+                with mock.patch.object(Build, 'complete_build_outputs', side_effect=ValidationError('Completion failed')):
+                    response = self.post(self.url, data, expected_code=400)
+
+            self.assertIn('Completion failed', str(response.data))
+
+            response = self.post(self.url, data, expected_code=201)
+
+        self.assertTrue(response.data['background'])
+
+        # The outputs are completed when the queued task is run
+        self.assertEqual(self.build.incomplete_outputs.count(), 5)
+
+        response = self.get(progress_url, expected_code=200)
+
+        self.assertEqual(response.data['total'], 5)
+        self.assertEqual(response.data['completed'], 0)
+        self.assertFalse(response.data['finished'])
+
+        self.assertEqual(run_queued_tasks(build.tasks.complete_build_outputs), 1)
+
+        self.assertEqual(self.build.incomplete_outputs.count(), 0)
+
+        self.build.refresh_from_db()
+        self.assertEqual(self.build.completed, 50)
+
+        response = self.get(progress_url, expected_code=200)
+
+        self.assertEqual(response.data['total'], 5)
+        self.assertEqual(response.data['completed'], 5)
+        self.assertTrue(response.data['finished'])
+
     def test_cancel(self):
         """Test that we can cancel a BuildOrder via the API."""
         bo = Build.objects.get(pk=1)
@@ -875,6 +929,30 @@ class BuildAllocationTest(BuildAPITest):
         )
 
 
+    def test_auto_allocate_dry_run(self):
+        """Test the 'dry_run' option for the auto-allocate endpoint."""
+        url = reverse('api-build-auto-allocate', kwargs={'pk': 1})
+
+        data = {'interchangeable': True, 'optional_items': True}
+
+        response = self.post(url, {**data, 'dry_run': True}, expected_code=201)
+
+        allocations = response.data['allocations']
+        self.assertGreater(len(allocations), 0)
+
+        # Nothing has been allocated
+        self.assertEqual(BuildItem.objects.count(), self.n)
+
+        for allocation in allocations:
+            for key in ['build_line', 'stock_item', 'quantity']:
+                self.assertIn(key, allocation)
+
+        # Perform the actual allocation
+        response = self.post(url, data, expected_code=201)
+
+        self.assertEqual(response.data['allocations'], allocations)
+        self.assertEqual(BuildItem.objects.count(), self.n + len(allocations))
+
 class BuildOverallocationTest(BuildAPITest):
     """Unit tests for over allocation of stock items against a build order.
 
@@ -1203,3 +1281,133 @@ class BuildOutputScrapTest(BuildAPITest):
             output.refresh_from_db()
             self.assertEqual(output.status, StockStatus.REJECTED)
             self.assertFalse(output.is_building)
+
+
+class BuildLineTest(InvenTreeAPITestCase):
+    """Unit tests for the BuildLine API endpoints, against a synthetic large build."""
+
+    roles = [
+        'build.view',
+        'stock.view',
+    ]
+
+    N_LINES = 30
+    N_ITEMS = 50
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a build with a large number of lines, and a large amount of stock."""
+        super().setUpTestData()
+
+        from build.models import generate_next_build_reference
+
+        assembly = Part.objects.create(
+            name='Big Assembly',
+            description='An assembly with a large BOM',
+            assembly=True,
+        )
+
+        location = StockLocation.objects.create(name='Warehouse', description='Lots of stock')
+
+        cls.components = []
+
+        for idx in range(cls.N_LINES):
+            component = Part.objects.create(
+                name=f'Component {idx}',
+                description='A component part',
+                component=True,
+            )
+
+            BomItem.objects.create(part=assembly, sub_part=component, quantity=2)
+
+            cls.components.append(component)
+
+        StockItem.objects.bulk_create([
+            StockItem(
+                part=component,
+                location=location,
+                quantity=10,
+                lft=0,
+                rght=0,
+                level=0,
+                tree_id=0,
+            )
+            for component in cls.components
+            for _ in range(cls.N_ITEMS)
+        ])
+
+        cls.build = Build.objects.create(
+            reference=generate_next_build_reference(),
+            title='A large build',
+            part=assembly,
+            quantity=10,
+        )
+
+    def test_line_list_sparse(self):
+        """Only the requested fields are computed for the build line list."""
+        url = reverse('api-build-line-list')
+
+        with CaptureQueriesContext(connection) as ctx_full:
+            full = self.get(url, {'build': self.build.pk}, expected_code=200).data
+
+        with CaptureQueriesContext(connection) as ctx_sparse:
+            sparse = self.get(
+                url,
+                {'build': self.build.pk, 'fields': 'quantity,bom_item'},
+                expected_code=200,
+            ).data
+
+        self.assertEqual(len(full), len(sparse))
+
+        for line in sparse:
+            self.assertEqual(set(line.keys()), {'pk', 'quantity', 'bom_item'})
+
+        sql_full = ' '.join(q['sql'] for q in ctx_full.captured_queries)
+        sql_sparse = ' '.join(q['sql'] for q in ctx_sparse.captured_queries)
+
+        self.assertLessEqual(len(ctx_sparse), len(ctx_full))
+        self.assertLess(len(sql_sparse), len(sql_full) / 2)
+
+    def test_line_list(self):
+        """The build line list is served from aggregates, without loading stock items."""
+        from django.db.models.signals import post_init
+
+        loaded = []
+
+        def count_stock_items(sender, instance, **kwargs):
+            loaded.append(instance)
+
+        post_init.connect(count_stock_items, sender=StockItem)
+
+        try:
+            with self.assertNumQueriesLessThan(50):
+                response = self.get(
+                    reverse('api-build-line-list'),
+                    {'build': self.build.pk},
+                    expected_code=200,
+                )
+        finally:
+            post_init.disconnect(count_stock_items, sender=StockItem)
+
+        self.assertEqual(len(response.data), self.N_LINES)
+
+        # No stock items are loaded into memory
+        self.assertEqual(len(loaded), 0)
+
+        for line in response.data:
+            self.assertEqual(line['available_stock'], 10 * self.N_ITEMS)
+            self.assertEqual(line['quantity'], 20)
+
+    def test_line_stock(self):
+        """Stock items for a single line are available from a separate endpoint."""
+        line = self.build.build_lines.first()
+
+        url = reverse('api-build-line-stock', kwargs={'pk': line.pk})
+
+        response = self.get(url, {'limit': 10}, expected_code=200)
+
+        self.assertEqual(response.data['count'], self.N_ITEMS)
+        self.assertEqual(len(response.data['results']), 10)
+
+        for item in response.data['results']:
+            self.assertEqual(item['part'], line.bom_item.sub_part.pk)
@@ -1,13 +1,16 @@
 """Unit tests for the 'build' models"""
 import uuid
 from datetime import datetime, timedelta
+from unittest import mock
 
 from django.test import TestCase
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.db.models import Sum
+from django.test.utils import CaptureQueriesContext
 
 from InvenTree import status_codes as status
 
@@ -664,6 +667,146 @@ class BuildTest(BuildTestBase):
         # let's see if a non required test could be saved
         self.build_wo_tests_trackable.complete_build_output(self.stockitem_wo_required_test, None)
 
+    def test_complete_outputs_bulk(self):
+        """Test completion of multiple build outputs at once"""
+        outputs = [self.output_1, self.output_2]
+
+        # Allocate tracked parts against each output, from the same stock item
+        self.allocate_stock(self.output_1, {self.stock_3_1: 6})
+        self.allocate_stock(self.output_2, {self.stock_3_1: 14})
+
+        self.build.complete_build_outputs(outputs, None)
+
+        self.assertEqual(self.build.completed, 10)
+        self.assertEqual(BuildItem.objects.filter(install_into__in=outputs).count(), 0)
+
+        # The source stock item has been split
+        source = StockItem.objects.get(pk=self.stock_3_1.pk)
+        self.assertEqual(source.quantity, 980)
+
+        children = source.get_children()
+        self.assertEqual(children.count(), 2)
+
+        for output, quantity in zip(outputs, [6, 14]):
+            output.refresh_from_db()
+            self.assertFalse(output.is_building)
+
+            # The split stock has been installed into each output
+            item = children.get(belongs_to=output)
+            self.assertEqual(item.quantity, quantity)
+            self.assertEqual(item.consumed_by, self.build)
+
+            self.assertTrue(item.tracking_info.filter(
+                tracking_type=status.StockHistoryCode.SPLIT_FROM_PARENT.value
+            ).exists())
+
+            self.assertTrue(item.tracking_info.filter(
+                tracking_type=status.StockHistoryCode.INSTALLED_INTO_ASSEMBLY.value
+            ).exists())
+
+            self.assertEqual(output.tracking_info.filter(
+                tracking_type=status.StockHistoryCode.INSTALLED_CHILD_ITEM.value
+            ).count(), 1)
+
+            self.assertEqual(output.tracking_info.filter(
+                tracking_type=status.StockHistoryCode.BUILD_OUTPUT_COMPLETED.value
+            ).count(), 1)
+
+        self.assertEqual(source.tracking_info.filter(
+            tracking_type=status.StockHistoryCode.SPLIT_CHILD_ITEM.value
+        ).count(), 2)
+
+    def test_complete_outputs_queries(self):
+        """The number of queries required to complete outputs does not scale with the number of outputs"""
+        def create_outputs(n):
+            outputs = [
+                StockItem.objects.create(part=self.assembly, quantity=1, is_building=True, build=self.build)
+                for _ in range(n)
+            ]
+
+            for output in outputs:
+                self.allocate_stock(output, {self.stock_3_1: 2})
+
+            return outputs
+
+        queries = []
+
+        for n in [2, 20]:
+            outputs = create_outputs(n)
+
+            with CaptureQueriesContext(connection) as ctx:
+                self.build.complete_build_outputs(outputs, None)
+
+            queries.append(len(ctx))
+
+        self.assertEqual(queries[0], queries[1])
+
+        self.assertEqual(StockItem.objects.get(pk=self.stock_3_1.pk).quantity, 1000 - 44)
+        self.assertEqual(StockItem.objects.filter(parent=self.stock_3_1, belongs_to__isnull=False).count(), 22)
+
+    def test_complete_outputs_task(self):
+        """Test completion of build outputs via the background task"""
+        self.allocate_stock(self.output_1, {self.stock_3_1: 6})
+        self.allocate_stock(self.output_2, {self.stock_3_1: 14})
+
+        pks = [self.output_1.pk, self.output_2.pk]
+
+        build.tasks.complete_build_outputs(self.build.pk, pks, None, chunk_size=1)
+
+        key = build.tasks.output_completion_progress_key(self.build.pk)
+
+        self.assertEqual(
+            common.models.TaskProgress.get_progress_data(key),
+            {'total': 2, 'completed': 2, 'finished': True, 'error': ''}
+        )
+
+        self.assertEqual(StockItem.objects.filter(pk__in=pks, is_building=False).count(), 2)
+
+        self.build.refresh_from_db()
+        self.assertEqual(self.build.completed, 10)
+
+        # Running the task again has no effect
+        build.tasks.complete_build_outputs(self.build.pk, pks, None)
+
+        self.build.refresh_from_db()
+        self.assertEqual(self.build.completed, 10)
+
+    def test_complete_outputs_task_error(self):
+        """Test that a failure of the build output completion task is reported."""
+        self.allocate_stock(self.output_1, {self.stock_3_1: 6})
+        self.allocate_stock(self.output_2, {self.stock_3_1: 14})
+
+        pks = [self.output_1.pk, self.output_2.pk]
+
+        key = build.tasks.output_completion_progress_key(self.build.pk)
+
+        complete_outputs = Build.complete_build_outputs
+
+        def fail_second_chunk(build_order, outputs, *args, **kwargs):
+            """Complete the first output, then fail."""
+            if self.output_2.pk in [output.pk for output in outputs]:
+                raise ValidationError('Required tests have not passed')
+
+            return complete_outputs(build_order, outputs, *args, **kwargs)
+
+        with mock.patch.object(Build, 'complete_build_outputs', fail_second_chunk):
+            with self.assertRaises(ValidationError):
+                build.tasks.complete_build_outputs(self.build.pk, pks, None, chunk_size=1)
+
+        # The task is reported as finished, with the error message and the outputs completed so far
+        self.assertEqual(
+            common.models.TaskProgress.get_progress_data(key),
+            {'total': 2, 'completed': 1, 'finished': True, 'error': 'Required tests have not passed'}
+        )
+
+        # Retrying the task clears the error
+        build.tasks.complete_build_outputs(self.build.pk, pks, None)
+
+        self.assertEqual(
+            common.models.TaskProgress.get_progress_data(key),
+            {'total': 2, 'completed': 2, 'finished': True, 'error': ''}
+        )
+
     def test_overdue_notification(self):
         """Test sending of notifications when a build order is overdue."""
         self.build.target_date = datetime.now().date() - timedelta(days=1)
@@ -810,6 +953,39 @@ class AutoAllocationTests(BuildTestBase):
         self.assertTrue(self.line_1.is_fully_allocated())
         self.assertFalse(self.line_2.is_fully_allocated())
 
+    def test_dry_run(self):
+        """A 'dry run' returns the proposed allocations, without saving them"""
+        with CaptureQueriesContext(connection) as queries:
+            plan = self.build.auto_allocate_stock(
+                interchangeable=True,
+                substitutes=True,
+                optional_items=True,
+                dry_run=True,
+            )
+
+        # Stock for all lines is loaded at once
+        self.assertLess(len(queries), 10)
+
+        self.assertEqual(self.build.allocated_stock.count(), 0)
+
+        self.assertEqual(sum(item.quantity for item in plan if item.build_line == self.line_1), 50)
+        self.assertEqual(sum(item.quantity for item in plan if item.build_line == self.line_2), 30)
+
+        # Direct part matches are allocated before substitute parts
+        line_2_parts = [item.stock_item.part for item in plan if item.build_line == self.line_2]
+        self.assertEqual(line_2_parts[-1].name, 'alt part')
+        self.assertTrue(all(p == self.sub_part_2 for p in line_2_parts[:-1]))
+
+        # Performing the allocation matches the plan
+        self.build.auto_allocate_stock(
+            interchangeable=True,
+            substitutes=True,
+            optional_items=True,
+        )
+
+        allocated = set(self.build.allocated_stock.values_list('stock_item', 'quantity'))
+        self.assertEqual(allocated, {(item.stock_item_id, item.quantity) for item in plan})
+
     def test_fully_auto(self):
         """We should be able to auto-allocate against a build in a single go"""
         self.build.auto_allocate_stock(
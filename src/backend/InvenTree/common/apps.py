@@ -19,6 +19,9 @@ class CommonConfig(AppConfig):
 
     def ready(self):
         """Initialize restart flag clearance on startup."""
+        # Connect the search index signal handlers
+        import common.search  # noqa: F401
+
         if InvenTree.ready.isRunningMigrations():
             return
 
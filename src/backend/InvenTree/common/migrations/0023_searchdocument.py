@@ -0,0 +1,98 @@
+# Generated by Django 4.2.11 on 2026-10-19 07:10
+
+import logging
+
+from django.db import migrations, models, transaction
+import django.db.models.deletion
+
+logger = logging.getLogger('inventree')
+
+
+# SQLite: FTS5 virtual table (trigram tokenizer), kept in sync with the document table via triggers
+# The statements are idempotent, and the FTS index is rebuilt from the document table,
+# so that an existing (possibly stale) FTS table is brought back in sync
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS common_searchdocument_fts USING fts5(document, content='common_searchdocument', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS common_searchdocument_fts_insert AFTER INSERT ON common_searchdocument BEGIN INSERT INTO common_searchdocument_fts(rowid, document) VALUES (new.id, new.document); END",
+    "CREATE TRIGGER IF NOT EXISTS common_searchdocument_fts_delete AFTER DELETE ON common_searchdocument BEGIN INSERT INTO common_searchdocument_fts(common_searchdocument_fts, rowid, document) VALUES ('delete', old.id, old.document); END",
+    "CREATE TRIGGER IF NOT EXISTS common_searchdocument_fts_update AFTER UPDATE ON common_searchdocument BEGIN INSERT INTO common_searchdocument_fts(common_searchdocument_fts, rowid, document) VALUES ('delete', old.id, old.document); INSERT INTO common_searchdocument_fts(rowid, document) VALUES (new.id, new.document); END",
+    "INSERT INTO common_searchdocument_fts(common_searchdocument_fts) VALUES ('rebuild')",
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS common_searchdocument_fts_insert",
+    "DROP TRIGGER IF EXISTS common_searchdocument_fts_delete",
+    "DROP TRIGGER IF EXISTS common_searchdocument_fts_update",
+    "DROP TABLE IF EXISTS common_searchdocument_fts",
+]
+
+# PostgreSQL: trigram index which supports case-insensitive substring (icontains) lookups
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    'CREATE INDEX IF NOT EXISTS common_searchdocument_trgm ON common_searchdocument USING gin (UPPER("document"::text) gin_trgm_ops)',
+]
+
+POSTGRES_REVERSE = [
+    "DROP INDEX IF EXISTS common_searchdocument_trgm",
+]
+
+
+def run_statements(schema_editor, statements, action):
+    """Run the provided SQL statements, as a single unit.
+
+    If the statements cannot be run (e.g. missing database support), none of them are applied,
+    and a warning is logged. In this case, searches fall back to standard lookups.
+    """
+
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            for statement in statements:
+                schema_editor.execute(statement)
+    except Exception as exc:
+        logger.warning("Could not %s search index structures: %s", action, str(exc))
+
+
+def create_search_index(apps, schema_editor):
+    """Create database specific search index structures."""
+
+    vendor = schema_editor.connection.vendor
+
+    if vendor == 'sqlite':
+        run_statements(schema_editor, SQLITE_FORWARD, 'create')
+    elif vendor == 'postgresql':
+        run_statements(schema_editor, POSTGRES_FORWARD, 'create')
+
+
+def remove_search_index(apps, schema_editor):
+    """Remove database specific search index structures."""
+
+    vendor = schema_editor.connection.vendor
+
+    if vendor == 'sqlite':
+        run_statements(schema_editor, SQLITE_REVERSE, 'remove')
+    elif vendor == 'postgresql':
+        run_statements(schema_editor, POSTGRES_REVERSE, 'remove')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('common', '0022_projectcode_responsible'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveIntegerField()),
+                ('document', models.TextField(blank=True)),
+                ('model_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'unique_together': {('model_type', 'object_id')},
+            },
+        ),
+        migrations.RunPython(create_search_index, reverse_code=remove_search_index),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.11 on 2026-10-19 07:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0023_searchdocument'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Sequence',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=250, unique=True, verbose_name='Key')),
+                ('value', models.BigIntegerField(default=0, verbose_name='Value')),
+            ],
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.11 on 2026-10-19 12:09
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('common', '0024_sequence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskProgress',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=250, unique=True, verbose_name='Key')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='Total')),
+                ('completed', models.PositiveIntegerField(default=0, verbose_name='Completed')),
+                ('finished', models.BooleanField(default=False, verbose_name='Finished')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Updated')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
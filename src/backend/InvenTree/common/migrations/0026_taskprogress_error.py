@@ -0,0 +1,18 @@
+# Generated by Django 4.2.11 on 2026-10-19 14:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0025_taskprogress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='taskprogress',
+            name='error',
+            field=models.TextField(blank=True, default='', verbose_name='Error'),
+        ),
+    ]
@@ -28,6 +28,8 @@ from django.core.cache import cache
 from django.core.exceptions import AppRegistryNotReady, ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator, URLValidator
 from django.db import models, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
 from django.db.models.signals import post_delete, post_save
 from django.db.utils import IntegrityError, OperationalError, ProgrammingError
 from django.dispatch.dispatcher import receiver
@@ -1146,6 +1148,13 @@ def update_instance_name(setting):
     site_obj.save()
 
 
+def after_change_part_name_format(setting):
+    """Callback function when the 'PART_NAME_FORMAT' setting is changed."""
+    from part.helpers import invalidate_full_name_template
+
+    invalidate_full_name_template()
+
+
 def validate_email_domains(setting):
     """Validate the email domains setting."""
     if not setting.value:
@@ -1550,6 +1559,7 @@ class InvenTreeSetting(BaseInvenTreeSetting):
             'default': "{{ part.IPN if part.IPN }}{{ ' | ' if part.IPN }}{{ part.name }}{{ ' | ' if part.revision }}"
             '{{ part.revision if part.revision }}',
             'validator': InvenTree.validators.validate_part_name_format,
+            'after_save': after_change_part_name_format,
         },
         'PART_CATEGORY_DEFAULT_ICON': {
             'name': _('Part Category Default Icon'),
@@ -3028,6 +3038,213 @@ class NewsFeedEntry(models.Model):
     )
 
 
+class SearchDocument(models.Model):
+    """A SearchDocument stores the searchable text for a single database object.
+
+    Search documents are used by the (optional) search index,
+    which allows search queries to be performed against a single (indexed) table,
+    rather than across a large number of (related) fields.
+
+    Refer to common.search for further information.
+
+    Attributes:
+    - model_type: ContentType of the indexed model
+    - object_id: Primary key of the indexed object
+    - document: Searchable text content for the indexed object
+    """
+
+    class Meta:
+        """Meta options for SearchDocument."""
+
+        unique_together = [('model_type', 'object_id')]
+
+    model_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+
+    object_id = models.PositiveIntegerField()
+
+    document = models.TextField(blank=True)
+
+
+class Sequence(models.Model):
+    """A Sequence is a named, monotonically increasing counter stored in the database.
+
+    Values are handed out with a single atomic UPDATE statement,
+    so concurrent callers can never be allocated the same value(s).
+
+    Attributes:
+    - key: Unique name for this sequence
+    - value: The most recently allocated value
+    """
+
+    key = models.CharField(max_length=250, unique=True, verbose_name=_('Key'))
+
+    value = models.BigIntegerField(default=0, verbose_name=_('Value'))
+
+    def __str__(self):
+        """Return a string representation of this sequence."""
+        return f'{self.key}: {self.value}'
+
+    @classmethod
+    def allocate(cls, key: str, count: int = 1, minimum: int = 0) -> int:
+        """Allocate a contiguous block of values from the named sequence.
+
+        Arguments:
+            key: The name of the sequence (created if it does not exist)
+            count: The number of values to allocate
+            minimum: Values will be allocated strictly above this value
+
+        Returns:
+            The first allocated value. The allocated block is [first, first + count)
+        """
+        count = max(int(count), 1)
+
+        with transaction.atomic():
+            cls.objects.get_or_create(key=key)
+
+            # The UPDATE acquires a row lock, which is held until the transaction completes
+            cls.objects.filter(key=key).update(
+                value=Greatest(F('value'), Value(int(minimum))) + count
+            )
+
+            value = cls.objects.filter(key=key).values_list('value', flat=True)[0]
+
+        return value - count + 1
+
+    @classmethod
+    def try_lock(cls, key: str) -> bool:
+        """Attempt to acquire an exclusive (cross-process) lock on the named sequence.
+
+        Must be called within an atomic block, and the lock is held until the transaction completes.
+
+        Returns:
+            True if the lock was acquired, or False (without waiting) if it is held by another transaction
+
+        Note: Database backends which do not support row locking (e.g. sqlite) serialize write transactions,
+        so the lock is always acquired.
+        """
+        cls.objects.get_or_create(key=key)
+
+        return bool(
+            cls.objects.select_for_update(skip_locked=True)
+            .filter(key=key)
+            .values_list('pk', flat=True)
+        )
+
+
+class TaskProgress(models.Model):
+    """A TaskProgress records the progress of a long-running background task.
+
+    Progress is stored in the database (rather than the cache),
+    so that it can be reported by any server process while the task is run by the background worker.
+
+    If the task fails, it is reported as finished with an error message,
+    and the number of items completed before the failure is retained.
+
+    Attributes:
+    - key: Unique identifier for the task
+    - user: The user who started the task (optional)
+    - total: Total number of items to be processed
+    - completed: Number of items which have been processed
+    - finished: True once the task has finished (successfully or not)
+    - error: Error message, if the task failed
+    - updated: Date / time of the most recent progress update
+    """
+
+    key = models.CharField(max_length=250, unique=True, verbose_name=_('Key'))
+
+    user = models.ForeignKey(
+        User, on_delete=models.SET_NULL, blank=True, null=True, related_name='+'
+    )
+
+    total = models.PositiveIntegerField(default=0, verbose_name=_('Total'))
+
+    completed = models.PositiveIntegerField(default=0, verbose_name=_('Completed'))
+
+    finished = models.BooleanField(default=False, verbose_name=_('Finished'))
+
+    error = models.TextField(blank=True, default='', verbose_name=_('Error'))
+
+    updated = models.DateTimeField(auto_now=True, verbose_name=_('Updated'))
+
+    def __str__(self):
+        """Return a string representation of this task progress."""
+        return f'{self.key}: {self.completed} / {self.total}'
+
+    def to_dict(self) -> dict:
+        """Return the progress information as a dict."""
+        return {
+            'total': self.total,
+            'completed': self.completed,
+            'finished': self.finished,
+            'error': self.error,
+        }
+
+    @classmethod
+    def get_progress(cls, key: str):
+        """Return the TaskProgress instance for the provided key (or None if the task is unknown)."""
+        return cls.objects.filter(key=key).first()
+
+    @classmethod
+    def get_progress_data(cls, key: str) -> dict:
+        """Return the progress of the task with the provided key, as a dict.
+
+        If no progress is recorded for the task, there is nothing left to do,
+        and the task is reported as finished.
+        """
+        progress = cls.get_progress(key)
+
+        if progress is None:
+            return {'total': 0, 'completed': 0, 'finished': True, 'error': ''}
+
+        return progress.to_dict()
+
+    @classmethod
+    def set_progress(
+        cls,
+        key: str,
+        total: int,
+        completed: int,
+        finished: bool = False,
+        user_id: int = None,
+    ):
+        """Record the progress of the task with the provided key."""
+        defaults = {
+            'total': total,
+            'completed': completed,
+            'finished': finished,
+            'error': '',
+        }
+
+        if user_id is not None:
+            defaults['user_id'] = user_id
+
+        progress, _created = cls.objects.update_or_create(key=key, defaults=defaults)
+
+        return progress
+
+    @classmethod
+    def set_failed(cls, key: str, error):
+        """Record that the task with the provided key has failed.
+
+        Arguments:
+            key: Unique identifier for the task
+            error: The exception (or error message) which caused the task to fail
+        """
+        if isinstance(error, ValidationError):
+            error = '; '.join(error.messages)
+
+        progress, _created = cls.objects.update_or_create(
+            key=key, defaults={'finished': True, 'error': str(error)}
+        )
+
+        return progress
+
+    @classmethod
+    def clear_progress(cls, key: str):
+        """Remove the progress record for the task with the provided key."""
+        cls.objects.filter(key=key).delete()
+
+
 def rename_notes_image(instance, filename):
     """Function for renaming uploading image file. Will store in the 'notes' directory."""
     fname = os.path.basename(filename)
@@ -6,10 +6,13 @@ from datetime import timedelta
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
 import common.models
 import InvenTree.helpers
+import InvenTree.tasks
 from InvenTree.ready import isImportingData
 from plugin import registry
 from plugin.models import NotificationUserSetting, PluginConfig
@@ -157,6 +160,29 @@ class NotificationMethod:
             method=self.METHOD_NAME,
         )
 
+    def get_enabled_users(self, users) -> list:
+        """Return the provided users which have this method enabled in their notification settings.
+
+        The settings for all users are retrieved with a single query.
+        """
+        key = f'NOTIFICATION_METHOD_{self.METHOD_NAME.upper()}'
+
+        default = NotificationUserSetting.get_setting_default(
+            key, settings=storage.user_settings
+        )
+
+        values = dict(
+            NotificationUserSetting.objects.filter(
+                key__iexact=key, method=self.METHOD_NAME, user__in=users
+            ).values_list('user', 'value')
+        )
+
+        return [
+            user
+            for user in users
+            if InvenTree.helpers.str2bool(values.get(user.pk, default))
+        ]
+
     # endregion
 
 
@@ -257,7 +283,7 @@ IGNORED_NOTIFICATION_CLS = {SingleNotificationMethod, BulkNotificationMethod}
 storage = MethodStorageClass()
 
 
-class UIMessageNotification(SingleNotificationMethod):
+class UIMessageNotification(BulkNotificationMethod):
     """Delivery method for sending specific users notifications in the notification pain in the web UI."""
 
     METHOD_NAME = 'ui_message'
@@ -266,16 +292,20 @@ class UIMessageNotification(SingleNotificationMethod):
         """Only send notifications for active users."""
         return [target for target in self.targets if target.is_active]
 
-    def send(self, target):
-        """Send a UI notification to a user."""
-        common.models.NotificationMessage.objects.create(
-            target_object=self.obj,
-            source_object=target,
-            user=target,
-            category=self.category,
-            name=self.context['name'],
-            message=self.context['message'],
-        )
+    def send_bulk(self):
+        """Send a UI notification to each user (with a single query)."""
+        common.models.NotificationMessage.objects.bulk_create([
+            common.models.NotificationMessage(
+                target_object=self.obj,
+                source_object=target,
+                user=target,
+                category=self.category,
+                name=self.context['name'],
+                message=self.context['message'],
+            )
+            for target in self.targets
+        ])
+
         return True
 
 
@@ -342,7 +372,11 @@ class InvenTreeNotificationBodies:
 
 
 def trigger_notification(obj, category=None, obj_ref='pk', **kwargs):
-    """Send out a notification."""
+    """Send out a notification.
+
+    The targets are resolved (to user and group IDs) immediately,
+    and the notification is then delivered by the background worker.
+    """
     targets = kwargs.get('targets', None)
     target_fnc = kwargs.get('target_fnc', None)
     target_args = kwargs.get('target_args', [])
@@ -381,65 +415,129 @@ def trigger_notification(obj, category=None, obj_ref='pk', **kwargs):
 
     logger.info("Gathering users for notification '%s'", category)
 
-    if target_exclude is None:
-        target_exclude = set()
-
     # Collect possible targets
     if not targets:
         targets = target_fnc(*target_args, **target_kwargs)
 
-    # Convert list of targets to a list of users
-    # (targets may include 'owner' or 'group' classes)
-    target_users = set()
-
-    if targets:
-        for target in targets:
-            if target is None:
-                continue
-            # User instance is provided
-            elif isinstance(target, get_user_model()):
-                if target not in target_exclude:
-                    target_users.add(target)
-            # Group instance is provided
-            elif isinstance(target, Group):
-                for user in get_user_model().objects.filter(groups__name=target.name):
-                    if user not in target_exclude:
-                        target_users.add(user)
-            # Owner instance (either 'user' or 'group' is provided)
-            elif isinstance(target, Owner):
-                for owner in target.get_related_owners(include_group=False):
-                    user = owner.owner
-                    if user not in target_exclude:
-                        target_users.add(user)
-            # Unhandled type
-            else:
-                logger.error(
-                    'Unknown target passed to trigger_notification method: %s', target
-                )
+    recipients = get_notification_recipients(targets, target_exclude)
+
+    if not recipients['users'] and not recipients['groups']:
+        logger.debug("No possible users for notification '%s'", category)
+        return
+
+    # Record the notification now (rather than after delivery),
+    # so that any repeated triggers are skipped while the delivery is pending
+    common.models.NotificationEntry.notify(category, obj_ref_value)
+
+    InvenTree.tasks.offload_task(
+        deliver_notifications,
+        obj,
+        category,
+        obj_ref_value,
+        recipients,
+        context,
+        delivery_methods=delivery_methods,
+    )
 
-    if target_users:
-        logger.info("Sending notification '%s' for '%s'", category, str(obj))
 
-        # Collect possible methods
-        if delivery_methods is None:
-            delivery_methods = storage.liste or []
+def get_notification_recipients(targets, target_exclude=None) -> dict:
+    """Convert a list of notification targets to the IDs of the target users and groups.
+
+    Targets may be User, Group or Owner instances (no database queries are required).
+
+    Returns:
+        A dict containing the 'users', 'groups' and (excluded) 'exclude' ID lists
+    """
+    user_model = get_user_model()
+    user_type = ContentType.objects.get_for_model(user_model)
+    group_type = ContentType.objects.get_for_model(Group)
+
+    users = set()
+    groups = set()
+
+    for target in targets or []:
+        if target is None:
+            continue
+        # User instance is provided
+        elif isinstance(target, user_model):
+            users.add(target.pk)
+        # Group instance is provided
+        elif isinstance(target, Group):
+            groups.add(target.pk)
+        # Owner instance (either 'user' or 'group' is provided)
+        elif isinstance(target, Owner):
+            if target.owner_type_id == user_type.pk:
+                users.add(target.owner_id)
+            elif target.owner_type_id == group_type.pk:
+                groups.add(target.owner_id)
+        # Unhandled type
         else:
-            delivery_methods = delivery_methods - IGNORED_NOTIFICATION_CLS
-
-        for method in delivery_methods:
-            logger.info("Triggering notification method '%s'", method.METHOD_NAME)
-            try:
-                deliver_notification(method, obj, category, target_users, context)
-            except NotImplementedError as error:
-                # Allow any single notification method to fail, without failing the others
-                logger.error(error)  # noqa: LOG005
-            except Exception as error:
-                logger.error(error)  # noqa: LOG005
-
-        # Set delivery flag
-        common.models.NotificationEntry.notify(category, obj_ref_value)
-    else:
+            logger.error(
+                'Unknown target passed to trigger_notification method: %s', target
+            )
+
+    exclude = {user.pk for user in target_exclude or [] if user is not None}
+
+    return {
+        'users': sorted(users),
+        'groups': sorted(groups),
+        'exclude': sorted(exclude),
+    }
+
+
+def get_notification_users(users=None, groups=None, exclude=None):
+    """Return a queryset of the users (and members of the groups) which should be notified.
+
+    Arguments:
+        users: IDs of the target users
+        groups: IDs of the target groups
+        exclude: IDs of any users which should not be notified
+    """
+    return (
+        get_user_model()
+        .objects.filter(Q(pk__in=users or []) | Q(groups__in=groups or []))
+        .exclude(pk__in=exclude or [])
+        .distinct()
+    )
+
+
+def deliver_notifications(
+    obj, category, obj_ref_value, recipients: dict, context: dict, **kwargs
+):
+    """Deliver a notification to the provided recipients, via each delivery method.
+
+    Arguments:
+        obj: The object which the notification refers to
+        category: The notification category
+        obj_ref_value: Reference value for the object (see trigger_notification)
+        recipients: The target user and group IDs (see get_notification_recipients)
+        context: The notification context
+    """
+    delivery_methods = kwargs.get('delivery_methods', None)
+
+    target_users = list(get_notification_users(**recipients))
+
+    if not target_users:
         logger.debug("No possible users for notification '%s'", category)
+        return
+
+    logger.info("Sending notification '%s' for '%s'", category, str(obj))
+
+    # Collect possible methods
+    if delivery_methods is None:
+        delivery_methods = storage.liste or []
+    else:
+        delivery_methods = delivery_methods - IGNORED_NOTIFICATION_CLS
+
+    for method in delivery_methods:
+        logger.info("Triggering notification method '%s'", method.METHOD_NAME)
+        try:
+            deliver_notification(method, obj, category, target_users, context)
+        except NotImplementedError as error:
+            # Allow any single notification method to fail, without failing the others
+            logger.error(error)  # noqa: LOG005
+        except Exception as error:
+            logger.error(error)  # noqa: LOG005
 
 
 def trigger_superuser_notification(plugin: PluginConfig, msg: str):
@@ -0,0 +1,477 @@
+"""Search index support for InvenTree.
+
+The (optional) search index maintains a single text "document" for each indexed database object,
+which contains the values of all the fields which are searched by the matching API list endpoint.
+
+Search queries are then performed against the document table, rather than as a series of
+'icontains' lookups (OR'd together) across many (related) fields:
+
+- PostgreSQL: A trigram (pg_trgm) GIN index supports the substring lookups
+- SQLite: An FTS5 virtual table (trigram tokenizer) is used to match search terms
+- Other database backends perform substring lookups against the document table
+
+Search documents are updated when indexed objects (or the objects they depend on) are saved,
+and the entire index can be rebuilt using the 'rebuild_search_index' management command.
+
+The search index is enabled via the INVENTREE_SEARCH_INDEX setting.
+"""
+
+import logging
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+from django.db.models import F, OuterRef, Q, Subquery, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import StrIndex, Upper
+from django.db.models.signals import post_delete, post_save
+from django.db.utils import OperationalError, ProgrammingError
+from django.dispatch import receiver
+
+import InvenTree.ready
+import InvenTree.tasks
+
+logger = logging.getLogger('inventree')
+
+
+# Name of the annotation used to rank search results
+SEARCH_RANK_FIELD = 'search_rank'
+
+# Separator used between field values in the search document
+# (ensures that a search term cannot match across multiple field values)
+SEARCH_DOCUMENT_SEPARATOR = '\n'
+
+# Name of the SQLite FTS5 table (see common/migrations/0023_searchdocument.py)
+SQLITE_FTS_TABLE = 'common_searchdocument_fts'
+
+# Minimum term length supported by the FTS5 trigram tokenizer
+SQLITE_FTS_MIN_LENGTH = 3
+
+
+# Models which are indexed, and the fields which are included in the search document.
+#
+# Each entry provides:
+# - fields: The (related) fields which are included in the search document.
+#   These must match the 'search_fields' for the associated API list endpoint.
+# - depends: Related models which are also included in the search document,
+#   and the lookup(s) required to find the indexed objects from a related object.
+#   When a related object is saved, the search documents for matching objects are updated.
+SEARCH_INDEX_MODELS = {
+    'part.part': {
+        'fields': [
+            'name',
+            'description',
+            'IPN',
+            'revision',
+            'keywords',
+            'category__name',
+            'manufacturer_parts__MPN',
+            'supplier_parts__SKU',
+            'tags__name',
+            'tags__slug',
+        ],
+        'depends': {
+            'part.partcategory': ['category'],
+            'company.manufacturerpart': ['manufacturer_parts'],
+            'company.supplierpart': ['supplier_parts'],
+        },
+    },
+    'company.company': {'fields': ['name', 'description', 'website'], 'depends': {}},
+    'company.manufacturerpart': {
+        'fields': [
+            'manufacturer__name',
+            'description',
+            'MPN',
+            'part__IPN',
+            'part__name',
+            'part__description',
+            'tags__name',
+            'tags__slug',
+        ],
+        'depends': {'part.part': ['part'], 'company.company': ['manufacturer']},
+    },
+    'company.supplierpart': {
+        'fields': [
+            'SKU',
+            'supplier__name',
+            'manufacturer_part__manufacturer__name',
+            'description',
+            'manufacturer_part__MPN',
+            'part__IPN',
+            'part__name',
+            'part__description',
+            'part__keywords',
+            'tags__name',
+            'tags__slug',
+        ],
+        'depends': {
+            'part.part': ['part'],
+            'company.company': ['supplier', 'manufacturer_part__manufacturer'],
+            'company.manufacturerpart': ['manufacturer_part'],
+        },
+    },
+    'stock.stockitem': {
+        'fields': [
+            'serial',
+            'batch',
+            'part__name',
+            'part__IPN',
+            'part__description',
+            'location__name',
+            'tags__name',
+            'tags__slug',
+        ],
+        'depends': {'part.part': ['part'], 'stock.stocklocation': ['location']},
+    },
+    'order.purchaseorder': {
+        'fields': [
+            'reference',
+            'supplier__name',
+            'supplier_reference',
+            'project_code__code',
+            'description',
+        ],
+        'depends': {
+            'company.company': ['supplier'],
+            'common.projectcode': ['project_code'],
+        },
+    },
+    'order.salesorder': {
+        'fields': [
+            'customer__name',
+            'reference',
+            'description',
+            'customer_reference',
+            'project_code__code',
+        ],
+        'depends': {
+            'company.company': ['customer'],
+            'common.projectcode': ['project_code'],
+        },
+    },
+    'order.returnorder': {
+        'fields': [
+            'customer__name',
+            'reference',
+            'description',
+            'customer_reference',
+            'project_code__code',
+        ],
+        'depends': {
+            'company.company': ['customer'],
+            'common.projectcode': ['project_code'],
+        },
+    },
+}
+
+
+def search_index_enabled() -> bool:
+    """Return True if the search index is enabled."""
+    return bool(getattr(settings, 'SEARCH_INDEX_ENABLED', False))
+
+
+def get_model_label(model) -> str:
+    """Return the lowercase label (e.g. 'part.part') for the provided model."""
+    return model._meta.label_lower
+
+
+def is_model_indexed(model) -> bool:
+    """Return True if the provided model is covered by the search index."""
+    return get_model_label(model) in SEARCH_INDEX_MODELS
+
+
+def get_index_fields(model) -> list:
+    """Return the list of fields included in the search document for the provided model."""
+    return SEARCH_INDEX_MODELS.get(get_model_label(model), {}).get('fields', [])
+
+
+# Cached result of the FTS5 table check (see sqlite_fts_available)
+_sqlite_fts_available = None
+
+
+def sqlite_fts_available() -> bool:
+    """Return True if the SQLite FTS5 search table is available.
+
+    The FTS5 table may not be available if the SQLite library does not support the trigram tokenizer.
+    """
+    global _sqlite_fts_available
+
+    if connection.vendor != 'sqlite':
+        return False
+
+    if _sqlite_fts_available is None:
+        try:
+            _sqlite_fts_available = (
+                SQLITE_FTS_TABLE in connection.introspection.table_names()
+            )
+        except (OperationalError, ProgrammingError):  # pragma: no cover
+            return False
+
+    return _sqlite_fts_available
+
+
+def build_search_documents(model, pks) -> dict:
+    """Construct the search documents for the provided model instances.
+
+    Arguments:
+        model: The indexed model class
+        pks: The primary key values of the objects to construct documents for
+
+    Returns:
+        A dict of {pk: document}
+
+    Note: One query is performed for each indexed field (regardless of the number of objects)
+    """
+    pks = list(pks)
+    values = {pk: [] for pk in pks}
+
+    queryset = model.objects.filter(pk__in=pks)
+
+    for field in get_index_fields(model):
+        for pk, value in queryset.values_list('pk', field):
+            if value is None:
+                continue
+
+            value = str(value).strip()
+
+            if value and value not in values[pk]:
+                values[pk].append(value)
+
+    return {pk: SEARCH_DOCUMENT_SEPARATOR.join(v) for pk, v in values.items()}
+
+
+def update_search_documents(model, pks=None, chunk_size: int = 1000):
+    """Update the search documents for the provided model instances.
+
+    Arguments:
+        model: The indexed model class (or model label)
+        pks: The primary key values of the objects to update (or None to update all objects)
+        chunk_size: The maximum number of documents to update at once
+
+    Any documents for objects which no longer exist are removed.
+    """
+    from common.models import SearchDocument
+
+    if isinstance(model, str):
+        model = apps.get_model(model)
+
+    if pks is None:
+        pks = model.objects.order_by('pk').values_list('pk', flat=True)
+
+    pks = list(pks)
+
+    model_type = ContentType.objects.get_for_model(model)
+
+    for idx in range(0, len(pks), chunk_size):
+        chunk = pks[idx : idx + chunk_size]
+
+        existing = model.objects.filter(pk__in=chunk).values_list('pk', flat=True)
+        documents = build_search_documents(model, existing)
+
+        with transaction.atomic():
+            SearchDocument.objects.filter(
+                model_type=model_type, object_id__in=chunk
+            ).delete()
+
+            SearchDocument.objects.bulk_create([
+                SearchDocument(model_type=model_type, object_id=pk, document=document)
+                for pk, document in documents.items()
+            ])
+
+
+def delete_search_documents(model, pks):
+    """Remove the search documents for the provided model instances."""
+    from common.models import SearchDocument
+
+    model_type = ContentType.objects.get_for_model(model)
+
+    SearchDocument.objects.filter(model_type=model_type, object_id__in=pks).delete()
+
+
+def update_dependent_documents(label: str, pk: int):
+    """Update the search documents which depend on a particular (related) object.
+
+    Arguments:
+        label: The model label of the related object e.g. 'part.part'
+        pk: The primary key of the related object
+    """
+    for model_label, options in SEARCH_INDEX_MODELS.items():
+        lookups = options.get('depends', {}).get(label, [])
+
+        if not lookups:
+            continue
+
+        model = apps.get_model(model_label)
+
+        query = Q()
+
+        for lookup in lookups:
+            query |= Q(**{lookup: pk})
+
+        pks = model.objects.filter(query).values_list('pk', flat=True).distinct()
+
+        update_search_documents(model, pks)
+
+
+def rebuild_search_index(chunk_size: int = 1000):
+    """Rebuild the entire search index.
+
+    Documents are (re)constructed in chunks, to limit memory usage.
+    """
+    from common.models import SearchDocument
+
+    for label in SEARCH_INDEX_MODELS.keys():
+        model = apps.get_model(label)
+        model_type = ContentType.objects.get_for_model(model)
+
+        logger.info('Rebuilding search index for %s', label)
+
+        update_search_documents(model, chunk_size=chunk_size)
+
+        # Remove any stale documents
+        SearchDocument.objects.filter(model_type=model_type).exclude(
+            object_id__in=model.objects.values('pk')
+        ).delete()
+
+
+def can_search_view(view, queryset) -> bool:
+    """Determine if the search index can be used to search the provided view.
+
+    The search index is only used if:
+    - The search index is enabled
+    - The queryset model is indexed
+    - The search fields for the view exactly match the fields in the search document
+
+    A view which searches a subset of the indexed fields cannot use the search index,
+    as the search document would also match on fields which the view does not search.
+    """
+    if not search_index_enabled():
+        return False
+
+    if not is_model_indexed(queryset.model):
+        return False
+
+    search_fields = getattr(view, 'search_fields', None) or []
+
+    if not search_fields:
+        return False
+
+    index_fields = get_index_fields(queryset.model)
+
+    return set(search_fields) == set(index_fields)
+
+
+def format_fts_term(term: str) -> str:
+    """Format a search term for an FTS5 MATCH query (as a quoted string)."""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def search_queryset(queryset, terms: list):
+    """Filter the provided queryset against the search index.
+
+    Arguments:
+        queryset: The queryset to filter (the model must be indexed)
+        terms: A list of search terms - each term must be matched
+
+    Returns:
+        A filtered queryset, annotated with a 'search_rank' value (lower is better)
+
+    The semantics match the default DRF SearchFilter behaviour,
+    i.e. each term must be (case-insensitively) contained in at least one of the search fields.
+    """
+    from common.models import SearchDocument
+
+    if not terms:
+        return queryset
+
+    model_type = ContentType.objects.get_for_model(queryset.model)
+
+    documents = SearchDocument.objects.filter(model_type=model_type)
+
+    fts_terms = []
+
+    for term in terms:
+        if len(term) >= SQLITE_FTS_MIN_LENGTH and sqlite_fts_available():
+            fts_terms.append(format_fts_term(term))
+        else:
+            documents = documents.filter(document__icontains=term)
+
+    if fts_terms:
+        documents = documents.filter(
+            pk__in=RawSQL(
+                f'SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH %s',
+                [' AND '.join(fts_terms)],
+            )
+        )
+
+    # Rank results based on the position of the first term in the document
+    # Fields are stored in priority order, so earlier matches are more relevant
+    rank = Subquery(
+        SearchDocument.objects.filter(model_type=model_type, object_id=OuterRef('pk'))
+        .annotate(rank=StrIndex(Upper('document'), Upper(Value(terms[0]))))
+        .values('rank')[:1]
+    )
+
+    queryset = queryset.filter(pk__in=documents.values('object_id'))
+    queryset = queryset.annotate(**{SEARCH_RANK_FIELD: rank})
+
+    return queryset.order_by(F(SEARCH_RANK_FIELD).asc(nulls_last=True), 'pk')
+
+
+def index_update_allowed(raw=False) -> bool:
+    """Determine if the search index should be updated in response to a model event."""
+    if raw or not search_index_enabled():
+        return False
+
+    if InvenTree.ready.isImportingData() or InvenTree.ready.isRunningMigrations():
+        return False
+
+    return True
+
+
+@receiver(post_save, dispatch_uid='search_index_post_save')
+def after_save(sender, instance, raw=False, **kwargs):
+    """Update the search index after a model instance is saved."""
+    if not index_update_allowed(raw):
+        return
+
+    label = get_model_label(sender)
+
+    if label == 'taggit.taggeditem':
+        # Tags have been added to an object
+        model = instance.content_type.model_class()
+
+        if model is not None and is_model_indexed(model):
+            update_search_documents(model, [instance.object_id])
+
+        return
+
+    if label in SEARCH_INDEX_MODELS:
+        update_search_documents(sender, [instance.pk])
+
+    if any(
+        label in options.get('depends', {}) for options in SEARCH_INDEX_MODELS.values()
+    ):
+        # Updating dependent documents may be expensive, so offload to the background worker
+        InvenTree.tasks.offload_task(update_dependent_documents, label, instance.pk)
+
+
+@receiver(post_delete, dispatch_uid='search_index_post_delete')
+def after_delete(sender, instance, **kwargs):
+    """Update the search index after a model instance is deleted."""
+    if not index_update_allowed():
+        return
+
+    label = get_model_label(sender)
+
+    if label == 'taggit.taggeditem':
+        model = instance.content_type.model_class()
+
+        if model is not None and is_model_indexed(model):
+            update_search_documents(model, [instance.object_id])
+
+        return
+
+    if label in SEARCH_INDEX_MODELS:
+        delete_search_documents(sender, [instance.pk])
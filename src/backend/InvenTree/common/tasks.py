@@ -2,6 +2,7 @@
 
 import logging
 import os
+import time
 from datetime import timedelta
 
 from django.conf import settings
@@ -13,9 +14,14 @@ import feedparser
 import requests
 
 import InvenTree.helpers
-from InvenTree.helpers_model import getModelsWithMixin
+from InvenTree.helpers_model import delete_in_chunks, getModelsWithMixin
 from InvenTree.models import InvenTreeNotesMixin
-from InvenTree.tasks import ScheduledTask, scheduled_task
+from InvenTree.tasks import (
+    ScheduledTask,
+    cleanup_deadline,
+    delete_old_records,
+    scheduled_task,
+)
 
 logger = logging.getLogger('inventree')
 
@@ -37,7 +43,34 @@ def delete_old_notifications():
     before = timezone.now() - timedelta(days=90)
 
     # Delete notification records before the specified date
-    NotificationEntry.objects.filter(updated__lte=before).delete()
+    deleted = delete_old_records(
+        NotificationEntry.objects.filter(updated__lte=before), cleanup_deadline()
+    )
+
+    return {'common.notificationentry': deleted}
+
+
+@scheduled_task(ScheduledTask.DAILY)
+def delete_old_task_progress():
+    """Remove old background task progress records from the database.
+
+    Anything which has not been updated for a day is removed
+    """
+    try:
+        from common.models import TaskProgress
+    except AppRegistryNotReady:  # pragma: no cover
+        logger.info(
+            "Could not perform 'delete_old_task_progress' - App registry not ready"
+        )
+        return
+
+    before = timezone.now() - timedelta(days=1)
+
+    deleted = delete_old_records(
+        TaskProgress.objects.filter(updated__lte=before), cleanup_deadline()
+    )
+
+    return {'common.taskprogress': deleted}
 
 
 @scheduled_task(ScheduledTask.DAILY)
@@ -87,44 +120,96 @@ def update_news_feed():
     logger.info('update_news_feed: Sync done')
 
 
+# Setting key which stores the primary key of the last NotesImage checked by delete_old_notes_images
+NOTES_IMAGE_CLEANUP_CURSOR = '_NOTES_IMAGE_CLEANUP_CURSOR'
+
+
 @scheduled_task(ScheduledTask.DAILY)
 def delete_old_notes_images():
     """Remove old notes images from the database.
 
-    Anything older than ~3 months is removed, unless it is linked to a note
+    Anything older than ~3 months is removed, unless it is linked to a note.
+    Any notes images which point to non-existent image files are also removed.
+
+    Images are checked in batches (in primary key order) until the cleanup time limit is reached.
+    The last checked image is stored, so that the next run resumes from that point.
     """
     try:
-        from common.models import NotesImage
+        from common.models import InvenTreeSetting, NotesImage
     except AppRegistryNotReady:
         logger.info(
             "Could not perform 'delete_old_notes_images' - App registry not ready"
         )
         return
 
-    # Remove any notes which point to non-existent image files
-    for note in NotesImage.objects.all():
-        if not os.path.exists(note.image.path):
-            logger.info('Deleting note %s - image file does not exist', note.image.path)
-            note.delete()
+    deadline = cleanup_deadline()
 
     note_classes = getModelsWithMixin(InvenTreeNotesMixin)
     before = InvenTree.helpers.current_date() - timedelta(days=90)
 
-    for note in NotesImage.objects.filter(date__lte=before):
-        # Find any images which are no longer referenced by a note
+    def is_stale(note) -> bool:
+        """Return True if the provided notes image should be removed."""
+        if not os.path.exists(note.image.path):
+            logger.info('Deleting note %s - image file does not exist', note.image.path)
+            return True
 
-        found = False
+        if note.date.date() > before:
+            return False
 
+        # Find any images which are no longer referenced by a note
         img = note.image.name
 
         for model in note_classes:
             if model.objects.filter(notes__icontains=img).exists():
-                found = True
-                break
+                return False
+
+        logger.info('Deleting note %s - image file not linked to a note', img)
+        return True
 
-        if not found:
-            logger.info('Deleting note %s - image file not linked to a note', img)
-            note.delete()
+    try:
+        cursor = int(
+            InvenTreeSetting.get_setting(NOTES_IMAGE_CLEANUP_CURSOR, 0, cache=False)
+        )
+    except (TypeError, ValueError):
+        cursor = 0
+
+    deleted = 0
+    finished = False
+
+    while True:
+        batch = list(
+            NotesImage.objects.filter(pk__gt=cursor).order_by('pk')[
+                : settings.CLEANUP_BATCH_SIZE
+            ]
+        )
+
+        if not batch:
+            finished = True
+            break
+
+        if stale := [note.pk for note in batch if is_stale(note)]:
+            deleted += delete_in_chunks(NotesImage, [stale])
+
+        cursor = batch[-1].pk
+
+        if len(batch) < settings.CLEANUP_BATCH_SIZE:
+            finished = True
+            break
+
+        if time.monotonic() >= deadline:
+            break
+
+        time.sleep(settings.CLEANUP_BATCH_DELAY)
+
+    # Start from the first image on the next run, once all images have been checked
+    InvenTreeSetting.set_setting(
+        NOTES_IMAGE_CLEANUP_CURSOR, 0 if finished else cursor, None
+    )
+
+    if not finished:
+        logger.info(
+            'Time limit reached - remaining notes images will be checked on the next run'
+        )
 
     # Finally, remove any images in the notes dir which are not linked to a note
     notes_dir = os.path.join(settings.MEDIA_ROOT, 'notes')
@@ -135,16 +220,29 @@ def delete_old_notes_images():
         # Thrown if the directory does not exist
         images = []
 
-    all_notes = NotesImage.objects.all()
+    linked = {
+        os.path.basename(name)
+        for name in NotesImage.objects.values_list('image', flat=True).iterator()
+    }
 
     for image in images:
-        found = False
-        for note in all_notes:
-            img_path = os.path.basename(note.image.path)
-            if img_path == image:
-                found = True
-                break
-
-        if not found:
+        if image not in linked:
             logger.info('Deleting note %s - image file not linked to a note', image)
             os.remove(os.path.join(notes_dir, image))
+
+    return {'common.notesimage': deleted}
+
+
+@scheduled_task(ScheduledTask.DAILY)
+def rebuild_search_index():
+    """Rebuild the search index (if enabled).
+
+    Search documents are updated as objects are saved,
+    but some changes (e.g. deleted related objects) are only captured by a full rebuild.
+    """
+    import common.search
+
+    if not common.search.search_index_enabled():
+        return
+
+    common.search.rebuild_search_index()
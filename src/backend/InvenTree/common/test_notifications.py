@@ -1,14 +1,27 @@
 """Tests for basic notification methods and functions in InvenTree."""
 
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 import plugin.templatetags.plugin_extras as plugin_tags
+from common.models import NotificationEntry, NotificationMessage
 from common.notifications import (
     BulkNotificationMethod,
     NotificationMethod,
     SingleNotificationMethod,
+    UIMessageNotification,
+    get_notification_recipients,
+    get_notification_users,
     storage,
+    trigger_notification,
 )
 from part.test_part import BaseNotificationIntegrationTest
 from plugin.models import NotificationUserSetting
+from users.models import Owner
 
 
 class BaseNotificationTests(BaseNotificationIntegrationTest):
@@ -120,6 +133,117 @@ class SingleNotificationMethodTests(BaseNotificationIntegrationTest):
 # A integration test for notifications is provided in test_part.PartNotificationTest
 
 
+class NotificationTargetTests(BaseNotificationIntegrationTest):
+    """Tests for resolving and notifying the target users of a notification."""
+
+    def test_recipients(self):
+        """Test that users, groups and owners are resolved to a single set of users."""
+        User = get_user_model()
+
+        group = Group.objects.create(name='Notification group')
+
+        users = [
+            User.objects.create_user(username=f'notify_{idx}', password='password')
+            for idx in range(6)
+        ]
+
+        for user in users[:4]:
+            user.groups.add(group)
+
+        targets = [
+            None,
+            users[0],
+            group,
+            Owner.get_owner(users[4]),
+            Owner.get_owner(group),
+        ]
+
+        recipients = get_notification_recipients(targets, [users[1], None])
+
+        self.assertEqual(recipients['users'], [users[0].pk, users[4].pk])
+        self.assertEqual(recipients['groups'], [group.pk])
+        self.assertEqual(recipients['exclude'], [users[1].pk])
+
+        # Users are resolved with a single query
+        with self.assertNumQueries(1):
+            result = list(get_notification_users(**recipients))
+
+        self.assertEqual(
+            {user.pk for user in result},
+            {users[0].pk, users[2].pk, users[3].pk, users[4].pk},
+        )
+
+    def notify_group(self, category: str, members: int) -> int:
+        """Trigger a UI notification for a new group with the provided number of members.
+
+        Returns:
+            The number of database queries performed
+        """
+        User = get_user_model()
+
+        group = Group.objects.create(name=category)
+
+        for idx in range(members):
+            user = User.objects.create_user(username=f'{category}_{idx}', password='pw')
+            user.groups.add(group)
+
+        context = {'name': 'Group notification', 'message': 'A message'}
+
+        with CaptureQueriesContext(connection) as queries:
+            trigger_notification(
+                self.part,
+                category,
+                targets=[group],
+                context=context,
+                delivery_methods={UIMessageNotification},
+            )
+
+        self.assertEqual(
+            NotificationMessage.objects.filter(category=category).count(), members
+        )
+
+        return len(queries)
+
+    def test_group_notification(self):
+        """Test that UI notifications for a large group are written in bulk."""
+        storage.collect(UIMessageNotification)
+
+        # Prime any cached lookups (e.g. content types and settings)
+        self.notify_group('part.test_warmup', 1)
+
+        small = self.notify_group('part.test_small', 5)
+        large = self.notify_group('part.test_large', 50)
+
+        # The number of queries does not depend on the number of recipients
+        self.assertEqual(small, large)
+
+        self.assertTrue(
+            NotificationEntry.objects.filter(key='part.test_large').exists()
+        )
+
+    def test_recent_notification(self):
+        """Test that a repeated notification is skipped before the first one is delivered."""
+        User = get_user_model()
+
+        user = User.objects.create_user(username='recent', password='pw')
+
+        with mock.patch('InvenTree.tasks.offload_task') as offload:
+            for _idx in range(3):
+                trigger_notification(
+                    self.part,
+                    'part.test_recent',
+                    targets=[user],
+                    context={'name': 'Recent', 'message': 'A message'},
+                )
+
+        # The notification is only queued for delivery once
+        self.assertEqual(offload.call_count, 1)
+
+        self.assertTrue(
+            NotificationEntry.objects.filter(key='part.test_recent').exists()
+        )
+
+
 class NotificationUserSettingTests(BaseNotificationIntegrationTest):
     """Tests for NotificationUserSetting."""
 
@@ -1,9 +1,18 @@
 """Tests for tasks in app common."""
 
+from datetime import timedelta
+
 from django.conf import settings
 from django.test import TestCase
-
-from common.models import NewsFeedEntry, NotificationEntry
+from django.utils import timezone
+
+from common.models import (
+    InvenTreeSetting,
+    NewsFeedEntry,
+    NotesImage,
+    NotificationEntry,
+    TaskProgress,
+)
 from InvenTree.tasks import offload_task
 
 from . import tasks as common_tasks
@@ -18,6 +27,50 @@ class TaskTest(TestCase):
         self.assertEqual(NotificationEntry.objects.all().count(), 0)
         offload_task(common_tasks.delete_old_notifications)
 
+    def test_delete_task_progress(self):
+        """Test that old task progress records are removed."""
+        TaskProgress.set_progress('old', 10, 10, finished=True)
+        TaskProgress.set_progress('new', 10, 5)
+
+        TaskProgress.objects.filter(key='old').update(
+            updated=timezone.now() - timedelta(days=2)
+        )
+
+        result = common_tasks.delete_old_task_progress()
+
+        self.assertEqual(result, {'common.taskprogress': 1})
+        self.assertIsNone(TaskProgress.get_progress('old'))
+        self.assertEqual(TaskProgress.get_progress('new').completed, 5)
+
+    def test_delete_notes_images(self):
+        """Test that notes images are checked in batches, resuming from the last checked image."""
+        for idx in range(3):
+            NotesImage.objects.create(image=f'notes/missing_{idx}.png')
+
+        with self.settings(
+            CLEANUP_BATCH_SIZE=2, CLEANUP_BATCH_DELAY=0, CLEANUP_TIME_LIMIT=0
+        ):
+            # Time limit is exceeded immediately - only a single batch is checked
+            result = common_tasks.delete_old_notes_images()
+            self.assertEqual(result, {'common.notesimage': 2})
+            self.assertEqual(NotesImage.objects.count(), 1)
+
+            cursor = InvenTreeSetting.get_setting(
+                common_tasks.NOTES_IMAGE_CLEANUP_CURSOR, 0, cache=False
+            )
+            self.assertGreater(int(cursor), 0)
+
+            # The next run resumes from the stored cursor, and checks the remaining image
+            result = common_tasks.delete_old_notes_images()
+            self.assertEqual(result, {'common.notesimage': 1})
+            self.assertEqual(NotesImage.objects.count(), 0)
+
+            # The cursor is reset once all images have been checked
+            cursor = InvenTreeSetting.get_setting(
+                common_tasks.NOTES_IMAGE_CLEANUP_CURSOR, 0, cache=False
+            )
+            self.assertEqual(int(cursor), 0)
+
 
 class NewsFeedTests(TestCase):
     """Tests for update_news_feed task.
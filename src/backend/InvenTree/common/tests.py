@@ -12,12 +12,14 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
 from django.test import Client, TestCase
 from django.test.utils import override_settings
 from django.urls import reverse
 
 import PIL
 
+import common.search
 from InvenTree.helpers import str2bool
 from InvenTree.unit_test import InvenTreeAPITestCase, InvenTreeTestCase, PluginMixin
 from plugin import registry
@@ -33,6 +35,8 @@ from .models import (
     NotificationEntry,
     NotificationMessage,
     ProjectCode,
+    SearchDocument,
+    Sequence,
     WebhookEndpoint,
     WebhookMessage,
 )
@@ -934,7 +938,7 @@ class NotificationTest(InvenTreeAPITestCase):
 
         # Now, let's bulk delete all 'unread' notifications via the API,
         # but only associated with the logged in user
-        response = self.delete(url, {'filters': {'read': False}}, expected_code=204)
+        response = self.delete(url, {'filters': {'read': False}}, expected_code=200)
 
         # Only 7 notifications should have been deleted,
         # as the notifications associated with other users must remain untouched
@@ -1383,3 +1387,225 @@ class ContentTypeAPITest(InvenTreeAPITestCase):
             reverse('api-contenttype-detail-modelname', kwargs={'model': None}),
             expected_code=404,
         )
+
+
+class SearchIndexTest(InvenTreeAPITestCase):
+    """Tests for the search index."""
+
+    fixtures = [
+        'category',
+        'part',
+        'company',
+        'location',
+        'supplier_part',
+        'manufacturer_part',
+        'stock',
+        'order',
+        'sales_order',
+    ]
+
+    roles = ['part.view', 'stock.view', 'purchase_order.view', 'sales_order.view']
+
+    # Search terms to compare (between standard and indexed searches)
+    terms = ['chair', 'M2x4', 'ACME', 'r 1', 'wid', 'ab', 'zzzz', 'PO', 'Hinged', '5']
+
+    def setUp(self):
+        """Rebuild the search index before each test."""
+        super().setUp()
+
+        common.search.rebuild_search_index()
+
+    def get_results(self, url, term, **kwargs):
+        """Return the set of pk values returned by a search query."""
+        response = self.get(url, {'search': term, **kwargs}, expected_code=200)
+        return {item['pk'] for item in response.data}
+
+    def test_index_fields(self):
+        """Check that the indexed fields match the search fields of each list endpoint."""
+        import company.api
+        import order.api
+        import part.api
+        import stock.api
+
+        views = {
+            'part.part': part.api.PartList,
+            'company.company': company.api.CompanyList,
+            'company.manufacturerpart': company.api.ManufacturerPartList,
+            'company.supplierpart': company.api.SupplierPartList,
+            'stock.stockitem': stock.api.StockList,
+            'order.purchaseorder': order.api.PurchaseOrderList,
+            'order.salesorder': order.api.SalesOrderList,
+            'order.returnorder': order.api.ReturnOrderList,
+        }
+
+        self.assertEqual(set(views.keys()), set(common.search.SEARCH_INDEX_MODELS))
+
+        for label, view in views.items():
+            self.assertEqual(
+                set(view.search_fields),
+                set(common.search.SEARCH_INDEX_MODELS[label]['fields']),
+            )
+
+    def test_search_results(self):
+        """Test that indexed search results match the standard search results."""
+        urls = [
+            reverse('api-part-list'),
+            reverse('api-company-list'),
+            reverse('api-manufacturer-part-list'),
+            reverse('api-supplier-part-list'),
+            reverse('api-stock-list'),
+            reverse('api-po-list'),
+            reverse('api-so-list'),
+        ]
+
+        for url in urls:
+            for term in self.terms:
+                expected = self.get_results(url, term)
+
+                with override_settings(SEARCH_INDEX_ENABLED=True):
+                    with mock.patch(
+                        'common.search.search_queryset',
+                        wraps=common.search.search_queryset,
+                    ) as search:
+                        results = self.get_results(url, term)
+                        search.assert_called_once()
+
+                self.assertEqual(results, expected, f'{url} : {term}')
+
+    @override_settings(SEARCH_INDEX_ENABLED=True)
+    def test_updates(self):
+        """Test that the search index is updated when objects are saved."""
+        from part.models import Part, PartCategory
+        from stock.models import StockItem
+
+        url = reverse('api-part-list')
+
+        self.assertEqual(len(self.get_results(url, 'Flibbertigibbet')), 0)
+
+        part = Part.objects.get(pk=1)
+        part.description = 'A flibbertigibbet part'
+        part.save()
+
+        self.assertEqual(self.get_results(url, 'Flibbertigibbet'), {1})
+
+        # Search on related (category) name
+        category = PartCategory.objects.get(pk=part.category.pk)
+        category.name = 'Whatchamacallit'
+        category.save()
+
+        results = self.get_results(url, 'Whatchamacallit')
+        self.assertEqual(
+            results,
+            set(Part.objects.filter(category=category).values_list('pk', flat=True)),
+        )
+
+        # Stock items are updated when the part is renamed
+        part.name = 'Thingamajig'
+        part.save()
+
+        results = self.get_results(reverse('api-stock-list'), 'Thingamajig')
+        self.assertEqual(
+            results,
+            set(StockItem.objects.filter(part=part).values_list('pk', flat=True)),
+        )
+
+        # Tags are included in the search document
+        part.tags.add('doohickey')
+        self.assertEqual(self.get_results(url, 'doohickey'), {1})
+
+        # Deleted objects are removed from the index
+        part.active = False
+        part.save()
+        part.delete()
+
+        self.assertEqual(len(self.get_results(url, 'Flibbertigibbet')), 0)
+        self.assertFalse(
+            SearchDocument.objects.filter(
+                model_type=ContentType.objects.get_for_model(Part), object_id=1
+            ).exists()
+        )
+
+    @override_settings(SEARCH_INDEX_ENABLED=True)
+    def test_ranking(self):
+        """Test that search results are ranked, unless ordering is specified."""
+        from part.models import Part
+
+        url = reverse('api-part-list')
+
+        p1 = Part.objects.create(name='Zeta widget', description='Blue widget')
+        p2 = Part.objects.create(name='Alpha', description='Widget')
+
+        # p1 matches on name, p2 on description
+        response = self.get(url, {'search': 'widget'}, expected_code=200)
+        pks = [item['pk'] for item in response.data]
+        self.assertLess(pks.index(p1.pk), pks.index(p2.pk))
+
+        # Explicit ordering overrides ranking
+        response = self.get(
+            url, {'search': 'widget', 'ordering': 'name'}, expected_code=200
+        )
+        pks = [item['pk'] for item in response.data]
+        self.assertLess(pks.index(p2.pk), pks.index(p1.pk))
+
+    @override_settings(SEARCH_INDEX_ENABLED=True)
+    def test_view_fields(self):
+        """The search index is only used for views which search all of the indexed fields."""
+        import part.api
+        from part.models import Part
+
+        queryset = Part.objects.all()
+
+        self.assertTrue(common.search.can_search_view(part.api.PartList, queryset))
+
+        # The thumbnail view searches a subset of the indexed fields
+        self.assertFalse(common.search.can_search_view(part.api.PartThumbs, queryset))
+
+        url = reverse('api-part-thumbs')
+
+        with mock.patch('common.search.search_queryset') as search:
+            self.get(url, {'search': 'chair'}, expected_code=200)
+            search.assert_not_called()
+
+    def test_regex(self):
+        """Regex and whole-word searches bypass the search index."""
+        url = reverse('api-part-list')
+
+        for params in [{'search_regex': True}, {'search_whole': True}]:
+            expected = self.get_results(url, 'chair', **params)
+
+            with override_settings(SEARCH_INDEX_ENABLED=True):
+                with mock.patch('common.search.search_queryset') as search:
+                    results = self.get_results(url, 'chair', **params)
+                    search.assert_not_called()
+
+            self.assertEqual(results, expected)
+
+
+class SequenceTest(TestCase):
+    """Unit tests for the Sequence model."""
+
+    def test_allocate(self):
+        """Test allocation of values from a sequence."""
+        self.assertEqual(Sequence.allocate('test'), 1)
+        self.assertEqual(Sequence.allocate('test'), 2)
+
+        # Allocate a block of values
+        self.assertEqual(Sequence.allocate('test', 10), 3)
+        self.assertEqual(Sequence.allocate('test'), 13)
+
+        # Sequences are independent
+        self.assertEqual(Sequence.allocate('other', 5), 1)
+
+        # Minimum value is respected
+        self.assertEqual(Sequence.allocate('test', 2, minimum=100), 101)
+        self.assertEqual(Sequence.allocate('test', minimum=50), 103)
+
+        self.assertEqual(Sequence.objects.get(key='test').value, 103)
+        self.assertEqual(Sequence.objects.get(key='other').value, 5)
+
+    def test_lock(self):
+        """Test that a sequence can be used as a lock."""
+        with transaction.atomic():
+            self.assertTrue(Sequence.try_lock('lock'))
+
+        self.assertTrue(Sequence.objects.filter(key='lock').exists())
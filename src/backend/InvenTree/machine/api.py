@@ -10,9 +10,15 @@ from rest_framework.views import APIView
 
 import machine.serializers as MachineSerializers
 from InvenTree.filters import SEARCH_ORDER_FILTER
-from InvenTree.mixins import ListCreateAPI, RetrieveUpdateAPI, RetrieveUpdateDestroyAPI
+from InvenTree.mixins import (
+    ListAPI,
+    ListCreateAPI,
+    RetrieveAPI,
+    RetrieveUpdateAPI,
+    RetrieveUpdateDestroyAPI,
+)
 from machine import registry
-from machine.models import MachineConfig, MachineSetting
+from machine.models import MachineConfig, MachineJob, MachineSetting
 
 
 class MachineList(ListCreateAPI):
@@ -156,6 +162,38 @@ class MachineRestart(APIView):
         return Response(result)
 
 
+class MachineJobList(ListAPI):
+    """List endpoint for the jobs (e.g. print jobs) queued for a machine.
+
+    - GET: Return the jobs for a machine (most recent first)
+    """
+
+    queryset = MachineJob.objects.all()
+    serializer_class = MachineSerializers.MachineJobSerializer
+
+    filter_backends = SEARCH_ORDER_FILTER
+
+    filterset_fields = ['status']
+
+    ordering_fields = ['pk', 'status', 'created']
+
+    ordering = ['-pk']
+
+    def get_queryset(self):
+        """Only return jobs for the specified machine."""
+        return super().get_queryset().filter(machine_config=self.kwargs['pk'])
+
+
+class MachineJobDetail(RetrieveAPI):
+    """Detail endpoint for a single machine job.
+
+    - GET: Return the status and progress of a job
+    """
+
+    queryset = MachineJob.objects.all()
+    serializer_class = MachineSerializers.MachineJobSerializer
+
+
 class MachineTypesList(APIView):
     """List API Endpoint for all discovered machine types.
 
@@ -226,6 +264,8 @@ machine_api_urls = [
     path('drivers/', MachineDriverList.as_view(), name='api-machine-drivers'),
     # registry status
     path('status/', RegistryStatusView.as_view(), name='api-machine-registry-status'),
+    # machine jobs
+    path('jobs/<int:pk>/', MachineJobDetail.as_view(), name='api-machine-job-detail'),
     # detail views for a single Machine
     path(
         '<uuid:pk>/',
@@ -244,6 +284,8 @@ machine_api_urls = [
             ),
             # restart
             path('restart/', MachineRestart.as_view(), name='api-machine-restart'),
+            # jobs
+            path('jobs/', MachineJobList.as_view(), name='api-machine-jobs'),
             # detail
             path('', MachineDetail.as_view(), name='api-machine-detail'),
         ]),
@@ -2,6 +2,8 @@
 
 from typing import TYPE_CHECKING, Any, Literal, Union
 
+from django.db.utils import IntegrityError, OperationalError, ProgrammingError
+
 from generic.states import StatusCode
 from InvenTree.helpers_mixin import ClassProviderMixin, ClassValidationMixin
 
@@ -178,13 +180,15 @@ class BaseMachineType(ClassValidationMixin, ClassProviderMixin):
         from machine import registry
         from machine.models import MachineSetting
 
-        self.errors: list[Union[str, Exception]] = []
-        self.initialized = False
+        self.pk = machine_config.pk
 
-        self.status = self.default_machine_status
-        self.status_text: str = ''
+        # Fallback for the shared machine state (if the database is not available)
+        # Note: The shared state is not reset here, as it may have been reported by another process
+        # (it is reset when the machine registry loads the machines, see MachineRegistry.load_machines)
+        self._state: dict[str, Any] = {}
+
+        self.initialized = False
 
-        self.pk = machine_config.pk
         self.driver = registry.get_driver_instance(machine_config.driver)
 
         if not self.driver:
@@ -237,6 +241,77 @@ class BaseMachineType(ClassValidationMixin, ClassProviderMixin):
         """The machines active status."""
         return self.machine_config.active
 
+    # --- shared state
+    # The machine status, status text and errors are stored in the database (see MachineState),
+    # so that they are consistent across all server (and worker) processes
+
+    def get_state(self) -> dict[str, Any]:
+        """Return the shared state of this machine."""
+        from machine.models import MachineState
+
+        try:
+            state = (
+                MachineState.objects.filter(machine_config=self.pk)
+                .values('status', 'status_text', 'errors')
+                .first()
+            )
+        except (OperationalError, ProgrammingError):  # pragma: no cover
+            state = None
+
+        return self._state if state is None else state
+
+    def update_state(self, **kwargs):
+        """Update the shared state of this machine.
+
+        Only the provided values are written, so that concurrent updates
+        (from other processes) to the other values are not overwritten.
+        """
+        from machine.models import MachineState
+
+        self._state = {**self.get_state(), **kwargs}
+
+        try:
+            MachineState.objects.update_or_create(
+                machine_config_id=self.pk, defaults=kwargs
+            )
+        except (IntegrityError, OperationalError, ProgrammingError):  # pragma: no cover
+            # The machine config may have been deleted, or the database is not ready
+            pass
+
+    def get_status(self, state: dict[str, Any]) -> MachineStatus:
+        """Return the machine status from the provided shared state (see get_state)."""
+        try:
+            return self.MACHINE_STATUS(state.get('status', None))
+        except ValueError:
+            return self.default_machine_status
+
+    @property
+    def status(self) -> MachineStatus:
+        """The current machine status."""
+        return self.get_status(self.get_state())
+
+    @status.setter
+    def status(self, status: MachineStatus):
+        self.update_state(status=status.value)
+
+    @property
+    def status_text(self) -> str:
+        """The current machine status text."""
+        return self.get_state().get('status_text', '')
+
+    @status_text.setter
+    def status_text(self, status_text: str):
+        self.update_state(status_text=str(status_text))
+
+    @property
+    def errors(self) -> list[str]:
+        """The errors which have been reported for this machine."""
+        return list(self.get_state().get('errors', []))
+
+    @errors.setter
+    def errors(self, errors: list[Union[str, Exception]]):
+        self.update_state(errors=[str(error) for error in errors])
+
     # --- hook functions
     def initialize(self):
         """Machine initialization function, gets called after all machines are loaded."""
@@ -280,12 +355,25 @@ class BaseMachineType(ClassValidationMixin, ClassProviderMixin):
         if self.driver is None:
             return
 
+        # Errors are reported again (if required) when the machine is restarted
+        self.errors = []
+
         try:
             self.restart_required = False
             self.driver.restart_machine(self)
         except Exception as e:
             self.handle_error(e)
 
+    def run_job(self, job):
+        """Run a queued job for this machine, this gets called by the background worker.
+
+        Machine types which support jobs (see MachineJob) must override this method.
+
+        Arguments:
+            job: The MachineJob instance to run
+        """
+        raise NotImplementedError(f"Machine type '{self.SLUG}' does not support jobs")
+
     # --- helper functions
     def handle_error(self, error: Union[Exception, str]):
         """Helper function for capturing errors with the machine.
@@ -293,7 +381,11 @@ class BaseMachineType(ClassValidationMixin, ClassProviderMixin):
         Arguments:
             error: Exception or string
         """
-        self.errors.append(error)
+        errors = self.errors
+
+        # Each server process reports the same (initialization) errors
+        if str(error) not in errors:
+            self.errors = [*errors, str(error)]
 
     def get_setting(
         self, key: str, config_type_str: Literal['M', 'D'], cache: bool = False
@@ -1,9 +1,12 @@
 """Label printing machine type."""
 
 from typing import Union, cast
+from urllib.parse import urlparse
 
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.contenttypes.models import ContentType
 from django.db.models.query import QuerySet
-from django.http import HttpResponse, JsonResponse
+from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.utils.translation import gettext_lazy as _
 
 from PIL.Image import Image
@@ -22,12 +25,15 @@ class LabelPrinterBaseDriver(BaseDriver):
 
     Attributes:
         USE_BACKGROUND_WORKER (bool): If True, the `print_label()` and `print_labels()` methods will be run in a background worker (default: True)
+        JOB_CHUNK_SIZE (int): Number of labels passed to each `print_labels()` call when running a print job in the background worker (default: 10)
     """
 
     machine_type = 'label-printer'
 
     USE_BACKGROUND_WORKER = True
 
+    JOB_CHUNK_SIZE = 10
+
     def print_label(
         self,
         machine: 'LabelPrinterMachine',
@@ -267,3 +273,96 @@ class LabelPrinterMachine(BaseMachineType):
             return None
 
         return StockLocation.objects.get(pk=location_pk)
+
+    def create_print_job(self, label: LabelTemplate, items, request: Request, **kwargs):
+        """Create a print job for this printer, and queue it for the background worker.
+
+        Arguments:
+            label: The LabelTemplate object to use for printing
+            items: The list of database items to print (e.g. StockItem instances)
+            request: The HTTP request object which triggered this print job
+
+        Keyword Arguments:
+            printing_options (dict): The printing options which are passed to the driver
+
+        Returns:
+            The created MachineJob instance
+        """
+        from machine.models import MachineJob
+        from machine.tasks import queue_machine_job
+
+        items = list(items)
+
+        user = getattr(request, 'user', None)
+
+        job = MachineJob.objects.create(
+            machine_config_id=self.pk,
+            user=user if getattr(user, 'is_authenticated', False) else None,
+            label_type=ContentType.objects.get_for_model(label),
+            label_id=label.pk,
+            item_type=ContentType.objects.get_for_model(items[0]),
+            item_ids=[item.pk for item in items],
+            options=kwargs.get('printing_options', {}),
+            base_url=request.build_absolute_uri('/'),
+            total=len(items),
+        )
+
+        queue_machine_job(job)
+
+        return job
+
+    def run_job(self, job):
+        """Print the labels for a queued print job (in chunks), recording the progress of the job."""
+        driver = cast(LabelPrinterBaseDriver, self.driver)
+
+        if driver is None:
+            raise ValueError(f"Machine '{self.name}' has no driver")
+
+        label = job.label
+        request = PrintJobRequest(job.user, job.base_url)
+
+        # Print the items in the order in which they were provided
+        existing = set(job.items().values_list('pk', flat=True))
+        item_ids = [pk for pk in job.item_ids if pk in existing]
+
+        chunk_size = max(int(driver.JOB_CHUNK_SIZE), 1)
+
+        for idx in range(0, len(item_ids), chunk_size):
+            chunk = job.items().filter(pk__in=item_ids[idx : idx + chunk_size])
+
+            driver.print_labels(
+                self, label, chunk, request, printing_options=job.options
+            )
+
+            job.set_progress(idx + chunk_size)
+
+
+class PrintJobRequest(HttpRequest):
+    """Request object which is used to render the labels for a print job in the background worker.
+
+    Provides the user and (absolute) URL information of the request which created the print job.
+    """
+
+    def __init__(self, user, base_url: str):
+        """Construct a request for the provided user and base URL."""
+        super().__init__()
+
+        url = urlparse(base_url or '')
+
+        self.user = user or AnonymousUser()
+        self.method = 'GET'
+        self.path = self.path_info = '/'
+
+        self._scheme = url.scheme or 'http'
+
+        if url.netloc:
+            self.META['HTTP_HOST'] = url.netloc
+
+        self.META['SERVER_NAME'] = url.hostname or 'localhost'
+        self.META['SERVER_PORT'] = str(
+            url.port or (443 if self._scheme == 'https' else 80)
+        )
+
+    def _get_scheme(self):
+        """Return the scheme of the original request."""
+        return self._scheme
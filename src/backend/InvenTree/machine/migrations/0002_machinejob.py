@@ -0,0 +1,41 @@
+# Generated by Django 4.2.11 on 2026-10-19 10:57
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('machine', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MachineJob',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('complete', 'Complete'), ('failed', 'Failed')], default='pending', max_length=20, verbose_name='Status')),
+                ('label_id', models.PositiveIntegerField()),
+                ('item_ids', models.JSONField(default=list, verbose_name='Items')),
+                ('options', models.JSONField(blank=True, default=dict, verbose_name='Options')),
+                ('base_url', models.CharField(blank=True, max_length=250)),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='Total')),
+                ('completed', models.PositiveIntegerField(default=0, verbose_name='Completed')),
+                ('error', models.TextField(blank=True, verbose_name='Error')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Created')),
+                ('started', models.DateTimeField(blank=True, null=True, verbose_name='Started')),
+                ('finished', models.DateTimeField(blank=True, null=True, verbose_name='Finished')),
+                ('item_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype')),
+                ('label_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype')),
+                ('machine_config', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='jobs', to='machine.machineconfig', verbose_name='Machine Config')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'ordering': ['pk'],
+            },
+        ),
+    ]
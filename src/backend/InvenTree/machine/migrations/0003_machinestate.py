@@ -0,0 +1,24 @@
+# Generated by Django 4.2.11 on 2026-10-19 12:21
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('machine', '0002_machinejob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MachineState',
+            fields=[
+                ('machine_config', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='state', serialize=False, to='machine.machineconfig', verbose_name='Machine Config')),
+                ('status', models.IntegerField(blank=True, null=True, verbose_name='Status')),
+                ('status_text', models.TextField(blank=True, default='', verbose_name='Status Text')),
+                ('errors', models.JSONField(blank=True, default=list, verbose_name='Errors')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Updated')),
+            ],
+        ),
+    ]
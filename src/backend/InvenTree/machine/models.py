@@ -4,6 +4,9 @@ import uuid
 from typing import Literal
 
 from django.contrib import admin
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
 from django.utils.html import escape, format_html_join
 from django.utils.safestring import mark_safe
@@ -195,3 +198,146 @@ class MachineSetting(common.models.BaseInvenTreeSetting):
                     kwargs['settings'] = machine_config.machine.machine_settings
 
         return super().get_setting_definition(key, **kwargs)
+
+
+class MachineState(models.Model):
+    """The current state of a machine, which is reported by the machine driver.
+
+    The state is stored in the database, so that it is shared by all server (and worker) processes.
+
+    Attributes:
+        machine_config: The machine which this state belongs to
+        status: The current machine status code
+        status_text: The current machine status text
+        errors: The errors which have been reported for the machine
+        updated: Date / time of the most recent state update
+    """
+
+    machine_config = models.OneToOneField(
+        MachineConfig,
+        primary_key=True,
+        related_name='state',
+        verbose_name=_('Machine Config'),
+        on_delete=models.CASCADE,
+    )
+
+    status = models.IntegerField(null=True, blank=True, verbose_name=_('Status'))
+
+    status_text = models.TextField(
+        blank=True, default='', verbose_name=_('Status Text')
+    )
+
+    errors = models.JSONField(default=list, blank=True, verbose_name=_('Errors'))
+
+    updated = models.DateTimeField(auto_now=True, verbose_name=_('Updated'))
+
+
+class MachineJob(models.Model):
+    """A job (e.g. a label print job) which is queued for execution on a machine.
+
+    The jobs for each machine are run in order by the background worker (see machine.tasks).
+
+    Attributes:
+        machine_config: The machine which runs this job
+        user: The user who created this job
+        status: The current status of the job
+        label: The label template to print
+        item_type: The model type of the items to print
+        item_ids: The primary keys of the items to print
+        options: Options (e.g. printing options) which are passed to the machine driver
+        base_url: The base URL of the request which created this job
+        total: The total number of items to process
+        completed: The number of items which have been processed
+        error: Error message (if the job failed)
+    """
+
+    class Meta:
+        """Meta for MachineJob."""
+
+        ordering = ['pk']
+
+    class Status(models.TextChoices):
+        """Machine job status enum."""
+
+        PENDING = 'pending', _('Pending')
+        RUNNING = 'running', _('Running')
+        COMPLETE = 'complete', _('Complete')
+        FAILED = 'failed', _('Failed')
+
+    machine_config = models.ForeignKey(
+        MachineConfig,
+        related_name='jobs',
+        verbose_name=_('Machine Config'),
+        on_delete=models.CASCADE,
+    )
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name='+',
+        verbose_name=_('User'),
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name=_('Status'),
+    )
+
+    label_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, related_name='+'
+    )
+
+    label_id = models.PositiveIntegerField()
+
+    label = GenericForeignKey('label_type', 'label_id')
+
+    item_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, related_name='+'
+    )
+
+    item_ids = models.JSONField(default=list, verbose_name=_('Items'))
+
+    options = models.JSONField(default=dict, blank=True, verbose_name=_('Options'))
+
+    base_url = models.CharField(max_length=250, blank=True)
+
+    total = models.PositiveIntegerField(default=0, verbose_name=_('Total'))
+
+    completed = models.PositiveIntegerField(default=0, verbose_name=_('Completed'))
+
+    error = models.TextField(blank=True, verbose_name=_('Error'))
+
+    created = models.DateTimeField(auto_now_add=True, verbose_name=_('Created'))
+
+    started = models.DateTimeField(null=True, blank=True, verbose_name=_('Started'))
+
+    finished = models.DateTimeField(null=True, blank=True, verbose_name=_('Finished'))
+
+    def __str__(self) -> str:
+        """String representation of a machine job."""
+        return f'{self.machine_config} #{self.pk} ({self.status})'
+
+    @property
+    def progress(self) -> int:
+        """Return the job progress (as a percentage)."""
+        if self.status == self.Status.COMPLETE:
+            return 100
+
+        if self.total <= 0:
+            return 0
+
+        return int(100 * self.completed / self.total)
+
+    def items(self):
+        """Return a queryset of the items for this job."""
+        return self.item_type.model_class().objects.filter(pk__in=self.item_ids)
+
+    def set_progress(self, completed: int):
+        """Record the number of items which have been processed."""
+        self.completed = min(completed, self.total)
+
+        MachineJob.objects.filter(pk=self.pk).update(completed=self.completed)
@@ -116,7 +116,11 @@ class MachineRegistry:
     def load_machines(self):
         """Load all machines defined in the database into the machine registry."""
         # Imports need to be in this level to prevent early db model imports
-        from machine.models import MachineConfig
+        from machine.models import MachineConfig, MachineState
+
+        # Discard the shared state reported before the server was (re)started,
+        # it is reported again when the machines are initialized
+        MachineState.objects.all().delete()
 
         for machine_config in MachineConfig.objects.all():
             self.add_machine(machine_config, initialize=False)
@@ -7,7 +7,7 @@ from rest_framework import serializers
 from common.serializers import GenericReferencedSettingSerializer
 from InvenTree.helpers_mixin import ClassProviderMixin
 from machine import registry
-from machine.models import MachineConfig, MachineSetting
+from machine.models import MachineConfig, MachineJob, MachineSetting
 
 
 class MachineConfigSerializer(serializers.ModelSerializer):
@@ -42,15 +42,21 @@ class MachineConfigSerializer(serializers.ModelSerializer):
     is_driver_available = serializers.SerializerMethodField('get_is_driver_available')
     restart_required = serializers.SerializerMethodField('get_restart_required')
 
+    def to_representation(self, instance):
+        """Load the shared state of the machine once, rather than for each state field."""
+        machine = instance.machine
+        self.machine_state = machine.get_state() if machine else {}
+
+        return super().to_representation(instance)
+
     def get_initialized(self, obj: MachineConfig) -> bool:
         """Serializer method for the initialized field."""
         return getattr(obj.machine, 'initialized', False)
 
     def get_status(self, obj: MachineConfig) -> int:
         """Serializer method for the status field."""
-        status = getattr(obj.machine, 'status', None)
-        if status is not None:
-            return status.value
+        if obj.machine:
+            return obj.machine.get_status(self.machine_state).value
         return -1
 
     def get_status_model(self, obj: MachineConfig) -> Union[str, None]:
@@ -60,11 +66,11 @@ class MachineConfigSerializer(serializers.ModelSerializer):
 
     def get_status_text(self, obj: MachineConfig) -> str:
         """Serializer method for the status text field."""
-        return getattr(obj.machine, 'status_text', '')
+        return self.machine_state.get('status_text', '')
 
     def get_errors(self, obj: MachineConfig) -> list[str]:
         """Serializer method for the errors field."""
-        return [str(err) for err in obj.errors]
+        return [str(err) for err in self.machine_state.get('errors', [])]
 
     def get_is_driver_available(self, obj: MachineConfig) -> bool:
         """Serializer method for the is_driver_available field."""
@@ -204,3 +210,36 @@ class MachineRestartSerializer(serializers.Serializer):
         fields = ['ok']
 
     ok = serializers.BooleanField()
+
+
+class MachineJobSerializer(serializers.ModelSerializer):
+    """Serializer for a MachineJob."""
+
+    class Meta:
+        """Meta for serializer."""
+
+        model = MachineJob
+        fields = [
+            'pk',
+            'machine',
+            'user',
+            'status',
+            'label',
+            'total',
+            'completed',
+            'progress',
+            'error',
+            'created',
+            'started',
+            'finished',
+        ]
+
+        read_only_fields = fields
+
+    machine = serializers.UUIDField(source='machine_config_id', read_only=True)
+    label = serializers.SerializerMethodField('get_label')
+    progress = serializers.IntegerField(read_only=True)
+
+    def get_label(self, obj: MachineJob) -> str:
+        """Serializer method for the label field."""
+        return str(obj.label or '')
@@ -0,0 +1,150 @@
+"""Background tasks for the machine app."""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+
+import InvenTree.helpers
+import InvenTree.tasks
+from InvenTree.exceptions import log_error
+from InvenTree.tasks import ScheduledTask, scheduled_task
+
+logger = logging.getLogger('inventree')
+
+
+def queue_machine_job(job):
+    """Queue the provided job for execution by the background worker."""
+    InvenTree.tasks.offload_task(run_machine_jobs, str(job.machine_config_id))
+
+
+def timeout_running_jobs(jobs) -> int:
+    """Mark the running jobs which have exceeded the worker timeout as failed.
+
+    The worker which was running these jobs has been terminated, so they will never finish.
+
+    Arguments:
+        jobs: A queryset of MachineJob objects to check
+
+    Returns:
+        The number of jobs which were marked as failed
+    """
+    from machine.models import MachineJob
+
+    now = InvenTree.helpers.current_time()
+    timeout = timedelta(seconds=settings.Q_CLUSTER.get('timeout', 90))
+
+    return jobs.filter(
+        status=MachineJob.Status.RUNNING, started__lt=now - timeout
+    ).update(status=MachineJob.Status.FAILED, error='Job timed out', finished=now)
+
+
+@scheduled_task(ScheduledTask.MINUTES, 5)
+def check_stale_jobs():
+    """Fail any running jobs which have exceeded the worker timeout.
+
+    Stale jobs are also failed when the next job for a machine is claimed,
+    but that only happens when a new job is queued for the machine.
+    Machines which have pending jobs (but no running job) are queued again,
+    as their queue may have been blocked by a stale job.
+    """
+    from machine.models import MachineJob
+
+    n = timeout_running_jobs(MachineJob.objects.all())
+
+    if n > 0:
+        logger.info('Marked %s stale machine jobs as failed', n)
+
+    running = MachineJob.objects.filter(status=MachineJob.Status.RUNNING)
+
+    machine_pks = (
+        MachineJob.objects.filter(status=MachineJob.Status.PENDING)
+        .exclude(machine_config__in=running.values('machine_config'))
+        .values_list('machine_config', flat=True)
+        .distinct()
+    )
+
+    for machine_pk in machine_pks:
+        InvenTree.tasks.offload_task(run_machine_jobs, str(machine_pk))
+
+
+def claim_next_job(machine_pk: str):
+    """Claim the next pending job for the specified machine.
+
+    The jobs for each machine are run one at a time (in order),
+    so no job is returned if another job is currently running for this machine.
+
+    Running jobs which have exceeded the worker timeout are marked as failed,
+    as the worker which was running them has been terminated.
+
+    Returns:
+        The claimed MachineJob instance, or None
+    """
+    from machine.models import MachineConfig, MachineJob
+
+    now = InvenTree.helpers.current_time()
+
+    with transaction.atomic():
+        # The machine config row acts as a (cross-process) lock for the job queue
+        if not MachineConfig.objects.select_for_update().filter(pk=machine_pk).exists():
+            return None
+
+        jobs = MachineJob.objects.filter(machine_config=machine_pk)
+
+        timeout_running_jobs(jobs)
+
+        if jobs.filter(status=MachineJob.Status.RUNNING).exists():
+            return None
+
+        job = jobs.filter(status=MachineJob.Status.PENDING).order_by('pk').first()
+
+        if job is None:
+            return None
+
+        job.status = MachineJob.Status.RUNNING
+        job.started = now
+        job.save(update_fields=['status', 'started'])
+
+    return job
+
+
+def run_machine_jobs(machine_pk: str):
+    """Run the next pending job for the specified machine.
+
+    If there are further pending jobs, another task is queued to run them.
+    """
+    from machine import registry
+    from machine.models import MachineJob
+
+    job = claim_next_job(machine_pk)
+
+    if job is None:
+        return
+
+    machine = registry.get_machine(machine_pk)
+
+    try:
+        if machine is None:
+            raise ValueError(f"Machine '{machine_pk}' not found")
+
+        logger.info("Running job %s for machine '%s'", job.pk, machine.name)
+
+        machine.run_job(job)
+
+        job.status = MachineJob.Status.COMPLETE
+        job.completed = job.total
+    except Exception as exc:
+        log_error('machine.run_job')
+        job.status = MachineJob.Status.FAILED
+        job.error = str(exc)
+
+    job.finished = InvenTree.helpers.current_time()
+    job.save(update_fields=['status', 'completed', 'error', 'finished'])
+
+    if (
+        MachineJob.objects.filter(machine_config=machine_pk)
+        .filter(status=MachineJob.Status.PENDING)
+        .exists()
+    ):
+        queue_machine_job(job)
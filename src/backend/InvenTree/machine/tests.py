@@ -1,20 +1,25 @@
 """Machine app tests."""
 
+from datetime import timedelta
 from typing import cast
 from unittest.mock import MagicMock, Mock
 
 from django.apps import apps
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from rest_framework import serializers
 
+import InvenTree.helpers
 from InvenTree.unit_test import InvenTreeAPITestCase
 from label.models import PartLabel
 from machine.machine_type import BaseDriver, BaseMachineType, MachineStatus
 from machine.machine_types.label_printer import LabelPrinterBaseDriver
-from machine.models import MachineConfig
+from machine.models import MachineConfig, MachineJob
 from machine.registry import registry
+from machine.tasks import check_stale_jobs
 from part.models import Part
 from plugin.models import PluginConfig
 from plugin.registry import registry as plg_registry
@@ -307,3 +312,168 @@ class TestLabelPrinterMachineType(TestMachineRegistryMixin, InvenTreeAPITestCase
             },
             expected_code=400,
         )
+
+    def test_print_job(self):
+        """Test that print jobs are queued and run by the background worker."""
+        plugin_ref = 'inventreelabelmachine'
+
+        apps.get_app_config('label').create_defaults()  # type: ignore
+        plg_registry.reload_plugins()
+        config = cast(PluginConfig, plg_registry.get_plugin(plugin_ref).plugin_config())  # type: ignore
+        config.active = True
+        config.save()
+
+        parts = list(Part.objects.all()[:3])
+        label = cast(PartLabel, PartLabel.objects.first())
+
+        url = reverse('api-part-label-print', kwargs={'pk': label.pk})
+        url += f'/?plugin={plugin_ref}&' + '&'.join(f'part[]={p.pk}' for p in parts)
+
+        driver = cast(LabelPrinterBaseDriver, self.machine.machine.driver)  # type: ignore
+        driver.JOB_CHUNK_SIZE = 2
+
+        response = self.post(
+            url,
+            {'machine': str(self.machine.pk), 'driver_options': {'test_option': '2'}},
+            expected_code=200,
+        )
+
+        job = MachineJob.objects.get(pk=response.json()['job'])
+
+        # The job is run (synchronously) in chunks of JOB_CHUNK_SIZE labels
+        self.assertEqual(self.print_labels.call_count, 2)
+        self.assertEqual(
+            [p.pk for p in self.print_labels.call_args_list[0].args[2]],
+            [p.pk for p in parts[:2]],
+        )
+        self.assertEqual(
+            self.print_labels.call_args.kwargs['printing_options'],
+            {'copies': 1, 'test_option': 2},
+        )
+
+        request = self.print_labels.call_args.args[3]
+        self.assertEqual(request.user, self.user)
+        self.assertEqual(request.build_absolute_uri('/'), 'http://testserver/')
+
+        self.assertEqual(job.status, MachineJob.Status.COMPLETE)
+        self.assertEqual(job.user, self.user)
+        self.assertEqual(job.total, 3)
+        self.assertEqual(job.completed, 3)
+
+        # Job status is available via the API
+        response = self.get(
+            reverse('api-machine-jobs', kwargs={'pk': self.machine.pk}),
+            expected_code=200,
+        )
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['status'], 'complete')
+        self.assertEqual(response.data[0]['progress'], 100)
+
+        # A failed job does not prevent subsequent jobs from running
+        self.print_labels.side_effect = ValueError('Printer on fire')
+
+        response = self.post(
+            url,
+            {'machine': str(self.machine.pk), 'driver_options': {'test_option': '2'}},
+            expected_code=200,
+        )
+
+        response = self.get(
+            reverse('api-machine-job-detail', kwargs={'pk': response.json()['job']}),
+            expected_code=200,
+        )
+        self.assertEqual(response.data['status'], 'failed')
+        self.assertEqual(response.data['error'], 'Printer on fire')
+        self.assertEqual(response.data['completed'], 0)
+
+    def test_stale_job(self):
+        """Test that stale jobs are failed by the scheduled task, unblocking the queue."""
+        plugin_ref = 'inventreelabelmachine'
+
+        apps.get_app_config('label').create_defaults()  # type: ignore
+        plg_registry.reload_plugins()
+        config = cast(PluginConfig, plg_registry.get_plugin(plugin_ref).plugin_config())  # type: ignore
+        config.active = True
+        config.save()
+
+        part = cast(Part, Part.objects.first())
+        label = cast(PartLabel, PartLabel.objects.first())
+
+        url = reverse('api-part-label-print', kwargs={'pk': label.pk})
+        url += f'/?plugin={plugin_ref}&part[]={part.pk}'
+
+        response = self.post(
+            url,
+            {'machine': str(self.machine.pk), 'driver_options': {'test_option': '2'}},
+            expected_code=200,
+        )
+
+        # Simulate a job whose worker was terminated, which blocks a pending job
+        stale = MachineJob.objects.get(pk=response.json()['job'])
+        stale.status = MachineJob.Status.RUNNING
+        stale.started = InvenTree.helpers.current_time() - timedelta(days=1)
+        stale.save()
+
+        pending = MachineJob.objects.get(pk=stale.pk)
+        pending.pk = None
+        pending.status = MachineJob.Status.PENDING
+        pending.save()
+
+        self.print_labels.reset_mock()
+
+        check_stale_jobs()
+
+        stale.refresh_from_db()
+        pending.refresh_from_db()
+
+        self.assertEqual(stale.status, MachineJob.Status.FAILED)
+        self.assertEqual(stale.error, 'Job timed out')
+        self.assertEqual(pending.status, MachineJob.Status.COMPLETE)
+        self.assertEqual(self.print_labels.call_count, 1)
+
+    def test_shared_state(self):
+        """Test that the machine status is shared between processes."""
+        machine = cast(BaseMachineType, self.machine.machine)
+
+        machine.set_status(machine.MACHINE_STATUS.PRINTING)  # type: ignore
+        machine.set_status_text('Printing...')
+        machine.handle_error('Paper jam')
+        machine.handle_error('Paper jam')
+
+        # Simulate access from another process, which has no local state
+        # (creating the machine instance must not reset the shared state)
+        other = type(machine)(self.machine)
+
+        self.assertEqual(other.status.value, 110)
+        self.assertEqual(other.status_text, 'Printing...')
+        self.assertEqual(other.errors, ['Paper jam'])
+
+        response = self.get(
+            reverse('api-machine-detail', kwargs={'pk': self.machine.pk}),
+            expected_code=200,
+        )
+
+        self.assertEqual(response.data['status'], 110)
+        self.assertEqual(response.data['status_text'], 'Printing...')
+        self.assertEqual(response.data['machine_errors'], ['Paper jam'])
+
+        # The shared state is only loaded once when the machine is serialized
+        with CaptureQueriesContext(connection) as ctx:
+            self.get(
+                reverse('api-machine-detail', kwargs={'pk': self.machine.pk}),
+                expected_code=200,
+            )
+
+        state_queries = [
+            q for q in ctx.captured_queries if 'machine_machinestate' in q['sql']
+        ]
+        self.assertEqual(len(state_queries), 1)
+
+        # The shared state is reset when the machines are loaded (on server start)
+        registry.initialize()
+
+        machine = cast(BaseMachineType, self.machine.machine)
+
+        self.assertEqual(machine.status, machine.default_machine_status)
+        self.assertEqual(machine.status_text, '')
+        self.assertEqual(machine.errors, [])
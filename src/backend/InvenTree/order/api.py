@@ -29,7 +29,13 @@ from InvenTree.api import (
 from InvenTree.filters import SEARCH_ORDER_FILTER, SEARCH_ORDER_FILTER_ALIAS
 from InvenTree.helpers import DownloadFile, str2bool
 from InvenTree.helpers_model import construct_absolute_url, get_base_url
-from InvenTree.mixins import CreateAPI, ListAPI, ListCreateAPI, RetrieveUpdateDestroyAPI
+from InvenTree.mixins import (
+    CreateAPI,
+    ListAPI,
+    ListCreateAPI,
+    RetrieveAPI,
+    RetrieveUpdateDestroyAPI,
+)
 from InvenTree.status_codes import (
     PurchaseOrderStatus,
     PurchaseOrderStatusGroups,
@@ -1130,11 +1136,28 @@ class SalesOrderShipmentDetail(RetrieveUpdateDestroyAPI):
 
 
 class SalesOrderShipmentComplete(CreateAPI):
-    """API endpoint for completing (shipping) a SalesOrderShipment."""
+    """API endpoint for completing (shipping) a SalesOrderShipment.
+
+    A large shipment is completed by the background worker,
+    in which case the response contains 'background': True.
+    Progress can be monitored via the SalesOrderShipmentProgress endpoint.
+    """
 
     queryset = models.SalesOrderShipment.objects.all()
     serializer_class = serializers.SalesOrderShipmentCompleteSerializer
 
+    def create(self, request, *args, **kwargs):
+        """Complete the shipment, and report whether a background task was used."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        background = serializer.save()
+
+        data = serializer.data
+        data['background'] = background
+
+        return Response(data, status=status.HTTP_201_CREATED)
+
     def get_serializer_context(self):
         """Pass the request object to the serializer."""
         ctx = super().get_serializer_context()
@@ -1150,6 +1173,23 @@ class SalesOrderShipmentComplete(CreateAPI):
         return ctx
 
 
+class SalesOrderShipmentProgress(RetrieveAPI):
+    """API endpoint for reporting the progress of the background shipment completion task."""
+
+    queryset = models.SalesOrderShipment.objects.all()
+    serializer_class = serializers.SalesOrderShipmentProgressSerializer
+
+    def get_object(self):
+        """Return the progress information for the specified shipment."""
+        import order.tasks
+
+        shipment = super().get_object()
+
+        return common_models.TaskProgress.get_progress_data(
+            order.tasks.shipment_progress_key(shipment.pk)
+        )
+
+
 class PurchaseOrderAttachmentList(AttachmentMixin, ListCreateDestroyAPIView):
     """API endpoint for listing, creating and bulk deleting) a PurchaseOrderAttachment (file upload)."""
 
@@ -1730,6 +1770,11 @@ order_api_urls = [
                                 SalesOrderShipmentComplete.as_view(),
                                 name='api-so-shipment-ship',
                             ),
+                            path(
+                                'ship-progress/',
+                                SalesOrderShipmentProgress.as_view(),
+                                name='api-so-shipment-ship-progress',
+                            ),
                             path(
                                 'metadata/',
                                 MetadataView.as_view(),
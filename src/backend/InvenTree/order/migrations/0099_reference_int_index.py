@@ -0,0 +1,28 @@
+# Generated by Django 4.2.11 on 2026-10-19 10:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0098_auto_20231024_1844'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='purchaseorder',
+            name='reference_int',
+            field=models.BigIntegerField(db_index=True, default=0),
+        ),
+        migrations.AlterField(
+            model_name='returnorder',
+            name='reference_int',
+            field=models.BigIntegerField(db_index=True, default=0),
+        ),
+        migrations.AlterField(
+            model_name='salesorder',
+            name='reference_int',
+            field=models.BigIntegerField(db_index=True, default=0),
+        ),
+    ]
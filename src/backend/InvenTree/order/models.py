@@ -10,8 +10,8 @@ from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
-from django.db import models, transaction
-from django.db.models import F, Q, Sum
+from django.db import connection, models, transaction
+from django.db.models import Case, F, Max, OuterRef, Q, Subquery, Sum, When
 from django.db.models.functions import Coalesce
 from django.db.models.signals import post_save
 from django.dispatch.dispatcher import receiver
@@ -57,6 +57,7 @@ from InvenTree.status_codes import (
 )
 from part import models as PartModels
 from plugin.events import trigger_event
+from plugin.registry import registry
 
 logger = logging.getLogger('inventree')
 
@@ -381,9 +382,7 @@ class PurchaseOrder(TotalPriceMixin, Order):
     @classmethod
     def api_defaults(cls, request):
         """Return default values for this model when issuing an API OPTIONS request."""
-        defaults = {
-            'reference': order.validators.generate_next_purchase_order_reference()
-        }
+        defaults = {'reference': cls.generate_reference(allocate=False)}
 
         return defaults
 
@@ -609,9 +608,13 @@ class PurchaseOrder(TotalPriceMixin, Order):
             self.save()
 
             # Schedule pricing update for any referenced parts
-            for line in self.lines.all():
-                if line.part and line.part.part:
-                    line.part.part.schedule_pricing_update(create=True)
+            parts = {
+                line.part.part.pk: line.part.part
+                for line in self.lines.exclude(part=None).select_related('part__part')
+            }
+
+            for part in parts.values():
+                part.schedule_pricing_update(create=True)
 
             trigger_event('purchaseorder.completed', id=self.pk)
 
@@ -711,39 +714,100 @@ class PurchaseOrder(TotalPriceMixin, Order):
     def receive_line_item(
         self, line, location, quantity, user, status=StockStatus.OK.value, **kwargs
     ):
-        """Receive a line item (or partial line item) against this PurchaseOrder."""
-        # Extract optional batch code for the new stock item
-        batch_code = kwargs.get('batch_code', '')
+        """Receive a line item (or partial line item) against this PurchaseOrder.
 
-        # Extract optional list of serial numbers
-        serials = kwargs.get('serials', None)
-
-        # Extract optional notes field
-        notes = kwargs.get('notes', '')
+        Refer to receive_line_items for the available keyword arguments.
+        """
+        return self.receive_line_items(
+            [
+                {
+                    **kwargs,
+                    'line_item': line,
+                    'location': location,
+                    'quantity': quantity,
+                    'status': status,
+                }
+            ],
+            user,
+        )
 
-        # Extract optional barcode field
-        barcode = kwargs.get('barcode', None)
+    @transaction.atomic
+    def receive_line_items(self, items: list, user):
+        """Receive multiple line items (or partial line items) against this PurchaseOrder.
+
+        Arguments:
+            items: A list of dicts, each of which contains:
+                - line_item: The PurchaseOrderLineItem to receive against
+                - location: The destination StockLocation
+                - quantity: The quantity to receive (number of packs)
+                - status: (optional) Status of the received stock
+                - batch_code: (optional) Batch code for the received stock
+                - serials: (optional) List of serial numbers for the received stock
+                - barcode: (optional) Barcode to assign to the received stock
+                - notes: (optional) Notes for the stock tracking entries
+            user: The user who is receiving the items
+
+        All items are validated before any changes are made. The new stock items
+        (and tracking entries) are then created in bulk, and the received quantity
+        of each line is updated with a single query.
 
-        # Prevent null values for barcode
-        if barcode is None:
-            barcode = ''
+        Returns:
+            A list of the StockItem objects which were created
+        """
+        StockItem = stock.models.StockItem
 
         if self.status != PurchaseOrderStatus.PLACED:
             raise ValidationError(
                 "Lines can only be received against an order marked as 'PLACED'"
             )
 
-        try:
-            if quantity < 0:
+        # List of (stock_item, notes, deltas) tuples for the new stock items
+        new_items = []
+
+        # Total quantity received against each line item
+        received = {}
+
+        # Serial numbers provided for each part
+        serials = {}
+
+        barcodes = set()
+
+        # Evaluate the default value once, rather than for each new stock item
+        delete_on_deplete = stock.models.default_delete_on_deplete()
+
+        # Look up the validation plugins once, and reuse them for each new stock item
+        plugins = registry.with_mixin('validation')
+
+        for entry in items:
+            line = entry['line_item']
+            quantity = entry['quantity']
+
+            try:
+                if quantity < 0:
+                    raise ValidationError({
+                        'quantity': _('Quantity must be a positive number')
+                    })
+                quantity = InvenTree.helpers.clean_decimal(quantity)
+            except TypeError:
+                raise ValidationError({'quantity': _('Invalid quantity provided')})
+
+            if line.order_id != self.pk:
                 raise ValidationError({
-                    'quantity': _('Quantity must be a positive number')
+                    'line_item': _('Line item does not match purchase order')
                 })
-            quantity = InvenTree.helpers.clean_decimal(quantity)
-        except TypeError:
-            raise ValidationError({'quantity': _('Invalid quantity provided')})
 
-        # Create a new stock item
-        if line.part and quantity > 0:
+            received[line.pk] = received.get(line.pk, 0) + quantity
+
+            if not line.part or quantity <= 0:
+                continue
+
+            location = entry.get('location', None)
+            status = entry.get('status', StockStatus.OK.value)
+            notes = entry.get('notes', '')
+
+            # Prevent null values for barcode
+            barcode = entry.get('barcode', None) or ''
+
             # Calculate received quantity in base units
             stock_quantity = line.part.base_quantity(quantity)
 
@@ -755,56 +819,139 @@ class PurchaseOrder(TotalPriceMixin, Order):
                 unit_purchase_price = None
 
             # Determine if we should individually serialize the items, or not
-            if type(serials) is list and len(serials) > 0:
+            item_serials = entry.get('serials', None)
+
+            if type(item_serials) is list and len(item_serials) > 0:
                 serialize = True
+                serials.setdefault(line.part.part, []).extend(item_serials)
             else:
                 serialize = False
-                serials = [None]
+                item_serials = [None]
+
+            deltas = {'status': status, 'purchaseorder': self.pk}
+
+            if location:
+                deltas['location'] = location.pk
+
+            if quantity:
+                deltas['quantity'] = float(quantity)
 
-            for sn in serials:
-                item = stock.models.StockItem(
+            for sn in item_serials:
+                item = StockItem(
                     part=line.part.part,
                     supplier_part=line.part,
                     location=location,
                     quantity=1 if serialize else stock_quantity,
                     purchase_order=self,
                     status=status,
-                    batch=batch_code,
+                    batch=entry.get('batch_code', ''),
                     serial=sn,
                     purchase_price=unit_purchase_price,
+                    delete_on_deplete=delete_on_deplete,
                 )
 
                 # Assign the provided barcode
                 if barcode:
                     item.assign_barcode(barcode_data=barcode, save=False)
 
+                    if item.barcode_hash in barcodes:
+                        raise ValidationError(_('Existing barcode found'))
+
+                    barcodes.add(item.barcode_hash)
+
+                # Perform the same validation checks as StockItem.save()
+                item.clean(plugins=plugins)
+                item.update_serial_number(plugins=plugins)
+                item.run_plugin_validation(plugins=plugins)
+
+                new_items.append((item, notes, dict(deltas)))
+
+        # Validate all provided serial numbers at once (for each part)
+        for part, part_serials in serials.items():
+            errors = part.validate_serial_numbers(part_serials)
+
+            seen = set()
+
+            for serial in part_serials:
+                if serial in seen:
+                    errors[serial] = _('Duplicate serial number') + ': ' + str(serial)
+
+                seen.add(serial)
+
+            if errors:
+                raise ValidationError({'serial_numbers': list(errors.values())})
+
+        # Each new stock item is the root of a new tree
+        tree_id = StockItem.objects.aggregate(tree_id=Max('tree_id'))['tree_id'] or 0
+
+        for item, _notes, _deltas in new_items:
+            tree_id += 1
+            item.tree_id = tree_id
+            item.lft = 1
+            item.rght = 2
+            item.level = 0
+
+        stock_items = [item for item, _notes, _deltas in new_items]
+
+        if connection.features.can_return_rows_from_bulk_insert:
+            StockItem.objects.bulk_create(stock_items)
+        else:
+            # Primary keys are required for the tracking entries
+            for item in stock_items:
                 item.save(add_note=False)
 
-                tracking_info = {'status': status, 'purchaseorder': self.pk}
+        now = InvenTree.helpers.current_time()
 
-                item.add_tracking_entry(
-                    StockHistoryCode.RECEIVED_AGAINST_PURCHASE_ORDER,
-                    user,
-                    notes=notes,
-                    deltas=tracking_info,
-                    location=location,
-                    purchaseorder=self,
-                    quantity=quantity,
-                )
+        stock.models.StockItemTracking.objects.bulk_create([
+            stock.models.StockItemTracking(
+                item=item,
+                tracking_type=StockHistoryCode.RECEIVED_AGAINST_PURCHASE_ORDER.value,
+                user=user,
+                date=now,
+                notes=notes,
+                deltas=deltas,
+            )
+            for item, notes, deltas in new_items
+        ])
 
-        # Update the number of parts received against the particular line item
+        # Update the number of parts received against each line item
         # Note that this quantity does *not* take the pack_quantity into account, it is "number of packs"
-        line.received += quantity
-        line.save()
+        if received:
+            self.lines.filter(pk__in=received.keys()).update(
+                received=Case(
+                    *[
+                        When(pk=pk, then=F('received') + quantity)
+                        for pk, quantity in received.items()
+                    ],
+                    default=F('received'),
+                    output_field=models.DecimalField(),
+                )
+            )
+
+        for entry in items:
+            entry['line_item'].received += InvenTree.helpers.clean_decimal(
+                entry['quantity']
+            )
+
+        # Line items and stock items were updated without triggering the post_save signal
+        from part.summary import schedule_summary_update
+
+        schedule_summary_update(
+            'company.supplierpart', {entry['line_item'].part_id for entry in items}
+        )
+
+        stock.models.after_bulk_create_stock_items(stock_items)
 
         # Has this order been completed?
-        if len(self.pending_line_items()) == 0:
+        if not self.pending_line_items().exists():
             if common_models.InvenTreeSetting.get_setting(
                 'PURCHASEORDER_AUTO_COMPLETE', True
             ):
                 self.received_by = user
                 self.complete_order()  # This will save the model
 
+        trigger_event('purchaseorder.received', id=self.pk)
+
         # Issue a notification to interested parties, that this order has been "updated"
         notify_responsible(
             self,
@@ -813,6 +960,8 @@ class PurchaseOrder(TotalPriceMixin, Order):
             content=InvenTreeNotificationBodies.ItemsReceived,
         )
 
+        return stock_items
+
 
 class SalesOrder(TotalPriceMixin, Order):
     """A SalesOrder represents a list of goods shipped outwards to a customer."""
@@ -839,7 +988,7 @@ class SalesOrder(TotalPriceMixin, Order):
     @classmethod
     def api_defaults(cls, request):
         """Return default values for this model when issuing an API OPTIONS request."""
-        defaults = {'reference': order.validators.generate_next_sales_order_reference()}
+        defaults = {'reference': cls.generate_reference(allocate=False)}
 
         return defaults
 
@@ -1097,6 +1246,141 @@ class SalesOrder(TotalPriceMixin, Order):
             self.status, SalesOrderStatus.IN_PROGRESS.value, self, self._action_place
         )
 
+    @transaction.atomic
+    def complete_allocations(self, allocations, user):
+        """Complete (ship) the provided SalesOrderAllocation objects against this order.
+
+        This is the bulk equivalent of StockItem.allocateToCustomer, for each allocation:
+
+        - Any stock item with more stock than is allocated is split first
+        - The allocated stock items are assigned to the customer (with a single query)
+        - The "shipped" quantity of each affected line item is updated (with a single query)
+
+        Note: The SalesOrderAllocation objects are not deleted by this function
+        """
+        from common.search import (
+            index_update_allowed,
+            is_model_indexed,
+            update_search_documents,
+        )
+        from part.summary import schedule_summary_update
+
+        StockItem = stock.models.StockItem
+
+        allocations = list(allocations.select_related('item', 'line').order_by('pk'))
+
+        if len(allocations) == 0:
+            return
+
+        # Remaining quantity for each source stock item, after splitting
+        remaining = {}
+
+        # Ensure that each source stock item is represented by a single instance
+        sources = {}
+
+        # List of (source, new_item, quantity) tuples for stock which must be split
+        splits = []
+
+        # Allocations which point to a new (split) stock item
+        moved = []
+
+        for allocation in allocations:
+            source = sources.setdefault(allocation.item_id, allocation.item)
+
+            available = remaining.get(source.pk, source.quantity)
+
+            if allocation.quantity < available and not source.serialized:
+                # Split the allocated quantity into a new stock item
+                item = source.get_split_item(allocation.quantity)
+                item.sales_order = self
+                item.customer = self.customer
+                item.location = None
+
+                remaining[source.pk] = available - allocation.quantity
+                splits.append((source, item, allocation.quantity))
+
+                allocation.item = item
+                moved.append(allocation)
+            else:
+                remaining[source.pk] = 0
+
+        # Source items which are assigned to the customer in their entirety
+        assigned = [source for source in sources.values() if remaining[source.pk] == 0]
+
+        for item in assigned:
+            item.sales_order = self
+            item.customer = self.customer
+            item.location = None
+
+        StockItem.objects.filter(pk__in=[item.pk for item in assigned]).update(
+            sales_order=self, customer=self.customer, location=None
+        )
+
+        new_items = [item for _source, item, _quantity in splits]
+
+        tracking = stock.models.create_split_items(splits)
+
+        SalesOrderAllocation.objects.bulk_update(moved, ['item'])
+
+        deltas = {'salesorder': self.pk}
+
+        if self.customer:
+            deltas['customer'] = self.customer.pk
+            deltas['customer_name'] = self.customer.name
+
+        for item in new_items + assigned:
+            tracking.append((
+                item,
+                StockHistoryCode.SHIPPED_AGAINST_SALES_ORDER,
+                dict(deltas),
+            ))
+
+        now = InvenTree.helpers.current_time()
+
+        stock.models.StockItemTracking.objects.bulk_create([
+            stock.models.StockItemTracking(
+                item=item,
+                tracking_type=code.value,
+                user=user,
+                date=now,
+                deltas=item_deltas,
+            )
+            for item, code, item_deltas in tracking
+        ])
+
+        # Update the "shipped" quantity for each line item
+        shipped = (
+            SalesOrderAllocation.objects.filter(
+                pk__in=[allocation.pk for allocation in allocations],
+                line=OuterRef('pk'),
+            )
+            .order_by()
+            .values('line')
+            .annotate(total=Sum('quantity'))
+            .values('total')
+        )
+
+        SalesOrderLineItem.objects.filter(
+            pk__in={allocation.line_id for allocation in allocations}
+        ).update(
+            shipped=F('shipped')
+            + Coalesce(
+                Subquery(shipped), Decimal(0), output_field=models.DecimalField()
+            )
+        )
+
+        # Stock items and line items were updated without triggering the post_save signal
+        schedule_summary_update(
+            'part.part',
+            {item.part_id for item in sources.values()}
+            | {allocation.line.part_id for allocation in allocations},
+        )
+
+        stock.models.after_bulk_create_stock_items(new_items)
+
+        if assigned and is_model_indexed(StockItem) and index_update_allowed():
+            update_search_documents(StockItem, [item.pk for item in assigned])
+
     @transaction.atomic
     def complete_order(self, user, **kwargs):
         """Attempt to transition to SHIPPED status."""
@@ -1742,12 +2026,8 @@ class SalesOrderShipment(
         # Check if the shipment can be completed (throw error if not)
         self.check_can_complete()
 
-        allocations = self.allocations.all()
-
-        # Iterate through each stock item assigned to this shipment
-        for allocation in allocations:
-            # Mark the allocation as "complete"
-            allocation.complete_allocation(user)
+        # Ship all stock items assigned to this shipment
+        self.order.complete_allocations(self.allocations.all(), user)
 
         # Update the "shipment" date
         self.shipment_date = kwargs.get(
@@ -1934,20 +2214,13 @@ class SalesOrderAllocation(models.Model):
         - Determine if the referenced StockItem needs to be "split" (if allocated quantity != stock quantity)
         - Mark the StockItem as belonging to the Customer (this will remove it from stock)
         """
-        order = self.line.order
-
-        item = self.item.allocateToCustomer(
-            order.customer, quantity=self.quantity, order=order, user=user
+        self.line.order.complete_allocations(
+            SalesOrderAllocation.objects.filter(pk=self.pk), user
         )
 
-        # Update the 'shipped' quantity
-        self.line.shipped += self.quantity
-        self.line.save()
-
         # Update our own reference to the StockItem
         # (It may have changed if the stock was split)
-        self.item = item
-        self.save()
+        self.refresh_from_db()
 
 
 class ReturnOrder(TotalPriceMixin, Order):
@@ -1981,9 +2254,7 @@ class ReturnOrder(TotalPriceMixin, Order):
     @classmethod
     def api_defaults(cls, request):
         """Return default values for this model when issuing an API OPTIONS request."""
-        defaults = {
-            'reference': order.validators.generate_next_return_order_reference()
-        }
+        defaults = {'reference': cls.generate_reference(allocate=False)}
 
         return defaults
 
@@ -15,18 +15,21 @@ from django.db.models import (
     Value,
     When,
 )
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
 from rest_framework.serializers import ValidationError
-from sql_util.utils import SubqueryCount
+from sql_util.utils import SubqueryCount, SubquerySum
 
+import InvenTree.tasks
 import order.models
 import part.filters
 import part.filters as part_filters
 import part.models as part_models
 import stock.models
 import stock.serializers
+from common.models import TaskProgress
 from common.serializers import ProjectCodeSerializer
 from company.serializers import (
     AddressBriefSerializer,
@@ -730,30 +733,24 @@ class PurchaseOrderReceiveSerializer(serializers.Serializer):
         items = data['items']
         location = data.get('location', None)
 
+        # Select location (in descending order of priority)
+        entries = [
+            {
+                **item,
+                'location': location
+                or item.get('location', None)
+                or item['line_item'].get_destination(),
+            }
+            for item in items
+        ]
+
         # Now we can actually receive the items into stock
         with transaction.atomic():
-            for item in items:
-                # Select location (in descending order of priority)
-                loc = (
-                    location
-                    or item.get('location', None)
-                    or item['line_item'].get_destination()
-                )
-
-                try:
-                    order.receive_line_item(
-                        item['line_item'],
-                        loc,
-                        item['quantity'],
-                        request.user,
-                        status=item['status'],
-                        barcode=item.get('barcode', ''),
-                        batch_code=item.get('batch_code', ''),
-                        serials=item.get('serials', None),
-                    )
-                except (ValidationError, DjangoValidationError) as exc:
-                    # Catch model errors and re-throw as DRF errors
-                    raise ValidationError(detail=serializers.as_serializer_error(exc))
+            try:
+                order.receive_line_items(entries, request.user)
+            except (ValidationError, DjangoValidationError) as exc:
+                # Catch model errors and re-throw as DRF errors
+                raise ValidationError(detail=serializers.as_serializer_error(exc))
 
 
 class PurchaseOrderAttachmentSerializer(InvenTreeAttachmentSerializer):
@@ -1106,7 +1103,14 @@ class SalesOrderShipmentSerializer(InvenTreeModelSerializer):
 
 
 class SalesOrderShipmentCompleteSerializer(serializers.ModelSerializer):
-    """Serializer for completing (shipping) a SalesOrderShipment."""
+    """Serializer for completing (shipping) a SalesOrderShipment.
+
+    If the shipment has more than BACKGROUND_THRESHOLD allocations,
+    it is completed by the background worker (refer to order.tasks.complete_shipment).
+    """
+
+    # Maximum number of allocations which are shipped as part of the request
+    BACKGROUND_THRESHOLD = 500
 
     class Meta:
         """Metaclass options."""
@@ -1138,11 +1142,17 @@ class SalesOrderShipmentCompleteSerializer(serializers.ModelSerializer):
         return data
 
     def save(self):
-        """Save the serializer to complete the SalesOrderShipment."""
+        """Save the serializer to complete the SalesOrderShipment.
+
+        Returns:
+            True if the shipment was queued for completion by the background worker
+        """
+        import order.tasks
+
         shipment = self.context.get('shipment', None)
 
         if not shipment:
-            return
+            return False
 
         data = self.validated_data
 
@@ -1157,14 +1167,56 @@ class SalesOrderShipmentCompleteSerializer(serializers.ModelSerializer):
             # checks if shipment_date exists in data
             shipment_date = now
 
-        shipment.complete_shipment(
-            user,
-            tracking_number=data.get('tracking_number', shipment.tracking_number),
-            invoice_number=data.get('invoice_number', shipment.invoice_number),
-            link=data.get('link', shipment.link),
-            shipment_date=shipment_date,
-            delivery_date=data.get('delivery_date', shipment.delivery_date),
-        )
+        options = {
+            'tracking_number': data.get('tracking_number', shipment.tracking_number),
+            'invoice_number': data.get('invoice_number', shipment.invoice_number),
+            'link': data.get('link', shipment.link),
+            'shipment_date': shipment_date,
+            'delivery_date': data.get('delivery_date', shipment.delivery_date),
+        }
+
+        n_allocations = shipment.allocations.count()
+
+        if n_allocations > self.BACKGROUND_THRESHOLD:
+            progress_key = order.tasks.shipment_progress_key(shipment.pk)
+
+            # Report the shipment as pending until the background worker completes it
+            TaskProgress.set_progress(progress_key, n_allocations, 0)
+
+            # Offload the completion of a large shipment to the background worker
+            if InvenTree.tasks.offload_task(
+                order.tasks.complete_shipment,
+                shipment.pk,
+                user.pk if user else None,
+                force_async=True,
+                **options,
+            ):
+                return True
+
+            # The task could not be queued - complete the shipment now,
+            # so that any errors are reported to the client
+            TaskProgress.clear_progress(progress_key)
+
+        shipment.complete_shipment(user, **options)
+
+        return False
+
+
+class SalesOrderShipmentProgressSerializer(serializers.Serializer):
+    """Serializer for reporting the progress of the background shipment completion task."""
+
+    class Meta:
+        """Metaclass options."""
+
+        fields = ['total', 'completed', 'finished', 'error']
+
+    total = serializers.IntegerField(read_only=True, label=_('Total'))
+
+    completed = serializers.IntegerField(read_only=True, label=_('Completed'))
+
+    finished = serializers.BooleanField(read_only=True, label=_('Finished'))
+
+    error = serializers.CharField(read_only=True, label=_('Error'))
 
 
 class SalesOrderShipmentAllocationItemSerializer(serializers.Serializer):
@@ -1312,6 +1364,9 @@ class SalesOrderCancelSerializer(serializers.Serializer):
 class SalesOrderSerialAllocationSerializer(serializers.Serializer):
     """DRF serializer for allocation of serial numbers against a sales order / shipment."""
 
+    # Maximum number of serial numbers to look up with each database query
+    SERIAL_CHUNK_SIZE = 1000
+
     class Meta:
         """Metaclass options."""
 
@@ -1396,21 +1451,47 @@ class SalesOrderSerialAllocationSerializer(serializers.Serializer):
         serials_allocated = []
         stock_items_to_allocate = []
 
-        for serial in data['serials']:
-            items = stock.models.StockItem.objects.filter(
-                part=part, serial=serial, quantity=1
+        serials = [str(serial) for serial in data['serials']]
+
+        # Annotate matching stock items with the quantity already allocated
+        queryset = (
+            stock.models.StockItem.objects.filter(part=part, quantity=1)
+            .annotate(
+                allocated=Coalesce(SubquerySum('allocations__quantity'), Decimal(0))
+                + Coalesce(
+                    SubquerySum(
+                        'sales_order_allocations__quantity',
+                        filter=Q(
+                            line__order__status__in=SalesOrderStatusGroups.OPEN,
+                            shipment__shipment_date=None,
+                        ),
+                    ),
+                    Decimal(0),
+                )
             )
+            .order_by('pk')
+        )
 
-            if not items.exists():
-                serials_not_exist.append(str(serial))
-                continue
+        # Fetch the stock items for all serial numbers (in chunks)
+        stock_items = {}
+
+        for idx in range(0, len(serials), self.SERIAL_CHUNK_SIZE):
+            chunk = serials[idx : idx + self.SERIAL_CHUNK_SIZE]
+
+            for item in queryset.filter(serial__in=chunk):
+                stock_items.setdefault(item.serial, item)
 
-            stock_item = items[0]
+        for serial in serials:
+            stock_item = stock_items.get(serial, None)
+
+            if stock_item is None:
+                serials_not_exist.append(serial)
+                continue
 
-            if stock_item.unallocated_quantity() == 1:
+            if stock_item.quantity - stock_item.allocated >= 1:
                 stock_items_to_allocate.append(stock_item)
             else:
-                serials_allocated.append(str(serial))
+                serials_allocated.append(serial)
 
         if len(serials_not_exist) > 0:
             error_msg = _('No match found for the following serial numbers')
@@ -1,16 +1,21 @@
 """Background tasks for the 'order' app."""
 
+import logging
 from datetime import datetime, timedelta
 
+from django.contrib.auth.models import User
 from django.utils.translation import gettext_lazy as _
 
 import common.notifications
 import InvenTree.helpers_model
 import order.models
+from common.models import TaskProgress
 from InvenTree.status_codes import PurchaseOrderStatusGroups, SalesOrderStatusGroups
 from InvenTree.tasks import ScheduledTask, scheduled_task
 from plugin.events import trigger_event
 
+logger = logging.getLogger('inventree')
+
 
 def notify_overdue_purchase_order(po: order.models.PurchaseOrder):
     """Notify users that a PurchaseOrder has just become 'overdue'."""
@@ -109,3 +114,56 @@ def check_overdue_sales_orders():
 
     for po in overdue_orders:
         notify_overdue_sales_order(po)
+
+
+def shipment_progress_key(shipment_id: int) -> str:
+    """Return the key used to report shipment completion progress."""
+    return f'sales_order_shipment_completion_{shipment_id}'
+
+
+def complete_shipment(shipment_id: int, user_id: int, **kwargs):
+    """Complete (ship) a SalesOrderShipment in the background.
+
+    Arguments:
+        shipment_id: The ID of the SalesOrderShipment
+        user_id: The ID of the user completing the shipment
+
+    kwargs:
+        Passed through to SalesOrderShipment.complete_shipment
+
+    The shipment is completed in a single database transaction.
+    Progress is reported via the TaskProgress record for shipment_progress_key.
+    If the shipment cannot be completed, the task is reported as finished with the error message,
+    and the error is re-raised.
+    """
+    key = shipment_progress_key(shipment_id)
+
+    shipment = order.models.SalesOrderShipment.objects.filter(pk=shipment_id).first()
+
+    if not shipment:
+        logger.warning(
+            'Could not complete SalesOrderShipment <%s> - shipment does not exist',
+            shipment_id,
+        )
+        TaskProgress.clear_progress(key)
+        return
+
+    if shipment.shipment_date:
+        logger.info('SalesOrderShipment <%s> has already been shipped', shipment_id)
+        TaskProgress.clear_progress(key)
+        return
+
+    user = User.objects.filter(pk=user_id).first() if user_id else None
+
+    total = shipment.allocations.count()
+
+    TaskProgress.set_progress(key, total, 0)
+
+    try:
+        shipment.complete_shipment(user, **kwargs)
+    except Exception as exc:
+        # Report the failure, so that clients stop waiting for the shipment
+        TaskProgress.set_failed(key, exc)
+        raise
+
+    TaskProgress.set_progress(key, total, total, finished=True)
@@ -3,6 +3,7 @@
 import base64
 import io
 from datetime import datetime, timedelta
+from unittest import mock
 
 from django.core.exceptions import ValidationError
 from django.db import connection
@@ -13,6 +14,7 @@ from djmoney.money import Money
 from icalendar import Calendar
 from rest_framework import status
 
+import order.tasks
 from common.models import InvenTreeSetting
 from common.settings import currency_codes
 from company.models import Company, SupplierPart, SupplierPriceBreak
@@ -24,8 +26,8 @@ from InvenTree.status_codes import (
     SalesOrderStatusGroups,
     StockStatus,
 )
-from InvenTree.unit_test import InvenTreeAPITestCase
-from order import models
+from InvenTree.unit_test import InvenTreeAPITestCase, run_queued_tasks
+from order import models, serializers
 from part.models import Part
 from stock.models import StockItem
 from users.models import Owner
@@ -692,7 +694,7 @@ class PurchaseOrderLineItemTest(OrderTest):
         url = reverse('api-po-line-list')
 
         # Try to delete a set of line items via their IDs
-        self.delete(url, {'items': [1, 2]}, expected_code=204)
+        self.delete(url, {'items': [1, 2]}, expected_code=200)
 
         # We should have 2 less PurchaseOrderLineItems after deletign them
         self.assertEqual(models.PurchaseOrderLineItem.objects.count(), n - 2)
@@ -1134,6 +1136,85 @@ class PurchaseOrderReceiveTest(OrderTest):
         self.assertEqual(item.quantity, 10)
         self.assertEqual(item.batch, 'B-xyz-789')
 
+    def test_receive_bulk(self):
+        """Test receiving a large number of line items in a single request."""
+        supplier_part = models.PurchaseOrderLineItem.objects.get(pk=1).part
+
+        po = models.PurchaseOrder.objects.create(
+            supplier=supplier_part.supplier, reference='PO-99999'
+        )
+
+        N_LINES = 40
+
+        lines = [
+            models.PurchaseOrderLineItem.objects.create(
+                order=po, part=supplier_part, quantity=5
+            )
+            for _ in range(N_LINES)
+        ]
+
+        po.place_order()
+
+        items = []
+
+        for idx, line in enumerate(lines):
+            item = {'line_item': line.pk, 'quantity': 5}
+
+            # Every second line is received with serial numbers
+            if idx % 2 == 0:
+                item['serial_numbers'] = f'{5000 + idx * 5}+'
+
+            items.append(item)
+
+        url = reverse('api-po-receive', kwargs={'pk': po.pk})
+
+        # Serial numbers must be unique across all lines in the request
+        duplicate = [dict(item) for item in items[:4]]
+        duplicate[2]['serial_numbers'] = '5000+'
+
+        self.post(url, {'items': duplicate, 'location': 1}, expected_code=400)
+        self.assertEqual(StockItem.objects.count(), self.n)
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.post(url, {'items': items, 'location': 1}, expected_code=201)
+
+        # Query count is dominated by per-line validation, not per-item saves
+        self.assertLess(len(ctx), N_LINES * 8)
+
+        # Validation plugins are not looked up again for each received item
+        plugin_queries = [
+            q for q in ctx.captured_queries if 'plugin_pluginconfig' in q['sql']
+        ]
+        self.assertLessEqual(len(plugin_queries), N_LINES)
+
+        # 20 lines x 5 serialized items, plus 20 lines x 1 item
+        created = StockItem.objects.filter(purchase_order=po)
+        self.assertEqual(created.count(), 120)
+        self.assertEqual(StockItem.objects.count(), self.n + 120)
+        self.assertEqual(created.exclude(serial=None).count(), 100)
+
+        # Each new item is the root of a new tree
+        tree_ids = set(created.values_list('tree_id', flat=True))
+        self.assertEqual(len(tree_ids), 120)
+        self.assertEqual(
+            StockItem.objects.filter(tree_id__in=tree_ids).count(), len(tree_ids)
+        )
+
+        for item in created.filter(serial='5001'):
+            self.assertEqual(item.serial_int, 5001)
+            self.assertEqual((item.lft, item.rght, item.level), (1, 2, 0))
+            self.assertEqual(item.get_descendant_count(), 0)
+
+        for item in created:
+            self.assertEqual(item.tracking_info.count(), 1)
+
+        for line in lines:
+            line.refresh_from_db()
+            self.assertEqual(line.received, 5)
+
+        po.refresh_from_db()
+        self.assertEqual(po.status, PurchaseOrderStatus.COMPLETE)
+
 
 class SalesOrderTest(OrderTest):
     """Tests for the SalesOrder API."""
@@ -1826,6 +1907,75 @@ class SalesOrderAllocateTest(OrderTest):
         self.assertEqual(self.shipment.delivery_date, datetime(2023, 12, 5).date())
         self.assertTrue(self.shipment.is_delivered())
 
+    def test_shipment_complete_background(self):
+        """Test that a large shipment is completed by the background worker."""
+        url = reverse('api-so-shipment-ship', kwargs={'pk': self.shipment.pk})
+
+        line = self.order.lines.first()
+
+        models.SalesOrderAllocation.objects.create(
+            shipment=self.shipment,
+            line=line,
+            item=line.part.stock_items.last(),
+            quantity=5,
+        )
+
+        response = self.post(url, {}, expected_code=201)
+        self.assertFalse(response.data['background'])
+
+        shipment = models.SalesOrderShipment.objects.create(
+            order=self.order, reference='BG-001'
+        )
+
+        models.SalesOrderAllocation.objects.create(
+            shipment=shipment, line=line, item=line.part.stock_items.first(), quantity=5
+        )
+
+        url = reverse('api-so-shipment-ship', kwargs={'pk': shipment.pk})
+
+        with mock.patch.object(
+            serializers.SalesOrderShipmentCompleteSerializer, 'BACKGROUND_THRESHOLD', 0
+        ):
+            # The shipment is completed inline if the task cannot be queued
+            with mock.patch('InvenTree.tasks.offload_task', return_value=False):
+                with mock.patch.object(
+                    models.SalesOrderShipment,
+                    'complete_shipment',
+                    side_effect=ValidationError('Shipment failed'),
+                ):
+                    response = self.post(url, {}, expected_code=400)
+
+            self.assertIn('Shipment failed', str(response.data))
+
+            response = self.post(url, {'tracking_number': 'BG-TRK'}, expected_code=201)
+
+        self.assertTrue(response.data['background'])
+
+        # The shipment is completed when the queued task is run
+        shipment.refresh_from_db()
+        self.assertFalse(shipment.is_complete())
+
+        progress_url = reverse(
+            'api-so-shipment-ship-progress', kwargs={'pk': shipment.pk}
+        )
+        data = self.get(progress_url, expected_code=200).data
+
+        self.assertEqual(data['total'], 1)
+        self.assertEqual(data['completed'], 0)
+        self.assertFalse(data['finished'])
+
+        self.assertEqual(run_queued_tasks(order.tasks.complete_shipment), 1)
+
+        shipment.refresh_from_db()
+        self.assertTrue(shipment.is_complete())
+        self.assertEqual(shipment.tracking_number, 'BG-TRK')
+
+        data = self.get(progress_url, expected_code=200).data
+
+        self.assertEqual(data['total'], 1)
+        self.assertEqual(data['completed'], 1)
+        self.assertTrue(data['finished'])
+
     def test_shipment_delivery_date(self):
         """Test delivery date functions via API."""
         url = reverse('api-so-shipment-detail', kwargs={'pk': self.shipment.pk})
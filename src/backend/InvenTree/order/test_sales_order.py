@@ -1,14 +1,17 @@
 """Unit tests for the SalesOrder models."""
 
 from datetime import datetime, timedelta
+from unittest import mock
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 import order.tasks
-from common.models import InvenTreeSetting, NotificationMessage
+from common.models import InvenTreeSetting, NotificationMessage, TaskProgress
 from company.models import Company
 from InvenTree import status_codes as status
 from order.models import (
@@ -277,6 +280,136 @@ class SalesOrderTest(TestCase):
         self.assertEqual(self.line.fulfilled_quantity(), 50)
         self.assertEqual(self.line.allocated_quantity(), 50)
 
+    def test_complete_large_shipment(self):
+        """Test that a shipment with a large number of allocations is completed in bulk."""
+        trackable = Part.objects.create(
+            name='Serialized spanner', salable=True, trackable=True
+        )
+
+        N_ITEMS = 100
+
+        serialized = [
+            StockItem.objects.create(part=trackable, quantity=1, serial=str(idx))
+            for idx in range(N_ITEMS)
+        ]
+
+        line = SalesOrderLineItem.objects.create(
+            quantity=N_ITEMS, order=self.order, part=trackable
+        )
+
+        for item in serialized:
+            SalesOrderAllocation.objects.create(
+                line=line, shipment=self.shipment, item=item, quantity=1
+            )
+
+        # Multiple partial allocations against the same stock item
+        for _ in range(3):
+            SalesOrderAllocation.objects.create(
+                line=self.line, shipment=self.shipment, item=self.Sa, quantity=10
+            )
+
+        # Allocate the entire quantity of another stock item
+        sc_line = SalesOrderLineItem.objects.create(
+            quantity=100, order=self.order, part=self.variant
+        )
+
+        SalesOrderAllocation.objects.create(
+            line=sc_line, shipment=self.shipment, item=self.Sc, quantity=100
+        )
+
+        n_items = StockItem.objects.count()
+
+        # Load the event setting up front, so that creating it (and the resulting
+        # plugin registry reload) is not counted against the shipment completion
+        InvenTreeSetting.get_setting('ENABLE_PLUGINS_EVENTS')
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.shipment.complete_shipment(None)
+
+        # The number of queries does not depend on the number of allocations
+        self.assertLess(len(ctx), 40)
+
+        self.assertTrue(self.shipment.is_complete())
+
+        # Three new items were split from Sa
+        self.assertEqual(StockItem.objects.count(), n_items + 3)
+
+        sa = StockItem.objects.get(pk=self.Sa.pk)
+        self.assertEqual(sa.quantity, 70)
+        self.assertIsNone(sa.customer)
+        self.assertEqual(sa.get_descendant_count(), 3)
+
+        for child in sa.get_children():
+            self.assertEqual(child.quantity, 10)
+            self.assertEqual(child.customer, self.customer)
+            self.assertEqual(child.sales_order, self.order)
+            self.assertIsNone(child.location)
+            self.assertEqual(child.tracking_info.count(), 2)
+
+        # Allocations point to the split stock items
+        for allocation in self.line.allocations.all():
+            self.assertEqual(allocation.item.parent, sa)
+
+        # Fully allocated items are assigned to the customer
+        sc = StockItem.objects.get(pk=self.Sc.pk)
+        self.assertEqual(sc.customer, self.customer)
+        self.assertEqual(sc.quantity, 100)
+
+        for item in StockItem.objects.filter(part=trackable):
+            self.assertEqual(item.customer, self.customer)
+            self.assertEqual(item.sales_order, self.order)
+            self.assertEqual(item.tracking_info.count(), 1)
+
+        # Line quantities are updated
+        for obj, shipped in [(self.line, 30), (line, N_ITEMS), (sc_line, 100)]:
+            obj.refresh_from_db()
+            self.assertEqual(obj.shipped, shipped)
+
+    def test_complete_shipment_task(self):
+        """Test completion of a shipment via the background task."""
+        self.allocate_stock(True)
+
+        order.tasks.complete_shipment(self.shipment.pk, None, tracking_number='TRK-123')
+
+        self.shipment.refresh_from_db()
+        self.assertTrue(self.shipment.is_complete())
+        self.assertEqual(self.shipment.tracking_number, 'TRK-123')
+
+        progress = TaskProgress.get_progress_data(
+            order.tasks.shipment_progress_key(self.shipment.pk)
+        )
+        self.assertEqual(
+            progress, {'total': 2, 'completed': 2, 'finished': True, 'error': ''}
+        )
+
+        # Running the task again has no effect
+        order.tasks.complete_shipment(self.shipment.pk, None)
+
+        self.assertEqual(StockItem.objects.filter(sales_order=self.order).count(), 2)
+
+    def test_complete_shipment_task_error(self):
+        """Test that a failure of the shipment completion task is reported."""
+        self.allocate_stock(True)
+
+        key = order.tasks.shipment_progress_key(self.shipment.pk)
+
+        with mock.patch.object(
+            SalesOrderShipment,
+            'complete_shipment',
+            side_effect=ValidationError('Shipment failed'),
+        ):
+            with self.assertRaises(ValidationError):
+                order.tasks.complete_shipment(self.shipment.pk, None)
+
+        # The failure is reported, rather than a successful (empty) completion
+        self.assertEqual(
+            TaskProgress.get_progress_data(key),
+            {'total': 2, 'completed': 0, 'finished': True, 'error': 'Shipment failed'},
+        )
+
+        self.shipment.refresh_from_db()
+        self.assertFalse(self.shipment.is_complete())
+
     def test_default_shipment(self):
         """Test sales order default shipment creation."""
         # Default setting value should be False
@@ -1,5 +1,7 @@
 """Various unit tests for order models."""
 
+import threading
+import time
 from datetime import datetime, timedelta
 from decimal import Decimal
 
@@ -7,7 +9,8 @@ import django.core.exceptions as django_exceptions
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
-from django.test import TestCase
+from django.db import OperationalError, connection
+from django.test import TestCase, TransactionTestCase
 
 from djmoney.money import Money
 
@@ -400,3 +403,107 @@ class OrderTest(TestCase):
                 p.set_metadata(k, k)
 
             self.assertEqual(len(p.metadata.keys()), 4)
+
+
+class ReferenceSequenceTest(TestCase):
+    """Unit tests for allocation of order reference values."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a supplier for the new orders."""
+        super().setUpTestData()
+
+        cls.supplier = Company.objects.create(name='Supplier', is_supplier=True)
+
+    def test_allocate(self):
+        """Test that reference values are allocated according to the reference pattern."""
+        common.models.InvenTreeSetting.set_setting(
+            'PURCHASEORDER_REFERENCE_PATTERN', 'PO-{ref:04d}-X', None
+        )
+
+        self.assertEqual(PurchaseOrder.generate_reference(allocate=False), 'PO-0001-X')
+
+        # Peeking at the next value does not allocate it
+        self.assertEqual(PurchaseOrder.generate_reference(allocate=False), 'PO-0001-X')
+
+        po = PurchaseOrder.objects.create(supplier=self.supplier)
+        self.assertEqual(po.reference, 'PO-0001-X')
+        self.assertEqual(po.reference_int, 1)
+
+        # Allocated values are not reused, even if the order is not saved
+        self.assertEqual(PurchaseOrder.generate_reference(), 'PO-0002-X')
+        self.assertEqual(PurchaseOrder.generate_reference(allocate=False), 'PO-0003-X')
+
+        # Manually specified references are respected
+        PurchaseOrder.objects.create(supplier=self.supplier, reference='PO-0100-X')
+
+        po = PurchaseOrder.objects.create(supplier=self.supplier)
+        self.assertEqual(po.reference, 'PO-0101-X')
+
+        # Each model has a separate sequence
+        self.assertEqual(
+            PurchaseOrder.get_reference_sequence_key(), 'reference:order.purchaseorder'
+        )
+        self.assertEqual(
+            common.models.Sequence.objects.get(
+                key='reference:order.purchaseorder'
+            ).value,
+            101,
+        )
+
+
+class ReferenceConcurrencyTest(TransactionTestCase):
+    """Test that concurrent order creation does not result in duplicate references."""
+
+    N_THREADS = 8
+    N_ORDERS = 5
+
+    def create_orders(self, supplier, references, errors):
+        """Create a number of orders, recording the allocated references."""
+        try:
+            for _ in range(self.N_ORDERS):
+                # Retry if the (test) database is locked by another thread
+                for _attempt in range(500):
+                    try:
+                        po = PurchaseOrder.objects.create(supplier=supplier)
+                        references.append(po.reference)
+                        break
+                    except OperationalError:
+                        time.sleep(0.01)
+                else:
+                    errors.append('Database locked')
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            connection.close()
+
+    def test_concurrent_allocation(self):
+        """Create orders from multiple threads, and check for duplicate references."""
+        supplier = Company.objects.create(name='Supplier', is_supplier=True)
+
+        # Ensure that the reference pattern setting exists before the threads start
+        PurchaseOrder.get_reference_pattern()
+
+        references = []
+        errors = []
+
+        threads = [
+            threading.Thread(
+                target=self.create_orders, args=(supplier, references, errors)
+            )
+            for _ in range(self.N_THREADS)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+        n = self.N_THREADS * self.N_ORDERS
+
+        self.assertEqual(len(references), n)
+        self.assertEqual(len(set(references)), n)
+        self.assertEqual(PurchaseOrder.objects.count(), n)
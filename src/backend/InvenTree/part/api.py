@@ -47,8 +47,10 @@ from InvenTree.mixins import (
     RetrieveAPI,
     RetrieveUpdateAPI,
     RetrieveUpdateDestroyAPI,
+    SparseFieldsMixin,
     UpdateAPI,
 )
+from InvenTree.pagination import InvenTreePagination
 from InvenTree.permissions import RolePermission
 from InvenTree.serializers import EmptySerializer
 from InvenTree.status_codes import (
@@ -855,6 +857,38 @@ class PartSerialNumberDetail(RetrieveAPI):
         return Response(data)
 
 
+class PartSerialNumberReserve(CreateAPI):
+    """API endpoint for reserving a block of serial numbers for a particular part.
+
+    Reserved serial numbers are never handed out again,
+    even if concurrent requests are made against the same part.
+    """
+
+    queryset = Part.objects.all()
+    serializer_class = part_serializers.PartSerialNumberReserveSerializer
+    role_required = 'stock.add'
+
+    def get_serializer_context(self):
+        """Add the referenced part to the serializer context."""
+        ctx = super().get_serializer_context()
+
+        try:
+            ctx['part'] = Part.objects.get(pk=self.kwargs.get('pk', None))
+        except Exception:
+            pass
+
+        return ctx
+
+    def create(self, request, *args, **kwargs):
+        """Reserve serial numbers, and return them to the client."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        serials = serializer.save()
+
+        return Response({'serials': serials}, status=status.HTTP_201_CREATED)
+
+
 class PartCopyBOM(CreateAPI):
     """API endpoint for duplicating a BOM."""
 
@@ -1201,9 +1235,11 @@ class PartMixin:
         return context
 
 
-class PartList(PartMixin, APIDownloadMixin, ListCreateAPI):
+class PartList(SparseFieldsMixin, PartMixin, APIDownloadMixin, ListCreateAPI):
     """API endpoint for accessing a list of Part objects, or creating a new Part instance."""
 
+    pagination_class = InvenTreePagination
+
     filterset_class = PartFilter
     is_create = True
 
@@ -1374,12 +1410,39 @@ class PartList(PartMixin, APIDownloadMixin, ListCreateAPI):
 
         Here we can perform a number of different functions:
 
+        Filtering Based on Parameter Value:
+        - Used if any query params match 'parameter_<id>' or 'parameter_<id>_<func>'
+        - e.g. '&parameter_3=10k' or '&parameter_3_gte=100 mm'
+        - <id> specifies the PartParameterTemplate
+        - <func> is one of: gt, gte, lt, lte, ne, contains
+        - Only parts which have a matching parameter are returned
+
         Ordering Based on Parameter Value:
         - Used if the 'ordering' query param points to a parameter
         - e.g. '&ordering=param_<id>' where <id> specifies the PartParameterTemplate
         - Only parts which have a matching parameter are returned
         - Queryset is ordered based on parameter value
         """
+        parameter_filters = []
+
+        for key, value in self.request.query_params.items():
+            result = re.match(r'^parameter_(\d+)(?:_(\w+))?$', key)
+
+            if not result:
+                continue
+
+            func = result.group(2) or ''
+
+            if func not in part.filters.PARAMETER_FILTER_FUNCTIONS:
+                raise ValidationError({
+                    key: _('Invalid parameter filter function') + f": '{func}'"
+                })
+
+            parameter_filters.append((result.group(1), value, func))
+
+        if parameter_filters:
+            queryset = part.filters.filter_by_parameters(queryset, parameter_filters)
+
         # Extract "ordering" parameter from query args
         ordering = self.request.query_params.get('ordering', None)
 
@@ -2288,8 +2351,18 @@ part_api_urls = [
             # Endpoint for extra serial number information
             path(
                 'serial-numbers/',
-                PartSerialNumberDetail.as_view(),
-                name='api-part-serial-number-detail',
+                include([
+                    path(
+                        'reserve/',
+                        PartSerialNumberReserve.as_view(),
+                        name='api-part-serial-number-reserve',
+                    ),
+                    path(
+                        '',
+                        PartSerialNumberDetail.as_view(),
+                        name='api-part-serial-number-detail',
+                    ),
+                ]),
             ),
             # Endpoint for future scheduling information
             path('scheduling/', PartScheduling.as_view(), name='api-part-scheduling'),
@@ -17,6 +17,9 @@ class PartConfig(AppConfig):
 
     def ready(self):
         """This function is called whenever the Part app is loaded."""
+        # Connect the stock summary signal handlers
+        import part.summary  # noqa: F401
+
         # skip loading if plugin registry is not loaded or we run in a background thread
         if (
             not InvenTree.ready.isPluginRegistryLoaded()
@@ -28,29 +31,49 @@ class PartConfig(AppConfig):
             return
 
         if InvenTree.ready.canAppAccessDatabase():
-            self.update_trackable_status()
-            self.reset_part_pricing_flags()
+            self.run_startup_checks()
 
-    def update_trackable_status(self):
-        """Check for any instances where a trackable part is used in the BOM for a non-trackable part.
+    def run_startup_checks(self):
+        """Perform data consistency checks on startup.
 
-        In such a case, force the top-level part to be trackable too.
+        Each server process loads the app, so the checks are performed by whichever
+        process first acquires the (database) lock - the others skip them.
+        Each check is performed with a single UPDATE statement,
+        so startup time does not depend on the number of affected rows.
         """
-        from .models import BomItem
+        from django.db import transaction
+
+        from common.models import Sequence
 
         try:
-            items = BomItem.objects.filter(
-                part__trackable=False, sub_part__trackable=True
-            )
-
-            for item in items:
-                logger.info("Marking part '%s' as trackable", item.part.name)
-                item.part.trackable = True
-                item.part.clean()
-                item.part.save()
+            with transaction.atomic():
+                if not Sequence.try_lock('lock:part.startup'):
+                    logger.info('Part startup checks are running in another process')
+                    return
+
+                self.update_trackable_status()
+                self.reset_part_pricing_flags()
         except (OperationalError, ProgrammingError):  # pragma: no cover
             # Exception if the database has not been migrated yet
             pass
+        except Exception:  # pragma: no cover
+            logger.exception('Failed to perform part startup checks')
+
+    def update_trackable_status(self):
+        """Check for any instances where a trackable part is used in the BOM for a non-trackable part.
+
+        In such a case, force the top-level part to be trackable too.
+        """
+        from .models import BomItem, Part
+
+        assemblies = BomItem.objects.filter(
+            part__trackable=False, sub_part__trackable=True
+        ).values('part')
+
+        n = Part.objects.filter(pk__in=assemblies).update(trackable=True)
+
+        if n > 0:
+            logger.info('Marked %s parts as trackable', n)
 
     def reset_part_pricing_flags(self):
         """Performed on startup, to ensure that all pricing objects are in a "good" state.
@@ -62,17 +85,10 @@ class PartConfig(AppConfig):
         if InvenTree.ready.isImportingData():
             return
 
-        try:
-            items = PartPricing.objects.filter(scheduled_for_update=True)
-
-            if items.count() > 0:
-                # Find any pricing objects which have the 'scheduled_for_update' flag set
-                logger.info(
-                    'Resetting update flags for %s pricing objects...', items.count()
-                )
-
-                for pricing in items:
-                    pricing.scheduled_for_update = False
-                    pricing.save()
-        except Exception:
-            logger.exception('Failed to reset pricing flags - database not ready')
+        # Find any pricing objects which have the 'scheduled_for_update' flag set
+        n = PartPricing.objects.filter(scheduled_for_update=True).update(
+            scheduled_for_update=False
+        )
+
+        if n > 0:
+            logger.info('Reset update flags for %s pricing objects', n)
@@ -36,8 +36,9 @@ from django.db.models import (
 )
 from django.db.models.functions import Coalesce
 
-from sql_util.utils import SubquerySum
+from sql_util.utils import SubqueryCount, SubquerySum
 
+import InvenTree.helpers
 import part.models
 import stock.models
 from InvenTree.status_codes import (
@@ -260,6 +261,46 @@ def annotate_variant_quantity(subquery: Q, reference: str = 'quantity'):
     )
 
 
+def annotate_stock_quantities(queryset):
+    """Annotate the stock and demand quantities for each part in a queryset.
+
+    These are the values which may also be read from the PartStockSummary table (see part.summary).
+
+    Arguments:
+        queryset: A queryset of Part objects
+    """
+    # Filter to limit builds to "active"
+    build_filter = Q(status__in=BuildStatusGroups.ACTIVE_CODES)
+
+    return queryset.annotate(
+        # Annotate with the total number of stock items
+        stock_item_count=SubqueryCount('stock_items'),
+        # Annotate with the total variant stock quantity
+        variant_stock=annotate_variant_quantity(
+            variant_stock_query(), reference='quantity'
+        ),
+        # Annotate with the total 'building' quantity
+        building=Coalesce(
+            SubquerySum('builds__quantity', filter=build_filter),
+            Decimal(0),
+            output_field=models.DecimalField(),
+        ),
+        # Annotate with the number of 'suppliers'
+        suppliers=Coalesce(
+            SubqueryCount('supplier_parts'),
+            Decimal(0),
+            output_field=models.DecimalField(),
+        ),
+        ordering=annotate_on_order_quantity(),
+        in_stock=annotate_total_stock(),
+        external_stock=annotate_total_stock(filter=Q(location__external=True)),
+        allocated_to_sales_orders=annotate_sales_order_allocations(),
+        allocated_to_build_orders=annotate_build_order_allocations(),
+        required_for_build_orders=annotate_build_order_requirements(),
+        required_for_sales_orders=annotate_sales_order_requirements(),
+    )
+
+
 def annotate_category_parts():
     """Construct a queryset annotation which returns the number of parts in a particular category.
 
@@ -335,6 +376,99 @@ def annotate_sub_categories():
     )
 
 
+# Supported comparison functions for filtering by parameter value
+PARAMETER_FILTER_FUNCTIONS = ['', 'gt', 'gte', 'lt', 'lte', 'ne', 'contains']
+
+
+def parameter_filter_query(template, value: str, func: str = '') -> Q:
+    """Construct a query to filter PartParameter instances against a given value.
+
+    Arguments:
+        template: The PartParameterTemplate which the value is compared against
+        value (str): The value to compare against
+        func (str): The comparison function (see PARAMETER_FILTER_FUNCTIONS)
+
+    - If the value can be converted to a number, data_numeric is compared
+    - Otherwise the (text) data value is compared
+    """
+    value = str(value).strip()
+    func = func.strip('_')
+
+    if func not in PARAMETER_FILTER_FUNCTIONS:
+        raise ValueError(f'Invalid parameter filter function: {func}')
+
+    if template.checkbox:
+        # Checkbox values are stored as 'True' / 'False'
+        value = str(InvenTree.helpers.str2bool(value))
+
+    if func == 'contains':
+        return Q(data__icontains=value)
+
+    # Convert the value to a numeric value (in the template units)
+    numeric = template.get_numeric_values([value])[value]
+
+    if func in ['', 'ne']:
+        query = Q(data__iexact=value)
+
+        if numeric is not None:
+            query |= Q(data_numeric=numeric)
+
+        return ~query if func == 'ne' else query
+
+    if numeric is not None:
+        return Q(**{f'data_numeric__{func}': numeric})
+
+    # Fall back to text comparison
+    return Q(**{f'data__{func}': value})
+
+
+def filter_by_parameters(queryset, filters: list):
+    """Filter the given queryset against multiple parameter values.
+
+    Parts which do not have a value for a filtered parameter are excluded.
+
+    Arguments:
+        queryset: A queryset of Part objects
+        filters: A list of (template_id, value, func) tuples (see filter_by_parameter)
+
+    Returns:
+        A queryset of Part objects which match *all* of the provided filters
+
+    Filters against the same template are combined, so that a single subquery is
+    performed against the PartParameter table for each template.
+    These subqueries make use of the (template, data_numeric) and (template, data) indexes.
+    """
+    template_ids = {str(template_id) for template_id, _value, _func in filters}
+
+    templates = {
+        str(template.pk): template
+        for template in part.models.PartParameterTemplate.objects.filter(
+            pk__in=[pk for pk in template_ids if pk.isdigit()]
+        )
+    }
+
+    queries = {}
+
+    for template_id, value, func in filters:
+        template = templates.get(str(template_id), None)
+
+        if template is None:
+            # No matching template, so no parts can match
+            return queryset.none()
+
+        query = parameter_filter_query(template, value, func)
+        queries[template.pk] = queries.get(template.pk, Q()) & query
+
+    for template_id, query in queries.items():
+        parameters = part.models.PartParameter.objects.filter(
+            Q(template=template_id) & query
+        )
+
+        queryset = queryset.filter(pk__in=parameters.values('part'))
+
+    return queryset
+
+
 def filter_by_parameter(queryset, template_id: int, value: str, func: str = ''):
     """Filter the given queryset by a given template parameter.
 
@@ -349,8 +483,7 @@ def filter_by_parameter(queryset, template_id: int, value: str, func: str = ''):
     Returns:
         A queryset of Part objects filtered by the given parameter
     """
-    # TODO
-    return queryset
+    return filter_by_parameters(queryset, [(template_id, value, func)])
 
 
 def order_by_parameter(queryset, template_id: int, ascending=True):
@@ -370,38 +503,23 @@ def order_by_parameter(queryset, template_id: int, ascending=True):
         template__id=template_id, part_id=OuterRef('id')
     )
 
-    # Annotate the queryset with the parameter value, and whether it exists
-    queryset = queryset.annotate(parameter_exists=Exists(template_filter))
-
-    # Annotate the text data value
+    # Annotate the queryset with the parameter value (null if the parameter does not exist)
     queryset = queryset.annotate(
-        parameter_value=Case(
-            When(
-                parameter_exists=True,
-                then=Subquery(
-                    template_filter.values('data')[:1], output_field=models.CharField()
-                ),
-            ),
-            default=Value('', output_field=models.CharField()),
+        parameter_value=Subquery(
+            template_filter.values('data')[:1], output_field=models.CharField()
         ),
-        parameter_value_numeric=Case(
-            When(
-                parameter_exists=True,
-                then=Subquery(
-                    template_filter.values('data_numeric')[:1],
-                    output_field=models.FloatField(),
-                ),
-            ),
-            default=Value(0, output_field=models.FloatField()),
+        parameter_value_numeric=Subquery(
+            template_filter.values('data_numeric')[:1], output_field=models.FloatField()
         ),
     )
 
-    prefix = '' if ascending else '-'
-
-    # Return filtered queryset
+    def ordering(field):
+        """Order by the given field, with null values last."""
+        if ascending:
+            return F(field).asc(nulls_last=True)
+        return F(field).desc(nulls_last=True)
 
+    # Parts with a numeric value are ordered first, then parts with a text value
     return queryset.order_by(
-        '-parameter_exists',
-        f'{prefix}parameter_value_numeric',
-        f'{prefix}parameter_value',
+        ordering('parameter_value_numeric'), ordering('parameter_value')
     )
@@ -2,8 +2,10 @@
 
 import logging
 import os
+import time
 
 from django.conf import settings
+from django.core.cache import cache
 
 from jinja2 import Environment, select_autoescape
 
@@ -14,21 +16,104 @@ logger = logging.getLogger('inventree')
 _part_full_name_template = None
 _part_full_name_template_string = ''
 
+# True if the template matches the default 'PART_NAME_FORMAT' (and can be rendered without jinja)
+_part_full_name_default = False
+
+# Generation of the 'PART_NAME_FORMAT' setting which the compiled template was built against
+_part_full_name_generation = None
+
+# Time (monotonic) at which the setting generation was last checked
+_part_full_name_checked = 0
+
+# Cache key for the (shared) 'PART_NAME_FORMAT' generation counter
+PART_NAME_FORMAT_GENERATION_KEY = 'part_name_format_generation'
+
+# Interval (seconds) between checks of the shared generation counter
+PART_NAME_FORMAT_CHECK_INTERVAL = 1.0
+
+
+def get_full_name_generation() -> int:
+    """Return the current generation of the 'PART_NAME_FORMAT' setting.
+
+    The generation counter is stored in the shared cache,
+    so that changes made in one process are detected by all other processes.
+    """
+    try:
+        return cache.get(PART_NAME_FORMAT_GENERATION_KEY) or 0
+    except Exception:
+        return 0
+
+
+def invalidate_full_name_template(*args, **kwargs):
+    """Invalidate the compiled 'full_name' template.
+
+    This function is called whenever the 'PART_NAME_FORMAT' setting is changed.
+    """
+    global _part_full_name_template
+    global _part_full_name_generation
+
+    _part_full_name_template = None
+    _part_full_name_generation = None
+
+    try:
+        cache.incr(PART_NAME_FORMAT_GENERATION_KEY)
+    except ValueError:
+        # Key does not yet exist in the cache
+        try:
+            cache.set(PART_NAME_FORMAT_GENERATION_KEY, 1, timeout=None)
+        except Exception:
+            pass
+    except Exception:
+        pass
+
+
+def is_default_full_name_format(template_string: str) -> bool:
+    """Test if the provided template string matches the default 'PART_NAME_FORMAT' value."""
+    from common.models import InvenTreeSetting
+
+    default = InvenTreeSetting.get_setting_default('PART_NAME_FORMAT')
+
+    return str(template_string).strip() == str(default).strip()
+
 
 def compile_full_name_template(*args, **kwargs):
     """Recompile the template for rendering the 'full_name' attribute of a Part.
 
-    This function is called whenever the 'PART_NAME_FORMAT' setting is changed.
+    The compiled template is held in-process, and is only recompiled when the 'PART_NAME_FORMAT'
+    setting generation changes (checked at most once per PART_NAME_FORMAT_CHECK_INTERVAL).
     """
     from common.models import InvenTreeSetting
 
     global _part_full_name_template
     global _part_full_name_template_string
+    global _part_full_name_default
+    global _part_full_name_generation
+    global _part_full_name_checked
+
+    now = time.monotonic()
+
+    if (
+        _part_full_name_template is not None
+        and now - _part_full_name_checked < PART_NAME_FORMAT_CHECK_INTERVAL
+    ):
+        return _part_full_name_template
+
+    _part_full_name_checked = now
+
+    generation = get_full_name_generation()
+
+    if (
+        _part_full_name_template is not None
+        and generation == _part_full_name_generation
+    ):
+        return _part_full_name_template
 
     template_string = InvenTreeSetting.get_setting(
         'PART_NAME_FORMAT', backup_value='', cache=True
     )
 
+    _part_full_name_generation = generation
+
     # Skip if the template string has not changed
     if (
         template_string == _part_full_name_template_string
@@ -38,6 +123,7 @@ def compile_full_name_template(*args, **kwargs):
 
     # Cache the template string
     _part_full_name_template_string = template_string
+    _part_full_name_default = is_default_full_name_format(template_string)
 
     env = Environment(
         autoescape=select_autoescape(default_for_string=False, default=False),
@@ -54,6 +140,21 @@ def compile_full_name_template(*args, **kwargs):
     return _part_full_name_template
 
 
+def render_default_full_name(part) -> str:
+    """Render the 'full_name' attribute of a Part, using the default 'PART_NAME_FORMAT'.
+
+    This produces the same output as the default template, without the overhead of jinja rendering.
+    """
+    name = f'{part.IPN} | ' if part.IPN else ''
+
+    name += str(part.name)
+
+    if part.revision:
+        name += f' | {part.revision}'
+
+    return name
+
+
 def render_part_full_name(part) -> str:
     """Render the 'full_name' attribute of a Part.
 
@@ -65,6 +166,9 @@ def render_part_full_name(part) -> str:
     template = compile_full_name_template()
 
     if template:
+        if _part_full_name_default:
+            return render_default_full_name(part)
+
         try:
             return template.render(part=part)
         except Exception as e:
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.11 on 2026-10-19 08:47
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('part', '0122_parttesttemplate_enabled'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PartStockSummary',
+            fields=[
+                ('part', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stock_summary', serialize=False, to='part.part', verbose_name='Part')),
+                ('updated', models.DateTimeField(auto_now=True, help_text='Last update', verbose_name='Updated')),
+                ('stock_item_count', models.IntegerField(default=0, verbose_name='Stock Items')),
+                ('suppliers', models.IntegerField(default=0, verbose_name='Suppliers')),
+                ('in_stock', models.DecimalField(decimal_places=5, default=0, max_digits=19, verbose_name='In Stock')),
+                ('variant_stock', models.DecimalField(decimal_places=5, default=0, max_digits=19, verbose_name='Variant Stock')),
+                ('external_stock', models.DecimalField(decimal_places=5, default=0, max_digits=19, verbose_name='External Stock')),
+                ('building', models.DecimalField(decimal_places=5, default=0, max_digits=19, verbose_name='Building')),
+                ('ordering', models.DecimalField(decimal_places=5, default=0, max_digits=19, verbose_name='On Order')),
+                ('allocated_to_build_orders', models.DecimalField(decimal_places=5, default=0, max_digits=19, verbose_name='Allocated to Build Orders')),
+                ('allocated_to_sales_orders', models.DecimalField(decimal_places=5, default=0, max_digits=19, verbose_name='Allocated to Sales Orders')),
+                ('required_for_build_orders', models.DecimalField(decimal_places=5, default=0, max_digits=19, verbose_name='Required for Build Orders')),
+                ('required_for_sales_orders', models.DecimalField(decimal_places=5, default=0, max_digits=19, verbose_name='Required for Sales Orders')),
+            ],
+        ),
+    ]
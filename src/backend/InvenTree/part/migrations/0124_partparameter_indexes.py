@@ -0,0 +1,21 @@
+# Generated by Django 4.2.11 on 2026-10-19 09:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('part', '0123_partstocksummary'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='partparameter',
+            index=models.Index(fields=['template', 'data_numeric'], name='part_param_numeric_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='partparameter',
+            index=models.Index(fields=['template', 'data'], name='part_param_data_idx'),
+        ),
+    ]
@@ -15,7 +15,7 @@ from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.core.validators import MinLengthValidator, MinValueValidator
 from django.db import models, transaction
-from django.db.models import ExpressionWrapper, F, Q, Sum, UniqueConstraint
+from django.db.models import ExpressionWrapper, F, Max, Q, Sum, UniqueConstraint
 from django.db.models.functions import Coalesce
 from django.db.models.signals import post_delete, post_save
 from django.db.utils import IntegrityError
@@ -703,15 +703,117 @@ class Part(
             # This serial number is perfectly valid
             return True
 
+    def validate_serial_numbers(
+        self, serials: list, stock_item=None, check_duplicates=True, chunk_size=1000
+    ) -> dict:
+        """Validate a batch of serial numbers against this Part instance.
+
+        This performs the same checks as validate_serial_number, for many serial numbers at once:
+
+        - Each serial number is run through the loaded validation plugins
+        - Any serial numbers not accepted outright by a plugin are then checked for duplicates,
+          with one (chunked) database query for the entire batch
+
+        Arguments:
+            serials: The proposed serial numbers
+            stock_item: (optional) A StockItem instance to exclude from the duplicate check
+            check_duplicates: If False, the duplicate check is skipped
+            chunk_size: Maximum number of serial numbers to check with each database query
+
+        Returns:
+            A dict of {serial: error message} for each invalid serial number
+        """
+        from plugin.registry import registry
+
+        plugins = registry.with_mixin('validation')
+
+        errors = {}
+        pending = []
+
+        for serial in serials:
+            serial = str(serial).strip()
+
+            try:
+                for plugin in plugins:
+                    # If the plugin returns 'True' we will skip any subsequent validation
+                    if plugin.validate_serial_number(serial, self):
+                        break
+                else:
+                    pending.append(serial)
+            except ValidationError as exc:
+                errors[serial] = '; '.join(exc.messages)
+
+        if not check_duplicates or len(pending) == 0:
+            return errors
+
+        stock = StockModels.StockItem.objects.all()
+
+        if not InvenTreeSetting.get_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False):
+            # Serial number must only be unique across this part "tree"
+            stock = stock.filter(part__tree_id=self.tree_id)
+
+        if stock_item:
+            # Exclude existing StockItem from query
+            stock = stock.exclude(pk=stock_item.pk)
+
+        existing = set()
+
+        for idx in range(0, len(pending), chunk_size):
+            existing.update(
+                stock.filter(serial__in=pending[idx : idx + chunk_size]).values_list(
+                    'serial', flat=True
+                )
+            )
+
+        for serial in pending:
+            if serial in existing:
+                errors[serial] = (
+                    _('Stock item with this serial number already exists')
+                    + ': '
+                    + serial
+                )
+
+        return errors
+
     def find_conflicting_serial_numbers(self, serials: list):
         """For a provided list of serials, return a list of those which are conflicting."""
-        conflicts = []
+        errors = self.validate_serial_numbers(serials)
 
-        for serial in serials:
-            if not self.validate_serial_number(serial, part=self):
-                conflicts.append(serial)
+        return [serial for serial in serials if str(serial).strip() in errors]
+
+    def reserve_serial_numbers(self, quantity: int) -> list:
+        """Reserve a block of sequential (integer) serial numbers for this Part.
+
+        The reserved block starts above both the highest serial number in use,
+        and any block which has previously been reserved.
+        Reservation is atomic, so concurrent requests never receive overlapping blocks.
 
-        return conflicts
+        Note: Reserved serial numbers are not validated here,
+        they are validated as normal when the stock items are created.
+
+        Arguments:
+            quantity: The number of serial numbers to reserve
+
+        Returns:
+            A list of reserved serial numbers (as strings)
+        """
+        stock = (
+            StockModels.StockItem.objects.all().exclude(serial=None).exclude(serial='')
+        )
+
+        if InvenTreeSetting.get_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False):
+            # Serial numbers are unique across all parts
+            key = 'serial'
+        else:
+            # Serial numbers are unique across part trees
+            key = f'serial:{self.get_root().pk}'
+            stock = stock.filter(part__tree_id=self.tree_id)
+
+        latest = stock.aggregate(latest=Max('serial_int'))['latest'] or 0
+
+        first = common.models.Sequence.allocate(key, quantity, minimum=latest)
+
+        return [str(first + idx) for idx in range(quantity)]
 
     def get_latest_serial_number(self):
         """Find the 'latest' serial number for this Part.
@@ -3131,6 +3233,81 @@ class PartPricing(common.models.MetaMixin):
     )
 
 
+class PartStockSummary(models.Model):
+    """Denormalized stock and demand quantities for a particular Part.
+
+    When enabled (INVENTREE_PART_STOCK_SUMMARY), the Part API reads these values
+    instead of calculating them with subqueries for each row.
+
+    - Rows are updated when related stock, orders or builds are changed (see part.summary)
+    - All rows are periodically reconciled against the live values
+    """
+
+    part = models.OneToOneField(
+        Part,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stock_summary',
+        verbose_name=_('Part'),
+    )
+
+    updated = models.DateTimeField(
+        auto_now=True, verbose_name=_('Updated'), help_text=_('Last update')
+    )
+
+    stock_item_count = models.IntegerField(default=0, verbose_name=_('Stock Items'))
+
+    suppliers = models.IntegerField(default=0, verbose_name=_('Suppliers'))
+
+    in_stock = models.DecimalField(
+        max_digits=19, decimal_places=5, default=0, verbose_name=_('In Stock')
+    )
+
+    variant_stock = models.DecimalField(
+        max_digits=19, decimal_places=5, default=0, verbose_name=_('Variant Stock')
+    )
+
+    external_stock = models.DecimalField(
+        max_digits=19, decimal_places=5, default=0, verbose_name=_('External Stock')
+    )
+
+    building = models.DecimalField(
+        max_digits=19, decimal_places=5, default=0, verbose_name=_('Building')
+    )
+
+    ordering = models.DecimalField(
+        max_digits=19, decimal_places=5, default=0, verbose_name=_('On Order')
+    )
+
+    allocated_to_build_orders = models.DecimalField(
+        max_digits=19,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('Allocated to Build Orders'),
+    )
+
+    allocated_to_sales_orders = models.DecimalField(
+        max_digits=19,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('Allocated to Sales Orders'),
+    )
+
+    required_for_build_orders = models.DecimalField(
+        max_digits=19,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('Required for Build Orders'),
+    )
+
+    required_for_sales_orders = models.DecimalField(
+        max_digits=19,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('Required for Sales Orders'),
+    )
+
+
 class PartStocktake(models.Model):
     """Model representing a 'stocktake' entry for a particular Part.
 
@@ -3611,6 +3788,28 @@ class PartParameterTemplate(InvenTree.models.InvenTreeMetadataModel):
 
         return [x.strip() for x in self.choices.split(',') if x.strip()]
 
+    def get_numeric_values(self, values) -> dict:
+        """Calculate the numeric values for a set of parameter values.
+
+        - If a 'units' field is provided, values are converted to the template units
+        - Otherwise, we'll try to do a simple float cast
+
+        Returns:
+            A dict mapping each provided value to its numeric value (or None)
+        """
+        if self.units:
+            return InvenTree.conversion.convert_physical_values(values, self.units)
+
+        results = {}
+
+        for value in values:
+            try:
+                results[value] = float(value)
+            except (TypeError, ValueError):
+                results[value] = None
+
+        return results
+
     name = models.CharField(
         max_length=100,
         verbose_name=_('Name'),
@@ -3679,6 +3878,14 @@ class PartParameter(InvenTree.models.InvenTreeMetadataModel):
         # Prevent multiple instances of a parameter for a single part
         unique_together = ('part', 'template')
 
+        # Indexes for filtering parts by parameter value
+        indexes = [
+            models.Index(
+                fields=['template', 'data_numeric'], name='part_param_numeric_idx'
+            ),
+            models.Index(fields=['template', 'data'], name='part_param_data_idx'),
+        ]
+
     @staticmethod
     def get_api_url():
         """Return the list API endpoint URL associated with the PartParameter model."""
@@ -3742,20 +3949,7 @@ class PartParameter(InvenTree.models.InvenTreeMetadataModel):
         - If a 'units' field is provided, then the data will be converted to the base SI unit.
         - Otherwise, we'll try to do a simple float cast
         """
-        if self.template.units:
-            try:
-                self.data_numeric = InvenTree.conversion.convert_physical_value(
-                    self.data, self.template.units
-                )
-            except (ValidationError, ValueError):
-                self.data_numeric = None
-
-        # No units provided, so try to cast to a float
-        else:
-            try:
-                self.data_numeric = float(self.data)
-            except ValueError:
-                self.data_numeric = None
+        self.data_numeric = self.template.get_numeric_values([self.data])[self.data]
 
     part = models.ForeignKey(
         Part,
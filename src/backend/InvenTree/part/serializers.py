@@ -30,6 +30,7 @@ import InvenTree.status
 import part.filters
 import part.helpers as part_helpers
 import part.stocktake
+import part.summary
 import part.tasks
 import stock.models
 import users.models
@@ -705,48 +706,11 @@ class PartSerializer(
 
         Performing database queries as efficiently as possible, to reduce database trips.
         """
-        # Annotate with the total number of stock items
-        queryset = queryset.annotate(stock_item_count=SubqueryCount('stock_items'))
-
-        # Annotate with the total variant stock quantity
-        variant_query = part.filters.variant_stock_query()
-
-        queryset = queryset.annotate(
-            variant_stock=part.filters.annotate_variant_quantity(
-                variant_query, reference='quantity'
-            )
-        )
-
-        # Filter to limit builds to "active"
-        build_filter = Q(status__in=BuildStatusGroups.ACTIVE_CODES)
-
-        # Annotate with the total 'building' quantity
-        queryset = queryset.annotate(
-            building=Coalesce(
-                SubquerySum('builds__quantity', filter=build_filter),
-                Decimal(0),
-                output_field=models.DecimalField(),
-            )
-        )
-
-        # Annotate with the number of 'suppliers'
-        queryset = queryset.annotate(
-            suppliers=Coalesce(
-                SubqueryCount('supplier_parts'),
-                Decimal(0),
-                output_field=models.DecimalField(),
-            )
-        )
-
-        # TODO: This could do with some refactoring
-        # TODO: Note that BomItemSerializer and BuildLineSerializer have very similar code
-
-        queryset = queryset.annotate(
-            ordering=part.filters.annotate_on_order_quantity(),
-            in_stock=part.filters.annotate_total_stock(),
-            allocated_to_sales_orders=part.filters.annotate_sales_order_allocations(),
-            allocated_to_build_orders=part.filters.annotate_build_order_allocations(),
-        )
+        if part.summary.stock_summary_enabled():
+            # Read the stock quantities from the summary table
+            queryset = part.summary.annotate_stock_summary(queryset)
+        else:
+            queryset = part.filters.annotate_stock_quantities(queryset)
 
         # Annotate the queryset with the 'total_in_stock' quantity
         # This is the 'in_stock' quantity summed with the 'variant_stock' quantity
@@ -756,12 +720,6 @@ class PartSerializer(
             )
         )
 
-        queryset = queryset.annotate(
-            external_stock=part.filters.annotate_total_stock(
-                filter=Q(location__external=True)
-            )
-        )
-
         # Annotate with the total 'available stock' quantity
         # This is the current stock, minus any allocations
         queryset = queryset.annotate(
@@ -773,12 +731,6 @@ class PartSerializer(
             )
         )
 
-        # Annotate with the total 'required for builds' quantity
-        queryset = queryset.annotate(
-            required_for_build_orders=part.filters.annotate_build_order_requirements(),
-            required_for_sales_orders=part.filters.annotate_sales_order_requirements(),
-        )
-
         queryset = queryset.annotate(
             category_default_location=part.filters.annotate_default_location(
                 'category__'
@@ -1691,6 +1643,42 @@ class CategoryParameterTemplateSerializer(
     category_detail = CategorySerializer(source='category', many=False, read_only=True)
 
 
+class PartSerialNumberReserveSerializer(serializers.Serializer):
+    """Serializer for reserving a block of serial numbers for a part."""
+
+    class Meta:
+        """Metaclass defining serializer fields."""
+
+        fields = ['quantity']
+
+    quantity = serializers.IntegerField(
+        min_value=1,
+        max_value=10000,
+        required=True,
+        label=_('Quantity'),
+        help_text=_('Number of serial numbers to reserve'),
+    )
+
+    def validate(self, data):
+        """Check that the part can be serialized."""
+        data = super().validate(data)
+
+        part = self.context['part']
+
+        if not part.trackable:
+            raise serializers.ValidationError(
+                _('Serial numbers can only be reserved for trackable parts')
+            )
+
+        return data
+
+    def save(self):
+        """Reserve the requested serial numbers."""
+        part = self.context['part']
+
+        return part.reserve_serial_numbers(self.validated_data['quantity'])
+
+
 class PartCopyBOMSerializer(serializers.Serializer):
     """Serializer for copying a BOM from another part."""
 
@@ -1805,58 +1793,125 @@ class BomImportExtractSerializer(InvenTree.serializers.DataFileExtractSerializer
             # At least one part column is required!
             raise serializers.ValidationError(_('No part column specified'))
 
+    # Part fields required to resolve and validate each row
+    PART_LOOKUP_FIELDS = ['pk', 'name', 'IPN', 'component']
+
     @staticmethod
-    def process_row(row):
-        """Process a single row from the loaded BOM file."""
-        # Skip any rows which are at a lower "level"
+    def skip_row(row):
+        """Determine if a row should be skipped, based on the provided BOM level."""
         level = row.get('level', None)
 
         if level is not None:
             try:
-                level = int(level)
-                if level != 1:
-                    # Skip this row
-                    return None
+                return int(level) != 1
             except Exception:
                 pass
 
-        # Attempt to extract a valid part based on the provided data
+        return False
+
+    @staticmethod
+    def get_part_identifiers(row):
+        """Return the (id, name, IPN) values provided for the part in a given row."""
         part_id = row.get('part_id', row.get('part', None))
         part_name = row.get('part_name', row.get('part', None))
         part_ipn = row.get('part_ipn', None)
 
+        return part_id, part_name, part_ipn
+
+    def prepare_rows(self, rows):
+        """Resolve the parts referenced by all rows up front.
+
+        Rather than querying the database for each row, all provided part
+        identifiers are collected and resolved with (at most) three queries,
+        against the primary key, name and IPN fields respectively.
+        """
+        part_ids = set()
+        part_names = set()
+        part_ipns = set()
+
+        for row in rows:
+            if self.skip_row(row):
+                continue
+
+            part_id, part_name, part_ipn = self.get_part_identifiers(row)
+
+            if part_id is not None:
+                try:
+                    part_ids.add(int(part_id))
+                except (TypeError, ValueError):
+                    pass
+
+            if part_name:
+                part_names.add(part_name)
+
+            if part_ipn:
+                part_ipns.add(part_ipn)
+
+        self.parts_by_id = {}
+        self.parts_by_name = {}
+        self.parts_by_ipn = {}
+
+        if part_ids:
+            for part in Part.objects.filter(pk__in=part_ids).values(
+                *self.PART_LOOKUP_FIELDS
+            ):
+                self.parts_by_id[part['pk']] = part
+
+        if part_names:
+            for part in Part.objects.filter(name__in=part_names).values(
+                *self.PART_LOOKUP_FIELDS
+            ):
+                self.parts_by_name.setdefault(part['name'], []).append(part)
+
+        if part_ipns:
+            for part in Part.objects.filter(IPN__in=part_ipns).values(
+                *self.PART_LOOKUP_FIELDS
+            ):
+                self.parts_by_ipn.setdefault(part['IPN'], []).append(part)
+
+    def process_row(self, row):
+        """Process a single row from the loaded BOM file.
+
+        Parts are resolved against the lookup maps generated by prepare_rows.
+        """
+        # Skip any rows which are at a lower "level"
+        if self.skip_row(row):
+            return None
+
+        # Attempt to extract a valid part based on the provided data
+        part_id, part_name, part_ipn = self.get_part_identifiers(row)
+
         part = None
 
         if part_id is not None:
             try:
-                part = Part.objects.get(pk=part_id)
-            except (ValueError, Part.DoesNotExist):
+                part = self.parts_by_id.get(int(part_id), None)
+            except (TypeError, ValueError):
                 pass
 
         # No direct match, where else can we look?
         if part is None and (part_name or part_ipn):
-            queryset = Part.objects.all()
-
             if part_name:
-                queryset = queryset.filter(name=part_name)
+                matches = self.parts_by_name.get(part_name, [])
 
-            if part_ipn:
-                queryset = queryset.filter(IPN=part_ipn)
+                if part_ipn:
+                    matches = [match for match in matches if match['IPN'] == part_ipn]
+            else:
+                matches = self.parts_by_ipn.get(part_ipn, [])
 
-            if queryset.exists():
-                if queryset.count() == 1:
-                    part = queryset.first()
-                else:
-                    row['errors']['part'] = _('Multiple matching parts found')
+            if len(matches) == 1:
+                part = matches[0]
+            elif len(matches) > 1:
+                row['errors']['part'] = _('Multiple matching parts found')
 
         if part is None:
-            row['errors']['part'] = _('No matching part found')
-        else:
-            if not part.component:
-                row['errors']['part'] = _('Part is not designated as a component')
+            if 'part' not in row['errors']:
+                row['errors']['part'] = _('No matching part found')
+        elif not part['component']:
+            row['errors']['part'] = _('Part is not designated as a component')
 
         # Update the 'part' value in the row
-        row['part'] = part.pk if part is not None else None
+        row['part'] = part['pk'] if part is not None else None
 
         # Check the provided 'quantity' value
         quantity = row.get('quantity', None)
@@ -1902,7 +1957,8 @@ class BomImportSubmitSerializer(serializers.Serializer):
 
         Actions:
         - By this stage each line in the BOM has been validated
-        - Individually 'save' (create) each BomItem line
+        - Lines which match an existing (part, sub_part) pair are ignored
+        - All remaining BomItem lines are created in bulk
         """
         data = self.validated_data
 
@@ -1911,14 +1967,22 @@ class BomImportSubmitSerializer(serializers.Serializer):
         bom_items = []
 
         try:
+            # Fetch all existing (part, sub_part) pairs with a single query
+            existing = set(
+                BomItem.objects.filter(
+                    part__in={item['part'] for item in items},
+                    sub_part__in={item['sub_part'] for item in items},
+                ).values_list('part', 'sub_part')
+            )
+
             for item in items:
-                part = item['part']
-                sub_part = item['sub_part']
+                key = (item['part'].pk, item['sub_part'].pk)
 
                 # Ignore duplicate BOM items
-                if BomItem.objects.filter(part=part, sub_part=sub_part).exists():
+                if key in existing:
                     continue
 
+                existing.add(key)
                 bom_items.append(BomItem(**item))
 
             if len(bom_items) > 0:
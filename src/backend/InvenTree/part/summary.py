@@ -0,0 +1,299 @@
+"""Stock summary support for the Part model.
+
+The Part API annotates each part with a number of stock and demand quantities
+(total stock, variant stock, on order, allocated, required, etc).
+Each of these quantities requires a separate subquery against the (potentially very large)
+stock, order and build tables, which is performed for every row returned by the API.
+
+When enabled, these quantities are instead stored in the PartStockSummary table:
+
+- Changes to related objects (stock items, allocations, order lines, build lines, etc)
+  mark the affected parts, which are updated once the transaction is committed
+- Changes which do not emit signals (e.g. bulk updates) are captured by a periodic rebuild
+- The entire table can be rebuilt using the 'rebuild_part_stock_summary' management command
+
+The stock summary table is enabled via the INVENTREE_PART_STOCK_SUMMARY setting.
+"""
+
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.db.models import F, Q, Value
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+import InvenTree.helpers
+import InvenTree.ready
+import part.filters
+
+logger = logging.getLogger('inventree')
+
+
+# Quantities which are stored in the PartStockSummary table
+SUMMARY_FIELDS = [
+    'stock_item_count',
+    'suppliers',
+    'in_stock',
+    'variant_stock',
+    'external_stock',
+    'building',
+    'ordering',
+    'allocated_to_build_orders',
+    'allocated_to_sales_orders',
+    'required_for_build_orders',
+    'required_for_sales_orders',
+]
+
+
+# Models which affect the stock summary, mapped to the (model, field) which is marked for update
+SUMMARY_DEPENDENCIES = {
+    'part.part': ('part.part', 'pk'),
+    'part.bomitem': ('part.part', 'sub_part_id'),
+    'stock.stockitem': ('part.part', 'part_id'),
+    'company.supplierpart': ('part.part', 'part_id'),
+    'build.build': ('build.build', 'pk'),
+    'build.buildline': ('part.bomitem', 'bom_item_id'),
+    'build.builditem': ('stock.stockitem', 'stock_item_id'),
+    'order.purchaseorder': ('order.purchaseorder', 'pk'),
+    'order.purchaseorderlineitem': ('company.supplierpart', 'part_id'),
+    'order.salesorder': ('order.salesorder', 'pk'),
+    'order.salesorderlineitem': ('part.part', 'part_id'),
+    'order.salesordershipment': ('order.salesordershipment', 'pk'),
+    'order.salesorderallocation': ('stock.stockitem', 'item_id'),
+}
+
+
+def stock_summary_enabled() -> bool:
+    """Return True if the stock summary table is enabled."""
+    return bool(getattr(settings, 'PART_STOCK_SUMMARY_ENABLED', False))
+
+
+def annotate_stock_summary(queryset):
+    """Annotate a Part queryset with the quantities stored in the PartStockSummary table.
+
+    The annotations match those provided by part.filters.annotate_stock_quantities
+    """
+    annotations = {}
+
+    for field in SUMMARY_FIELDS:
+        if field in ['stock_item_count', 'suppliers']:
+            output_field = models.IntegerField()
+        else:
+            output_field = models.DecimalField()
+
+        annotations[field] = Coalesce(
+            F(f'stock_summary__{field}'), Value(0), output_field=output_field
+        )
+
+    return queryset.annotate(**annotations)
+
+
+def get_part_ids(references) -> set:
+    """Return the IDs of the parts affected by the provided object references.
+
+    Arguments:
+        references: A set of (model label, pk) tuples (see SUMMARY_DEPENDENCIES)
+    """
+    from build.models import Build, BuildLine
+    from company.models import SupplierPart
+    from order.models import (
+        PurchaseOrderLineItem,
+        SalesOrderAllocation,
+        SalesOrderLineItem,
+    )
+    from part.models import BomItem
+    from stock.models import StockItem
+
+    pks = {}
+
+    for label, pk in references:
+        pks.setdefault(label, set()).add(pk)
+
+    # Lookup queries which return the affected part IDs for each model type
+    lookups = {
+        'stock.stockitem': [(StockItem, 'pk', 'part')],
+        'company.supplierpart': [(SupplierPart, 'pk', 'part')],
+        'part.bomitem': [(BomItem, 'pk', 'sub_part')],
+        'build.build': [
+            (Build, 'pk', 'part'),
+            (BuildLine, 'build', 'bom_item__sub_part'),
+        ],
+        'order.purchaseorder': [(PurchaseOrderLineItem, 'order', 'part__part')],
+        'order.salesorder': [
+            (SalesOrderAllocation, 'line__order', 'item__part'),
+            (SalesOrderLineItem, 'order', 'part'),
+        ],
+        'order.salesordershipment': [(SalesOrderAllocation, 'shipment', 'item__part')],
+    }
+
+    part_ids = set(pks.get('part.part', []))
+
+    for label, queries in lookups.items():
+        if label not in pks:
+            continue
+
+        for model, reference, field in queries:
+            part_ids.update(
+                model.objects.filter(**{f'{reference}__in': pks[label]})
+                .values_list(field, flat=True)
+                .distinct()
+            )
+
+    part_ids.discard(None)
+
+    return part_ids
+
+
+def get_ancestor_ids(part_ids) -> set:
+    """Return the provided part IDs, along with the IDs of any template parts above them.
+
+    The 'variant_stock' quantity of a template part depends on the stock of its variants.
+    """
+    from part.models import Part
+
+    parts = Part.objects.filter(pk__in=part_ids).values('tree_id', 'lft', 'rght')
+
+    query = Q()
+
+    for p in parts:
+        query |= Q(tree_id=p['tree_id'], lft__lt=p['lft'], rght__gt=p['rght'])
+
+    ancestors = Part.objects.filter(query).values_list('pk', flat=True) if query else []
+
+    return set(part_ids) | set(ancestors)
+
+
+def update_stock_summary(part_ids, chunk_size: int = 1000):
+    """Update the PartStockSummary entries for the provided parts.
+
+    Arguments:
+        part_ids: The IDs of the parts to update
+        chunk_size: The maximum number of parts to update at once
+
+    The (live) quantities for each chunk of parts are calculated with a single query.
+    """
+    from part.models import Part, PartStockSummary
+
+    part_ids = sorted(part_ids)
+
+    for idx in range(0, len(part_ids), chunk_size):
+        chunk = part_ids[idx : idx + chunk_size]
+
+        queryset = part.filters.annotate_stock_quantities(
+            Part.objects.filter(pk__in=chunk)
+        )
+
+        now = InvenTree.helpers.current_time()
+
+        summaries = [
+            PartStockSummary(part_id=row.pop('pk'), updated=now, **row)
+            for row in queryset.values('pk', *SUMMARY_FIELDS)
+        ]
+
+        with transaction.atomic():
+            existing = set(
+                PartStockSummary.objects.filter(part__in=chunk).values_list(
+                    'part', flat=True
+                )
+            )
+
+            PartStockSummary.objects.bulk_update(
+                [s for s in summaries if s.part_id in existing],
+                ['updated', *SUMMARY_FIELDS],
+            )
+
+            PartStockSummary.objects.bulk_create([
+                s for s in summaries if s.part_id not in existing
+            ])
+
+
+def rebuild_stock_summary(chunk_size: int = 1000):
+    """Rebuild the entire PartStockSummary table, reconciling it against the live values."""
+    from part.models import Part
+
+    logger.info('Rebuilding part stock summary')
+
+    update_stock_summary(
+        Part.objects.values_list('pk', flat=True), chunk_size=chunk_size
+    )
+
+
+# Object references which are pending a stock summary update (per thread)
+_pending = threading.local()
+
+
+def flush_summary_updates():
+    """Update the stock summary for all pending object references."""
+    references = getattr(_pending, 'references', None) or set()
+    _pending.references = None
+
+    if references:
+        update_stock_summary(get_ancestor_ids(get_part_ids(references)))
+
+
+def schedule_summary_update(label: str, pks):
+    """Mark the provided objects as requiring a stock summary update.
+
+    The update is performed (in a single batch) once the current transaction is committed.
+
+    Arguments:
+        label: The model label of the provided objects (e.g. 'part.part')
+        pks: The primary key values of the objects
+    """
+    if not stock_summary_enabled():
+        return
+
+    references = getattr(_pending, 'references', None)
+
+    # Only register a single callback per transaction
+    # Note: Callbacks are discarded if the transaction is rolled back
+    scheduled = (
+        references is not None
+        and connection.in_atomic_block
+        and any(entry[1] is flush_summary_updates for entry in connection.run_on_commit)
+    )
+
+    if references is None:
+        references = _pending.references = set()
+
+    references.update((label, pk) for pk in pks if pk is not None)
+
+    if not scheduled:
+        transaction.on_commit(flush_summary_updates, robust=True)
+
+
+def summary_update_allowed(raw=False) -> bool:
+    """Determine if the stock summary should be updated in response to a model event."""
+    if raw or not stock_summary_enabled():
+        return False
+
+    if InvenTree.ready.isImportingData() or InvenTree.ready.isRunningMigrations():
+        return False
+
+    return True
+
+
+def handle_model_event(sender, instance):
+    """Schedule a stock summary update for an object which has been saved or deleted."""
+    dependency = SUMMARY_DEPENDENCIES.get(sender._meta.label_lower, None)
+
+    if dependency is not None:
+        label, field = dependency
+        schedule_summary_update(label, [getattr(instance, field, None)])
+
+
+@receiver(post_save, dispatch_uid='part_stock_summary_post_save')
+def after_save(sender, instance, raw=False, **kwargs):
+    """Update the stock summary after a related object is saved."""
+    if summary_update_allowed(raw):
+        handle_model_event(sender, instance)
+
+
+@receiver(post_delete, dispatch_uid='part_stock_summary_post_delete')
+def after_delete(sender, instance, **kwargs):
+    """Update the stock summary after a related object is deleted."""
+    if summary_update_allowed():
+        handle_model_event(sender, instance)
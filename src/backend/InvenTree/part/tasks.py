@@ -1,5 +1,6 @@
 """Background task definitions for the 'part' app."""
 
+import itertools
 import logging
 import random
 import time
@@ -184,30 +185,45 @@ def scheduled_stocktake_reports():
     record_task_success('STOCKTAKE_RECENT_REPORT')
 
 
-def rebuild_parameters(template_id):
+def rebuild_parameters(template_id, chunk_size: int = 1000):
     """Rebuild all parameters for a given template.
 
     This function is called when a base template is changed,
     which may cause the base unit to be adjusted.
+
+    Only the numeric value of each parameter is recalculated:
+    - Each distinct parameter value is converted only once
+    - Changed parameters are updated in bulk
     """
     try:
         template = part.models.PartParameterTemplate.objects.get(pk=template_id)
     except part.models.PartParameterTemplate.DoesNotExist:
         return
 
+    if template.checkbox:
+        # Checkbox templates have no units, the numeric value is set when the parameter is saved
+        return
+
     parameters = part.models.PartParameter.objects.filter(template=template)
 
     n = 0
 
-    for parameter in parameters:
-        # Update the parameter if the numeric value has changed
-        value_old = parameter.data_numeric
-        parameter.calculate_numeric_value()
+    rows = parameters.values_list('pk', 'data', 'data_numeric').iterator(
+        chunk_size=chunk_size
+    )
 
-        if value_old != parameter.data_numeric:
-            parameter.full_clean()
-            parameter.save()
-            n += 1
+    while chunk := list(itertools.islice(rows, chunk_size)):
+        numeric_values = template.get_numeric_values({data for _pk, data, _n in chunk})
+
+        # Update the parameters where the numeric value has changed
+        updates = [
+            part.models.PartParameter(pk=pk, data_numeric=numeric_values[data])
+            for pk, data, value_old in chunk
+            if value_old != numeric_values[data]
+        ]
+
+        part.models.PartParameter.objects.bulk_update(updates, ['data_numeric'])
+        n += len(updates)
 
     if n > 0:
         logger.info("Rebuilt %s parameters for template '%s'", n, template.name)
@@ -238,3 +254,18 @@ def rebuild_supplier_parts(part_id):
 
     if n > 0:
         logger.info("Rebuilt %s supplier parts for part '%s'", n, prt.name)
+
+
+@scheduled_task(ScheduledTask.DAILY)
+def rebuild_stock_summary():
+    """Rebuild the part stock summary table (if enabled).
+
+    Summary entries are updated as related objects are saved,
+    but some changes (e.g. bulk updates) are only captured by a full rebuild.
+    """
+    import part.summary
+
+    if not part.summary.stock_summary_enabled():
+        return
+
+    part.summary.rebuild_stock_summary()
@@ -19,6 +19,7 @@ from rest_framework.test import APIClient
 import build.models
 import company.models
 import order.models
+import part.summary
 from common.models import InvenTreeSetting
 from company.models import Company, SupplierPart
 from InvenTree.settings import BASE_DIR
@@ -33,6 +34,7 @@ from part.models import (
     PartParameter,
     PartParameterTemplate,
     PartRelated,
+    PartStockSummary,
     PartStocktake,
     PartTestTemplate,
 )
@@ -1678,6 +1680,32 @@ class PartDetailTests(PartAPITestBase):
         self.assertIn('category_path', response.data)
         self.assertEqual(len(response.data['category_path']), 2)
 
+    def test_reserve_serial_numbers(self):
+        """Test the serial number reservation endpoint."""
+        url = reverse('api-part-serial-number-reserve', kwargs={'pk': 25})
+
+        # Requires the 'stock.add' role
+        self.post(url, {'quantity': 5}, expected_code=403)
+
+        self.assignRole('stock.add')
+
+        latest = Part.objects.get(pk=25).get_latest_serial_number()
+        start = int(latest or 0) + 1
+
+        response = self.post(url, {'quantity': 5}, expected_code=201)
+        self.assertEqual(
+            response.data['serials'], [str(start + idx) for idx in range(5)]
+        )
+
+        # A second request does not overlap with the first
+        response = self.post(url, {'quantity': 2}, expected_code=201)
+        self.assertEqual(response.data['serials'], [str(start + 5), str(start + 6)])
+
+        # Serial numbers can only be reserved for trackable parts
+        url = reverse('api-part-serial-number-reserve', kwargs={'pk': 1})
+        response = self.post(url, {'quantity': 1}, expected_code=400)
+        self.assertIn('trackable', str(response.data))
+
 
 class PartListTests(PartAPITestBase):
     """Unit tests for the Part List API endpoint."""
@@ -1726,6 +1754,51 @@ class PartListTests(PartAPITestBase):
             # No more than 20 DB queries
             self.assertLessEqual(len(ctx), 20)
 
+    def test_sparse_fields(self):
+        """Test that unused annotations are skipped when only some fields are requested."""
+        url = reverse('api-part-list')
+
+        with CaptureQueriesContext(connection) as ctx_full:
+            full = self.get(url, {'limit': 50}, expected_code=200).data
+
+        with CaptureQueriesContext(connection) as ctx_sparse:
+            sparse = self.get(
+                url, {'limit': 50, 'fields': 'name,IPN,in_stock'}, expected_code=200
+            ).data
+
+        self.assertEqual(
+            [part['pk'] for part in full['results']],
+            [part['pk'] for part in sparse['results']],
+        )
+
+        for full_part, sparse_part in zip(full['results'], sparse['results']):
+            self.assertEqual(set(sparse_part.keys()), {'pk', 'name', 'IPN', 'in_stock'})
+            self.assertEqual(full_part['in_stock'], sparse_part['in_stock'])
+
+        sql_full = ' '.join(q['sql'] for q in ctx_full.captured_queries)
+        sql_sparse = ' '.join(q['sql'] for q in ctx_sparse.captured_queries)
+
+        self.assertLessEqual(len(ctx_sparse), len(ctx_full))
+        self.assertLess(len(sql_sparse), len(sql_full) / 2)
+
+        # Annotations can still be used for ordering
+        for ordering in ['unallocated_stock', '-ordering']:
+            full = self.get(url, {'ordering': ordering}, expected_code=200).data
+            sparse = self.get(
+                url, {'ordering': ordering, 'fields': 'name'}, expected_code=200
+            ).data
+
+            self.assertEqual([p['pk'] for p in full], [p['pk'] for p in sparse])
+
+        # Endpoints which do not support sparse fieldsets return all fields
+        pk = full[0]['pk']
+        url = reverse('api-part-detail', kwargs={'pk': pk})
+
+        full = self.get(url, expected_code=200).data
+        sparse = self.get(url, {'fields': 'name'}, expected_code=200).data
+
+        self.assertEqual(full, sparse)
+
 
 class PartNotesTests(InvenTreeAPITestCase):
     """Tests for the 'notes' field (markdown field)."""
@@ -2117,6 +2190,135 @@ class PartAPIAggregationTest(InvenTreeAPITestCase):
             self.assertEqual(on_order, p.on_order)
 
 
+class PartStockSummaryTest(InvenTreeAPITestCase):
+    """Tests for the (optional) part stock summary table."""
+
+    fixtures = [
+        'category',
+        'company',
+        'part',
+        'location',
+        'bom',
+        'build',
+        'stock',
+        'supplier_part',
+        'order',
+        'sales_order',
+    ]
+
+    roles = ['part.view']
+
+    FIELDS = [
+        'allocated_to_build_orders',
+        'allocated_to_sales_orders',
+        'building',
+        'external_stock',
+        'in_stock',
+        'ordering',
+        'required_for_build_orders',
+        'required_for_sales_orders',
+        'stock_item_count',
+        'suppliers',
+        'total_in_stock',
+        'unallocated_stock',
+        'variant_stock',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data as part of setup routine."""
+        super().setUpTestData()
+
+        # Ensure the part "variant" tree is correctly structured
+        Part.objects.rebuild()
+
+    def get_part_data(self):
+        """Return the annotated quantities for each part, from the Part list API endpoint."""
+        response = self.get(reverse('api-part-list'), expected_code=200)
+
+        return {
+            row['pk']: {field: row[field] for field in self.FIELDS}
+            for row in response.data
+        }
+
+    def test_summary_matches_live(self):
+        """The quantities read from the summary table match the live annotations."""
+        live = self.get_part_data()
+
+        with self.settings(PART_STOCK_SUMMARY_ENABLED=True):
+            part.summary.rebuild_stock_summary(chunk_size=10)
+
+            self.assertEqual(PartStockSummary.objects.count(), Part.objects.count())
+
+            summary = self.get_part_data()
+
+        self.assertEqual(live, summary)
+
+        # Ensure that the test data covers the various quantities
+        for field in [
+            'in_stock',
+            'variant_stock',
+            'ordering',
+            'required_for_build_orders',
+            'suppliers',
+        ]:
+            self.assertTrue(any(row[field] for row in live.values()), field)
+
+    def test_external_stock(self):
+        """The 'external_stock' quantity is read from the summary table (when enabled)."""
+        with self.settings(PART_STOCK_SUMMARY_ENABLED=True):
+            part.summary.rebuild_stock_summary()
+
+            summary = PartStockSummary.objects.first()
+            PartStockSummary.objects.filter(pk=summary.pk).update(external_stock=123)
+
+            data = self.get_part_data()
+
+        self.assertEqual(data[summary.part_id]['external_stock'], 123)
+
+    def test_incremental_update(self):
+        """The summary table is updated when related objects are changed."""
+        template = Part.objects.get(pk=10000)
+        variant = Part.objects.get(pk=10004)
+
+        with self.settings(PART_STOCK_SUMMARY_ENABLED=True):
+            part.summary.rebuild_stock_summary()
+
+            in_stock = variant.stock_summary.in_stock
+            variant_stock = template.stock_summary.variant_stock
+
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                StockItem.objects.create(part=variant, quantity=50)
+                StockItem.objects.create(part=variant, quantity=25)
+
+            # A single update is performed for the transaction
+            self.assertEqual(len(callbacks), 1)
+
+            variant.stock_summary.refresh_from_db()
+            template.stock_summary.refresh_from_db()
+
+            self.assertEqual(variant.stock_summary.in_stock, in_stock + 75)
+            self.assertEqual(template.stock_summary.variant_stock, variant_stock + 75)
+
+            # Create a new sales order line against the variant
+            with self.captureOnCommitCallbacks(execute=True):
+                so = order.models.SalesOrder.objects.create(
+                    customer=Company.objects.filter(is_customer=True).first(),
+                    reference='SO-9999',
+                )
+
+                order.models.SalesOrderLineItem.objects.create(
+                    order=so, part=variant, quantity=12
+                )
+
+            variant.stock_summary.refresh_from_db()
+            self.assertEqual(variant.stock_summary.required_for_sales_orders, 12)
+
+            summary = self.get_part_data()
+
+        self.assertEqual(summary, self.get_part_data())
+
+
 class BomItemTest(InvenTreeAPITestCase):
     """Unit tests for the BomItem API."""
 
@@ -1,12 +1,14 @@
 """Unit testing for BOM upload / import functionality."""
 
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 import tablib
 
 from InvenTree.unit_test import InvenTreeAPITestCase
-from part.models import Part
+from part.models import BomItem, Part
 
 
 class BomUploadTest(InvenTreeAPITestCase):
@@ -261,3 +263,154 @@ class BomUploadTest(InvenTreeAPITestCase):
         self.assertEqual(rows[0]['data']['part'], components[1].pk)
         self.assertEqual(rows[1]['data']['part'], components[4].pk)
         self.assertEqual(rows[2]['data']['part'], components[7].pk)
+
+    def test_ambiguous_part(self):
+        """Test that ambiguous part matches are reported against the row."""
+        url = reverse('api-bom-import-extract')
+
+        cmp = Part.objects.get(IPN='CMP_3')
+
+        # Create another part with the same name, but a different IPN
+        Part.objects.create(
+            name=cmp.name, IPN='CMP_X', description='A duplicate part', component=True
+        )
+
+        response = self.post(
+            url,
+            {
+                'columns': ['part_name', 'part_ipn', 'quantity'],
+                'rows': [[cmp.name, '', 1], [cmp.name, 'CMP_3', 1]],
+            },
+            expected_code=201,
+        )
+
+        rows = response.data['rows']
+
+        self.assertIsNone(rows[0]['data']['part'])
+        self.assertEqual(
+            rows[0]['data']['errors']['part'], 'Multiple matching parts found'
+        )
+
+        # Supplying the IPN resolves the ambiguity
+        self.assertEqual(rows[1]['data']['part'], cmp.pk)
+        self.assertNotIn('part', rows[1]['data']['errors'])
+
+    def test_submit_duplicates(self):
+        """Test that duplicate BOM lines are ignored on submit."""
+        url = reverse('api-bom-import-submit')
+
+        components = list(Part.objects.filter(component=True)[:3])
+
+        BomItem.objects.create(part=self.part, sub_part=components[0], quantity=1)
+
+        items = [
+            {'part': self.part.pk, 'sub_part': cmp.pk, 'quantity': 5}
+            for cmp in components
+        ]
+
+        # Duplicate the final line
+        items.append(items[-1])
+
+        self.post(url, {'items': items}, expected_code=201)
+
+        self.assertEqual(self.part.bom_items.count(), 3)
+        self.assertEqual(self.part.bom_items.get(sub_part=components[0]).quantity, 1)
+
+
+class BomImportBenchmarkTest(InvenTreeAPITestCase):
+    """Benchmark BOM import against a large generated BOM."""
+
+    roles = ['part.add', 'part.change']
+
+    N_LINES = 10000
+
+    @classmethod
+    def setUpTestData(cls):
+        """Generate a large number of components."""
+        super().setUpTestData()
+
+        cls.assembly = Part.objects.create(
+            name='Big Assembly', description='A very large assembly', assembly=True
+        )
+
+        Part.objects.bulk_create([
+            Part(
+                name=f'Component {idx}',
+                IPN=f'BIG_{idx}',
+                description='A subcomponent',
+                component=True,
+                # Avoid looking up default values for each part
+                assembly=False,
+                is_template=False,
+                trackable=False,
+                purchaseable=True,
+                salable=False,
+                virtual=False,
+                lft=0,
+                rght=0,
+                level=0,
+                tree_id=0,
+            )
+            for idx in range(cls.N_LINES)
+        ])
+
+        cls.components = list(
+            Part.objects.filter(IPN__startswith='BIG_')
+            .order_by('pk')
+            .values('pk', 'name', 'IPN')
+        )
+
+    def test_extract(self):
+        """Part lookups for a large BOM require a fixed number of queries."""
+        url = reverse('api-bom-import-extract')
+
+        columns = ['part_id', 'part_name', 'part_ipn', 'quantity']
+
+        # Mix of lookups by primary key, name and IPN
+        rows = []
+
+        for idx, cmp in enumerate(self.components):
+            if idx % 3 == 0:
+                rows.append([cmp['pk'], '', '', 2])
+            elif idx % 3 == 1:
+                rows.append(['', cmp['name'], '', 2])
+            else:
+                rows.append(['', '', cmp['IPN'], 2])
+
+        # The lookup itself is independent of the number of rows
+        with self.assertNumQueriesLessThan(20):
+            response = self.post(
+                url, {'columns': columns, 'rows': rows}, expected_code=201
+            )
+
+        rows = response.data['rows']
+
+        self.assertEqual(len(rows), self.N_LINES)
+
+        for row, cmp in zip(rows, self.components):
+            self.assertEqual(row['data']['part'], cmp['pk'])
+            self.assertNotIn('part', row['data']['errors'])
+
+    def test_submit(self):
+        """Duplicate detection for a large BOM requires a single query."""
+        from part.serializers import BomImportSubmitSerializer
+
+        items = [
+            {'part': self.assembly, 'sub_part': part, 'quantity': 1}
+            for part in Part.objects.filter(IPN__startswith='BIG_')
+        ]
+
+        # Existing BOM lines are skipped
+        BomItem.objects.bulk_create([BomItem(**item) for item in items[:100]])
+
+        serializer = BomImportSubmitSerializer()
+        serializer._validated_data = {'items': items}
+
+        with CaptureQueriesContext(connection) as queries:
+            serializer.save()
+
+        # Existing lines are fetched with a single query
+        selects = [q for q in queries if q['sql'].startswith('SELECT')]
+        self.assertEqual(len(selects), 1)
+
+        self.assertEqual(self.assembly.bom_items.count(), self.N_LINES)
@@ -1,9 +1,14 @@
 """Various unit tests for Part Parameters."""
 
+from urllib.parse import parse_qs, urlparse
+
 import django.core.exceptions as django_exceptions
+from django.db import connection
 from django.test import TestCase, TransactionTestCase
 from django.urls import reverse
 
+import part.filters as part_filters
+import part.tasks as part_tasks
 from common.models import InvenTreeSetting
 from InvenTree.unit_test import InvenTreeAPITestCase
 
@@ -228,6 +233,59 @@ class ParameterTests(TestCase):
             param.calculate_numeric_value()
             self.assertAlmostEqual(param.data_numeric, expected, places=2)
 
+    def test_rebuild_parameters(self):
+        """Test that parameters are rebuilt when the template units are changed."""
+        template = PartParameterTemplate.objects.create(name='My Template', units='m')
+
+        values = ['1', '25mm', '3 feet', 'abc', '1']
+
+        for idx, value in enumerate(values):
+            PartParameter.objects.create(
+                part=Part.objects.create(name=f'Part {idx}', description='A part'),
+                template=template,
+                data=value,
+            )
+
+        # Change the template units (without triggering the post_save rebuild)
+        PartParameterTemplate.objects.filter(pk=template.pk).update(units='mm')
+
+        part_tasks.rebuild_parameters(template.pk, chunk_size=2)
+
+        expected = [1, 25, 914.4, None, 1]
+
+        for param, value in zip(
+            PartParameter.objects.filter(template=template).order_by('pk'), expected
+        ):
+            if value is None:
+                self.assertIsNone(param.data_numeric)
+            else:
+                self.assertAlmostEqual(param.data_numeric, value, places=2)
+
+    def test_checkbox_numeric_value(self):
+        """Test that checkbox parameters are not converted to numeric values."""
+        template = PartParameterTemplate.objects.create(name='My Flag', checkbox=True)
+
+        param = PartParameter.objects.create(
+            part=Part.objects.create(name='Flag part', description='A part'),
+            template=template,
+            data='yes',
+        )
+
+        param.refresh_from_db()
+        self.assertEqual(param.data, 'True')
+
+        data_numeric = param.data_numeric
+
+        param.calculate_numeric_value()
+        self.assertIsNone(param.data_numeric)
+
+        # Rebuilding the template parameters does not change the stored value
+
+        part_tasks.rebuild_parameters(template.pk)
+
+        param.refresh_from_db()
+        self.assertEqual(param.data_numeric, data_numeric)
+
 
 class PartParameterTest(InvenTreeAPITestCase):
     """Tests for the ParParameter API."""
@@ -392,3 +450,187 @@ class PartParameterTest(InvenTreeAPITestCase):
         for idx, expected in expectation.items():
             actual = get_param_value(response, template.pk, idx)
             self.assertEqual(actual, expected)
+
+        # Keyset (cursor) pagination returns the parts in the same order
+        ordered = [part['pk'] for part in response.data]
+        paged = []
+        cursor = ''
+
+        while cursor is not None:
+            page = self.get(
+                url,
+                {'ordering': f'-parameter_{template.pk}', 'limit': 4, 'cursor': cursor},
+                expected_code=200,
+            ).data
+
+            paged.extend(part['pk'] for part in page['results'])
+            cursor = (
+                page['next'] and parse_qs(urlparse(page['next']).query)['cursor'][0]
+            )
+
+        self.assertEqual(len(paged), len(ordered))
+        self.assertEqual(paged[: len(params)], ordered[: len(params)])
+
+    def test_filter_parts_by_param(self):
+        """Test that we can filter parts by parameter value."""
+        url = reverse('api-part-list')
+
+        length = PartParameterTemplate.objects.create(name='Test Length', units='m')
+        color = PartParameterTemplate.objects.create(name='Test Color')
+        flag = PartParameterTemplate.objects.create(name='Test Flag', checkbox=True)
+
+        parts = list(Part.objects.all().order_by('pk')[:6])
+
+        for idx, part in enumerate(parts):
+            PartParameter.objects.create(
+                part=part, template=length, data=f'{idx * 100}mm'
+            )
+            PartParameter.objects.create(
+                part=part, template=color, data='Red' if idx % 2 else 'Blue'
+            )
+
+            if idx < 3:
+                PartParameter.objects.create(
+                    part=part, template=flag, data='True' if idx else 'False'
+                )
+
+        def filter_parts(**kwargs):
+            """Return the set of part IDs which match the provided filters."""
+            response = self.get(url, kwargs, expected_code=200)
+            return {item['pk'] for item in response.data}
+
+        pks = [part.pk for part in parts]
+
+        # Numeric values are converted to the template units
+        self.assertEqual(filter_parts(**{f'parameter_{length.pk}': '0.2m'}), {pks[2]})
+        self.assertEqual(filter_parts(**{f'parameter_{length.pk}': '200'}), set())
+        self.assertEqual(
+            filter_parts(**{f'parameter_{length.pk}_gte': '30cm'}), set(pks[3:])
+        )
+        self.assertEqual(
+            filter_parts(**{f'parameter_{length.pk}_lt': '0.3'}), set(pks[:3])
+        )
+
+        # Multiple filters against the same template
+        self.assertEqual(
+            filter_parts(**{
+                f'parameter_{length.pk}_gt': '100mm',
+                f'parameter_{length.pk}_lte': '400mm',
+            }),
+            set(pks[2:5]),
+        )
+
+        # Text values
+        self.assertEqual(
+            filter_parts(**{f'parameter_{color.pk}': 'red'}), set(pks[1::2])
+        )
+        self.assertEqual(
+            filter_parts(**{f'parameter_{color.pk}_ne': 'red'}), set(pks[::2])
+        )
+        self.assertEqual(
+            filter_parts(**{f'parameter_{color.pk}_contains': 'lu'}), set(pks[::2])
+        )
+
+        # Checkbox values
+        self.assertEqual(filter_parts(**{f'parameter_{flag.pk}': 'yes'}), set(pks[1:3]))
+        self.assertEqual(filter_parts(**{f'parameter_{flag.pk}': 'false'}), {pks[0]})
+
+        # Filters against multiple templates are combined
+        self.assertEqual(
+            filter_parts(**{
+                f'parameter_{length.pk}_gte': '100mm',
+                f'parameter_{color.pk}': 'Blue',
+                f'parameter_{flag.pk}': '1',
+            }),
+            {pks[2]},
+        )
+
+        # Unknown template
+        self.assertEqual(filter_parts(parameter_9999='1'), set())
+
+        # Invalid filter function
+        response = self.get(url, {f'parameter_{length.pk}_xyz': '1'}, expected_code=400)
+        self.assertIn(f'parameter_{length.pk}_xyz', response.data)
+
+
+class ParameterFilterBenchmark(TestCase):
+    """Benchmark parametric filtering against a larger set of parameter data.
+
+    Ensures that the number of queries does not depend on the number of filters,
+    and that the parameter indexes are used for filtering.
+    """
+
+    N_PARTS = 200
+    N_TEMPLATES = 100
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a dataset of parts, each with a value for every parameter template."""
+        super().setUpTestData()
+
+        cls.templates = PartParameterTemplate.objects.bulk_create([
+            PartParameterTemplate(name=f'Template {idx}', units='mm' if idx % 2 else '')
+            for idx in range(cls.N_TEMPLATES)
+        ])
+
+        cls.parts = [
+            Part.objects.create(name=f'Part {idx}', description='A part')
+            for idx in range(cls.N_PARTS)
+        ]
+
+        parameters = []
+
+        for p_idx, prt in enumerate(cls.parts):
+            for t_idx, template in enumerate(cls.templates):
+                value = (p_idx * (t_idx + 1)) % 1000
+                parameters.append(
+                    PartParameter(
+                        part=prt,
+                        template=template,
+                        data=str(value),
+                        data_numeric=float(value),
+                    )
+                )
+
+        PartParameter.objects.bulk_create(parameters, batch_size=1000)
+
+    def test_filter_queries(self):
+        """The number of queries is constant, regardless of the number of filters."""
+        for n in [1, 5, 20]:
+            filters = [(t.pk, '500', 'lt') for t in self.templates[:n]]
+            filters.append((self.templates[0].pk, '10', 'gte'))
+
+            # One query for the templates, and one for the filtered parts
+            with self.assertNumQueries(2):
+                results = set(
+                    part_filters.filter_by_parameters(
+                        Part.objects.all(), filters
+                    ).values_list('pk', flat=True)
+                )
+
+            # Check the results against the parameter data
+            expected = [
+                prt
+                for p_idx, prt in enumerate(self.parts)
+                if p_idx >= 10
+                and all((p_idx * (t_idx + 1)) % 1000 < 500 for t_idx in range(n))
+            ]
+
+            self.assertEqual(results, {p.pk for p in expected})
+
+    def test_filter_index(self):
+        """The parameter indexes are used when filtering by parameter value."""
+        if connection.vendor != 'sqlite':
+            self.skipTest('Query plan check is only performed for sqlite')
+
+        template = self.templates[1]
+
+        queryset = part_filters.filter_by_parameter(
+            Part.objects.all(), template.pk, '100', 'gt'
+        )
+        self.assertIn('part_param_numeric_idx', queryset.explain())
+
+        queryset = part_filters.filter_by_parameter(
+            Part.objects.all(), template.pk, 'abc', 'gt'
+        )
+        self.assertIn('part_param_data_idx', queryset.explain())
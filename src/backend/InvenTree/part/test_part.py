@@ -1,15 +1,20 @@
 """Tests for the Part model."""
 
 import os
+import time
+from unittest import mock
 
+from django.apps import apps
 from django.conf import settings
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
-from django.test.utils import override_settings
+from django.test.utils import CaptureQueriesContext, override_settings
 
 from allauth.account.models import EmailAddress
 
+import part.helpers as part_helpers
 import part.settings
 from common.models import (
     InvenTreeSetting,
@@ -23,9 +28,11 @@ from InvenTree.templatetags import inventree_extras
 from InvenTree.unit_test import InvenTreeTestCase
 
 from .models import (
+    BomItem,
     Part,
     PartCategory,
     PartCategoryStar,
+    PartPricing,
     PartRelated,
     PartStar,
     PartStocktake,
@@ -572,6 +579,72 @@ class PartSettingsTest(InvenTreeTestCase):
         Part.objects.create(name='abc', revision='5', description='A part', IPN='  ')
         Part.objects.create(name='abc', revision='6', description='A part', IPN=' ')
 
+    def test_full_name_format(self):
+        """Test that changes to the PART_NAME_FORMAT setting are reflected immediately."""
+        part = Part(name='Widget', IPN='W-001', revision='B', description='A widget')
+
+        self.assertEqual(part.full_name, 'W-001 | Widget | B')
+        self.assertTrue(
+            part_helpers.is_default_full_name_format(
+                InvenTreeSetting.get_setting('PART_NAME_FORMAT')
+            )
+        )
+
+        InvenTreeSetting.set_setting(
+            'PART_NAME_FORMAT', '{{ part.name }} [{{ part.revision }}]', self.user
+        )
+
+        self.assertEqual(part.full_name, 'Widget [B]')
+
+        # Restore the default format
+        InvenTreeSetting.set_setting(
+            'PART_NAME_FORMAT',
+            InvenTreeSetting.get_setting_default('PART_NAME_FORMAT'),
+            self.user,
+        )
+
+        self.assertEqual(part.full_name, 'W-001 | Widget | B')
+
+    def test_default_full_name(self):
+        """Test that the default fast path matches the default template."""
+        template = part_helpers.compile_full_name_template()
+
+        for ipn in [None, '', 'IPN']:
+            for revision in [None, '', 'A']:
+                for name in ['name', '']:
+                    p = Part(name=name, IPN=ipn, revision=revision)
+
+                    self.assertEqual(
+                        part_helpers.render_default_full_name(p),
+                        template.render(part=p),
+                    )
+
+    def test_full_name_benchmark(self):
+        """Benchmark rendering of part names.
+
+        Rendering a large number of names should not require any database queries,
+        and only a single (shared) cache lookup per check interval.
+        """
+        # Note: Part instances are re-used, as constructing 100k instances is slow
+        parts = [
+            Part(name=f'Part {idx}', IPN=f'IPN-{idx}', revision='A')
+            for idx in range(100)
+        ] * 1000
+
+        # Ensure the template is compiled before timing
+        part_helpers.compile_full_name_template()
+
+        t_start = time.time()
+
+        with self.assertNumQueries(0):
+            names = [p.full_name for p in parts]
+
+        duration = time.time() - t_start
+
+        self.assertEqual(len(names), 100000)
+        self.assertEqual(names[123], 'IPN-23 | Part 23 | A')
+        self.assertLess(duration, 10)
+
 
 class PartSubscriptionTests(InvenTreeTestCase):
     """Unit tests for part 'subscription'."""
@@ -728,3 +801,53 @@ class PartNotificationTest(BaseNotificationIntegrationTest):
 
         # There should not be more messages
         self.assertEqual(NotificationMessage.objects.all().count(), 1)
+
+
+class PartStartupTest(TestCase):
+    """Tests for the data consistency checks performed on startup."""
+
+    def test_startup_checks(self):
+        """Test that the startup checks are performed with a fixed number of queries."""
+        sub_part = Part.objects.create(
+            name='Sub part',
+            description='A trackable part',
+            component=True,
+            trackable=True,
+        )
+
+        assemblies = []
+
+        for idx in range(10):
+            assembly = Part.objects.create(
+                name=f'Assembly {idx}', description='An assembly', assembly=True
+            )
+
+            BomItem.objects.create(part=assembly, sub_part=sub_part, quantity=1)
+            PartPricing.objects.update_or_create(
+                part=assembly, defaults={'scheduled_for_update': True}
+            )
+
+            assemblies.append(assembly)
+
+        config = apps.get_app_config('part')
+
+        with CaptureQueriesContext(connection) as queries:
+            config.run_startup_checks()
+
+        self.assertLess(len(queries), 10)
+
+        for assembly in assemblies:
+            assembly.refresh_from_db()
+            self.assertTrue(assembly.trackable)
+
+        self.assertFalse(PartPricing.objects.filter(scheduled_for_update=True).exists())
+
+        # The checks are skipped if another process holds the lock
+        PartPricing.objects.update(scheduled_for_update=True)
+
+        with mock.patch('common.models.Sequence.try_lock', return_value=False):
+            config.run_startup_checks()
+
+        self.assertEqual(
+            PartPricing.objects.filter(scheduled_for_update=True).count(), 10
+        )
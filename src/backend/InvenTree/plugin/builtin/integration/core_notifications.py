@@ -85,17 +85,10 @@ class InvenTreeCoreNotificationsPlugin(
 
         def get_targets(self):
             """Return a list of target email addresses, only for users which allow email notifications."""
-            allowed_users = []
+            # Ignore any users who have been deactivated
+            active_users = [user for user in self.targets if user.is_active]
 
-            for user in self.targets:
-                if not user.is_active:
-                    # Ignore any users who have been deactivated
-                    continue
-
-                allows_emails = InvenTree.helpers.str2bool(self.usersetting(user))
-
-                if allows_emails:
-                    allowed_users.append(user)
+            allowed_users = self.get_enabled_users(active_users)
 
             return EmailAddress.objects.filter(user__in=allowed_users)
 
@@ -9,7 +9,6 @@ from rest_framework import serializers
 
 from common.models import InvenTreeUserSetting
 from InvenTree.serializers import DependentField
-from InvenTree.tasks import offload_task
 from label.models import LabelTemplate
 from machine.machine_types import LabelPrinterBaseDriver, LabelPrinterMachine
 from plugin import InvenTreePlugin
@@ -95,13 +94,13 @@ class InvenTreeLabelPlugin(LabelPrintingMixin, InvenTreePlugin):
         if driver.USE_BACKGROUND_WORKER is False:
             return driver.print_labels(machine, label, items, request, **print_kwargs)
 
-        offload_task(
-            driver.print_labels, machine, label, items, request, **print_kwargs
-        )
+        # queue the print job for the background worker
+        job = machine.create_print_job(label, items, request, **print_kwargs)
 
         return JsonResponse({
             'success': True,
             'message': f'{len(items)} labels printed',
+            'job': job.pk,
         })
 
     class PrintingOptionsSerializer(serializers.Serializer):
@@ -54,7 +54,9 @@ from InvenTree.mixins import (
     ListCreateAPI,
     RetrieveAPI,
     RetrieveUpdateDestroyAPI,
+    SparseFieldsMixin,
 )
+from InvenTree.pagination import InvenTreePagination
 from InvenTree.status_codes import StockHistoryCode, StockStatus
 from order.models import PurchaseOrder, ReturnOrder, SalesOrder, SalesOrderAllocation
 from order.serializers import (
@@ -824,7 +826,7 @@ class StockFilter(rest_filters.FilterSet):
             return queryset.exclude(stale_filter)
 
 
-class StockList(APIDownloadMixin, ListCreateDestroyAPIView):
+class StockList(SparseFieldsMixin, APIDownloadMixin, ListCreateDestroyAPIView):
     """API endpoint for list view of Stock objects.
 
     - GET: Return a list of all StockItem objects (with optional query filters)
@@ -832,6 +834,8 @@ class StockList(APIDownloadMixin, ListCreateDestroyAPIView):
     - DELETE: Delete multiple StockItem objects
     """
 
+    pagination_class = InvenTreePagination
+
     serializer_class = StockSerializers.StockItemSerializer
     queryset = StockItem.objects.all()
     filterset_class = StockFilter
@@ -978,18 +982,14 @@ class StockList(APIDownloadMixin, ListCreateDestroyAPIView):
 
                 # Determine if any of the specified serial numbers are invalid
                 # Note "invalid" means either they already exist, or do not pass custom rules
-                invalid = []
-                errors = []
+                serial_errors = part.validate_serial_numbers(serials)
 
-                for serial in serials:
-                    try:
-                        part.validate_serial_number(serial, raise_error=True)
-                    except DjangoValidationError as exc:
-                        # Catch raised error to extract specific error information
-                        invalid.append(serial)
+                invalid = list(serial_errors.keys())
+                errors = []
 
-                        if exc.message not in errors:
-                            errors.append(exc.message)
+                for error in serial_errors.values():
+                    if error not in errors:
+                        errors.append(error)
 
                 if len(errors) > 0:
                     msg = _('The following serial numbers already exist or are invalid')
@@ -1379,6 +1379,8 @@ class StockTrackingList(ListAPI):
     - GET: Return list of StockItemTracking objects
     """
 
+    pagination_class = InvenTreePagination
+
     queryset = StockItemTracking.objects.all()
     serializer_class = StockSerializers.StockTrackingSerializer
 
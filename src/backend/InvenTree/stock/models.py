@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 import logging
 import os
 from datetime import timedelta
@@ -11,7 +12,7 @@ from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.exceptions import FieldError, ValidationError
 from django.core.validators import MinValueValidator
-from django.db import models, transaction
+from django.db import connection, models, transaction
 from django.db.models import Q, Sum
 from django.db.models.functions import Coalesce
 from django.db.models.signals import post_delete, post_save, pre_delete
@@ -415,21 +416,27 @@ class StockItem(
         & Q(expiry_date__lt=InvenTree.helpers.current_date())
     )
 
-    def update_serial_number(self):
+    def update_serial_number(self, plugins=None):
         """Update the 'serial_int' field, to be an integer representation of the serial number.
 
         This is used for efficient numerical sorting
+
+        Arguments:
+            plugins: List of active validation plugins (looked up from the registry if not provided)
         """
         serial = str(getattr(self, 'serial', '')).strip()
 
         from plugin.registry import registry
 
+        if plugins is None:
+            plugins = registry.with_mixin('validation')
+
         # First, let any plugins convert this serial number to an integer value
         # If a non-null value is returned (by any plugin) we will use that
 
         serial_int = None
 
-        for plugin in registry.with_mixin('validation'):
+        for plugin in plugins:
             serial_int = plugin.convert_serial_to_int(serial)
 
             if serial_int is not None:
@@ -592,15 +599,21 @@ class StockItem(
             except ValidationError as exc:
                 raise ValidationError({'serial': exc.message})
 
-    def validate_batch_code(self):
+    def validate_batch_code(self, plugins=None):
         """Ensure that the batch code is valid for this StockItem.
 
         - Validation is performed by custom plugins.
         - By default, no validation checks are performed
+
+        Arguments:
+            plugins: List of active validation plugins (looked up from the registry if not provided)
         """
         from plugin.registry import registry
 
-        for plugin in registry.with_mixin('validation'):
+        if plugins is None:
+            plugins = registry.with_mixin('validation')
+
+        for plugin in plugins:
             try:
                 plugin.validate_batch_code(self.batch, self)
             except ValidationError as exc:
@@ -610,7 +623,7 @@ class StockItem(
                     f'plugin.{plugin.slug}.validate_batch_code'
                 )
 
-    def clean(self):
+    def clean(self, plugins=None):
         """Validate the StockItem object (separate to field validation).
 
         The following validation checks are performed:
@@ -619,6 +632,9 @@ class StockItem(
         - The 'part' does not belong to itself
         - The location is not structural
         - Quantity must be 1 if the StockItem has a serial number
+
+        Arguments:
+            plugins: List of active validation plugins, used to validate the batch code
         """
         if self.location is not None and self.location.structural:
             raise ValidationError({
@@ -638,7 +654,7 @@ class StockItem(
             self.batch = self.batch.strip()
 
         # Custom validation of batch code
-        self.validate_batch_code()
+        self.validate_batch_code(plugins=plugins)
 
         try:
             # Trackable parts must have integer values for quantity field!
@@ -1836,6 +1852,22 @@ class StockItem(
         # Return a copy of the "new" stock item
         return new_stock
 
+    def get_split_item(self, quantity):
+        """Return a new (unsaved) StockItem, which is to be split from this item.
+
+        This is used to plan bulk operations - refer to create_split_items
+        """
+        item = copy.copy(self)
+        item.pk = None
+        item._state.adding = True
+        item.quantity = quantity
+        item.parent = self
+        item.level = self.level + 1
+        item.lft = 0
+        item.rght = 0
+
+        return item
+
     @classmethod
     def optional_transfer_fields(cls):
         """Returns a list of optional fields for a stock transfer."""
@@ -2262,6 +2294,120 @@ def after_save_stock_item(sender, instance: StockItem, created, **kwargs):
             instance.part.schedule_pricing_update(create=True)
 
 
+def after_bulk_create_stock_items(items):
+    """Hook function to be executed after StockItem objects are created in bulk.
+
+    Bulk creation does not emit the post_save signal, so the same actions are performed here
+    (once for each affected part, rather than once for each new stock item).
+    """
+    from common.search import (
+        index_update_allowed,
+        is_model_indexed,
+        update_search_documents,
+    )
+    from part import tasks as part_tasks
+    from part.summary import schedule_summary_update
+
+    if not items:
+        return
+
+    parts = {item.part_id: item.part for item in items}
+
+    schedule_summary_update('part.part', parts.keys())
+
+    if InvenTree.ready.isImportingData():
+        return
+
+    for part in parts.values():
+        # Run this check in the background
+        InvenTree.tasks.offload_task(part_tasks.notify_low_stock_if_required, part)
+
+        if InvenTree.ready.canAppAccessDatabase(allow_test=True):
+            part.schedule_pricing_update(create=True)
+
+    if is_model_indexed(StockItem) and index_update_allowed():
+        update_search_documents(StockItem, [item.pk for item in items])
+
+
+def create_split_items(splits) -> list:
+    """Create multiple split stock items in bulk.
+
+    This is the bulk equivalent of StockItem.splitStock, for a set of planned splits.
+    Each source item may be split multiple times.
+
+    Arguments:
+        splits: A list of (source, item, quantity) tuples, where 'item' is an unsaved StockItem
+                (refer to StockItem.get_split_item) which takes 'quantity' from 'source'
+
+    Returns:
+        A list of (stock_item, code, deltas) tuples, for the required tracking entries
+    """
+    if not splits:
+        return []
+
+    new_items = [item for _source, item, _quantity in splits]
+
+    if connection.features.can_return_rows_from_bulk_insert:
+        StockItem.objects.bulk_create(new_items)
+    else:
+        # Primary keys are required for the tracking entries
+        for item in new_items:
+            item.save(add_note=False)
+
+    tracking = []
+
+    for source, item, quantity in splits:
+        source.quantity -= quantity
+
+        tracking.append((
+            item,
+            StockHistoryCode.SPLIT_FROM_PARENT,
+            {'stockitem': source.pk, 'quantity': float(quantity)},
+        ))
+
+        tracking.append((
+            source,
+            StockHistoryCode.SPLIT_CHILD_ITEM,
+            {
+                'removed': float(quantity),
+                'quantity': float(source.quantity),
+                'stockitem': item.pk,
+            },
+        ))
+
+    sources = {source.pk: source for source, _item, _quantity in splits}
+
+    StockItem.objects.bulk_update(sources.values(), ['quantity'])
+
+    # Copy the test results of the source items to the new items
+    results = {}
+
+    for result in StockItemTestResult.objects.filter(stock_item__in=sources.keys()):
+        results.setdefault(result.stock_item_id, []).append(result)
+
+    new_results = []
+
+    for source, item, _quantity in splits:
+        for result in results.get(source.pk, []):
+            result = copy.copy(result)
+            result.pk = None
+            result.stock_item = item
+            new_results.append(result)
+
+    StockItemTestResult.objects.bulk_create(new_results)
+
+    # Rebuild the tree structure for each affected stock item tree
+    for tree_id in sorted({source.tree_id for source in sources.values()}):
+        try:
+            StockItem.objects.partial_rebuild(tree_id=tree_id)
+        except Exception:
+            logger.warning('Rebuilding entire StockItem tree')
+            StockItem.objects.rebuild()
+            break
+
+    return tracking
+
+
 class StockItemAttachment(InvenTree.models.InvenTreeAttachment):
     """Model for storing file attachments against a StockItem object."""
 
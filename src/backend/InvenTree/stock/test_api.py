@@ -4,9 +4,14 @@ import io
 import os
 from datetime import datetime, timedelta
 from enum import IntEnum
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
 
 import django.http
+from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 import tablib
@@ -16,7 +21,8 @@ from rest_framework import status
 import build.models
 import company.models
 import part.models
-from common.models import InvenTreeSetting
+import stock.api
+from common.models import InvenTreeSetting, TaskProgress
 from InvenTree.status_codes import StockHistoryCode, StockStatus
 from InvenTree.unit_test import InvenTreeAPITestCase
 from part.models import Part, PartTestTemplate
@@ -735,6 +741,118 @@ class StockItemListTest(StockAPITestCase):
 
             self.assertEqual(len(response['results']), n)
 
+    def test_paginate_count(self):
+        """Test that the total count can be skipped when paginating results."""
+        n = StockItem.objects.count()
+
+        response = self.get_stock(limit=5, count='false')
+        self.assertIsNone(response['count'])
+        self.assertEqual(len(response['results']), 5)
+        self.assertIn('offset=5', response['next'])
+
+        # Final page of results
+        response = self.get_stock(limit=5, offset=n - 2, count='false')
+        self.assertEqual(len(response['results']), 2)
+        self.assertIsNone(response['next'])
+
+        # Approximate count (exact count if an estimate is not available)
+        response = self.get_stock(limit=5, count='approximate')
+        self.assertGreater(response['count'], 0)
+
+    def test_paginate_cursor(self):
+        """Test keyset (cursor) pagination."""
+        # Ensure that some items share the same quantity (and some have no location)
+        StockItem.objects.filter(pk__in=[1, 2, 3]).update(quantity=5)
+        StockItem.objects.filter(pk__in=[2, 100]).update(location=None)
+
+        for ordering in [None, 'quantity', '-quantity', 'location', '-updated', 'SKU']:
+            params = {'ordering': ordering} if ordering else {}
+
+            # Retrieve the complete list of results, in a single request
+            expected = [item['pk'] for item in self.get_stock(**params)]
+
+            results = []
+            cursor = ''
+
+            while cursor is not None:
+                response = self.get_stock(
+                    limit=7, cursor=cursor, count='false', **params
+                )
+
+                self.assertIsNone(response['count'])
+                self.assertIsNone(response['previous'])
+                self.assertLessEqual(len(response['results']), 7)
+
+                results.extend(item['pk'] for item in response['results'])
+
+                if response['next']:
+                    cursor = parse_qs(urlparse(response['next']).query)['cursor'][0]
+                else:
+                    cursor = None
+
+            self.assertEqual(len(results), len(set(results)))
+            self.assertEqual(set(results), set(expected))
+
+            if ordering == 'quantity':
+                quantities = [StockItem.objects.get(pk=pk).quantity for pk in results]
+                self.assertEqual(quantities, sorted(quantities))
+
+        # The count is returned by default
+        response = self.get_stock(limit=7, cursor='')
+        self.assertEqual(response['count'], StockItem.objects.count())
+
+        cursor = parse_qs(urlparse(response['next']).query)['cursor'][0]
+
+        # A cursor cannot be used with a different ordering
+        response = self.client.get(
+            self.list_url, {'cursor': cursor, 'ordering': 'quantity'}, format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('cursor', response.data)
+
+        # Invalid cursor
+        response = self.client.get(self.list_url, {'cursor': 'abc'}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_sparse_fields(self):
+        """Test that only the selected fields are returned (and computed)."""
+
+        def get_stock(**params):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.get(self.list_url, params, expected_code=200)
+
+            sql = ' '.join(query['sql'] for query in ctx.captured_queries)
+            return response.data, len(ctx), sql
+
+        full, n_full, sql_full = get_stock(limit=50)
+        sparse, n_sparse, sql_sparse = get_stock(limit=50, fields='quantity,location')
+
+        self.assertEqual(len(full['results']), len(sparse['results']))
+
+        for item in sparse['results']:
+            self.assertEqual(set(item.keys()), {'pk', 'quantity', 'location'})
+
+        # Prefetches and annotations are not performed for the omitted fields
+        self.assertLess(n_sparse, n_full)
+        self.assertLess(len(sql_sparse), len(sql_full))
+        self.assertNotIn('stock_stockitemtracking', sql_sparse)
+
+        # Annotated fields can still be used for filtering and ordering
+        params = {'ordering': '-allocated', 'expired': False, 'stale': False}
+        full, _n, _sql = get_stock(**params)
+        sparse, _n, _sql = get_stock(fields='quantity', **params)
+
+        self.assertEqual([x['pk'] for x in sparse], [x['pk'] for x in full])
+
+        # Fields can also be omitted
+        omit, _n, _sql = get_stock(limit=5, omit='part_detail,tags,tracking_items')
+
+        for item in omit['results']:
+            self.assertIn('quantity', item)
+
+            for field in ['part_detail', 'tags', 'tracking_items']:
+                self.assertNotIn(field, item)
+
     def export_data(self, filters=None):
         """Helper to test exports."""
         if not filters:
@@ -1520,6 +1638,45 @@ class StockItemDeletionTest(StockAPITestCase):
 
         self.assertEqual(StockItem.objects.count(), n)
 
+    def test_bulk_delete_tree(self):
+        """Test bulk deletion of stock items, in multiple chunks."""
+        root = StockItem.objects.create(part_id=1, location_id=1, quantity=10)
+
+        items = [root]
+
+        for idx in range(8):
+            items.append(
+                StockItem.objects.create(
+                    part_id=1, location_id=1, quantity=idx, parent=items[-1]
+                )
+            )
+
+        # Delete every second item in the chain
+        deleted = [item.pk for item in items[1::2]]
+
+        with mock.patch.object(stock.api.StockList, 'BULK_DELETE_CHUNK_SIZE', 2):
+            response = self.delete(
+                reverse('api-stock-list'), {'items': deleted}, expected_code=200
+            )
+
+        self.assertEqual(response.data['deleted'], 4)
+        self.assertFalse(StockItem.objects.filter(pk__in=deleted).exists())
+
+        # The remaining items are re-attached to the nearest remaining ancestor
+        remaining = [StockItem.objects.get(pk=item.pk) for item in items[0::2]]
+
+        for parent, child in zip(remaining, remaining[1:]):
+            self.assertEqual(child.parent, parent)
+
+        # The tree structure has been rebuilt
+        root.refresh_from_db()
+
+        self.assertEqual(
+            list(root.get_descendants().values_list('pk', flat=True)),
+            [item.pk for item in remaining[1:]],
+        )
+        self.assertEqual(root.rght - root.lft, 2 * len(remaining) - 1)
+
 
 class StockTestResultTest(StockAPITestCase):
     """Tests for StockTestResult APIs."""
@@ -1683,18 +1840,71 @@ class StockTestResultTest(StockAPITestCase):
         # Now, let's delete all the newly created items with a single API request
         # However, we will provide incorrect filters
         response = self.delete(
-            url, {'items': tests, 'filters': {'stock_item': 10}}, expected_code=204
+            url, {'items': tests, 'filters': {'stock_item': 10}}, expected_code=200
         )
 
         self.assertEqual(StockItemTestResult.objects.count(), n + 50)
 
         # Try again, but with the correct filters this time
         response = self.delete(
-            url, {'items': tests, 'filters': {'stock_item': 1}}, expected_code=204
+            url, {'items': tests, 'filters': {'stock_item': 1}}, expected_code=200
         )
 
         self.assertEqual(StockItemTestResult.objects.count(), n)
 
+    def test_bulk_delete_background(self):
+        """Test that a large bulk deletion is performed by the background worker."""
+        n = StockItemTestResult.objects.count()
+
+        template = PartTestTemplate.objects.first()
+
+        results = StockItemTestResult.objects.bulk_create([
+            StockItemTestResult(stock_item_id=1, template=template, result=True)
+            for _idx in range(25)
+        ])
+
+        url = reverse('api-stock-test-result-list')
+
+        with (
+            mock.patch.object(
+                stock.api.StockItemTestResultList, 'BULK_DELETE_CHUNK_SIZE', 10
+            ),
+            mock.patch.object(
+                stock.api.StockItemTestResultList,
+                'BULK_DELETE_BACKGROUND_THRESHOLD',
+                20,
+            ),
+        ):
+            response = self.delete(
+                url, {'items': [r.pk for r in results]}, expected_code=202
+            )
+
+        self.assertEqual(response.data['total'], 25)
+        self.assertEqual(StockItemTestResult.objects.count(), n)
+
+        # The worker is not running, so the deletion has already been completed
+        job = response.data['job']
+        progress_url = reverse('api-bulk-delete-progress', kwargs={'job': job})
+
+        response = self.get(progress_url, expected_code=200)
+        self.assertEqual(response.data['total'], 25)
+        self.assertEqual(response.data['deleted'], 25)
+        self.assertTrue(response.data['finished'])
+
+        # Progress is stored in the database, so it is available to all server processes
+        self.assertTrue(TaskProgress.objects.filter(key__endswith=job).exists())
+
+        # The progress is only available to the user who requested the deletion
+        self.client.force_authenticate(
+            user=get_user_model().objects.create_user('other', 'other@test.com')
+        )
+
+        self.get(progress_url, expected_code=404)
+        self.get(
+            reverse('api-bulk-delete-progress', kwargs={'job': 'unknown'}),
+            expected_code=404,
+        )
+
 
 class StockAssignTest(StockAPITestCase):
     """Unit tests for the stock assignment API endpoint, where stock items are manually assigned to a customer."""
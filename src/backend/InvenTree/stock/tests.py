@@ -4,8 +4,10 @@ import datetime
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.db.models import Sum
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from build.models import Build
 from common.models import InvenTreeSetting
@@ -996,6 +998,63 @@ class VariantTest(StockTestBase):
         item.serial = int(n) + 2
         item.save()
 
+    def test_batch_serial_numbers(self):
+        """Test batch validation of serial numbers."""
+        InvenTreeSetting.set_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False, self.user)
+
+        chair = Part.objects.get(pk=10000)
+
+        to_check = [str(x) for x in range(1, 1001)]
+
+        # One query for duplicates per chunk, rather than per serial number
+        with CaptureQueriesContext(connection) as queries:
+            errors = chair.validate_serial_numbers(to_check, chunk_size=500)
+
+        stock_queries = [q for q in queries if 'stock_stockitem' in q['sql']]
+        self.assertEqual(len(stock_queries), 2)
+
+        self.assertEqual(
+            sorted(errors.keys(), key=int),
+            ['1', '2', '3', '4', '5', '10', '11', '12', '20', '21', '22'],
+        )
+
+        self.assertIn('already exists', errors['20'])
+
+        # Skip the duplicate check
+        self.assertEqual(
+            chair.validate_serial_numbers(['1', '2'], check_duplicates=False), {}
+        )
+
+        # Exclude a particular stock item from the duplicate check
+        item = StockItem.objects.filter(
+            part__tree_id=chair.tree_id, serial='20'
+        ).first()
+        errors = chair.validate_serial_numbers(['20', '21'], stock_item=item)
+        self.assertEqual(list(errors.keys()), ['21'])
+
+    def test_reserve_serial_numbers(self):
+        """Test reservation of serial numbers."""
+        InvenTreeSetting.set_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False, self.user)
+
+        chair = Part.objects.get(pk=10000)
+        variant = Part.objects.get(pk=10003)
+
+        # Reserved serials start above the latest serial number
+        self.assertEqual(chair.reserve_serial_numbers(3), ['23', '24', '25'])
+
+        # The variant part shares a serial number sequence with the template
+        self.assertEqual(variant.reserve_serial_numbers(2), ['26', '27'])
+
+        # A serial number created outside of the reservation moves the sequence on
+        StockItem.objects.create(part=variant, quantity=1, serial='100')
+        self.assertEqual(chair.reserve_serial_numbers(1), ['101'])
+
+        # Serial numbers for a separate part tree are independent
+        other = Part.objects.create(
+            name='Other', description='Another trackable part', trackable=True
+        )
+        self.assertEqual(other.reserve_serial_numbers(2), ['1', '2'])
+
 
 class StockTreeTest(StockTestBase):
     """Unit test for StockItem tree structure."""
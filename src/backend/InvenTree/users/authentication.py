@@ -1,13 +1,79 @@
 """Custom token authentication class for InvenTree API."""
 
-import datetime
-
+from django.contrib.auth import get_user_model
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import exceptions
 from rest_framework.authentication import TokenAuthentication
 
-from users.models import ApiToken
+from users.models import ApiToken, get_cached_api_token, update_api_token_last_seen
+
+
+def authenticate_api_token(key: str, request=None):
+    """Authenticate the provided API token key.
+
+    Arguments:
+        key: The (raw) token key
+        request: Optional request object - if provided, the result is stored against the request
+
+    Returns:
+        A (user, token) tuple
+
+    Raises:
+        AuthenticationFailed: If the token is invalid, revoked or expired
+
+    The result is stored against the request, so that a token is only looked up once per request
+    (e.g. by both the AuthRequiredMiddleware and the DRF authentication class).
+    """
+    if request is not None:
+        cached = getattr(request, '_api_token_auth', None)
+
+        if cached is not None and cached[0] == key:
+            if isinstance(cached[1], Exception):
+                raise cached[1]
+            return cached[1]
+
+    try:
+        result = _authenticate_api_token(key)
+    except exceptions.AuthenticationFailed as exc:
+        if request is not None:
+            request._api_token_auth = (key, exc)
+        raise exc
+
+    if request is not None:
+        request._api_token_auth = (key, result)
+
+    return result
+
+
+def _authenticate_api_token(key: str):
+    """Authenticate the provided API token key (see authenticate_api_token)."""
+    token = get_cached_api_token(key)
+
+    if token is None:
+        raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+    if token.revoked:
+        raise exceptions.AuthenticationFailed(_('Token has been revoked'))
+
+    if token.expired:
+        raise exceptions.AuthenticationFailed(_('Token has expired'))
+
+    # The user is always fetched from the database, so that changes are reflected immediately
+    try:
+        user = get_user_model().objects.get(pk=token.user_id)
+    except get_user_model().DoesNotExist:
+        raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+    if not user.is_active:
+        raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+    token.user = user
+
+    # Update the last-seen date
+    update_api_token_last_seen(token)
+
+    return (user, token)
 
 
 class ApiTokenAuthentication(TokenAuthentication):
@@ -16,24 +82,18 @@ class ApiTokenAuthentication(TokenAuthentication):
     Changes:
     - Tokens can be revoked
     - Tokens can expire
+    - Token information is cached (see get_cached_api_token)
     """
 
     model = ApiToken
 
-    def authenticate_credentials(self, key):
-        """Adds additional checks to the default token authentication method."""
-        # If this runs without error, then the token is valid (so far)
-        (user, token) = super().authenticate_credentials(key)
-
-        if token.revoked:
-            raise exceptions.AuthenticationFailed(_('Token has been revoked'))
+    def authenticate(self, request):
+        """Authenticate the request, keeping a reference to the underlying request object."""
+        # Note: A new authenticator instance is constructed for each request
+        self.request = getattr(request, '_request', request)
 
-        if token.expired:
-            raise exceptions.AuthenticationFailed(_('Token has expired'))
+        return super().authenticate(request)
 
-        if token.last_seen != datetime.date.today():
-            # Update the last-seen date
-            token.last_seen = datetime.date.today()
-            token.save()
-
-        return (user, token)
+    def authenticate_credentials(self, key):
+        """Adds additional checks to the default token authentication method."""
+        return authenticate_api_token(key, getattr(self, 'request', None))
@@ -1,6 +1,7 @@
 """Database model definitions for the 'users' app."""
 
 import datetime
+import hashlib
 import logging
 
 from django.conf import settings
@@ -13,7 +14,7 @@ from django.core.cache import cache
 from django.core.validators import MinLengthValidator
 from django.db import models
 from django.db.models import Q, UniqueConstraint
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.db.utils import IntegrityError
 from django.dispatch import receiver
 from django.urls import reverse
@@ -185,6 +186,93 @@ class ApiToken(AuthToken, InvenTree.models.MetadataMixin):
         return not self.revoked and not self.expired
 
 
+# Lifetime (in seconds) of cached API token information
+API_TOKEN_CACHE_TIMEOUT = 60
+
+
+def get_api_token_cache_key(key: str) -> str:
+    """Return the cache key for the provided API token key.
+
+    The raw token key is hashed, so that it is never stored in the cache backend.
+    """
+    digest = hashlib.sha256(str(key).encode()).hexdigest()
+    return f'api_token_{digest}'
+
+
+def get_cached_api_token(key: str):
+    """Return the ApiToken matching the provided key.
+
+    Token information (e.g. user, expiry, revoked status) is cached for a short time,
+    so that repeated requests using the same token do not require a database lookup.
+    The cached entry is removed whenever the token is saved or deleted.
+
+    Returns:
+        An ApiToken instance, or None if no matching token exists
+    """
+    cache_key = get_api_token_cache_key(key)
+
+    try:
+        fields = cache.get(cache_key)
+    except Exception:
+        fields = None
+
+    if fields is not None:
+        return ApiToken(key=key, **fields)
+
+    token = ApiToken.objects.filter(key=key).first()
+
+    if token is None:
+        return None
+
+    fields = {
+        field.attname: getattr(token, field.attname)
+        for field in ApiToken._meta.concrete_fields
+        if field.attname != 'key'
+    }
+
+    try:
+        cache.set(cache_key, fields, timeout=API_TOKEN_CACHE_TIMEOUT)
+    except Exception:
+        pass
+
+    return token
+
+
+def clear_api_token_cache(key: str):
+    """Remove cached information for the provided API token key."""
+    try:
+        cache.delete(get_api_token_cache_key(key))
+    except Exception:
+        pass
+
+
+def update_api_token_last_seen(token):
+    """Record that the provided API token has been used today.
+
+    The 'last_seen' date is written at most once per day for each token,
+    and is updated directly (without calling save()) to avoid invalidating the cached token.
+    """
+    today = InvenTree.helpers.current_date()
+
+    if token.last_seen == today:
+        return
+
+    # Only the first request (across all processes) on a given day performs the update
+    try:
+        first = cache.add(
+            f'{get_api_token_cache_key(token.key)}_seen_{today.isoformat()}',
+            True,
+            timeout=86400,
+        )
+    except Exception:
+        first = True
+
+    if first:
+        ApiToken.objects.filter(pk=token.pk).exclude(last_seen=today).update(
+            last_seen=today
+        )
+
+
 class RuleSet(models.Model):
     """A RuleSet is somewhat like a superset of the django permission class, in that in encapsulates a bunch of permissions.
 
@@ -246,6 +334,8 @@ class RuleSet(models.Model):
                 'flags_flagstate',
                 'machine_machineconfig',
                 'machine_machinesetting',
+                'machine_machinejob',
+                'machine_machinestate',
             ],
             'part_category': [
                 'part_partcategory',
@@ -255,6 +345,7 @@ class RuleSet(models.Model):
             'part': [
                 'part_part',
                 'part_partpricing',
+                'part_partstocksummary',
                 'part_bomitem',
                 'part_bomitemsubstitute',
                 'part_partattachment',
@@ -364,6 +455,9 @@ class RuleSet(models.Model):
             'common_notificationmessage',
             'common_notesimage',
             'common_projectcode',
+            'common_searchdocument',
+            'common_sequence',
+            'common_taskprogress',
             'common_webhookendpoint',
             'common_webhookmessage',
             'label_labeloutput',
@@ -437,11 +531,13 @@ class RuleSet(models.Model):
         if table in cls.get_ruleset_ignore():
             return True
 
+        role_map = get_user_role_map(user)
+        flag = ROLE_PERMISSION_FLAGS.get(permission, 0)
+
         # Work out which roles touch the given table
-        for role in cls.RULESET_NAMES:
-            if table in cls.get_ruleset_models()[role]:
-                if check_user_role(user, role, permission):
-                    return True
+        for role in get_ruleset_table_map().get(table, []):
+            if role_map.get(role, 0) & flag:
+                return True
 
         # Check for children models which inherits from parent role
         for parent, child in cls.RULESET_CHANGE_INHERIT:
@@ -450,7 +546,7 @@ class RuleSet(models.Model):
 
             if parent_child_string == table:
                 # Check if parent role has change permission
-                if check_user_role(user, parent, 'change'):
+                if role_map.get(parent, 0) & ROLE_PERMISSION_FLAGS['change']:
                     return True
 
         # Print message instead of throwing an error
@@ -686,6 +782,67 @@ def update_group_roles(group, debug=False):
                         )
 
 
+# Bit flags used to encode the permissions available against each role
+ROLE_PERMISSION_FLAGS = {'view': 1, 'add': 2, 'change': 4, 'delete': 8}
+
+# Cache key for the global role map "generation" counter
+ROLE_MAP_VERSION_KEY = 'user_role_map_version'
+
+# Reverse index of database table -> roles (constructed on first use)
+_ruleset_table_map = None
+
+
+def get_ruleset_table_map():
+    """Return a mapping of database table names to the roles which cover that table.
+
+    The mapping is the inverse of RuleSet.get_ruleset_models(),
+    and is calculated only once per process.
+    """
+    global _ruleset_table_map
+
+    if _ruleset_table_map is None:
+        table_map = {}
+
+        for role, tables in RuleSet.get_ruleset_models().items():
+            for table in tables:
+                table_map.setdefault(table, []).append(role)
+
+        _ruleset_table_map = table_map
+
+    return _ruleset_table_map
+
+
+def get_role_map_key(user):
+    """Return the cache key for the role map associated with the provided user."""
+    return f'user_role_map_{user.pk}'
+
+
+def get_role_map_version():
+    """Return the current "generation" of cached user role maps."""
+    try:
+        return cache.get(ROLE_MAP_VERSION_KEY) or 0
+    except Exception:
+        return 0
+
+
+def invalidate_role_maps():
+    """Invalidate the cached role maps for *all* users.
+
+    Rather than deleting each cached entry, the global generation counter is incremented,
+    which causes any existing cached role maps to be ignored.
+    """
+    try:
+        cache.incr(ROLE_MAP_VERSION_KEY)
+    except ValueError:
+        # Key does not yet exist in the cache
+        try:
+            cache.set(ROLE_MAP_VERSION_KEY, 1, timeout=None)
+        except Exception:
+            pass
+    except Exception:
+        pass
+
+
 def clear_user_role_cache(user):
     """Remove user role permission information from the cache.
 
@@ -694,79 +851,99 @@ def clear_user_role_cache(user):
     Args:
         user: The User object to be expunged from the cache
     """
-    for role in RuleSet.get_ruleset_models().keys():
-        for perm in ['add', 'change', 'view', 'delete']:
-            key = f'role_{user}_{role}_{perm}'
-            cache.delete(key)
+    try:
+        cache.delete(get_role_map_key(user))
+    except Exception:
+        pass
 
 
-def get_user_roles(user):
-    """Return all roles available to a given user."""
-    roles = set()
+def build_user_role_map(user):
+    """Construct the role permission map for a given user.
 
-    for group in user.groups.all():
-        for rule in group.rule_sets.all():
-            name = rule.name
-            if rule.can_view:
-                roles.add(f'{name}.view')
-            if rule.can_add:
-                roles.add(f'{name}.add')
-            if rule.can_change:
-                roles.add(f'{name}.change')
-            if rule.can_delete:
-                roles.add(f'{name}.delete')
+    All RuleSet objects associated with the user (via groups) are fetched in a single query.
 
-    return roles
+    Returns:
+        A dict of {role: flags}, where flags is a bitwise OR of ROLE_PERMISSION_FLAGS values
+    """
+    role_map = {}
 
+    rules = RuleSet.objects.filter(group__user=user).values_list(
+        'name', 'can_view', 'can_add', 'can_change', 'can_delete'
+    )
 
-def check_user_role(user, role, permission):
-    """Check if a user has a particular role:permission combination.
+    for name, can_view, can_add, can_change, can_delete in rules:
+        flags = role_map.get(name, 0)
 
-    If the user is a superuser, this will return True
-    """
-    if user.is_superuser:
-        return True
+        if can_view:
+            flags |= ROLE_PERMISSION_FLAGS['view']
+        if can_add:
+            flags |= ROLE_PERMISSION_FLAGS['add']
+        if can_change:
+            flags |= ROLE_PERMISSION_FLAGS['change']
+        if can_delete:
+            flags |= ROLE_PERMISSION_FLAGS['delete']
 
-    # First, check the cache
-    key = f'role_{user}_{role}_{permission}'
+        role_map[name] = flags
 
-    try:
-        result = cache.get(key)
-    except Exception:
-        result = None
+    return role_map
 
-    if result is not None:
-        return result
 
-    # Default for no match
-    result = False
+def get_user_role_map(user):
+    """Return the (cached) role permission map for a given user.
 
-    for group in user.groups.all():
-        for rule in group.rule_sets.all():
-            if rule.name == role:
-                if permission == 'add' and rule.can_add:
-                    result = True
-                    break
+    The map is stored in the cache alongside the generation counter it was built against,
+    so both values are retrieved with a single cache lookup.
+    """
+    # Anonymous users do not have any roles
+    if getattr(user, 'pk', None) is None:
+        return {}
 
-                if permission == 'change' and rule.can_change:
-                    result = True
-                    break
+    key = get_role_map_key(user)
 
-                if permission == 'view' and rule.can_view:
-                    result = True
-                    break
+    try:
+        cached = cache.get_many([ROLE_MAP_VERSION_KEY, key])
+    except Exception:
+        cached = {}
 
-                if permission == 'delete' and rule.can_delete:
-                    result = True
-                    break
+    version = cached.get(ROLE_MAP_VERSION_KEY) or 0
+    entry = cached.get(key)
+
+    if entry is not None and entry[0] == version:
+        return entry[1]
+
+    role_map = build_user_role_map(user)
 
-    # Save result to cache
     try:
-        cache.set(key, result, timeout=3600)
+        cache.set(key, (version, role_map), timeout=3600)
     except Exception:
         pass
 
-    return result
+    return role_map
+
+
+def get_user_roles(user):
+    """Return all roles available to a given user."""
+    roles = set()
+
+    for name, flags in get_user_role_map(user).items():
+        for permission, flag in ROLE_PERMISSION_FLAGS.items():
+            if flags & flag:
+                roles.add(f'{name}.{permission}')
+
+    return roles
+
+
+def check_user_role(user, role, permission):
+    """Check if a user has a particular role:permission combination.
+
+    If the user is a superuser, this will return True
+    """
+    if user.is_superuser:
+        return True
+
+    flag = ROLE_PERMISSION_FLAGS.get(permission, 0)
+
+    return bool(get_user_role_map(user).get(role, 0) & flag)
 
 
 class Owner(models.Model):
@@ -949,6 +1126,13 @@ def delete_owner(sender, instance, **kwargs):
     owner.delete()
 
 
+@receiver(post_save, sender=ApiToken, dispatch_uid='clear_api_token_cache_save')
+@receiver(post_delete, sender=ApiToken, dispatch_uid='clear_api_token_cache_delete')
+def clear_api_token(sender, instance, **kwargs):
+    """Callback function when an ApiToken is saved (e.g. revoked) or deleted."""
+    clear_api_token_cache(instance.key)
+
+
 @receiver(post_save, sender=get_user_model(), dispatch_uid='clear_user_cache')
 def clear_user_cache(sender, instance, **kwargs):
     """Callback function when a user object is saved."""
@@ -963,5 +1147,27 @@ def create_missing_rule_sets(sender, instance, **kwargs):
     """
     update_group_roles(instance)
 
-    for user in get_user_model().objects.filter(groups__name=instance.name):
-        clear_user_role_cache(user)
+    # Cached role maps for any users in this group are now stale
+    invalidate_role_maps()
+
+
+@receiver(post_delete, sender=Group, dispatch_uid='clear_role_maps_group_delete')
+@receiver(post_delete, sender=RuleSet, dispatch_uid='clear_role_maps_ruleset_delete')
+def clear_role_maps(sender, instance, **kwargs):
+    """Callback function when a Group or RuleSet object is deleted."""
+    invalidate_role_maps()
+
+
+@receiver(
+    m2m_changed, sender=User.groups.through, dispatch_uid='clear_user_group_cache'
+)
+def clear_user_group_cache(sender, instance, action, reverse, **kwargs):
+    """Callback function when the groups assigned to a user are changed."""
+    if action not in ['post_add', 'post_remove', 'post_clear']:
+        return
+
+    if reverse:
+        # Users were added to (or removed from) a group
+        invalidate_role_maps()
+    else:
+        clear_user_role_cache(instance)
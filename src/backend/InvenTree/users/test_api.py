@@ -3,8 +3,11 @@
 import datetime
 
 from django.contrib.auth.models import Group, User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+import InvenTree.helpers
 from InvenTree.unit_test import InvenTreeAPITestCase
 from users.models import ApiToken
 
@@ -156,3 +159,50 @@ class UserTokenTests(InvenTreeAPITestCase):
         token.save()
 
         self.client.get(me, expected_code=200)
+
+    def test_token_cache(self):
+        """Test that token information is cached between requests."""
+        token_key = self.get(
+            url=reverse('api-token'), data={'name': 'cached'}, expected_code=200
+        ).data['token']
+
+        token = ApiToken.objects.get(key=token_key)
+        self.assertIsNone(token.last_seen)
+
+        self.client.logout()
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token_key)
+
+        me = reverse('api-user-me')
+
+        with CaptureQueriesContext(connection) as first:
+            self.client.get(me, expected_code=200)
+
+        # The last_seen date is updated (once)
+        token.refresh_from_db()
+        self.assertEqual(token.last_seen, InvenTree.helpers.current_date())
+
+        # Subsequent requests do not look up (or update) the token
+        with CaptureQueriesContext(connection) as second:
+            self.client.get(me, expected_code=200)
+
+        self.assertLess(len(second), len(first))
+
+        for query in second.captured_queries:
+            self.assertNotIn('users_apitoken', query['sql'])
+
+        # The cached token is invalidated when the token is revoked
+        token.revoked = True
+        token.save()
+
+        response = self.client.get(me, expected_code=401)
+        self.assertIn('Token has been revoked', str(response.data))
+
+        # The cached token is invalidated when the token is deleted
+        token.revoked = False
+        token.save()
+        self.client.get(me, expected_code=200)
+
+        token.delete()
+
+        response = self.client.get(me, expected_code=401)
+        self.assertIn('Invalid token', str(response.data))
@@ -1,12 +1,21 @@
 """Unit tests for the 'users' app."""
 
 from django.apps import apps
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.test import TestCase, tag
 from django.urls import reverse
 
 from InvenTree.unit_test import InvenTreeTestCase
-from users.models import ApiToken, Owner, RuleSet
+from users.models import (
+    ApiToken,
+    Owner,
+    RuleSet,
+    check_user_role,
+    get_ruleset_table_map,
+    get_user_role_map,
+    get_user_roles,
+)
 
 
 class RuleSetModelTest(TestCase):
@@ -156,6 +165,92 @@ class RuleSetModelTest(TestCase):
         self.assertEqual(group.permissions.count(), 0)
 
 
+class RoleMapTest(TestCase):
+    """Tests for the cached user role permission map."""
+
+    def setUp(self):
+        """Create a user and group for testing."""
+        super().setUp()
+
+        self.user = get_user_model().objects.create_user(
+            username='roleuser', password='password'
+        )
+        self.group = Group.objects.create(name='Role group')
+
+    def set_rule(self, name, **kwargs):
+        """Update the RuleSet with the provided name for the test group."""
+        rule = self.group.rule_sets.get(name=name)
+
+        for key, value in kwargs.items():
+            setattr(rule, key, value)
+
+        rule.save()
+
+    def test_table_map(self):
+        """Test the reverse table -> role index."""
+        table_map = get_ruleset_table_map()
+
+        for role, tables in RuleSet.get_ruleset_models().items():
+            for table in tables:
+                self.assertIn(role, table_map[table])
+
+        self.assertIn('part', table_map['part_part'])
+        self.assertIn('build', table_map['part_part'])
+        self.assertNotIn('stock', table_map['part_part'])
+
+    def test_role_map(self):
+        """Test that the role map reflects group and ruleset changes."""
+        # No groups, no permissions
+        self.assertEqual(get_user_role_map(self.user), {})
+        self.assertFalse(check_user_role(self.user, 'part', 'view'))
+
+        # Adding the user to a group invalidates the cached map
+        self.user.groups.add(self.group)
+        self.assertTrue(check_user_role(self.user, 'part', 'view'))
+        self.assertFalse(check_user_role(self.user, 'part', 'add'))
+
+        self.assertFalse(
+            RuleSet.check_table_permission(self.user, 'part_part', 'change')
+        )
+
+        # Updating a ruleset invalidates the cached map
+        self.set_rule('build', can_change=True)
+
+        self.assertTrue(check_user_role(self.user, 'build', 'change'))
+        self.assertFalse(check_user_role(self.user, 'build', 'delete'))
+        self.assertIn('build.change', get_user_roles(self.user))
+
+        # 'part_part' is covered by the 'build' role
+        self.assertTrue(
+            RuleSet.check_table_permission(self.user, 'part_part', 'change')
+        )
+
+        # Child tables inherit from the parent 'change' permission
+        self.assertFalse(
+            RuleSet.check_table_permission(self.user, 'part_partparameter', 'add')
+        )
+        self.set_rule('part', can_change=True)
+        self.assertTrue(
+            RuleSet.check_table_permission(self.user, 'part_partparameter', 'add')
+        )
+
+        # Repeated checks are served from the cache
+        with self.assertNumQueries(0):
+            for permission in RuleSet.RULESET_PERMISSIONS:
+                for role in RuleSet.RULESET_NAMES:
+                    check_user_role(self.user, role, permission)
+
+        # Removing the user from the group (reverse relation)
+        self.group.user_set.remove(self.user)
+        self.assertFalse(check_user_role(self.user, 'part', 'view'))
+
+        # Deleting the group invalidates the cached map
+        self.user.groups.add(self.group)
+        self.assertTrue(check_user_role(self.user, 'part', 'view'))
+        self.group.delete()
+        self.assertFalse(check_user_role(self.user, 'part', 'view'))
+
+
 class OwnerModelTest(InvenTreeTestCase):
     """Some simplistic tests to ensure the Owner model is setup correctly."""
 
@@ -198,7 +198,7 @@ def check_file_existance(filename: str, overwrite: bool = False):
         filename (str): Name of the file to check.
         overwrite (bool, optional): Overwrite the file without asking. Defaults to False.
     """
-    if Path(filename).is_file() and overwrite is False:
+    if Path(filename).exists() and overwrite is False:
         response = input(
             'Warning: file already exists. Do you want to overwrite? [y/N]: '
         )
@@ -290,10 +290,22 @@ def rebuild_models(c):
     manage(c, 'rebuild_models', pty=True)
 
 
+@task(help={'workers': 'Number of worker processes used to render images'})
+def rebuild_thumbnails(c, workers=1):
+    """Rebuild missing (or changed) image thumbnails."""
+    manage(c, f'rebuild_thumbnails --workers {workers}', pty=True)
+
+
+@task
+def rebuild_search_index(c):
+    """Rebuild the search index."""
+    manage(c, 'rebuild_search_index', pty=True)
+
+
 @task
-def rebuild_thumbnails(c):
-    """Rebuild missing image thumbnails."""
-    manage(c, 'rebuild_thumbnails', pty=True)
+def rebuild_part_stock_summary(c):
+    """Rebuild the part stock summary table."""
+    manage(c, 'rebuild_part_stock_summary', pty=True)
 
 
 @task
@@ -514,111 +526,81 @@ def update(
 # Data tasks
 @task(
     help={
-        'filename': "Output filename (default = 'data.json')",
+        'filename': "Output directory (default = 'data')",
         'overwrite': 'Overwrite existing files without asking first (default = False)',
         'include_permissions': 'Include user and group permissions in the output file (default = False)',
         'include_tokens': 'Include API tokens in the output file (default = False)',
         'exclude_plugins': 'Exclude plugin data from the output file (default = False)',
         'include_sso': 'Include SSO token data in the output file (default = False)',
-        'retain_temp': 'Retain temporary files (containing permissions) at end of process (default = False)',
+        'chunk_size': 'Maximum number of records per data file (default = 10000)',
     }
 )
 def export_records(
     c,
-    filename='data.json',
+    filename='data',
     overwrite=False,
     include_permissions=False,
     include_tokens=False,
     exclude_plugins=False,
     include_sso=False,
-    retain_temp=False,
+    chunk_size=10000,
 ):
-    """Export all database records to a file.
+    """Export all database records to a directory.
 
-    Write data to the file defined by filename.
-    If --overwrite is not set, the user will be prompted about overwriting an existing files.
-    If --include-permissions is not set, the file defined by filename will have permissions specified for a user or group removed.
-    If --delete-temp is not set, the temporary file (which includes permissions) will not be deleted. This file is named filename.tmp
+    Records for each model are written (in chunks) to separate JSONL files,
+    along with a manifest file which lists the models in dependency order.
+    Memory usage does not depend on the size of the database.
 
-    For historical reasons, calling this function without any arguments will thus result in two files:
-    - data.json: does not include permissions
-    - data.json.tmp: includes permissions
-
-    If you want the script to overwrite any existing files without asking, add argument -o / --overwrite.
-
-    If you only want one file, add argument - d / --delete-temp.
-
-    If you want only one file, with permissions, then additionally add argument -i / --include-permissions
+    If --overwrite is not set, the user will be prompted about overwriting an existing export.
+    If --include-permissions is not set, permissions specified for a user or group are removed.
     """
-    # Get an absolute path to the file
+    # Get an absolute path to the output directory
     if not os.path.isabs(filename):
         filename = localDir().joinpath(filename).resolve()
 
-    print(f"Exporting database records to file '{filename}'")
+    print(f"Exporting database records to '{filename}'")
 
     check_file_existance(filename, overwrite)
 
-    tmpfile = f'{filename}.tmp'
-
     excludes = content_excludes(
         allow_tokens=include_tokens,
         allow_plugins=not exclude_plugins,
         allow_sso=include_sso,
     )
 
-    cmd = f"dumpdata --natural-foreign --indent 2 --output '{tmpfile}' {excludes}"
-
-    # Dump data to temporary file
-    manage(c, cmd, pty=True)
-
-    print('Running data post-processing step...')
-
-    # Post-process the file, to remove any "permissions" specified for a user or group
-    with open(tmpfile, 'r') as f_in:
-        data = json.loads(f_in.read())
-
-    data_out = []
-
-    if include_permissions is False:
-        for entry in data:
-            model_name = entry.get('model', None)
-
-            # Ignore any temporary settings (start with underscore)
-            if model_name in ['common.inventreesetting', 'common.inventreeusersetting']:
-                if entry['fields'].get('key', '').startswith('_'):
-                    continue
-
-            if model_name == 'auth.group':
-                entry['fields']['permissions'] = []
-
-            if model_name == 'auth.user':
-                entry['fields']['user_permissions'] = []
+    cmd = (
+        f"export_records '{filename}' --overwrite --chunk-size {chunk_size} {excludes}"
+    )
 
-            data_out.append(entry)
+    if include_permissions:
+        cmd += ' --include-permissions'
 
-    # Write the processed data to file
-    with open(filename, 'w') as f_out:
-        f_out.write(json.dumps(data_out, indent=2))
+    manage(c, cmd, pty=True)
 
     print('Data export completed')
 
-    if not retain_temp:
-        print('Removing temporary files')
-        os.remove(tmpfile)
-
 
 @task(
     help={
-        'filename': 'Input filename',
+        'filename': "Input directory (default = 'data'), or a JSON file created by an earlier version",
         'clear': 'Clear existing data before import',
-        'retain_temp': 'Retain temporary files at end of process (default = False)',
+        'retain_temp': 'Retain temporary files at end of process (JSON file only, default = False)',
+        'batch_size': 'Number of records to insert at once (default = 500)',
     },
     post=[rebuild_models, rebuild_thumbnails],
 )
 def import_records(
-    c, filename='data.json', clear: bool = False, retain_temp: bool = False
+    c,
+    filename='data',
+    clear: bool = False,
+    retain_temp: bool = False,
+    batch_size: int = 500,
 ):
-    """Import database records from a file."""
+    """Import database records from a directory (or file).
+
+    Records are read one at a time, and imported in dependency order,
+    and the row counts are checked against the export manifest.
+    """
     # Get an absolute path to the supplied filename
     if not os.path.isabs(filename):
         filename = localDir().joinpath(filename)
@@ -632,6 +614,23 @@ def import_records(
 
     print(f"Importing database records from '{filename}'")
 
+    if os.path.isdir(filename):
+        excludes = content_excludes()
+
+        cmd = f"import_records '{filename}' --batch-size {batch_size} {excludes}"
+        manage(c, cmd, pty=True)
+    else:
+        import_records_file(c, filename, retain_temp=retain_temp)
+
+    print('Data import completed')
+
+
+def import_records_file(c, filename, retain_temp: bool = False):
+    """Import database records from a single JSON file.
+
+    Files of this format were created by the export-records task in earlier versions.
+    Note that the entire file is loaded into memory.
+    """
     # We need to load 'auth' data (users / groups) *first*
     # This is due to the users.owner model, which has a ContentType foreign key
     authfile = f'{filename}.auth.json'
@@ -694,8 +693,6 @@ def import_records(
         os.remove(datafile)
         os.remove(authfile)
 
-    print('Data import completed')
-
 
 @task
 def delete_data(c, force=False):